@@ -0,0 +1,5 @@
+"""Performance benchmarks for the Südwest-Energie website
+
+Run the scripts from the project root as modules, e.g.
+``python -m benchmarks.state_footprint``.
+"""
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Page compile-time benchmark
+
+Evaluates every registered page the way ``reflex export`` and the dev
+server do (build the component tree, apply app styles, add meta tags) and
+reports the time per full pass with component memoization disabled, for the
+first (cold) memoized pass and for later (warm) passes, plus the build time
+of each memoized factory.
+
+Usage:
+    python -m benchmarks.compile_time [--rounds 20] [--json results.json]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+
+def _timed(func: Callable[[], Any], rounds: int) -> List[float]:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    return {"median_ms": round(statistics.median(samples), 2), "min_ms": round(min(samples), 2)}
+
+
+def measure(rounds: int) -> Dict[str, Any]:
+    """Measure page evaluation with and without component memoization"""
+    from reflex.compiler import compiler
+    from suedwestenergie.components import footer, memo, navbar
+    from suedwestenergie.config import Config
+    from suedwestenergie.suedwestenergie import app
+    import suedwestenergie.sections as sections
+
+    def evaluate_pages():
+        for route, page in app._unevaluated_pages.items():
+            compiler.compile_unevaluated_page(route, page, app.style, app.theme)
+
+    # Warm up imports and Reflex' own caches
+    evaluate_pages()
+
+    Config.COMPONENT_MEMO = False
+    uncached = _timed(evaluate_pages, rounds)
+
+    Config.COMPONENT_MEMO = True
+    cold = []
+    for _ in range(rounds):
+        memo.clear_component_cache()
+        cold.extend(_timed(evaluate_pages, 1))
+    warm = _timed(evaluate_pages, rounds)
+    info = memo.component_cache_info()
+
+    factories = {}
+    for factory in [navbar, footer] + [getattr(sections, name) for name in sections.__all__]:
+        Config.COMPONENT_MEMO = False
+        build = _timed(factory, rounds)
+        Config.COMPONENT_MEMO = True
+        factory()
+        reuse = _timed(factory, rounds)
+        factories[factory.__name__] = {
+            "build_ms": round(statistics.median(build), 3),
+            "memoized_ms": round(statistics.median(reuse), 3),
+            "config_keys": len(factory.config_dependencies()),
+        }
+
+    return {
+        "pages": len(app._unevaluated_pages),
+        "rounds": rounds,
+        "uncached": _summary(uncached),
+        "memoized_cold": _summary(cold),
+        "memoized_warm": _summary(warm),
+        "cache": info,
+        "factories": factories,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure page compile time with and without component memoization")
+    parser.add_argument("--rounds", type=int, default=20, help="Passes over all pages per mode (default: 20)")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = measure(args.rounds)
+
+    print(f"Pages evaluated per pass:     {results['pages']}")
+    for mode in ("uncached", "memoized_cold", "memoized_warm"):
+        summary = results[mode]
+        print(f"  {mode:<16} median {summary['median_ms']:>8.2f} ms   min {summary['min_ms']:>8.2f} ms")
+    print(f"Memo cache: {results['cache']}")
+    print(f"\n{'Factory':<28} {'build ms':>10} {'memoized ms':>12} {'config keys':>12}")
+    for name, factory in results["factories"].items():
+        print(f"{name:<28} {factory['build_ms']:>10.3f} {factory['memoized_ms']:>12.3f} {factory['config_keys']:>12}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
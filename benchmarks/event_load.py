@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""
+Websocket load generator for the contact form events
+
+Opens many simulated visitor sessions against a running backend over the
+Reflex event websocket (socket.io at ``/_event``), the same way the browser
+does: every session hydrates, types the contact form at a human pace and
+submits it. Per event type it reports the round-trip latency (event sent until
+its state update arrives), and from ``/proc`` of the backend process tree the
+CPU time per event and the resident memory per connected session.
+
+The keystroke stream depends on ``--mode``, mirroring ``CONTACT_FORM_MODE``:
+
+- ``uncontrolled``: no field events, only ``submit_form``
+- ``debounced``: ``set_<field>`` once the user pauses for ``--debounce-ms``
+- ``keystroke``: ``set_<field>`` on every keystroke (worst case)
+
+Only events that change the state get an update back. Which ones do is
+predicted with the same validation rules as ``ContactFormState._update_field``;
+latencies are recorded for those, the others only count towards CPU time.
+
+Submissions reach Ninox and SMTP, so the backend must be started against the
+stand-ins this script serves (see TESTING.md)::
+
+    NINOX_API_URL=http://127.0.0.1:8125 NINOX_API_KEY=load NINOX_TEAM_ID=load \\
+    NINOX_DATABASE_ID=load NINOX_TABLE_ID=load EMAIL_HOST=127.0.0.1 EMAIL_PORT=2525 \\
+    EMAIL_USE_TLS=false EMAIL_HOST_USER=load@example.com EMAIL_HOST_PASSWORD=load \\
+    reflex run --env prod --backend-only
+
+Each session connects with its own ``X-Forwarded-For`` address, so the per-IP
+rate limit of the contact form applies per simulated visitor.
+
+Requires python-socketio and aiohttp (its asyncio websocket transport).
+
+Usage:
+    python -m benchmarks.event_load [--url http://127.0.0.1:8000] [--sessions 1000]
+        [--mode debounced] [--pid PID] [--json results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import resource
+import sys
+import time
+import uuid
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+from benchmarks.lead_corpus import contact_values
+from benchmarks.stand_ins import NINOX_PORT, SMTP_PORT, StandIns
+
+MODES = ("uncontrolled", "debounced", "keystroke")
+
+# Seconds beyond SPAM_MIN_SUBMIT_SECONDS between showing the form and the
+# submit at least, so that fast typing profiles are not scored as spam
+READING_MARGIN = 0.5
+
+
+def contact_lead(rng: random.Random, index: int, tag: str = "") -> Dict[str, str]:
+    """
+    Form values of one visitor, from the lead corpus generator
+
+    ``tag`` keeps messages unique across runs. The honeypot field is left
+    out, visitors never see it.
+    """
+    values = contact_values(rng)
+    del values["website"]
+    values["message"] += f" (Anfrage {index}{tag})"
+    return values
+
+
+def typing_plan(rng: random.Random, values: Dict[str, str], mode: str, cps: float = 6.0,
+                debounce_ms: int = 500, field_pause: float = 1.5) -> List[Tuple[float, str, str]]:
+    """
+    Events of one visitor filling in and submitting the form
+
+    Args:
+        rng: Seeded random source for the keystroke timing
+        values: Final field values
+        mode: One of ``MODES``
+        cps: Mean typing speed in characters per second
+        debounce_ms: Idle time after which a debounced field is synced
+        field_pause: Mean pause before each field and before the submit, in seconds
+
+    Returns:
+        ``(delay_before, field, value)`` for every ``set_<field>`` event,
+        followed by ``(delay_before, "", "")`` for the submit
+    """
+    keystrokes: List[Tuple[float, str, str]] = []
+    now = 0.0
+    for field, text in values.items():
+        now += rng.expovariate(1 / field_pause)
+        for position in range(1, len(text) + 1):
+            now += max(0.03, rng.gauss(1 / cps, 0.4 / cps))
+            keystrokes.append((now, field, text[:position]))
+
+    debounce = debounce_ms / 1000
+    events: List[Tuple[float, str, str]] = []
+    for i, (at, field, value) in enumerate(keystrokes):
+        if mode == "keystroke":
+            events.append((at, field, value))
+        elif mode == "debounced":
+            # Each input has its own timer; it fires once that input is idle long enough
+            following = keystrokes[i + 1] if i + 1 < len(keystrokes) else None
+            if following is None or following[1] != field or following[0] - at >= debounce:
+                events.append((at + debounce, field, value))
+    events.sort(key=lambda event: event[0])
+    submit_at = max([now] + [at for at, _, _ in events]) + rng.expovariate(1 / field_pause)
+    events.append((submit_at, "", ""))
+
+    plan, previous = [], 0.0
+    for at, field, value in events:
+        plan.append((at - previous, field, value))
+        previous = at
+    return plan
+
+
+def expects_update(field: str, value: str, fields_with_errors: set) -> bool:
+    """
+    Whether ``set_<field>`` produces a state update, mirroring ``_update_field``
+
+    ``field_errors`` is reassigned when the field is invalid or was invalid
+    before; ``set_email`` always recomputes the ``is_valid_email`` var.
+    Updates ``fields_with_errors`` in place.
+    """
+    from suedwestenergie.utils import validation
+
+    error = validation.validate_field(field, value)
+    answered = field == "email" or bool(error) or field in fields_with_errors
+    if error:
+        fields_with_errors.add(field)
+    else:
+        fields_with_errors.discard(field)
+    return answered
+
+
+def _percentile(sorted_values: Sequence[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def latency_summary(latencies_ms: Sequence[float]) -> Dict[str, float]:
+    ordered = sorted(latencies_ms)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(_percentile(ordered, 50), 2),
+        "p95_ms": round(_percentile(ordered, 95), 2),
+        "p99_ms": round(_percentile(ordered, 99), 2),
+        "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+    }
+
+
+def process_tree(pid: int) -> List[int]:
+    """``pid`` and all its descendants (the server workers)"""
+    children = defaultdict(list)
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children[ppid].append(int(entry))
+    tree, todo = [], [pid]
+    while todo:
+        current = todo.pop()
+        tree.append(current)
+        todo.extend(children.get(current, ()))
+    return tree
+
+
+def sample_processes(pids: Sequence[int]) -> Tuple[float, int]:
+    """Total CPU seconds (user + system) and resident bytes of ``pids``"""
+    ticks = os.sysconf("SC_CLK_TCK")
+    cpu, rss = 0.0, 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/stat", encoding="utf-8") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            with open(f"/proc/{pid}/status", encoding="utf-8") as f:
+                status = f.read()
+        except OSError:
+            continue  # exited since the tree was listed
+        cpu += (int(fields[11]) + int(fields[12])) / ticks
+        for line in status.splitlines():
+            if line.startswith("VmRSS:"):
+                rss += int(line.split()[1]) * 1024
+    return cpu, rss
+
+
+class _Session:
+    """One browser tab: a socket.io connection with its own client token"""
+
+    def __init__(self, index: int, results: "_Results", root_state: str, form_state: str):
+        self.index = index
+        self.results = results
+        self.root_state = root_state
+        self.form_state = form_state
+        self.token = str(uuid.uuid4())
+        self.pending: Deque[Tuple[str, float]] = deque()
+        self.hydrated = asyncio.Event()
+        self.idle = asyncio.Event()
+        self.idle.set()
+        self.finished = False
+        self.submit_update: Optional[Dict[str, Any]] = None
+        self.sio = None
+        self._connect_start = 0.0
+
+    def _router_data(self) -> Dict[str, Any]:
+        return {"pathname": "/", "asPath": "/", "query": {}}
+
+    def _on_update(self, update: Dict[str, Any]) -> None:
+        now = time.perf_counter()
+        if not self.hydrated.is_set():
+            # Hydration sends the full state first, then ``is_hydrated``
+            if update.get("delta", {}).get(self.root_state, {}).get("is_hydrated_rx_state_"):
+                self.results.latencies["hydrate"].append((now - self._connect_start) * 1000)
+                self.hydrated.set()
+            return
+        if self.finished:
+            return  # further updates of the submit chain
+        if not self.pending:
+            self.results.unexpected += 1
+            return
+        kind, sent = self.pending.popleft()
+        self.results.latencies[kind].append((now - sent) * 1000)
+        if kind == "submit_form":
+            self.submit_update = update
+            self.finished = True
+        if not self.pending:
+            self.idle.set()
+
+    async def connect(self, url: str, client_ip: str) -> None:
+        import socketio
+
+        self.sio = socketio.AsyncClient(reconnection=False)
+        self.sio.on("event", self._on_update, namespace="/_event")
+        hydrate = {"name": f"{self.root_state}.hydrate_and_load", "payload": {}, "router_data": self._router_data()}
+        self._connect_start = time.perf_counter()
+        await self.sio.connect(
+            f"{url}?token={self.token}",
+            headers={"X-Forwarded-For": client_ip},
+            transports=["websocket"],
+            namespaces=["/_event"],
+            socketio_path="/_event",
+            auth={"event": hydrate},
+        )
+
+    async def send(self, handler: str, payload: Dict[str, Any], answered: bool) -> None:
+        if answered:
+            self.pending.append((handler, time.perf_counter()))
+            self.idle.clear()
+        await self.sio.emit("event", {
+            "name": f"{self.form_state}.{handler}",
+            "payload": payload,
+            "router_data": self._router_data(),
+        }, namespace="/_event")
+        self.results.events += 1
+
+    async def fill_and_submit(self, plan: List[Tuple[float, str, str]], values: Dict[str, str],
+                              timeout: float) -> None:
+        from suedwestenergie.config import Config
+
+        fields_with_errors: set = set()
+        # What the browser sends when the first field is focused; it changes no frontend var, so nothing is sent back
+        await self.send("start_form", {}, False)
+        shown = time.perf_counter()
+        for delay, field, value in plan:
+            await asyncio.sleep(delay)
+            if field:
+                await self.send(f"set_{field}", {"value": value}, expects_update(field, value, fields_with_errors))
+        reading = Config.SPAM_MIN_SUBMIT_SECONDS + READING_MARGIN
+        await asyncio.sleep(max(0.0, shown + reading - time.perf_counter()))
+        form_data = dict(values, website="")
+        await self.send("submit_form", {"form_data": form_data}, True)
+        try:
+            await asyncio.wait_for(self.idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            self.results.timeouts += len(self.pending)
+
+    async def close(self) -> None:
+        if self.sio is not None and self.sio.connected:
+            await self.sio.disconnect()
+
+
+class _Results:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.events = 0
+        self.unexpected = 0
+        self.timeouts = 0
+        self.connect_errors: Dict[str, int] = defaultdict(int)
+
+
+async def run(url: str, sessions: int, mode: str, pid: Optional[int] = None, ramp_up: float = 10.0,
+              cps: float = 6.0, debounce_ms: int = 500, field_pause: float = 1.5, timeout: float = 30.0,
+              seed: int = 1, stand_ins: Optional[StandIns] = None,
+              leads: Optional[List[Dict[str, str]]] = None) -> Dict[str, Any]:
+    """
+    Run the load test against a running backend
+
+    Args:
+        url: Backend origin (the socket.io endpoint is ``<url>/_event``)
+        sessions: Number of simulated visitors, all connected at the same time
+        mode: Field event stream, one of ``MODES``
+        pid: Backend process id; CPU and memory are sampled from it and its children
+        ramp_up: Seconds over which the sessions connect
+        cps, debounce_ms, field_pause: Typing model, see ``typing_plan``
+        timeout: Seconds to wait for outstanding updates after the submit
+        seed: Seed of the form values and the keystroke timing
+        stand_ins: Started stand-ins whose counters are reported
+        leads: Form values to type, one per session in turn (e.g. from a lead
+            corpus); by default generated with ``contact_lead``
+
+    Returns:
+        Latency per event type, backend CPU per event and memory per session
+    """
+    from reflex.state import State
+    from suedwestenergie.state.contact_state import ContactFormState
+
+    rng = random.Random(seed)
+    results = _Results()
+    root_state, form_state = State.get_full_name(), ContactFormState.get_full_name()
+    pids = process_tree(pid) if pid else []
+
+    cpu_start, rss_start = sample_processes(pids)
+    started = time.perf_counter()
+
+    async def connect(session: _Session) -> Optional[_Session]:
+        await asyncio.sleep(ramp_up * session.index / sessions)
+        try:
+            await session.connect(url, f"10.{session.index >> 16 & 255}.{session.index >> 8 & 255}.{session.index & 255}")
+            await asyncio.wait_for(session.hydrated.wait(), timeout)
+            return session
+        except Exception as e:  # connection refused, handshake or hydrate timeout
+            results.connect_errors[type(e).__name__] += 1
+            await session.close()
+            return None
+
+    connected = [s for s in await asyncio.gather(*(
+        connect(_Session(i, results, root_state, form_state)) for i in range(sessions)
+    )) if s is not None]
+    cpu_connected, rss_connected = sample_processes(process_tree(pid) if pid else [])
+    connect_elapsed = time.perf_counter() - started
+
+    # Repeated runs against the same backend must not look like duplicate content
+    tag = f"-{uuid.uuid4().hex[:6]}"
+    scripts = []
+    for session in connected:
+        values = leads[session.index % len(leads)] if leads else contact_lead(rng, session.index, tag)
+        scripts.append((session, typing_plan(rng, values, mode, cps, debounce_ms, field_pause), values))
+    events_before = results.events
+    stream_start = time.perf_counter()
+    await asyncio.gather(*(session.fill_and_submit(plan, values, timeout) for session, plan, values in scripts))
+    stream_elapsed = time.perf_counter() - stream_start
+    cpu_end, rss_end = sample_processes(process_tree(pid) if pid else [])
+    await asyncio.gather(*(session.close() for session in connected))
+
+    events = results.events - events_before
+    answered = {kind: latency_summary(samples) for kind, samples in sorted(results.latencies.items())}
+    report: Dict[str, Any] = {
+        "url": url,
+        "mode": mode,
+        "sessions": sessions,
+        "connected": len(connected),
+        "connect_errors": dict(results.connect_errors),
+        "connect_seconds": round(connect_elapsed, 2),
+        "stream_seconds": round(stream_elapsed, 2),
+        "events": events,
+        "events_per_second": round(events / stream_elapsed, 1) if stream_elapsed else 0.0,
+        "answered_events": sum(summary["count"] for kind, summary in answered.items() if kind != "hydrate"),
+        "unexpected_updates": results.unexpected,
+        "timeouts": results.timeouts,
+        "latency": answered,
+    }
+    if pid:
+        report["backend"] = {
+            "pid": pid,
+            "cpu_ms_per_hydrate": round((cpu_connected - cpu_start) * 1000 / max(1, len(connected)), 3),
+            "cpu_ms_per_event": round((cpu_end - cpu_connected) * 1000 / max(1, events), 3),
+            "cpu_cores_busy": round((cpu_end - cpu_connected) / stream_elapsed, 2) if stream_elapsed else 0.0,
+            "rss_start_bytes": rss_start,
+            "rss_connected_bytes": rss_connected,
+            "rss_end_bytes": rss_end,
+            "rss_bytes_per_session": round((rss_connected - rss_start) / max(1, len(connected))),
+        }
+    if stand_ins is not None:
+        report["stand_ins"] = {"emails": stand_ins.emails, "ninox_records": stand_ins.ninox_records}
+    return report
+
+
+def _raise_open_file_limit() -> None:
+    # Every session holds one socket
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+async def _main(args: argparse.Namespace) -> Dict[str, Any]:
+    leads = None
+    if args.corpus:
+        from benchmarks.lead_corpus import read_corpus
+        from suedwestenergie.utils.validation import FIELD_ORDER
+
+        leads = [{field: record["form"][field] for field in FIELD_ORDER} for record in read_corpus(args.corpus)[1]]
+    stand_ins = None
+    if not args.no_stand_ins:
+        stand_ins = StandIns(args.smtp_port, args.ninox_port, args.smtp_delay_ms, args.ninox_delay_ms)
+        await stand_ins.start()
+        print(f"Stand-ins: SMTP on {stand_ins.smtp_port}, Ninox on {stand_ins.ninox_port}")
+    try:
+        return await run(args.url.rstrip("/"), args.sessions, args.mode, args.pid, args.ramp_up, args.cps,
+                         args.debounce_ms, args.field_pause, args.timeout, args.seed, stand_ins, leads)
+    finally:
+        if stand_ins is not None:
+            await stand_ins.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay contact form event streams over the Reflex websocket")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Backend URL (default: http://127.0.0.1:8000)")
+    parser.add_argument("--sessions", type=int, default=1000, help="Concurrent simulated visitors (default: 1000)")
+    parser.add_argument("--mode", choices=MODES, default="debounced", help="Field event stream (default: debounced)")
+    parser.add_argument("--pid", type=int, help="Backend process id, e.g. $(pgrep -of 'reflex run'), for CPU and memory")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="Seconds over which sessions connect (default: 10)")
+    parser.add_argument("--cps", type=float, default=6.0, help="Typing speed in characters per second (default: 6)")
+    parser.add_argument("--debounce-ms", type=int, default=500, help="Debounce of the debounced mode (default: 500)")
+    parser.add_argument("--field-pause", type=float, default=1.5, help="Mean pause between fields in seconds (default: 1.5)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Seconds to wait for updates (default: 30)")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of form values and timing (default: 1)")
+    parser.add_argument("--corpus", help="Type the form values of this lead corpus (see benchmarks.lead_corpus)")
+    parser.add_argument("--no-stand-ins", action="store_true", help="Do not serve the Ninox and SMTP stand-ins")
+    parser.add_argument("--smtp-port", type=int, default=SMTP_PORT, help=f"SMTP stand-in port (default: {SMTP_PORT})")
+    parser.add_argument("--ninox-port", type=int, default=NINOX_PORT, help=f"Ninox stand-in port (default: {NINOX_PORT})")
+    parser.add_argument("--smtp-delay-ms", type=int, default=150, help="SMTP stand-in delay per mail (default: 150)")
+    parser.add_argument("--ninox-delay-ms", type=int, default=250, help="Ninox stand-in delay per request (default: 250)")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    try:
+        import aiohttp  # noqa: F401  # transport of socketio.AsyncClient
+        import socketio  # noqa: F401
+    except ImportError:
+        print("The load generator needs python-socketio and aiohttp: pip install python-socketio aiohttp")
+        return 1
+
+    # State classes are only imported for their names; no app is started
+    os.environ.setdefault("PYTEST_CURRENT_TEST", "benchmarks.event_load")
+    _raise_open_file_limit()
+    results = asyncio.run(_main(args))
+
+    print(f"Sessions connected:     {results['connected']}/{results['sessions']} in {results['connect_seconds']}s")
+    for kind, count in results["connect_errors"].items():
+        print(f"  {kind:<22} {count}")
+    print(f"Events sent ({results['mode']}): {results['events']} in {results['stream_seconds']}s "
+          f"({results['events_per_second']}/s), {results['timeouts']} timed out, "
+          f"{results['unexpected_updates']} unexpected updates")
+    print(f"  {'event':<20} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for kind, summary in results["latency"].items():
+        print(f"  {kind:<20} {summary['count']:>7} {summary['p50_ms']:>9} {summary['p95_ms']:>9} "
+              f"{summary['p99_ms']:>9} {summary['max_ms']:>9}")
+    if "backend" in results:
+        backend = results["backend"]
+        print(f"Backend CPU per hydrate: {backend['cpu_ms_per_hydrate']} ms")
+        print(f"Backend CPU per event:   {backend['cpu_ms_per_event']} ms ({backend['cpu_cores_busy']} cores busy)")
+        print(f"Backend RSS per session: {backend['rss_bytes_per_session']} bytes")
+    if "stand_ins" in results:
+        print(f"Stand-ins received:      {results['stand_ins']['emails']} emails, "
+              f"{results['stand_ins']['ninox_records']} Ninox records")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark
+
+Imports each module in a fresh interpreter with ``python -X importtime`` and
+reports the median cumulative import time over ``--runs`` processes, the
+direct imports that cost the most, and the wall time of the whole process
+(interpreter start included). Bytecode caches are warmed by one untimed run.
+
+It also checks that imports stay lazy: importing a module of
+``EXPECTED_LAZY`` must not load the listed modules (SMTP, TLS, the Ninox and
+Twilio SDKs, Reflex for the plain utilities) or create files in the working
+directory (such as ``logs/``). The app module is only timed; Reflex writes
+its state directory when the app is created. A violation fails the run
+(exit code 1), as does a module that got slower than ``--threshold`` against
+``--compare``. Compare only results of the same machine.
+
+Usage:
+    python -m benchmarks.import_time [--runs 7] [--json results.json]
+    python -m benchmarks.import_time --compare results.json [--threshold 0.25]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Integrations that are imported on first use
+_INTEGRATIONS = ("smtplib", "ssl", "ninox", "twilio")
+
+# Module -> modules that importing it must not load
+EXPECTED_LAZY: Dict[str, Tuple[str, ...]] = {
+    "suedwestenergie.config": _INTEGRATIONS + ("reflex",),
+    "suedwestenergie.utils": _INTEGRATIONS + ("reflex",),
+    "suedwestenergie.utils.validation": _INTEGRATIONS + ("reflex",),
+    "suedwestenergie.utils.logger": _INTEGRATIONS + ("reflex",),
+    "suedwestenergie.utils.email": ("smtplib", "ssl", "reflex"),
+    "suedwestenergie.utils.email_notification": ("smtplib", "ssl", "reflex"),
+    "suedwestenergie.utils.ninox_client": ("ninox", "reflex"),
+    "suedwestenergie.utils.sms_notification": ("twilio", "reflex"),
+    # Reflex itself loads ssl (through asyncio)
+    "suedwestenergie.state.contact_state": ("smtplib", "ninox", "twilio"),
+}
+
+MODULES = tuple(EXPECTED_LAZY) + ("suedwestenergie.suedwestenergie",)
+
+# Allowed slowdown against the compared results, and changes below the noise floor
+THRESHOLD = 0.25
+NOISE_FLOOR_MS = 2.0
+
+# Direct imports reported per module
+TOP_IMPORTS = 5
+
+
+def parse_importtime(stderr: str) -> List[Tuple[int, str, int, int]]:
+    """
+    Entries of ``-X importtime`` output
+
+    Returns:
+        ``(depth, module, self_us, cumulative_us)`` in output order; a module
+        is listed after everything it imported, one depth level deeper
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # the header line
+        stripped = name.lstrip(" ")
+        depth = (len(name) - len(stripped) - 1) // 2
+        entries.append((depth, stripped.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def module_time(entries: Sequence[Tuple[int, str, int, int]], module: str) -> Tuple[int, List[Tuple[str, int]]]:
+    """Cumulative microseconds of ``module`` and its direct imports, slowest first"""
+    for index in range(len(entries) - 1, -1, -1):
+        depth, name, _, cumulative = entries[index]
+        if name != module:
+            continue
+        children = []
+        for child_depth, child, _, child_cumulative in reversed(entries[:index]):
+            if child_depth <= depth:
+                break
+            if child_depth == depth + 1:
+                children.append((child, child_cumulative))
+        return cumulative, sorted(children, key=lambda child: -child[1])
+    return 0, []
+
+
+def _files(directory: str) -> List[str]:
+    return sorted(os.path.relpath(os.path.join(path, name), directory)
+                  for path, dirs, names in os.walk(directory) for name in dirs + names)
+
+
+def import_once(module: str) -> Dict[str, Any]:
+    """Import ``module`` in a new interpreter started in an empty directory"""
+    code = f"import sys; import {module}; print(' '.join(sorted(sys.modules)))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (ROOT, os.environ.get("PYTHONPATH")))))
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=directory, env=env,
+                                 capture_output=True, text=True)
+        wall = time.perf_counter() - start
+        created = _files(directory)
+    if process.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{process.stderr[-2000:]}")
+    cumulative, children = module_time(parse_importtime(process.stderr), module)
+    return {
+        "import_us": cumulative,
+        "children": children,
+        "process_ms": wall * 1000,
+        "modules": set(process.stdout.split()),
+        "created_files": created,
+    }
+
+
+def measure(modules: Sequence[str] = MODULES, runs: int = 7) -> Dict[str, Any]:
+    """Import every module ``runs`` times and check that the lazy imports stay lazy"""
+    results = {}
+    for module in modules:
+        import_once(module)  # write the bytecode caches
+        samples = [import_once(module) for _ in range(runs)]
+        times = [sample["import_us"] / 1000 for sample in samples]
+        median_run = min(samples, key=lambda sample: abs(sample["import_us"] / 1000 - statistics.median(times)))
+        loaded = set.union(*(sample["modules"] for sample in samples))
+        results[module] = {
+            "median_ms": round(statistics.median(times), 2),
+            "min_ms": round(min(times), 2),
+            "process_ms": round(statistics.median(sample["process_ms"] for sample in samples), 1),
+            "modules_loaded": len(median_run["modules"]),
+            "largest_imports": [[name, round(us / 1000, 2)] for name, us in median_run["children"][:TOP_IMPORTS]],
+            "eager_imports": sorted(name for name in EXPECTED_LAZY.get(module, ()) if name in loaded),
+            "created_files": sorted(set().union(*(sample["created_files"] for sample in samples))),
+            "runs": runs,
+        }
+    return {
+        "created": datetime.now().isoformat(),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "machine": platform.node(),
+        "modules": results,
+    }
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=ROOT,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def violations(results: Dict[str, Any]) -> List[str]:
+    """Modules in ``EXPECTED_LAZY`` that loaded an integration eagerly or wrote files when imported"""
+    problems = []
+    for module, result in results["modules"].items():
+        if module not in EXPECTED_LAZY:
+            continue
+        if result["eager_imports"]:
+            problems.append(f"{module} imports {', '.join(result['eager_imports'])}")
+        if result["created_files"]:
+            problems.append(f"{module} creates {', '.join(result['created_files'])}")
+    return problems
+
+
+def compare(results: Dict[str, Any], previous: Dict[str, Any], threshold: float = THRESHOLD) -> List[str]:
+    """
+    Compare the median import times against earlier results
+
+    Returns:
+        One message per module that got slower by more than the threshold
+        and by more than ``NOISE_FLOOR_MS``
+    """
+    failures = []
+    for module, current in results["modules"].items():
+        before = previous.get("modules", {}).get(module)
+        if before is None or not before["median_ms"]:
+            continue
+        increase = current["median_ms"] - before["median_ms"]
+        if increase > NOISE_FLOOR_MS and increase / before["median_ms"] > threshold:
+            failures.append(f"{module}: {before['median_ms']:.1f} ms -> {current['median_ms']:.1f} ms "
+                            f"(+{increase / before['median_ms'] * 100:.1f}%, allowed {threshold * 100:.0f}%)")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the import time of the application modules")
+    parser.add_argument("--runs", type=int, default=7, help="Interpreter runs per module (default: 7)")
+    parser.add_argument("--module", action="append", help="Only measure this module (repeatable)")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Fail when slower than the results in this JSON file")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help=f"Allowed slowdown against --compare (default: {THRESHOLD})")
+    args = parser.parse_args()
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+
+    results = measure(args.module or MODULES, args.runs)
+
+    print(f"{'Module':<42} {'import ms':>10} {'process ms':>11} {'modules':>8}  largest imports")
+    for module, result in results["modules"].items():
+        largest = ", ".join(f"{name} {ms:.0f}" for name, ms in result["largest_imports"][:3])
+        print(f"{module:<42} {result['median_ms']:>10.1f} {result['process_ms']:>11.0f} "
+              f"{result['modules_loaded']:>8}  {largest}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+
+    failed = False
+    problems = violations(results)
+    if problems:
+        print("\nImports that should be lazy:")
+        for problem in problems:
+            print(f"  {problem}")
+        failed = True
+
+    if previous is not None:
+        failures = compare(results, previous, args.threshold)
+        label = previous.get("commit") or args.compare
+        if failures:
+            print(f"\nSlower than {label}:")
+            for failure in failures:
+                print(f"  {failure}")
+            failed = True
+        else:
+            print(f"\nNo module imports more than {args.threshold * 100:.0f}% slower than {label}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
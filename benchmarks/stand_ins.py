@@ -0,0 +1,122 @@
+"""
+Stand-ins for the external services
+
+``StandIns`` serves a local SMTP server and Ninox REST API.
+``benchmarks.event_load`` and ``benchmarks.lead_corpus`` serve them for
+their load runs; the test conftest starts them for the contact service and
+event tests.
+"""
+
+import asyncio
+import json
+from typing import Dict, List
+
+SMTP_PORT = 2525
+NINOX_PORT = 8125
+
+
+class StandIns:
+    """
+    Local SMTP server and Ninox REST API that accept everything
+
+    Both answer after an optional delay to model the latency of the real
+    services; they count what they received. ``GET /stats`` on the Ninox port
+    reports the counters to other processes.
+    """
+
+    def __init__(self, smtp_port: int = SMTP_PORT, ninox_port: int = NINOX_PORT,
+                 smtp_delay_ms: int = 0, ninox_delay_ms: int = 0, host: str = "127.0.0.1"):
+        self.host = host
+        self.smtp_port = smtp_port
+        self.ninox_port = ninox_port
+        self.smtp_delay = smtp_delay_ms / 1000
+        self.ninox_delay = ninox_delay_ms / 1000
+        self.emails = 0
+        self.ninox_records = 0
+        self._servers: List[asyncio.AbstractServer] = []
+
+    async def start(self) -> None:
+        self._servers = [
+            await asyncio.start_server(self._smtp, self.host, self.smtp_port),
+            await asyncio.start_server(self._ninox, self.host, self.ninox_port),
+        ]
+        # Report the actual ports when 0 (any free port) was requested
+        self.smtp_port = self._servers[0].sockets[0].getsockname()[1]
+        self.ninox_port = self._servers[1].sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+
+    def backend_env(self) -> Dict[str, str]:
+        """Environment that points the backend at the stand-ins"""
+        return {
+            "NINOX_API_URL": f"http://{self.host}:{self.ninox_port}",
+            "NINOX_API_KEY": "load", "NINOX_TEAM_ID": "load", "NINOX_DATABASE_ID": "load", "NINOX_TABLE_ID": "load",
+            "EMAIL_HOST": self.host, "EMAIL_PORT": str(self.smtp_port), "EMAIL_USE_TLS": "false",
+            "EMAIL_HOST_USER": "load@example.com", "EMAIL_HOST_PASSWORD": "load",
+        }
+
+    async def _smtp(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        async def reply(line: str) -> None:
+            writer.write(line.encode("ascii") + b"\r\n")
+            await writer.drain()
+
+        try:
+            await reply("220 stand-in ESMTP")
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode("utf-8", "replace").strip().upper()
+                if command.startswith(("EHLO", "HELO")):
+                    await reply("250-stand-in\r\n250-AUTH PLAIN\r\n250 8BITMIME")
+                elif command.startswith("AUTH"):
+                    await reply("235 2.7.0 Authentication successful")
+                elif command == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    while (await reader.readline()) not in (b".\r\n", b".\n", b""):
+                        pass
+                    if self.smtp_delay:
+                        await asyncio.sleep(self.smtp_delay)
+                    self.emails += 1
+                    await reply("250 2.0.0 Ok: queued")
+                elif command == "QUIT":
+                    await reply("221 2.0.0 Bye")
+                    break
+                else:  # MAIL, RCPT, RSET, NOOP
+                    await reply("250 2.0.0 Ok")
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _ninox(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await reader.readline()
+            length = 0
+            while (header := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                name, _, value = header.decode("latin-1").partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+            body = json.loads(await reader.readexactly(length) or b"null") if length else None
+            if self.ninox_delay:
+                await asyncio.sleep(self.ninox_delay)
+
+            method, path = request_line.decode("latin-1").split()[:2]
+            if method == "GET" and path == "/stats":
+                payload = {"emails": self.emails, "ninox_records": self.ninox_records}
+            elif method == "POST" and path.rstrip("/").endswith("/records") and isinstance(body, list):
+                self.ninox_records += len(body)
+                payload = [{"id": self.ninox_records - len(body) + i + 1, **record} for i, record in enumerate(body)]
+            else:
+                payload = {"id": path.rsplit("/", 1)[-1], "fields": {}}
+            data = json.dumps(payload).encode("utf-8")
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nConnection: close\r\n"
+                         + f"Content-Length: {len(data)}\r\n\r\n".encode("ascii") + data)
+            await writer.drain()
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Per-visitor state footprint benchmark
+
+Builds the Reflex state tree the way the memory state manager does for every
+connected client, hydrates it (as on the initial websocket connect) and
+reports:
+
+- heap bytes per idle visitor (tracemalloc, averaged over many trees)
+- pickled bytes per state class (what the redis/disk state managers store)
+- size of the initial hydrate payload sent to the browser
+
+Usage:
+    python -m benchmarks.state_footprint [--visitors 500] [--json results.json]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from typing import Any, Dict, Iterator
+
+
+def _walk(state) -> Iterator[Any]:
+    yield state
+    for substate in state.substates.values():
+        yield from _walk(substate)
+
+
+def _new_visitor(state_cls):
+    """Create and hydrate the state tree of one idle visitor"""
+    state = state_cls(_reflex_internal_init=True)
+    hydrate_payload = json.dumps(state.dict(), default=str)
+    return state, hydrate_payload
+
+
+def measure(visitors: int) -> Dict[str, Any]:
+    """Measure the state footprint for the given number of idle visitors"""
+    # Importing the app registers all pages and their state classes
+    import suedwestenergie.suedwestenergie  # noqa: F401
+    from reflex.state import State
+
+    # Warm up class-level caches so they are not attributed to visitors
+    state, hydrate_payload = _new_visitor(State)
+
+    per_state = {
+        sub.get_full_name().rsplit("____", 1)[-1]: len(sub._serialize())
+        for sub in _walk(state)
+    }
+
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    trees = [_new_visitor(State) for _ in range(visitors)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del trees
+
+    return {
+        "visitors": visitors,
+        "heap_bytes_per_visitor": round((current - baseline) / visitors),
+        "pickled_bytes_per_visitor": sum(per_state.values()),
+        "pickled_bytes_per_state": per_state,
+        "hydrate_payload_bytes": len(hydrate_payload.encode("utf-8")),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Reflex state bytes per idle visitor")
+    parser.add_argument("--visitors", type=int, default=500, help="Number of simulated visitors (default: 500)")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    # State classes may only be instantiated directly in test mode
+    os.environ.setdefault("PYTEST_CURRENT_TEST", "benchmarks.state_footprint")
+    results = measure(args.visitors)
+
+    print(f"Idle visitors simulated:      {results['visitors']}")
+    print(f"Heap bytes per idle visitor:  {results['heap_bytes_per_visitor']}")
+    print(f"Pickled bytes per visitor:    {results['pickled_bytes_per_visitor']}")
+    for name, size in sorted(results["pickled_bytes_per_state"].items()):
+        print(f"  {name:<40} {size}")
+    print(f"Hydrate payload bytes:        {results['hydrate_payload_bytes']}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -63,6 +63,18 @@ $DOCKER_COMPOSE_CMD up -d db
 echo -e "${GREEN}Waiting for database to be ready...${NC}"
 sleep 10
 
+# Export the content-only pages, the 404 page, sitemap.xml and robots.txt so nginx serves them without the backend
+echo -e "${GREEN}Exporting static pages...${NC}"
+$DOCKER_COMPOSE_CMD run --rm --no-deps -v "$(pwd)/static_pages:/app/static_pages" app \
+    python -m suedwestenergie.build static --out /app/static_pages
+$DOCKER_COMPOSE_CMD run --rm --no-deps -v "$(pwd)/static_pages:/app/static_pages" app \
+    python -m suedwestenergie.build seo --out /app/static_pages
+
+# Unpack the frontend build with .gz/.br siblings so nginx serves assets without compressing or proxying
+echo -e "${GREEN}Precompressing frontend assets...${NC}"
+$DOCKER_COMPOSE_CMD run --rm --no-deps -v "$(pwd)/frontend_static:/app/frontend_static" app \
+    python -m suedwestenergie.build precompress --source /app/frontend.zip --out /app/frontend_static
+
 # Start the application
 echo -e "${GREEN}Starting application...${NC}"
 $DOCKER_COMPOSE_CMD up -d
@@ -4,35 +4,166 @@ Penetration Testing Script for Südwest-Energie Website
 
 This script performs security testing on the Südwest-Energie website,
 identifying potential vulnerabilities and security issues.
+
+The checks run concurrently. Requests share one pooled session, at most
+``max_per_host`` are in flight per host and a global token bucket caps the
+request rate. Each check stops submitting payloads once it has a finding. The
+output is collected per check and replayed in the fixed check order, so the
+console output and the JSON report look like those of a serial run.
+
+With a cache file, every finished check is stored together with a key of its
+code (payloads included) and the scanner settings, and a fingerprint of the
+target's start page. A re-run replays checks whose key and fingerprint are
+unchanged instead of sending their requests, so an interrupted run resumes
+and a nightly scan of an unchanged deployment costs the start page plus the
+path probes. The checks that probe paths are never cached: a path can start
+answering without the start page changing, and fingerprinting the probed
+paths would cost as many requests as the check itself. Each run also writes a
+diff against the previous run's results.
 """
 
 import requests
+import hashlib
+import inspect
 import json
+import os
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime
-from urllib.parse import urljoin
+from functools import partial
+from urllib.parse import urljoin, urlsplit
 import re
 import argparse
 import sys
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterator, List, Tuple, Optional
 import urllib3
+from requests.adapters import HTTPAdapter
 
 # Disable SSL warnings for testing
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+CACHE_VERSION = 1
+
+# Response headers that change on every request and do not identify a deployment
+VOLATILE_HEADERS = {"date", "expires", "age", "set-cookie", "x-request-id", "cf-ray", "report-to", "nel"}
+
+
+def response_fingerprint(response: requests.Response) -> str:
+    """Hash of the status, stable headers and body of a response"""
+    digest = hashlib.sha256(str(response.status_code).encode())
+    for name in sorted(response.headers):
+        if name.lower() not in VOLATILE_HEADERS:
+            digest.update(f"\n{name.lower()}: {response.headers[name]}".encode("utf-8"))
+    digest.update(b"\n\n" + response.content)
+    return digest.hexdigest()
+
+
+def diff_results(previous: List[Dict], current: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    Compare two runs' ``test_results`` by test name
+
+    Returns:
+        ``new_findings`` (failing now, not failing before), ``resolved_findings``
+        (failing before, not now), ``changed`` (failing in both with another
+        severity or details), ``added_tests`` and ``removed_tests``
+    """
+    before = {result["name"]: result for result in previous}
+    after = {result["name"]: result for result in current}
+    diff = {"new_findings": [], "resolved_findings": [], "changed": [], "added_tests": [], "removed_tests": []}
+    for name, result in after.items():
+        old = before.get(name)
+        if old is None:
+            diff["added_tests"].append(name)
+        if not result["passed"] and (old is None or old["passed"]):
+            diff["new_findings"].append(result)
+        elif not result["passed"] and (old["severity"], old["details"]) != (result["severity"], result["details"]):
+            diff["changed"].append({"name": name, "before": old, "after": result})
+    for name, old in before.items():
+        result = after.get(name)
+        if result is None:
+            diff["removed_tests"].append(name)
+        if not old["passed"] and (result is None or result["passed"]):
+            diff["resolved_findings"].append(old)
+    return diff
+
+
+class RateLimiter:
+    """Token bucket shared by all checks; ``rate`` <= 0 disables the cap"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the next request may be sent"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
 
 class SudwestEnergiePentester:
-    def __init__(self, base_url: str = "http://localhost:3000", timeout: int = 10):
+    # Run by run_all_tests; results are reported in this order
+    CHECKS = (
+        "check_security_headers",
+        "test_xss_vulnerabilities",
+        "test_sql_injection",
+        "test_form_validation_bypass",
+        "test_ninox_api_integration",
+        "test_csrf_vulnerabilities",
+        "test_directory_enumeration",
+        "test_information_disclosure",
+    )
+
+    # Checks whose result depends on paths other than the start page; always run
+    UNCACHED_CHECKS = frozenset({"test_ninox_api_integration", "test_directory_enumeration"})
+
+    def __init__(self, base_url: str = "http://localhost:3000", timeout: int = 10,
+                 max_per_host: int = 8, rate_limit: float = 100.0, cache_file: Optional[str] = None,
+                 max_age_hours: float = 168):
         """
         Initialize the pentester with the target URL
         
         Args:
             base_url: Base URL of the website to test
             timeout: Request timeout in seconds
+            max_per_host: Maximum concurrent requests per host
+            rate_limit: Maximum requests per second over all checks (0 = unlimited)
+            cache_file: Where check results are kept between runs (None = always run every check)
+            max_age_hours: Re-run cached checks that are older than this
         """
         self.base_url = base_url
         self.timeout = timeout
+        self.cache_file = cache_file
+        self.max_age_hours = max_age_hours
+        self.cache: Dict = {"version": CACHE_VERSION, "targets": {}}
+        self.diff: Optional[Dict[str, List[Dict]]] = None
+        self.max_per_host = max(1, max_per_host)
+        self.rate_limiter = RateLimiter(rate_limit, burst=self.max_per_host)
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._base_response: Optional[Future] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+
         self.session = requests.Session()
+        # One keep-alive pool per host, as large as the per-host limit
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_per_host, pool_block=True)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -79,6 +210,16 @@ class SudwestEnergiePentester:
             "vulnerability_type": vulnerability_type,
             "timestamp": datetime.now().isoformat()
         }
+        buffer = getattr(self._local, "output", None)
+        if buffer is not None:
+            buffer.append(("result", result))
+        else:
+            self._record(result)
+
+    def _record(self, result: Dict):
+        """Add a finished result to the summary and print it"""
+        test_name, passed, severity = result["name"], result["passed"], result["severity"]
+        details, vulnerability_type = result["details"], result["vulnerability_type"]
         self.test_results["test_results"].append(result)
         self.test_results["summary"]["total_tests"] += 1
 
@@ -110,12 +251,80 @@ class SudwestEnergiePentester:
             if details:
                 print(f"   Details: {details}")
 
+    def _print(self, message: str):
+        """Print now, or at the end of the check when checks run concurrently"""
+        buffer = getattr(self._local, "output", None)
+        if buffer is not None:
+            buffer.append(("print", message))
+        else:
+            print(message)
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request within the per-host and global rate limits"""
+        host = urlsplit(url).netloc
+        with self._lock:
+            slots = self._host_slots.setdefault(host, threading.BoundedSemaphore(self.max_per_host))
+        with slots:
+            self.rate_limiter.acquire()
+            return self.session.request(method, url, timeout=self.timeout, **kwargs)
+
+    def _submit(self, calls: List[Callable[[], requests.Response]]) -> List[Future]:
+        """Schedule requests on the shared pool (inline when no pool is running)"""
+        futures = []
+        for call in calls:
+            if self._pool is not None:
+                futures.append(self._pool.submit(call))
+                continue
+            future = Future()
+            try:
+                future.set_result(call())
+            except Exception as e:
+                future.set_exception(e)
+            futures.append(future)
+        return futures
+
+    def _results(self, futures: List[Future]) -> Iterator[Tuple[Optional[requests.Response], Optional[Exception]]]:
+        """
+        ``(response, error)`` of the futures in submission order
+
+        Requests that have not started yet are cancelled when the caller stops
+        iterating, which is how a check exits early after a finding.
+        """
+        try:
+            for future in futures:
+                try:
+                    yield future.result(), None
+                except Exception as e:
+                    yield None, e
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _get_base(self) -> requests.Response:
+        """Response of the start page, fetched once for all checks that inspect it"""
+        with self._lock:
+            if self._base_response is None:
+                self._base_response = self._submit([partial(self._request, "GET", self.base_url)])[0]
+        return self._base_response.result()
+
+    def _contact_form(self, field: str, payload: str) -> Dict[str, str]:
+        test_data = {
+            "name": "Test User",
+            "email": "test@example.com",
+            "phone": "+49 123 456789",
+            "company": "Test Company",
+            "message": "Test message"
+        }
+        # Inject the payload into the current field
+        test_data[field] = payload
+        return test_data
+
     def check_security_headers(self):
         """Check for security headers"""
-        print("\n🔍 Testing Security Headers...")
+        self._print("\n🔍 Testing Security Headers...")
         
         try:
-            response = self.session.get(self.base_url, timeout=self.timeout)
+            response = self._get_base()
             
             # Expected security headers
             expected_headers = [
@@ -148,7 +357,7 @@ class SudwestEnergiePentester:
 
     def test_xss_vulnerabilities(self):
         """Test for Cross-Site Scripting (XSS) vulnerabilities"""
-        print("\n🔍 Testing for XSS Vulnerabilities...")
+        self._print("\n🔍 Testing for XSS Vulnerabilities...")
         
         # Common XSS payloads to test
         xss_payloads = [
@@ -165,23 +374,21 @@ class SudwestEnergiePentester:
         # Test contact form fields
         contact_form_fields = ["name", "email", "company", "message"]
         
+        # Submit every field's payloads at once; each field is evaluated in payload order
+        submissions = {
+            field: self._submit([
+                partial(self._request, "POST", self.base_url, data=self._contact_form(field, payload))
+                for payload in xss_payloads
+            ])
+            for field in contact_form_fields
+        }
+        
         for field in contact_form_fields:
-            for payload in xss_payloads:
-                # Create a test form submission with XSS payload
-                test_data = {
-                    "name": "Test User",
-                    "email": "test@example.com",
-                    "phone": "+49 123 456789",
-                    "company": "Test Company",
-                    "message": "Test message"
-                }
-                
-                # Inject the payload into the current field
-                test_data[field] = payload
-                
-                try:
-                    # Submit form and check response
-                    response = self.session.post(self.base_url, data=test_data, timeout=self.timeout)
+            with closing(self._results(submissions[field])) as results:
+                for payload, (response, failure) in zip(xss_payloads, results):
+                    if failure is not None:
+                        self.add_test_result(f"XSS Test - {field}", False, "medium", str(failure), "HTTP Error")
+                        break  # Continue to next field
                     
                     # Check if the payload appears in the response (indicating potential XSS)
                     # This is a basic check - in real pentesting, check multiple response points
@@ -193,14 +400,10 @@ class SudwestEnergiePentester:
                         # If payload is properly sanitized, the test passes
                         if payload not in response.text:
                             self.add_test_result(f"XSS Test - {field} (with payload: {payload[:20]}...)", True, "low")
-                
-                except Exception as e:
-                    self.add_test_result(f"XSS Test - {field}", False, "medium", str(e), "HTTP Error")
-                    break  # Continue to next field
 
     def test_sql_injection(self):
         """Test for SQL Injection vulnerabilities"""
-        print("\n🔍 Testing for SQL Injection Vulnerabilities...")
+        self._print("\n🔍 Testing for SQL Injection Vulnerabilities...")
         
         # SQL injection payloads
         sqli_payloads = [
@@ -218,30 +421,28 @@ class SudwestEnergiePentester:
         # Test contact form fields for SQL injection
         contact_form_fields = ["name", "email", "company"]
         
+        # Look for common SQL error messages in response
+        sql_errors = [
+            "sql syntax",
+            "mysql", "mssql", "oracle", "postgresql",
+            "syntax error", "error in your sql",
+            "unrecognized token", "sqlite"
+        ]
+        
+        submissions = {
+            field: self._submit([
+                partial(self._request, "POST", self.base_url, data=self._contact_form(field, payload))
+                for payload in sqli_payloads
+            ])
+            for field in contact_form_fields
+        }
+        
         for field in contact_form_fields:
-            for payload in sqli_payloads:
-                test_data = {
-                    "name": "Test User",
-                    "email": "test@example.com",
-                    "phone": "+49 123 456789",
-                    "company": "Test Company",
-                    "message": "Test message"
-                }
-                
-                # Inject the payload into the current field
-                test_data[field] = payload
-                
-                try:
-                    # Submit form and check response
-                    response = self.session.post(self.base_url, data=test_data, timeout=self.timeout)
-                    
-                    # Look for common SQL error messages in response
-                    sql_errors = [
-                        "sql syntax",
-                        "mysql", "mssql", "oracle", "postgresql",
-                        "syntax error", "error in your sql",
-                        "unrecognized token", "sqlite"
-                    ]
+            with closing(self._results(submissions[field])) as results:
+                for payload, (response, failure) in zip(sqli_payloads, results):
+                    if failure is not None:
+                        self.add_test_result(f"SQL Injection Test - {field}", False, "medium", str(failure), "HTTP Error")
+                        break  # Continue to next field
                     
                     response_text = response.text.lower()
                     has_sql_error = any(error in response_text for error in sql_errors)
@@ -252,14 +453,10 @@ class SudwestEnergiePentester:
                         break  # Stop testing other payloads for this field
                     else:
                         self.add_test_result(f"SQL Injection Test - {field} (payload: {payload[:20]}...)", True, "low")
-                        
-                except Exception as e:
-                    self.add_test_result(f"SQL Injection Test - {field}", False, "medium", str(e), "HTTP Error")
-                    break  # Continue to next field
 
     def test_form_validation_bypass(self):
         """Test for form validation bypass"""
-        print("\n🔍 Testing Form Validation Bypass...")
+        self._print("\n🔍 Testing Form Validation Bypass...")
         
         # Test with empty required fields
         bypass_tests = [
@@ -270,9 +467,13 @@ class SudwestEnergiePentester:
             {"name": "Test", "email": "test@example.com", "phone": "+49 123", "company": "Test", "message": "Hi"},  # Too short
         ]
         
-        for i, test_data in enumerate(bypass_tests):
+        submissions = self._submit([
+            partial(self._request, "POST", self.base_url, data=test_data) for test_data in bypass_tests
+        ])
+        
+        for i, (test_data, future) in enumerate(zip(bypass_tests, submissions)):
             try:
-                response = self.session.post(self.base_url, data=test_data, timeout=self.timeout)
+                response = future.result()
                 
                 # If the server doesn't validate and accepts the data, that's a vulnerability
                 # This is tricky to determine with HTTP requests alone, so we'll test for expected behavior
@@ -292,7 +493,7 @@ class SudwestEnergiePentester:
 
     def test_ninox_api_integration(self):
         """Test for Ninox API integration vulnerabilities"""
-        print("\n🔍 Testing Ninox API Integration...")
+        self._print("\n🔍 Testing Ninox API Integration...")
         
         # Check environment for Ninox configuration (this would typically be done on the server side)
         # For now, we'll test if there are any exposed API endpoints
@@ -305,29 +506,28 @@ class SudwestEnergiePentester:
         
         vulnerable_endpoints_found = False
         
-        for path in common_ninox_paths:
-            try:
-                url = urljoin(self.base_url, path)
-                response = self.session.get(url, timeout=self.timeout)
+        urls = [urljoin(self.base_url, path) for path in common_ninox_paths]
+        with closing(self._results(self._submit([partial(self._request, "GET", url) for url in urls]))) as results:
+            for url, (response, failure) in zip(urls, results):
+                if failure is not None:
+                    continue
                 
                 if response.status_code not in [404, 403, 405]:
                     details = f"Potentially exposed Ninox API endpoint found: {url} (Status: {response.status_code})"
                     self.add_test_result("Ninox API Endpoint Exposure", False, "high", details, "Exposed API Endpoint")
                     vulnerable_endpoints_found = True
                     break
-            except Exception:
-                continue
         
         if not vulnerable_endpoints_found:
             self.add_test_result("Ninox API Endpoint Exposure", True, "low")
 
     def test_csrf_vulnerabilities(self):
         """Test for CSRF vulnerabilities"""
-        print("\n🔍 Testing for CSRF Vulnerabilities...")
+        self._print("\n🔍 Testing for CSRF Vulnerabilities...")
         
         # Check if there's a CSRF token in forms
         try:
-            response = self.session.get(self.base_url, timeout=self.timeout)
+            response = self._get_base()
             content = response.text
             
             # Look for CSRF tokens (common names)
@@ -353,7 +553,7 @@ class SudwestEnergiePentester:
 
     def test_directory_enumeration(self):
         """Test for directory enumeration vulnerabilities"""
-        print("\n🔍 Testing for Directory Enumeration...")
+        self._print("\n🔍 Testing for Directory Enumeration...")
         
         # Common sensitive directories/files to check
         sensitive_paths = [
@@ -408,16 +608,10 @@ class SudwestEnergiePentester:
         
         accessible_paths = []
         
-        for path in sensitive_paths:
-            try:
-                url = urljoin(self.base_url, path)
-                response = self.session.get(url, timeout=self.timeout)
-                
-                if response.status_code not in [404, 403]:
-                    accessible_paths.append((path, response.status_code))
-                    
-            except Exception:
-                continue
+        probes = self._submit([partial(self._request, "GET", urljoin(self.base_url, path)) for path in sensitive_paths])
+        for path, (response, failure) in zip(sensitive_paths, self._results(probes)):
+            if failure is None and response.status_code not in [404, 403]:
+                accessible_paths.append((path, response.status_code))
         
         if accessible_paths:
             details = "Accessible sensitive paths found: " + ", ".join([f"{path}({status})" for path, status in accessible_paths])
@@ -427,10 +621,10 @@ class SudwestEnergiePentester:
 
     def test_information_disclosure(self):
         """Test for information disclosure"""
-        print("\n🔍 Testing for Information Disclosure...")
+        self._print("\n🔍 Testing for Information Disclosure...")
         
         try:
-            response = self.session.get(self.base_url, timeout=self.timeout)
+            response = self._get_base()
             
             # Check for common information disclosure patterns
             content = response.text
@@ -477,15 +671,26 @@ class SudwestEnergiePentester:
         print(f"🚀 Starting Pentest for: {self.base_url}\n")
         print("="*60)
         
-        # Run all tests
-        self.check_security_headers()
-        self.test_xss_vulnerabilities()
-        self.test_sql_injection()
-        self.test_form_validation_bypass()
-        self.test_ninox_api_integration()
-        self.test_csrf_vulnerabilities()
-        self.test_directory_enumeration()
-        self.test_information_disclosure()
+        # Run all tests concurrently; requests share one pool sized for every host slot
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_per_host * 2, thread_name_prefix="pentest-request") as pool, \
+                ThreadPoolExecutor(max_workers=len(self.CHECKS), thread_name_prefix="pentest-check") as checks:
+            self._pool = pool
+            try:
+                fingerprint = self._target_fingerprint()
+                outputs = list(checks.map(partial(self._run_check, fingerprint=fingerprint), self.CHECKS))
+            finally:
+                self._pool = None
+                self._base_response = None
+        
+        # Report in check order, as a serial run would
+        for output in outputs:
+            for kind, item in output:
+                if kind == "print":
+                    print(item)
+                else:
+                    self._record(item)
+        self._update_history()
         
         # Print summary
         print("\n" + "="*60)
@@ -493,6 +698,7 @@ class SudwestEnergiePentester:
         print("="*60)
         summary = self.test_results["summary"]
         print(f"Target: {self.test_results['target']}")
+        print(f"Duration: {time.perf_counter() - started:.1f}s")
         print(f"Total tests: {summary['total_tests']}")
         print(f"Passed: {summary['passed_tests']}")
         print(f"Failed: {summary['failed_tests']}")
@@ -507,8 +713,124 @@ class SudwestEnergiePentester:
                 print(f"  {i}. {vuln['type']} ({vuln['severity'].upper()}) - {vuln['test']}")
                 print(f"     Details: {vuln['details'][:100]}...")
         
+        if self.diff is not None:
+            print("\nChanges since the last run:")
+            print(f"  New findings: {len(self.diff['new_findings'])}")
+            for result in self.diff["new_findings"]:
+                print(f"    + {result['name']} ({result['severity'].upper()})")
+            print(f"  Resolved findings: {len(self.diff['resolved_findings'])}")
+            for result in self.diff["resolved_findings"]:
+                print(f"    - {result['name']}")
+            print(f"  Changed findings: {len(self.diff['changed'])}")
+        
         print("="*60)
 
+    def _run_check(self, name: str, fingerprint: Optional[str] = None) -> List[Tuple[str, object]]:
+        """Run one check, or replay it from the cache, and return its console output and results"""
+        if name in self.UNCACHED_CHECKS:
+            fingerprint = None
+        key = self._check_key(name)
+        cached = self._cached_check(name, key, fingerprint)
+        if cached is not None:
+            output = [tuple(item) for item in cached["output"]]
+            output.insert(1, ("print", f"   (unchanged since {cached['completed']}, results from cache)"))
+            return output
+
+        self._local.output = []
+        try:
+            getattr(self, name)()
+            output = self._local.output
+        finally:
+            self._local.output = None
+        # Checks that could not reach the target are run again next time
+        unreachable = any(kind == "result" and item["vulnerability_type"] == "HTTP Error" for kind, item in output)
+        if fingerprint is not None and not unreachable:
+            self._store_check(name, key, fingerprint, output)
+        return output
+
+    def _target_fingerprint(self) -> Optional[str]:
+        """Fingerprint of the deployment under test, or None if it cannot be fetched"""
+        if not self.cache_file:
+            return None
+        try:
+            return response_fingerprint(self._get_base())
+        except Exception:
+            return None
+
+    def _check_key(self, name: str) -> str:
+        """Key of a check's code (payloads included) and the settings that shape its requests"""
+        try:
+            source = inspect.getsource(getattr(type(self), name))
+        except (OSError, TypeError):
+            source = name
+        settings = json.dumps([self.base_url, self.timeout, dict(self.session.headers)], sort_keys=True)
+        return hashlib.sha256(f"{source}\n{settings}".encode("utf-8")).hexdigest()
+
+    def _target_cache(self) -> Dict:
+        return self.cache["targets"].setdefault(self.base_url, {"checks": {}, "last_results": None})
+
+    def load_cache(self):
+        """Read the cache file; a missing, corrupt or outdated file starts an empty cache"""
+        if not self.cache_file:
+            return
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(cache, dict) and cache.get("version") == CACHE_VERSION:
+            self.cache = cache
+
+    def _save_cache(self):
+        """Write the cache atomically, so an interrupted run never leaves a broken file"""
+        temporary = f"{self.cache_file}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(self.cache, f, indent=2, ensure_ascii=False)
+        os.replace(temporary, self.cache_file)
+
+    def _cached_check(self, name: str, key: str, fingerprint: Optional[str]) -> Optional[Dict]:
+        if fingerprint is None:
+            return None
+        with self._lock:
+            entry = self._target_cache()["checks"].get(name)
+        if not entry or entry["key"] != key or entry["fingerprint"] != fingerprint:
+            return None
+        age = datetime.now() - datetime.fromisoformat(entry["completed"])
+        if age.total_seconds() > self.max_age_hours * 3600:
+            return None
+        return entry
+
+    def _store_check(self, name: str, key: str, fingerprint: str, output: List[Tuple[str, object]]):
+        """Persist a finished check right away, so that an interrupted run can resume"""
+        with self._lock:
+            self._target_cache()["checks"][name] = {
+                "key": key,
+                "fingerprint": fingerprint,
+                "completed": datetime.now().isoformat(timespec="seconds"),
+                "output": [list(item) for item in output],
+            }
+            self._save_cache()
+
+    def _update_history(self):
+        """Diff this run against the previous one and keep it for the next diff"""
+        if not self.cache_file:
+            return
+        with self._lock:
+            target = self._target_cache()
+            if target["last_results"] is not None:
+                self.diff = diff_results(target["last_results"], self.test_results["test_results"])
+            target["last_results"] = self.test_results["test_results"]
+            self._save_cache()
+
+    def save_diff(self, filename: str = "pentest_diff.json"):
+        """Save the changes since the last run to a file"""
+        if self.diff is None:
+            return
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump({"target": self.base_url, "time": datetime.now().isoformat(), **self.diff},
+                      f, indent=2, ensure_ascii=False)
+        print(f"Changes since the last run saved to {filename}")
+
     def save_results(self, filename: str = "pentest_results.json"):
         """Save pentest results to a file"""
         self.test_results["end_time"] = datetime.now().isoformat()
@@ -524,6 +846,12 @@ def main():
     parser.add_argument("--url", default="http://localhost:3000", help="Target website URL (default: http://localhost:3000)")
     parser.add_argument("--timeout", type=int, default=10, help="Request timeout in seconds (default: 10)")
     parser.add_argument("--output", default="pentest_results.json", help="Output file for results (default: pentest_results.json)")
+    parser.add_argument("--max-per-host", type=int, default=8, help="Concurrent requests per host (default: 8)")
+    parser.add_argument("--rate", type=float, default=100.0, help="Maximum requests per second, 0 for no limit (default: 100)")
+    parser.add_argument("--cache", default="pentest_cache.json", help="Check result cache (default: pentest_cache.json)")
+    parser.add_argument("--no-cache", action="store_true", help="Run every check and do not read or write the cache")
+    parser.add_argument("--max-age", type=float, default=168, help="Re-run cached checks older than this many hours (default: 168)")
+    parser.add_argument("--diff-output", default="pentest_diff.json", help="Output file for the changes since the last run (default: pentest_diff.json)")
     
     args = parser.parse_args()
     
@@ -546,9 +874,14 @@ def main():
         return
     
     # Initialize and run pentester
-    pentester = SudwestEnergiePentester(base_url=args.url, timeout=args.timeout)
+    pentester = SudwestEnergiePentester(base_url=args.url, timeout=args.timeout,
+                                        max_per_host=args.max_per_host, rate_limit=args.rate,
+                                        cache_file=None if args.no_cache else args.cache,
+                                        max_age_hours=args.max_age)
+    pentester.load_cache()
     pentester.run_all_tests()
     pentester.save_results(args.output)
+    pentester.save_diff(args.diff_output)
     
     print(f"\n✅ Pentest completed! Results saved to {args.output}")
 
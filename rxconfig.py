@@ -18,6 +18,8 @@ config = rx.Config(
     # Compression settings
     compress_response=True,
     # Other production settings
+    # sitemap.xml and robots.txt come from `python -m suedwestenergie.build seo`
+    disable_plugins=[rx.plugins.SitemapPlugin],
     admin_dash=rx.AdminDash(
         # Optional: Add admin dash if needed
     ),
@@ -0,0 +1,14 @@
+"""Build steps that run ahead of deployment
+
+Run as ``python -m suedwestenergie.build <step>``.
+"""
+
+from . import bundle
+from . import css_report
+from . import fonts
+from . import images
+from . import precompress
+from . import seo
+from . import static_export
+
+__all__ = ["bundle", "css_report", "fonts", "images", "precompress", "seo", "static_export"]
@@ -0,0 +1,137 @@
+"""Command line entry point for the build steps"""
+
+import argparse
+import json
+import os
+import sys
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m suedwestenergie.build", description="Südwest-Energie build steps")
+    steps = parser.add_subparsers(dest="step", required=True)
+
+    static = steps.add_parser("static", help="Export the content-only pages as static HTML")
+    static.add_argument("--out", default="static_pages", help="Output directory (default: static_pages)")
+
+    seo = steps.add_parser("seo", help="Write sitemap.xml, robots.txt and 404 handling for unknown paths")
+    seo.add_argument("--out", default="static_pages", help="Output directory (default: static_pages)")
+    seo.add_argument("--site-url", default=None, help="Canonical origin (default: SITE_URL)")
+
+    images = steps.add_parser("images", help="Build responsive AVIF/WebP variants of the images in public/")
+    images.add_argument("--source", default="public", help="Directory with the original images (default: public)")
+    images.add_argument("--out", default="assets/img", help="Output directory (default: assets/img)")
+
+    fonts = steps.add_parser("fonts", help="Subset the vendored Inter fonts to self-hosted WOFF2")
+    fonts.add_argument("--vendor", default="vendor/fonts/inter", help="Directory with the vendored TTFs")
+    fonts.add_argument("--out", default="assets/fonts", help="Output directory (default: assets/fonts)")
+    fonts.add_argument("--require", action="store_true", help="Fail unless every face is vendored (production builds)")
+
+    css = steps.add_parser("css", help="Report the CSS weight of every landing page section")
+    css.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    pre = steps.add_parser("precompress", help="Unpack frontend.zip with .gz/.br siblings and an nginx include")
+    pre.add_argument("--source", default="frontend.zip", help="Export zip or directory (default: frontend.zip)")
+    pre.add_argument("--out", default="frontend_static", help="Output directory (default: frontend_static)")
+    pre.add_argument("--brotli-static", action="store_true", help="Emit brotli_static (nginx built with ngx_brotli)")
+
+    bundle = steps.add_parser("bundle", help="Run reflex export and check the bundle against the size budget")
+    bundle.add_argument("--source", default="frontend.zip", help="Export zip or directory (default: frontend.zip)")
+    bundle.add_argument("--no-export", action="store_true", help="Analyze the existing export instead of running reflex export")
+    bundle.add_argument("--budget", default="benchmarks/bundle_budget.json", help="Budget file")
+    bundle.add_argument("--threshold", type=float, default=None, help="Allowed growth per route (default: from the budget)")
+    bundle.add_argument("--update-budget", action="store_true", help="Write the current sizes as the new budget")
+    bundle.add_argument("--json", action="store_true", help="Print the full report as JSON")
+
+    args = parser.parse_args()
+
+    if args.step == "images":
+        from suedwestenergie.build.images import build
+
+        manifest = build(args.source, args.out)
+        for src, entry in manifest.items():
+            print(f"{src} ({entry['width']}x{entry['height']})")
+            for fmt, variants in entry["variants"].items():
+                sizes = ", ".join(f"{width}w {size // 1024 or 1} KiB" for width, _, size in variants)
+                print(f"  {fmt:<5} {sizes}")
+    elif args.step == "fonts":
+        from suedwestenergie.build.fonts import build
+
+        manifest = build(args.vendor, args.out, require=args.require)
+        if not manifest:
+            print(f"No vendored fonts in {args.vendor}; the site uses the fallback face "
+                  f"(Inter from Google Fonts in development)")
+        for face in manifest.get("faces", []):
+            print(f"{manifest['family']} {face['weight']:<4} {face['url']:<40} {face['bytes']:>7} bytes")
+    elif args.step == "css":
+        from suedwestenergie.build.css_report import report
+
+        result = report()
+        if args.json:
+            print(json.dumps(result, indent=2))
+            return 0
+        print(f"{'section':<16} {'elements':>8} {'styled':>7} {'emotion':>9} {'static':>8} {'rules':>6}")
+        for name, counts in result["sections"].items():
+            print(f"{name:<16} {counts['elements']:>8} {counts['styled']:>7} {counts['emotion_bytes']:>9} "
+                  f"{counts['static_bytes']:>8} {counts['static_rules']:>6}")
+        print(f"Critical CSS (inlined in <head>): {result['critical_bytes']} bytes")
+    elif args.step == "precompress":
+        from suedwestenergie.build.precompress import build
+
+        totals = build(args.source, args.out, brotli_static=args.brotli_static)
+        print(f"Compressible files: {totals['raw']:>9} bytes")
+        print(f"gzip -9:            {totals['.gz']:>9} bytes")
+        print(f"brotli q11:         {totals['.br']:>9} bytes")
+    elif args.step == "bundle":
+        from suedwestenergie.build import bundle as budget_check
+
+        source = args.source
+        if not args.no_export:
+            source = budget_check.export_frontend(os.path.dirname(os.path.abspath(source)))
+        result = budget_check.analyze(source)
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            print(f"{'chunk':<40} {'raw':>9} {'gzip':>9} {'brotli':>9}")
+            for name, size in result["chunks"].items():
+                print(f"{name:<40} {size['raw']:>9} {size['gzip']:>9} {size['brotli'] or '-':>9}")
+            print()
+            print(f"{'route':<16} {'js gzip':>9} {'css gzip':>9} {'html gzip':>9} {'gzip':>9} {'brotli':>9}")
+            for route, entry in result["routes"].items():
+                print(f"{route:<16} {entry['js'].get('gzip', 0):>9} {entry['css'].get('gzip', 0):>9} "
+                      f"{entry['html']['gzip']:>9} {entry['total']['gzip']:>9} {entry['total']['brotli'] or '-':>9}")
+        if args.update_budget:
+            threshold = args.threshold if args.threshold is not None else budget_check.THRESHOLD
+            budget_check.write_budget(budget_check.budget_from(result, threshold, budget_check.provenance()),
+                                      args.budget)
+            print(f"Budget written to {args.budget}")
+            return 0
+        budget = budget_check.load_budget(args.budget)
+        for warning in budget_check.budget_warnings(budget, budget_check.provenance()):
+            print(f"WARNING {warning}; regenerate it with --update-budget from a fresh reflex export")
+        failures = budget_check.check(result, budget, args.threshold)
+        for failure in failures:
+            print(f"FAILED {failure}")
+        if failures:
+            print("Regenerate the budget with --update-budget from a reflex export of this tree if the sizes are intended")
+            return 1
+        print("All routes within budget")
+    elif args.step == "seo":
+        from suedwestenergie.build.seo import NOINDEX_ROUTES, build
+
+        for route, entry in build(args.out, args.site_url).items():
+            note = "  (noindex)" if route in NOINDEX_ROUTES else ""
+            print(f"/{route if route != 'index' else '':<15} lastmod {entry['lastmod']}{note}")
+    elif args.step == "static":
+        from suedwestenergie.build.static_export import export
+
+        manifest = export(args.out)
+        for route, page in manifest["pages"].items():
+            print(f"{route:<16} {page['file']:<32} {page['bytes']:>7} bytes")
+        print(f"Stylesheet: {manifest['stylesheet']}")
+        if "not_found" in manifest:
+            print(f"Error page: {manifest['not_found']['file']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Frontend bundle size budget
+
+Runs ``reflex export --frontend-only`` and weighs the result: every JS and
+CSS chunk raw, gzipped (level 9) and brotli-compressed (quality 11), and
+every route as the sum of its HTML document and the scripts and
+stylesheets it loads. The route totals are compared against the committed
+budget in ``benchmarks/bundle_budget.json``; a route whose gzip or brotli
+size grows by more than the threshold fails the check.
+
+Chunk file names carry a content hash, so chunks are keyed by their name
+with the hash removed.
+
+A budget records the commit and the Reflex version of the export it was
+taken from. A budget without a commit was never measured on an export of
+the tree, so the check fails on it; a different Reflex version only warns.
+"""
+
+import gzip
+import json
+import os
+import re
+import subprocess
+import zipfile
+from importlib import metadata
+from typing import Any, Dict, List, Optional
+
+BUDGET_PATH = os.path.join("benchmarks", "bundle_budget.json")
+EXPORT_ZIP = "frontend.zip"
+
+# Allowed growth of a route before the check fails
+THRESHOLD = 0.05
+
+_HASH = re.compile(r"-[A-Za-z0-9_-]{8}(?=\.(?:js|css)$)")
+_REFERENCE = re.compile(r'(?:href|src)="(/assets/[^"]+\.(?:js|css))"')
+
+
+class BundleBudgetError(Exception):
+    """Raised when the frontend cannot be exported or analyzed"""
+
+
+def export_frontend(dest_dir: str = ".") -> str:
+    """Run ``reflex export --frontend-only`` and return the path of the zip"""
+    try:
+        subprocess.run(["reflex", "export", "--frontend-only", "--zip-dest-dir", dest_dir], check=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise BundleBudgetError(f"reflex export failed: {e}") from e
+    return os.path.join(dest_dir, EXPORT_ZIP)
+
+
+def _read_files(source: str) -> Dict[str, bytes]:
+    """Files of an export, from the zip or an unpacked directory"""
+    if not os.path.exists(source):
+        raise BundleBudgetError(f"No frontend export at {source}")
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            return {name: archive.read(name) for name in archive.namelist() if not name.endswith("/")}
+    files = {}
+    for root, _, names in os.walk(source):
+        for name in names:
+            path = os.path.join(root, name)
+            with open(path, "rb") as f:
+                files[os.path.relpath(path, source).replace(os.sep, "/")] = f.read()
+    return files
+
+
+def sizes(data: bytes) -> Dict[str, Optional[int]]:
+    """Raw, gzip and brotli size of a file; brotli is None without the brotli package"""
+    try:
+        import brotli
+        brotli_size = len(brotli.compress(data, quality=11))
+    except ImportError:
+        brotli_size = None
+    return {"raw": len(data), "gzip": len(gzip.compress(data, compresslevel=9, mtime=0)), "brotli": brotli_size}
+
+
+def chunk_name(path: str) -> str:
+    """Stable name of a hashed chunk, e.g. ``assets/entry.client-C0kq-89h.js`` -> ``entry.client.js``"""
+    return _HASH.sub("", os.path.basename(path))
+
+
+def _add(total: Dict[str, Optional[int]], part: Dict[str, Optional[int]]) -> None:
+    for key, value in part.items():
+        total[key] = None if value is None or total.get(key, 0) is None else total.get(key, 0) + value
+
+
+def analyze(source: str = EXPORT_ZIP) -> Dict[str, Any]:
+    """
+    Weigh an exported frontend
+
+    Args:
+        source: ``frontend.zip`` or an unpacked export directory
+
+    Returns:
+        ``{"chunks": {name: sizes}, "routes": {route: {"assets", "js", "css", "html", "total"}}}``
+    """
+    files = _read_files(source)
+    chunk_sizes = {path: sizes(data) for path, data in files.items() if path.endswith((".js", ".css"))}
+
+    routes: Dict[str, Any] = {}
+    for path, data in sorted(files.items()):
+        # Top-level documents only; route/index.html are duplicates for trailing-slash URLs
+        if "/" in path or not path.endswith(".html") or path == "__spa-fallback.html":
+            continue
+        route = "/" if path == "index.html" else "/" + path[:-len(".html")]
+        assets = sorted({ref.lstrip("/") for ref in _REFERENCE.findall(data.decode("utf-8", "replace"))})
+        entry = {"assets": [chunk_name(a) for a in assets], "js": {}, "css": {}, "html": sizes(data)}
+        for asset in assets:
+            if asset in chunk_sizes:
+                _add(entry["js" if asset.endswith(".js") else "css"], chunk_sizes[asset])
+        entry["total"] = {}
+        for part in (entry["js"], entry["css"], entry["html"]):
+            _add(entry["total"], part)
+        routes[route] = entry
+
+    return {
+        "chunks": {chunk_name(path): value for path, value in sorted(chunk_sizes.items())},
+        "routes": routes,
+    }
+
+
+def provenance() -> Dict[str, Optional[str]]:
+    """Commit and Reflex version of the tree being exported; None where unknown"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    try:
+        reflex_version = metadata.version("reflex")
+    except metadata.PackageNotFoundError:
+        reflex_version = None
+    return {"commit": commit, "reflex": reflex_version}
+
+
+def budget_from(report: Dict[str, Any], threshold: float = THRESHOLD,
+                generated_from: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
+    """A budget that allows the routes of ``report`` to grow by ``threshold``"""
+    budget: Dict[str, Any] = {"threshold": threshold}
+    if generated_from is not None:
+        budget["generated_from"] = generated_from
+    budget["routes"] = {route: {key: entry["total"][key] for key in ("gzip", "brotli")}
+                        for route, entry in report["routes"].items()}
+    return budget
+
+
+def budget_warnings(budget: Dict[str, Any], current: Dict[str, Optional[str]]) -> List[str]:
+    """Reasons to distrust a measured budget: taken with another Reflex version"""
+    generated_from = budget.get("generated_from") or {}
+    if generated_from.get("commit") and current.get("reflex") and generated_from.get("reflex") != current["reflex"]:
+        return [f"the budget was taken with Reflex {generated_from.get('reflex')}, this export uses {current['reflex']}"]
+    return []
+
+
+def check(report: Dict[str, Any], budget: Dict[str, Any], threshold: Optional[float] = None) -> List[str]:
+    """
+    Compare route sizes against the budget
+
+    Returns:
+        One message per route and encoding that grew by more than the threshold,
+        or that is new and has no budget yet, and one if the budget was never
+        measured on an export
+    """
+    if threshold is None:
+        threshold = budget.get("threshold", THRESHOLD)
+    failures = []
+    if not (budget.get("generated_from") or {}).get("commit"):
+        failures.append("the budget does not record the export it was taken from")
+    for route, entry in report["routes"].items():
+        limits = budget["routes"].get(route)
+        if limits is None:
+            failures.append(f"{route}: not in the budget")
+            continue
+        for key in ("gzip", "brotli"):
+            size, limit = entry["total"].get(key), limits.get(key)
+            if size is None or limit is None:
+                continue
+            if size > limit * (1 + threshold):
+                failures.append(f"{route}: {key} {size} bytes exceeds budget {limit} by "
+                                f"{(size / limit - 1) * 100:.1f}% (allowed {threshold * 100:.0f}%)")
+    return failures
+
+
+def load_budget(path: str = BUDGET_PATH) -> Dict[str, Any]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        raise BundleBudgetError(f"Cannot read bundle budget {path}: {e}") from e
+
+
+def write_budget(budget: Dict[str, Any], path: str = BUDGET_PATH) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(budget, f, indent=2)
+        f.write("\n")
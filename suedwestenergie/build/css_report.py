@@ -0,0 +1,82 @@
+"""
+CSS weight per section
+
+Reflex ships component styles as Emotion ``css`` props inside the page
+bundle. This report shows, for the navbar, the footer and every section of
+the landing page, how many elements carry styles, how many bytes of ``css``
+props end up in the bundle and how large the same styles are as deduplicated
+static rules. Above-the-fold sections that go through ``critical_styles``
+carry no ``css`` props; their weight shows up in the critical CSS total.
+"""
+
+import inspect
+from typing import Any, Callable, Dict, List, Tuple
+
+import reflex as rx
+
+from suedwestenergie.components.critical import _compile_styles
+from suedwestenergie.components.static_css import StyleSheet
+
+
+def _sections() -> List[Tuple[str, Callable[[], rx.Component]]]:
+    from suedwestenergie.components import footer, navbar
+    from suedwestenergie.sections import (
+        about_section,
+        benefits_section,
+        contact_section,
+        hero_section,
+        service_models_section,
+        services_section,
+    )
+
+    return [
+        ("navbar", navbar),
+        ("hero", hero_section),
+        ("service_models", service_models_section),
+        ("benefits", benefits_section),
+        ("about", about_section),
+        ("services", services_section),
+        ("contact", contact_section),
+        ("footer", footer),
+    ]
+
+
+def _css_props(rendered: Dict[str, Any], counts: Dict[str, int]) -> None:
+    counts["elements"] += 1
+    for prop in rendered.get("props", []):
+        if isinstance(prop, str) and prop.startswith("css:"):
+            counts["styled"] += 1
+            counts["emotion_bytes"] += len(prop.encode("utf-8"))
+    for child in rendered.get("children", []):
+        if isinstance(child, dict):
+            _css_props(child, counts)
+
+
+def section_weight(factory: Callable[[], rx.Component]) -> Dict[str, int]:
+    """CSS weight of one section factory"""
+    component = factory()
+    counts = {"elements": 0, "styled": 0, "emotion_bytes": 0}
+    _css_props(component.render(), counts)
+
+    # Weigh the styles as written, also for factories already compiled to critical CSS
+    sheet = StyleSheet()
+    _compile_styles(inspect.unwrap(factory)(), sheet)
+    static_css = sheet.stylesheet()
+    counts["static_rules"] = len(sheet._rules)
+    counts["static_bytes"] = len(static_css.encode("utf-8"))
+    return counts
+
+
+def report() -> Dict[str, Any]:
+    """
+    Weigh every landing page section
+
+    Returns:
+        ``{"sections": {name: counts}, "critical_bytes": int}``
+    """
+    from suedwestenergie.components.critical import critical_css
+
+    return {
+        "sections": {name: section_weight(factory) for name, factory in _sections()},
+        "critical_bytes": len(critical_css().encode("utf-8")),
+    }
@@ -0,0 +1,168 @@
+"""
+Subsetted, self-hosted web fonts
+
+Reads the vendored Inter TTFs from ``vendor/fonts/inter/``, subsets each
+weight to Latin/German plus every character the pages render, and writes
+content-hashed WOFF2 files and a manifest to ``assets/fonts/``. The app
+inlines the matching @font-face rules and preloads the body and heading
+weights (see ``suedwestenergie.components.fonts``), so no request leaves
+our origin for fonts.
+
+Requires fontTools with WOFF2 support (``pip install fonttools[woff]``).
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+VENDOR_DIR = os.path.join("vendor", "fonts", "inter")
+OUTPUT_DIR = os.path.join("assets", "fonts")
+URL_PREFIX = "/fonts"
+MANIFEST = "manifest.json"
+
+FAMILY = "Inter"
+# Weight and vendored file of every face the site uses
+FACES = (
+    (400, "Inter-Regular.ttf"),
+    (500, "Inter-Medium.ttf"),
+    (600, "Inter-SemiBold.ttf"),
+    (700, "Inter-Bold.ttf"),
+)
+
+# Basic Latin, Latin-1 Supplement (umlauts, ß, §, ©, accented names),
+# dashes, German quotes, bullet, ellipsis and the euro sign
+BASE_RANGES = (
+    (0x0020, 0x007E),
+    (0x00A0, 0x00FF),
+    (0x2013, 0x2014),
+    (0x2018, 0x201E),
+    (0x2022, 0x2022),
+    (0x2026, 0x2026),
+    (0x20AC, 0x20AC),
+)
+
+# OpenType features worth keeping for body text and figures
+LAYOUT_FEATURES = ["kern", "liga", "calt", "ccmp", "locl", "mark", "mkmk", "tnum", "case"]
+
+
+class FontBuildError(Exception):
+    """Raised when the fonts cannot be built"""
+
+
+def base_codepoints() -> Set[int]:
+    return {cp for start, end in BASE_RANGES for cp in range(start, end + 1)}
+
+
+def page_codepoints() -> Set[int]:
+    """Every character rendered as literal text or placeholder on any page"""
+    from suedwestenergie.suedwestenergie import app
+
+    text: List[str] = []
+
+    def walk(component):
+        contents = getattr(component, "contents", None)
+        for value in (contents, getattr(component, "placeholder", None)):
+            literal = getattr(value, "_var_value", None)
+            if isinstance(literal, str):
+                text.append(literal)
+        for child in getattr(component, "children", []):
+            walk(child)
+
+    for page in app._unevaluated_pages.values():
+        walk(page.component())
+    return {ord(char) for char in "".join(text)}
+
+
+def unicode_range(codepoints: Iterable[int]) -> str:
+    """Compress codepoints into a CSS unicode-range value"""
+    ranges: List[Tuple[int, int]] = []
+    for cp in sorted(set(codepoints)):
+        if ranges and cp == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], cp)
+        else:
+            ranges.append((cp, cp))
+    return ", ".join(f"U+{a:X}" if a == b else f"U+{a:X}-{b:X}" for a, b in ranges)
+
+
+def _subset(path: str, codepoints: Set[int]) -> Tuple[bytes, Set[int]]:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = LAYOUT_FEATURES
+    options.hinting = False
+    options.desubroutinize = True
+    options.name_IDs = [1, 2]  # Family and subfamily only
+
+    font = TTFont(path)
+    covered = codepoints & set(font.getBestCmap())
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=covered)
+    subsetter.subset(font)
+
+    buffer = io.BytesIO()
+    font.flavor = "woff2"
+    font.save(buffer)
+    return buffer.getvalue(), covered
+
+
+def build(vendor_dir: str = VENDOR_DIR, out_dir: str = OUTPUT_DIR, codepoints: Set[int] = None,
+          require: bool = False) -> Dict[str, Any]:
+    """
+    Subset the vendored faces to WOFF2
+
+    Args:
+        vendor_dir: Directory with the vendored TTFs
+        out_dir: Directory that is served at ``URL_PREFIX``
+        codepoints: Characters to keep (default: base ranges plus page text)
+        require: Raise FontBuildError unless every face is vendored
+
+    Returns:
+        The manifest; empty if no vendored fonts are present
+    """
+    available = [(weight, name) for weight, name in FACES if os.path.exists(os.path.join(vendor_dir, name))]
+    if require and len(available) < len(FACES):
+        missing = sorted(set(name for _, name in FACES) - set(name for _, name in available))
+        raise FontBuildError(f"Missing vendored fonts in {vendor_dir}: {', '.join(missing)} "
+                             f"(see {os.path.join(VENDOR_DIR, 'README.md')})")
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    if not available:
+        # Without the vendored copy the app uses the fallback face (Google Fonts in development)
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+        return {}
+
+    try:
+        import fontTools.subset  # noqa: F401
+        import brotli  # noqa: F401
+    except ImportError as e:
+        raise FontBuildError("fontTools with WOFF2 support is required: pip install fonttools[woff]") from e
+
+    if codepoints is None:
+        codepoints = base_codepoints() | page_codepoints()
+
+    os.makedirs(out_dir, exist_ok=True)
+    faces = []
+    covered_all: Set[int] = set()
+    written = {MANIFEST}
+    for weight, name in available:
+        data, covered = _subset(os.path.join(vendor_dir, name), codepoints)
+        covered_all |= covered
+        file_name = f"{FAMILY.lower()}-{weight}.{hashlib.sha256(data).hexdigest()[:10]}.woff2"
+        with open(os.path.join(out_dir, file_name), "wb") as f:
+            f.write(data)
+        written.add(file_name)
+        faces.append({"weight": weight, "style": "normal", "url": f"{URL_PREFIX}/{file_name}", "bytes": len(data)})
+
+    for name in os.listdir(out_dir):
+        if name not in written and re.search(r"\.[0-9a-f]{10}\.woff2$", name):
+            os.remove(os.path.join(out_dir, name))
+
+    manifest = {"family": FAMILY, "unicode_range": unicode_range(covered_all), "faces": faces}
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
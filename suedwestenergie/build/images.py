@@ -0,0 +1,112 @@
+"""
+Responsive image variants
+
+Every raster image in ``public/`` is resized to a ladder of widths and
+encoded as AVIF, WebP and its original format. File names carry a content
+hash so they can be cached forever. ``assets/img/manifest.json`` records
+the intrinsic size and the variants of each source; the ``image`` component
+reads it to emit ``<picture>`` sources with ``srcset``/``sizes`` and
+``width``/``height`` attributes.
+
+Requires Pillow (AVIF needs Pillow >= 11.3 or the pillow-avif-plugin).
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+from typing import Any, Dict, List
+
+SOURCE_DIR = "public"
+OUTPUT_DIR = os.path.join("assets", "img")
+URL_PREFIX = "/img"
+MANIFEST = "manifest.json"
+
+# Candidate widths in pixels; widths above the source width are skipped
+WIDTHS = (96, 192, 320, 480, 640, 960, 1280, 1920)
+
+EXTENSIONS = {".jpg": "jpeg", ".jpeg": "jpeg", ".png": "png"}
+ENCODERS = {
+    "avif": {"quality": 50},
+    "webp": {"quality": 78, "method": 6},
+    "jpeg": {"quality": 82, "optimize": True, "progressive": True},
+    "png": {"optimize": True},
+}
+FILE_EXTENSIONS = {"avif": "avif", "webp": "webp", "jpeg": "jpg", "png": "png"}
+
+
+class ImageBuildError(Exception):
+    """Raised when the image variants cannot be built"""
+
+
+def _encode(image, fmt: str) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt.upper(), **ENCODERS[fmt])
+    return buffer.getvalue()
+
+
+def build(source_dir: str = SOURCE_DIR, out_dir: str = OUTPUT_DIR) -> Dict[str, Any]:
+    """
+    Build all image variants
+
+    Args:
+        source_dir: Directory with the original images
+        out_dir: Directory that is served at ``URL_PREFIX``
+
+    Returns:
+        The manifest, keyed by the public URL of the original image
+    """
+    try:
+        from PIL import Image, features
+    except ImportError as e:
+        raise ImageBuildError("Pillow is required for the image pipeline: pip install Pillow") from e
+
+    formats = [fmt for fmt in ("avif", "webp") if features.check(fmt)]
+    os.makedirs(out_dir, exist_ok=True)
+
+    manifest: Dict[str, Any] = {}
+    written = {MANIFEST}
+    for name in sorted(os.listdir(source_dir)):
+        stem, extension = os.path.splitext(name)
+        fallback = EXTENSIONS.get(extension.lower())
+        if fallback is None:
+            continue
+
+        with Image.open(os.path.join(source_dir, name)) as original:
+            original.load()
+            has_alpha = original.mode in ("RGBA", "LA") or "transparency" in original.info
+            source = original.convert("RGBA" if has_alpha else "RGB")
+
+        variants: Dict[str, List[List[Any]]] = {}
+        widths = [w for w in WIDTHS if w < source.width] + [source.width]
+        for fmt in formats + [fallback]:
+            variants[fmt] = []
+            for width in widths:
+                height = round(source.height * width / source.width)
+                resized = source if width == source.width else source.resize((width, height), Image.LANCZOS)
+                data = _encode(resized, fmt)
+                digest = hashlib.sha256(data).hexdigest()[:10]
+                file_name = f"{stem}.{width}.{digest}.{FILE_EXTENSIONS[fmt]}"
+                path = os.path.join(out_dir, file_name)
+                if not os.path.exists(path):
+                    with open(path, "wb") as f:
+                        f.write(data)
+                written.add(file_name)
+                variants[fmt].append([width, f"{URL_PREFIX}/{file_name}", len(data)])
+
+        manifest[f"/{name}"] = {
+            "width": source.width,
+            "height": source.height,
+            "fallback": fallback,
+            "variants": variants,
+        }
+
+    # Drop variants of previous builds
+    for name in os.listdir(out_dir):
+        if name not in written and re.search(r"\.\d+\.[0-9a-f]{10}\.\w+$", name):
+            os.remove(os.path.join(out_dir, name))
+
+    with open(os.path.join(out_dir, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
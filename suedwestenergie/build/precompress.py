@@ -0,0 +1,145 @@
+"""
+Precompressed frontend assets
+
+Unpacks the ``reflex export`` output (``frontend.zip``) and writes a
+maximally compressed ``.gz`` (gzip -9) and ``.br`` (brotli q11) sibling next
+to every compressible file, so nginx serves them with ``gzip_static`` /
+``brotli_static`` instead of compressing each response on the fly. The
+generated ``frontend.conf`` include serves the content-hashed files
+(``/assets/``, ``/img/``, ``/fonts/``) straight from disk with
+``Cache-Control: immutable``; everything else is still proxied to the app.
+
+``brotli_static`` needs the ngx_brotli module, which the stock nginx image
+lacks, so it is only emitted on request. The ``.br`` files are always
+written.
+"""
+
+import gzip
+import os
+import shutil
+import zipfile
+from typing import Dict, Iterable
+
+OUTPUT_DIR = "frontend_static"
+NGINX_ROOT = "/usr/share/nginx/frontend"
+INCLUDE = "frontend.conf"
+
+# Already compressed formats (images, WOFF2, zip) are left alone
+COMPRESSIBLE = (".html", ".js", ".mjs", ".css", ".json", ".svg", ".xml", ".txt", ".map", ".webmanifest", ".ico")
+
+# URL prefixes whose file names carry a content hash
+HASHED_PREFIXES = ("assets", "img", "fonts")
+
+
+class PrecompressError(Exception):
+    """Raised when the frontend export cannot be precompressed"""
+
+
+def _compressed(data: bytes) -> Dict[str, bytes]:
+    variants = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    try:
+        import brotli
+    except ImportError as e:
+        raise PrecompressError("The brotli package is required: pip install brotli") from e
+    variants[".br"] = brotli.compress(data, quality=11, lgwin=24)
+    return variants
+
+
+def precompress(root: str, extensions: Iterable[str] = COMPRESSIBLE) -> Dict[str, int]:
+    """
+    Write ``.gz`` and ``.br`` siblings for every compressible file under ``root``
+
+    Siblings that would not be smaller than the original are removed, so
+    nginx falls back to the uncompressed file. Files whose siblings are newer
+    than themselves are not compressed again.
+
+    Returns:
+        Total bytes of the originals and of each encoding
+    """
+    extensions = tuple(extensions)
+    totals = {"raw": 0, ".gz": 0, ".br": 0}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            if not name.endswith(extensions):
+                continue
+            path = os.path.join(directory, name)
+            totals["raw"] += os.path.getsize(path)
+            mtime = os.path.getmtime(path)
+            siblings = {suffix: path + suffix for suffix in (".gz", ".br")}
+            if all(os.path.exists(p) and os.path.getmtime(p) >= mtime for p in siblings.values()):
+                for suffix, sibling in siblings.items():
+                    totals[suffix] += os.path.getsize(sibling)
+                continue
+
+            with open(path, "rb") as f:
+                data = f.read()
+            for suffix, compressed in _compressed(data).items():
+                if len(compressed) >= len(data):
+                    if os.path.exists(siblings[suffix]):
+                        os.remove(siblings[suffix])
+                    totals[suffix] += len(data)
+                    continue
+                with open(siblings[suffix], "wb") as f:
+                    f.write(compressed)
+                totals[suffix] += len(compressed)
+    return totals
+
+
+def nginx_include(root: str = NGINX_ROOT, brotli_static: bool = False) -> str:
+    """nginx locations that serve the hashed frontend files from disk"""
+    prefixes = "|".join(HASHED_PREFIXES)
+    lines = [
+        "# Generated by `python -m suedwestenergie.build precompress` - do not edit.",
+        f"location ~ ^/({prefixes})/ {{",
+        f"    root {root};",
+        "    gzip_static on;",
+    ]
+    if brotli_static:
+        lines.append("    brotli_static on;")
+    lines += [
+        "    expires 1y;",
+        '    add_header Cache-Control "public, max-age=31536000, immutable";',
+        # add_header here replaces the server-level headers for this location
+        '    add_header X-Content-Type-Options "nosniff" always;',
+        "    try_files $uri =404;",
+        "}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def build(source: str = "frontend.zip", out_dir: str = OUTPUT_DIR, nginx_root: str = NGINX_ROOT,
+          brotli_static: bool = False) -> Dict[str, int]:
+    """
+    Unpack the frontend export, precompress it and write the nginx include
+
+    Args:
+        source: ``frontend.zip`` or an unpacked export directory
+        out_dir: Output directory (mounted into the nginx container)
+        nginx_root: Path of ``out_dir`` inside the nginx container
+        brotli_static: Emit ``brotli_static on`` (requires ngx_brotli)
+
+    Returns:
+        Total bytes of the originals and of each encoding
+    """
+    if not os.path.exists(source):
+        raise PrecompressError(f"No frontend export at {source}; run reflex export --frontend-only first")
+
+    # Replace the previous build; old hashed files are not referenced any more
+    if os.path.isdir(out_dir):
+        for name in os.listdir(out_dir):
+            path = os.path.join(out_dir, name)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+    os.makedirs(out_dir, exist_ok=True)
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            archive.extractall(out_dir)
+    else:
+        shutil.copytree(source, out_dir, dirs_exist_ok=True)
+
+    totals = precompress(out_dir)
+    with open(os.path.join(out_dir, INCLUDE), "w", encoding="utf-8") as f:
+        f.write(nginx_include(nginx_root, brotli_static))
+    return totals
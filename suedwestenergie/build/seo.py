@@ -0,0 +1,144 @@
+"""
+sitemap.xml, robots.txt and 404 handling for crawlers
+
+Walks the routes registered with ``app.add_page`` and writes
+``sitemap.xml`` and ``robots.txt`` next to the static pages, plus an nginx
+include that serves both and answers unknown page paths with the exported
+404 page instead of proxying them to the app.
+
+``lastmod`` of a route only moves when its rendered content changes: the
+fingerprint and date of every route are kept in ``seo.json`` between
+builds.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from suedwestenergie.build.static_export import NGINX_ROOT, NOT_FOUND_ROUTE
+
+# Registered routes that crawlers should not index
+NOINDEX_ROUTES = ("danke", "status")
+
+# Paths the app serves besides the pages: the Reflex backend endpoints and the admin dashboard
+APP_PATHS = ("ping", "_event", "_upload", "auth-codespace", "_health", "_all_routes", "admin")
+
+STATE_FILE = "seo.json"
+INCLUDE = "seo.conf"
+
+
+def _path(route: str) -> str:
+    return "/" if route == "index" else f"/{route.strip('/')}"
+
+
+def page_routes() -> List[str]:
+    """Routes registered with ``app.add_page``, without the 404 page"""
+    from suedwestenergie.suedwestenergie import app
+
+    return [route for route in app._unevaluated_pages if route != NOT_FOUND_ROUTE]
+
+
+def route_fingerprint(route: str) -> str:
+    """Hash of the rendered page and its meta data"""
+    from suedwestenergie.suedwestenergie import app
+
+    page = app._unevaluated_pages[route]
+    rendered = "\n".join(str(part) for part in (page.component(), page.title, page.description, page.image))
+    return hashlib.sha256(rendered.encode("utf-8")).hexdigest()[:16]
+
+
+def sitemap_xml(urls: Iterable[Tuple[str, str]]) -> str:
+    """Sitemap for ``(loc, lastmod)`` pairs"""
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">']
+    for loc, lastmod in urls:
+        lines.append(f"  <url><loc>{escape(loc)}</loc><lastmod>{lastmod}</lastmod></url>")
+    lines.append("</urlset>")
+    return "\n".join(lines) + "\n"
+
+
+def robots_txt(site_url: str, disallow: Iterable[str]) -> str:
+    lines = ["User-agent: *"]
+    lines += [f"Disallow: {path}" for path in disallow]
+    lines += ["", f"Sitemap: {site_url}/sitemap.xml"]
+    return "\n".join(lines) + "\n"
+
+
+def nginx_include(routes: Iterable[str], root: str = NGINX_ROOT) -> str:
+    """
+    Serve sitemap.xml and robots.txt, and 404 extension-less paths that are no page
+
+    Paths with a file extension still reach the app (or the static asset
+    locations), which answers them itself.
+    """
+    known = "|".join(sorted(re.escape(route) for route in routes if route != "index"))
+    app_paths = "|".join(re.escape(path) for path in APP_PATHS)
+    return "\n".join([
+        "# Generated by `python -m suedwestenergie.build seo` - do not edit.",
+        "location = /sitemap.xml {",
+        f"    root {root};",
+        "    gzip_static on;",
+        "    expires 1h;",
+        "}",
+        "location = /robots.txt {",
+        f"    root {root};",
+        "    expires 1h;",
+        "}",
+        f'location ~ "^/(?!(?:{known})?/?$)(?!(?:{app_paths})(?:/|$))[^.]*$" {{',
+        "    return 404;",
+        "}",
+    ]) + "\n"
+
+
+def build(out_dir: str = "static_pages", site_url: Optional[str] = None, nginx_root: str = NGINX_ROOT,
+          today: Optional[datetime.date] = None) -> Dict[str, Dict[str, str]]:
+    """
+    Write sitemap.xml, robots.txt and the nginx include
+
+    Args:
+        out_dir: Output directory (the static pages directory mounted into nginx)
+        site_url: Canonical origin (default: ``Config.SITE_URL``)
+        nginx_root: Path of ``out_dir`` inside the nginx container
+        today: Date used as lastmod for changed routes
+
+    Returns:
+        Fingerprint and lastmod of every registered route
+    """
+    from suedwestenergie.build.precompress import precompress
+    from suedwestenergie.config import Config
+
+    site_url = (site_url or Config.SITE_URL).rstrip("/")
+    today = (today or datetime.date.today()).isoformat()
+    os.makedirs(out_dir, exist_ok=True)
+
+    state_path = os.path.join(out_dir, STATE_FILE)
+    try:
+        with open(state_path, encoding="utf-8") as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = {}
+
+    routes = page_routes()
+    state = {}
+    for route in routes:
+        fingerprint = route_fingerprint(route)
+        known = previous.get(route, {})
+        lastmod = known["lastmod"] if known.get("fingerprint") == fingerprint else today
+        state[route] = {"fingerprint": fingerprint, "lastmod": lastmod}
+
+    indexed = [route for route in routes if route not in NOINDEX_ROUTES]
+    files = {
+        "sitemap.xml": sitemap_xml((site_url + _path(route), state[route]["lastmod"]) for route in indexed),
+        "robots.txt": robots_txt(site_url, (_path(route) for route in routes if route in NOINDEX_ROUTES)),
+        INCLUDE: nginx_include(routes, nginx_root),
+        STATE_FILE: json.dumps(state, indent=2) + "\n",
+    }
+    for name, content in files.items():
+        with open(os.path.join(out_dir, name), "w", encoding="utf-8") as f:
+            f.write(content)
+    precompress(out_dir, (".xml",))
+    return state
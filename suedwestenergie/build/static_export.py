@@ -0,0 +1,368 @@
+"""
+Static HTML export for content-only pages
+
+The legal pages and the thank-you page contain no state, so there is no
+reason to serve them as SPA routes that hydrate and open a websocket. This
+module renders their component trees to plain HTML plus one shared
+stylesheet, names every file after its content hash and writes an nginx
+include that serves them without touching the backend.
+
+Only the handful of layout primitives used by these pages are supported.
+Anything bound to state or backend events raises StaticExportError, so a
+page that stops being static fails the build instead of silently breaking.
+"""
+
+import hashlib
+import html
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from suedwestenergie.components.fonts import (
+    FONT_FAMILY,
+    HOSTED_FONT_ORIGIN,
+    font_face_css,
+    font_manifest,
+    hosted_stylesheets,
+    preload_urls,
+)
+from suedwestenergie.components.static_css import NotStaticError, StyleSheet, static_value
+
+# Routes that are served as static HTML (without the leading slash)
+STATIC_ROUTES = ("impressum", "datenschutz", "agb", "danke")
+
+# Page registered for unknown paths; exported as the nginx error page
+NOT_FOUND_ROUTE = "404"
+
+# Directory the nginx container serves the export from (see docker-compose.yml)
+NGINX_ROOT = "/usr/share/nginx/static_pages"
+ASSET_DIR = "_static"
+
+# HTML pages live at stable URLs; hashed assets never change
+HTML_EXPIRES = "1d"
+
+# Radix Themes scales, so the export looks like the SPA rendering
+HEADING_FONT_SIZES = {"1": "12px", "2": "14px", "3": "16px", "4": "18px", "5": "20px",
+                      "6": "24px", "7": "28px", "8": "35px", "9": "60px"}
+SPACING = {"0": "0", "1": "4px", "2": "8px", "3": "12px", "4": "16px", "5": "24px",
+           "6": "32px", "7": "40px", "8": "48px", "9": "64px"}
+FLEX_ALIGN = {"start": "flex-start", "end": "flex-end", "center": "center",
+              "baseline": "baseline", "stretch": "stretch"}
+FLEX_JUSTIFY = {"start": "flex-start", "end": "flex-end", "center": "center",
+                "between": "space-between"}
+
+BASE_CSS = """\
+:root{--accent-8:#5bb98b;--accent-9:#30a46c;--accent-10:#2b9a66;--accent-11:#218358}
+*,*::before,*::after{box-sizing:border-box}
+body{margin:0;font-family:FONT_FAMILY;color:#1c2024;-webkit-font-smoothing:antialiased}
+h1,h2,h3,p{margin:0}
+img{max-width:100%}
+a{color:inherit;text-decoration:none}
+a:hover{text-decoration:underline}
+.rx-button{display:inline-flex;align-items:center;justify-content:center;border:none;font-weight:500;line-height:1}
+.rx-button:hover{text-decoration:none}
+""".replace("FONT_FAMILY", FONT_FAMILY)
+
+
+# Raised for values and components that need the Reflex runtime
+StaticExportError = NotStaticError
+
+
+def content_hash(data: bytes) -> str:
+    """Short content hash used in file names"""
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def _prop(component, name: str, default: Any = None) -> Any:
+    value = getattr(component, name, None)
+    return default if value is None else static_value(value)
+
+
+class StaticRenderer(StyleSheet):
+    """Renders Reflex component trees to HTML and a shared stylesheet"""
+
+    def stylesheet(self, base_css: str = BASE_CSS, repeat: int = 1) -> str:
+        """CSS for every element rendered so far, after the base rules of the page"""
+        return super().stylesheet(base_css, repeat)
+
+    # ----------------------------------------------------------------- HTML
+
+    def render(self, component) -> str:
+        """Render a component and its children to HTML"""
+        kind = type(component).__name__
+        method = getattr(self, f"_render_{kind.lower()}", None)
+        if method is None:
+            raise StaticExportError(f"Component {kind} is not supported in static pages")
+        if kind != "Button" and getattr(component, "event_triggers", None):
+            raise StaticExportError(f"Component {kind} has event handlers: {list(component.event_triggers)}")
+        return method(component)
+
+    def _children(self, component) -> str:
+        return "".join(self.render(child) for child in component.children)
+
+    def _element(self, tag: str, component, base: List[Tuple[str, Any]] = (), attrs: Optional[Dict[str, Any]] = None,
+                 extra_class: str = "", inner: Optional[str] = None) -> str:
+        classes = " ".join(c for c in (extra_class, _prop(component, "class_name"),
+                                       self._class_for(list(base), component.style)) if c)
+        attributes = dict(attrs or {})
+        attributes.update({k: static_value(v) for k, v in (getattr(component, "custom_attrs", None) or {}).items()})
+        if classes:
+            attributes["class"] = classes
+        element_id = _prop(component, "id")
+        if element_id:
+            attributes["id"] = element_id
+        rendered = "".join(f' {k}="{html.escape(str(v))}"' for k, v in attributes.items() if v is not None)
+        if inner is None:
+            inner = self._children(component)
+        return f"<{tag}{rendered}>{inner}</{tag}>"
+
+    def _render_bare(self, component) -> str:
+        return html.escape(str(static_value(component.contents)))
+
+    def _render_fragment(self, component) -> str:
+        return self._children(component)
+
+    def _render_box(self, component) -> str:
+        return self._element("div", component)
+
+    def _render_container(self, component) -> str:
+        return self._element("div", component, base=[("width", "100%"), ("margin-inline", "auto")])
+
+    def _render_flex(self, component, direction: Optional[str] = None) -> str:
+        base = [("display", "flex"), ("flex-direction", direction or _prop(component, "direction", "row"))]
+        align = _prop(component, "align")
+        if align:
+            base.append(("align-items", FLEX_ALIGN[align]))
+        justify = _prop(component, "justify")
+        if justify:
+            base.append(("justify-content", FLEX_JUSTIFY[justify]))
+        spacing = _prop(component, "spacing") or _prop(component, "gap")
+        if spacing:
+            base.append(("gap", SPACING.get(str(spacing), spacing)))
+        return self._element("div", component, base=base)
+
+    _render_vstack = _render_flex
+    _render_hstack = _render_flex
+
+    def _render_heading(self, component) -> str:
+        size = str(_prop(component, "size", "6"))
+        tag = "h1" if int(size) >= 8 else "h2" if int(size) >= 6 else "h3"
+        base = [("font-size", HEADING_FONT_SIZES[size]), ("font-weight", "700"), ("line-height", "1.25")]
+        return self._element(tag, component, base=base)
+
+    def _render_text(self, component) -> str:
+        tag = _prop(component, "as_", "p")
+        return self._element(tag, component, base=[("line-height", "1.5")])
+
+    def _void(self, tag: str, component, attrs: Dict[str, Any]) -> str:
+        """Render an element without children, including its custom attributes"""
+        attributes = {k: v for k, v in attrs.items() if v is not None}
+        attributes.update({k: static_value(v) for k, v in (getattr(component, "custom_attrs", None) or {}).items()})
+        classes = " ".join(c for c in (_prop(component, "class_name"), self._class_for([], component.style)) if c)
+        if classes:
+            attributes["class"] = classes
+        return f"<{tag}" + "".join(f' {k}="{html.escape(str(v))}"' for k, v in attributes.items()) + ">"
+
+    def _render_img(self, component) -> str:
+        return self._void("img", component, {
+            "src": _prop(component, "src"),
+            "srcset": _prop(component, "src_set"),
+            "sizes": _prop(component, "sizes"),
+            "alt": _prop(component, "alt", ""),
+            "loading": _prop(component, "loading"),
+            "decoding": _prop(component, "decoding", "async"),
+        })
+
+    def _render_source(self, component) -> str:
+        return self._void("source", component, {
+            "type": _prop(component, "type"),
+            "srcset": _prop(component, "src_set"),
+            "sizes": _prop(component, "sizes"),
+        })
+
+    def _render_picture(self, component) -> str:
+        return self._element("picture", component)
+
+    def _render_separator(self, component) -> str:
+        classes = self._class_for([("border", "none"), ("border-top", "1px solid"), ("width", "100%")],
+                                  component.style)
+        return f'<hr class="{classes}">'
+
+    def _render_link(self, component) -> str:
+        href = _prop(component, "href")
+        inner_component = component
+        if href is None and len(component.children) == 1:
+            # rx.link wraps internal routes in a router link carrying the target
+            router_link = component.children[0]
+            href = _prop(router_link, "to")
+            inner_component = router_link
+        if href is None:
+            raise StaticExportError("Link without a static target")
+        return self._element("a", component, attrs={"href": href}, inner=self._children(inner_component))
+
+    _render_reactrouterlink = _render_link
+
+    def _render_button(self, component) -> str:
+        """Buttons that only redirect become plain links"""
+        triggers = component.event_triggers or {}
+        href = _redirect_target(triggers.get("on_click"))
+        if href is None or set(triggers) != {"on_click"}:
+            raise StaticExportError("Only buttons that redirect can be exported")
+        return self._element("a", component, attrs={"href": href}, extra_class="rx-button")
+
+
+def _redirect_target(chain) -> Optional[str]:
+    """Return the path of an event chain that consists of a single rx.redirect"""
+    events = getattr(chain, "events", None)
+    if not events or len(events) != 1:
+        return None
+    event = events[0]
+    handler = getattr(getattr(event, "handler", None), "fn", None)
+    if getattr(handler, "__qualname__", None) != "_redirect":
+        return None
+    args = {getattr(name, "_js_expr", None): value for name, value in event.args}
+    return static_value(args.get("path"))
+
+
+def render_document(body: str, title: str, stylesheets: List[str], description: Optional[str] = None,
+                    image: Optional[str] = None, noindex: bool = False, scripts: List[str] = ()) -> str:
+    """Wrap a rendered body in a complete HTML document; ``scripts`` are inlined into the head"""
+    head = [
+        '<meta charset="utf-8">',
+        '<meta name="viewport" content="width=device-width, initial-scale=1">',
+        f"<title>{html.escape(title)}</title>",
+    ]
+    if noindex:
+        head.append('<meta name="robots" content="noindex">')
+    if description:
+        head.append(f'<meta name="description" content="{html.escape(description)}">')
+    head.append(f'<meta property="og:title" content="{html.escape(title)}">')
+    if image:
+        head.append(f'<meta property="og:image" content="{html.escape(image)}">')
+    head.append('<link rel="icon" href="/favicon.ico">')
+    fonts = font_manifest()
+    head.extend(f'<link rel="preload" href="{html.escape(url)}" as="font" type="font/woff2" crossorigin="anonymous">'
+                for url in preload_urls(fonts))
+    hosted = hosted_stylesheets(fonts)
+    if hosted:
+        head.append(f'<link rel="preconnect" href="{HOSTED_FONT_ORIGIN}" crossorigin="anonymous">')
+    head.extend(f'<link rel="stylesheet" href="{html.escape(href)}">' for href in hosted)
+    head.append(f"<style>{font_face_css(fonts)}</style>")
+    head.extend(f'<link rel="stylesheet" href="{html.escape(href)}">' for href in stylesheets)
+    head.extend(f"<script>{script}</script>" for script in scripts)
+    return (
+        '<!DOCTYPE html>\n<html lang="de">\n<head>\n' + "\n".join(head) +
+        f"\n</head>\n<body>\n{body}\n</body>\n</html>\n"
+    )
+
+
+def nginx_include(pages: Dict[str, str], root: str = NGINX_ROOT, not_found: Optional[str] = None) -> str:
+    """nginx locations that serve the exported pages and assets, and the error page for 404s"""
+    lines = [
+        "# Generated by `python -m suedwestenergie.build static` - do not edit.",
+        f"location ^~ /{ASSET_DIR}/ {{",
+        f"    root {root};",
+        "    gzip_static on;",
+        "    expires 1y;",
+        '    add_header Cache-Control "public, immutable";',
+        # add_header here replaces the server-level headers for this location
+        '    add_header X-Content-Type-Options "nosniff" always;',
+        "}",
+    ]
+    for route, file_name in sorted(pages.items()):
+        lines += [
+            f"location = /{route} {{",
+            f"    root {root};",
+            "    gzip_static on;",
+            f"    expires {HTML_EXPIRES};",
+            f"    try_files /{file_name} =404;",
+            "}",
+        ]
+    if not_found:
+        # Only 404s generated by nginx itself; the app's responses pass through unchanged
+        lines += [
+            f"error_page 404 /{not_found};",
+            f"location = /{not_found} {{",
+            f"    root {root};",
+            "    gzip_static on;",
+            "    internal;",
+            "}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def _write(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def export(out_dir: str = "static_pages", routes=STATIC_ROUTES, nginx_root: str = NGINX_ROOT) -> Dict[str, Any]:
+    """
+    Render the static routes of the app into ``out_dir``
+
+    Args:
+        out_dir: Output directory (mounted into the nginx container)
+        routes: Routes to export, as registered with ``app.add_page``
+        nginx_root: Path of ``out_dir`` inside the nginx container
+
+    Returns:
+        The manifest that is also written to ``manifest.json``
+    """
+    from suedwestenergie.build.precompress import precompress
+    from suedwestenergie.components.critical import critical_css
+    from suedwestenergie.config import Config
+    from suedwestenergie.suedwestenergie import app
+    from suedwestenergie.utils.analytics import analytics_shim_js
+
+    renderer = StaticRenderer()
+    bodies = {}
+    for route in routes:
+        page = app._unevaluated_pages.get(route)
+        if page is None:
+            raise StaticExportError(f"Route /{route} is not registered")
+        bodies[route] = (page, renderer.render(page.component()))
+    not_found_page = app._unevaluated_pages.get(NOT_FOUND_ROUTE)
+    if not_found_page is not None:
+        bodies[NOT_FOUND_ROUTE] = (not_found_page, renderer.render(not_found_page.component()))
+
+    # Components compiled to critical classes carry no inline styles any more
+    css = (renderer.stylesheet() + critical_css()).encode("utf-8")
+    css_name = f"{ASSET_DIR}/site.{content_hash(css)}.css"
+    _write(os.path.join(out_dir, css_name), css)
+    stylesheets = [s for s in app.stylesheets if "://" in s] + [f"/{css_name}"]
+    # The consent banner and the Cookie-Einstellungen link need the shim here too
+    scripts = [analytics_shim_js(Config.GOOGLE_ANALYTICS_ID)] if Config.GOOGLE_ANALYTICS_ID else []
+
+    manifest: Dict[str, Any] = {"stylesheet": css_name, "pages": {}}
+    pages = {}
+    for route, (page, body) in bodies.items():
+        title = static_value(page.title) if page.title is not None else route
+        description = static_value(page.description) if page.description is not None else None
+        document = render_document(body, title, stylesheets, description, page.image,
+                                   noindex=route == NOT_FOUND_ROUTE, scripts=scripts).encode("utf-8")
+        digest = content_hash(document)
+        file_name = f"{route}.{digest}.html"
+        _write(os.path.join(out_dir, file_name), document)
+        if route == NOT_FOUND_ROUTE:
+            manifest["not_found"] = {"file": file_name, "hash": digest, "bytes": len(document)}
+            continue
+        pages[route] = file_name
+        manifest["pages"][f"/{route}"] = {"file": file_name, "hash": digest, "bytes": len(document)}
+
+    # Remove the outputs of previous builds so the directory only holds what nginx serves
+    not_found = manifest.get("not_found", {}).get("file")
+    current = {css_name.replace("/", os.sep)} | set(pages.values()) | ({not_found} if not_found else set())
+    for directory in (out_dir, os.path.join(out_dir, ASSET_DIR)):
+        for name in os.listdir(directory):
+            relative = os.path.relpath(os.path.join(directory, name), out_dir)
+            if re.search(r"\.[0-9a-f]{10}\.(html|css)(\.gz|\.br)?$", name) and \
+                    re.sub(r"\.(gz|br)$", "", relative) not in current:
+                os.remove(os.path.join(directory, name))
+
+    # .gz/.br siblings for gzip_static (and brotli_static where ngx_brotli is available)
+    precompress(out_dir, (".html", ".css"))
+
+    _write(os.path.join(out_dir, "static_pages.conf"), nginx_include(pages, nginx_root, not_found).encode("utf-8"))
+    _write(os.path.join(out_dir, "manifest.json"), json.dumps(manifest, indent=2).encode("utf-8"))
+    return manifest
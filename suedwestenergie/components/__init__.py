@@ -1,5 +1,6 @@
+from .picture import image
 from .navbar import navbar
 from .footer import footer
 from .cards import feature_card
 
-__all__ = ["navbar", "footer", "feature_card"]
\ No newline at end of file
+__all__ = ["image", "navbar", "footer", "feature_card"]
\ No newline at end of file
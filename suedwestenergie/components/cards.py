@@ -2,8 +2,10 @@
 
 import reflex as rx
 from suedwestenergie.config import Config
+from .memo import memoize_component
 
 
+@memoize_component
 def feature_card(icon: str, title: str, description: str) -> rx.Component:
     """Feature Card Component"""
     return rx.box(
@@ -0,0 +1,88 @@
+"""
+Critical CSS for above-the-fold components
+
+Reflex turns style props into Emotion styles that only exist once the JS
+bundle has run. For the components that make up the first viewport
+(``navbar()`` and ``hero_section()``) ``critical_styles`` compiles the
+static style props into class names instead, and ``critical_head()``
+inlines the matching rules in the document head, so they apply on first
+paint. Everything below the fold keeps its Emotion styles and is wrapped
+in ``deferred()`` so the browser skips its style and layout work until it
+scrolls near the viewport.
+"""
+
+from functools import wraps
+from typing import Callable, List
+import reflex as rx
+from reflex.style import Style
+from suedwestenergie.components.static_css import NotStaticError, StyleSheet
+
+# Repeat each class in its selector so the rules outrank the Radix theme
+# stylesheet, which is loaded after the head
+SELECTOR_REPEAT = 2
+
+_critical_factories: List[Callable] = []
+
+
+def _compile_styles(component, sheet: StyleSheet) -> None:
+    """Move static style props of a tree into class names, in place"""
+    if component.style:
+        try:
+            class_name = sheet.class_for_style(component.style)
+        except NotStaticError:
+            class_name = None  # State-dependent styles stay with Emotion
+        if class_name:
+            existing = component.class_name
+            if existing is None:
+                component.class_name = class_name
+                component.style = Style()
+            elif isinstance(existing, str):
+                component.class_name = f"{existing} {class_name}"
+                component.style = Style()
+    for child in component.children:
+        if isinstance(child, rx.Component):
+            _compile_styles(child, sheet)
+
+
+def critical_styles(func: Callable) -> Callable:
+    """Render the styles of an above-the-fold factory as inlined critical CSS"""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        component = func(*args, **kwargs)
+        _compile_styles(component, StyleSheet())
+        return component
+
+    _critical_factories.append(func)
+    return wrapper
+
+
+def critical_css() -> str:
+    """Rules for every component built by a ``critical_styles`` factory"""
+    sheet = StyleSheet()
+    for func in _critical_factories:
+        _compile_styles(func(), sheet)
+    return sheet.stylesheet(repeat=SELECTOR_REPEAT)
+
+
+def critical_head() -> List[rx.Component]:
+    """Inline critical CSS for ``head_components``"""
+    return [rx.el.style(critical_css())]
+
+
+def deferred(component: rx.Component, intrinsic_height: str = "800px") -> rx.Component:
+    """
+    Defer rendering work for a below-the-fold section
+
+    Args:
+        component: The section
+        intrinsic_height: Placeholder height until the section has been rendered once
+
+    Returns:
+        The wrapped section
+    """
+    return rx.box(
+        component,
+        content_visibility="auto",
+        contain_intrinsic_size=f"auto {intrinsic_height}",
+    )
@@ -0,0 +1,76 @@
+"""Self-hosted web fonts for the document head"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+import reflex as rx
+from suedwestenergie.config import Config
+
+# Written by `python -m suedwestenergie.build fonts`
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                             "assets", "fonts", "manifest.json")
+
+# Weights worth a preload: body text and headings
+PRELOAD_WEIGHTS = (400, 700)
+
+# Arial scaled to Inter's metrics, so swapping in the web font barely moves text
+FALLBACK_FACE = (
+    '@font-face{font-family:"Inter Fallback";src:local("Arial");'
+    "ascent-override:90.44%;descent-override:22.52%;line-gap-override:0%;size-adjust:107.12%}"
+)
+FONT_FAMILY = 'Inter, "Inter Fallback", system-ui, -apple-system, "Segoe UI", Roboto, sans-serif'
+
+# Used in development until the vendored faces are built; production never
+# contacts Google Fonts and falls back to the metric-matched face instead
+HOSTED_STYLESHEET = "https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap"
+HOSTED_FONT_ORIGIN = "https://fonts.gstatic.com"
+
+_manifest: Optional[Dict[str, Any]] = None
+
+
+def font_manifest() -> Dict[str, Any]:
+    """Load the font manifest once; empty if the font build has not run"""
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST_PATH, encoding="utf-8") as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def font_face_css(manifest: Dict[str, Any]) -> str:
+    """@font-face rules for the subsetted faces plus the metric-matched fallback"""
+    rules = [FALLBACK_FACE]
+    for face in manifest.get("faces", []):
+        rules.append(
+            f'@font-face{{font-family:"{manifest["family"]}";font-style:{face["style"]};'
+            f'font-weight:{face["weight"]};font-display:swap;'
+            f'src:url({face["url"]}) format("woff2");unicode-range:{manifest["unicode_range"]}}}'
+        )
+    return "".join(rules)
+
+
+def preload_urls(manifest: Dict[str, Any]) -> List[str]:
+    """URLs of the faces that are preloaded"""
+    return [face["url"] for face in manifest.get("faces", [])
+            if face["weight"] in PRELOAD_WEIGHTS and face["style"] == "normal"]
+
+
+def hosted_stylesheets(manifest: Dict[str, Any]) -> List[str]:
+    """The Google Fonts stylesheet in development while the manifest has no faces, else nothing"""
+    return [] if manifest.get("faces") or not Config.is_development() else [HOSTED_STYLESHEET]
+
+
+def font_head() -> List[rx.Component]:
+    """Preload links and inline @font-face rules for ``head_components``"""
+    manifest = font_manifest()
+    preloads = [
+        rx.el.link(rel="preload", href=url, type="font/woff2", cross_origin="anonymous", custom_attrs={"as": "font"})
+        for url in preload_urls(manifest)
+    ]
+    hosted = [rx.el.link(rel="stylesheet", href=href) for href in hosted_stylesheets(manifest)]
+    if hosted:
+        hosted.insert(0, rx.el.link(rel="preconnect", href=HOSTED_FONT_ORIGIN, cross_origin="anonymous"))
+    return preloads + hosted + [rx.el.style(font_face_css(manifest))]
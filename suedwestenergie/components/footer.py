@@ -2,8 +2,12 @@
 
 import reflex as rx
 from suedwestenergie.config import Config
+from suedwestenergie.utils.analytics import consent_settings_link
+from .picture import image
+from .memo import memoize_component
 
 
+@memoize_component
 def footer() -> rx.Component:
     """Footer"""
     return rx.box(
@@ -13,12 +17,13 @@ def footer() -> rx.Component:
                 rx.vstack(
                     rx.vstack(
                         rx.hstack(
-                            rx.image(
+                            image(
                                 src="/logo.jpg",
                                 alt=Config.COMPANY_NAME,
                                 height="30px",
                                 width="auto",
                                 margin_right="0.5rem",
+                                loading="lazy",
                             ),
                             rx.heading(Config.COMPANY_NAME, size="6", color="#2E7D32", margin_bottom="1rem"),  # Darker green
                             align="center",
@@ -55,6 +60,7 @@ def footer() -> rx.Component:
                         rx.link("Impressum", href="/impressum", color="rgba(255,255,255,0.8)"),
                         rx.link("Datenschutz", href="/datenschutz", color="rgba(255,255,255,0.8)"),
                         rx.link("AGB", href="/agb", color="rgba(255,255,255,0.8)"),
+                        consent_settings_link(color="rgba(255,255,255,0.8)"),
                         align="center",
                         spacing="2",
                     ),
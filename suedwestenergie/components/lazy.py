@@ -0,0 +1,137 @@
+"""
+On-demand mounting of below-the-fold content
+
+``lazy_mount`` renders a sized placeholder and only mounts its content once
+an IntersectionObserver reports it near the viewport, so its markup, images
+and effects cost nothing for visitors who never scroll there. The content is
+missing from the prerendered page, so it is meant for embeds such as the
+Tarifrechner iframe; sections with text that should be indexed use
+``critical.deferred`` (content-visibility) instead.
+``click_to_load`` is a facade for third-party script embeds: the embed HTML
+is injected, and its scripts executed, only after the visitor asks for it.
+"""
+
+from typing import Optional
+import reflex as rx
+from suedwestenergie.config import Config
+
+# How far ahead of the viewport a lazy section is mounted
+ROOT_MARGIN = "400px"
+
+_LAZY_MOUNT_JS = """
+function LazyMount({children, id, minHeight, rootMargin}) {
+  const ref = useRef(null);
+  const [shown, setShown] = useState(false);
+  useEffect(() => {
+    if (shown) return;
+    if (!("IntersectionObserver" in window)) { setShown(true); return; }
+    const observer = new IntersectionObserver((entries) => {
+      if (entries.some((entry) => entry.isIntersecting)) { setShown(true); observer.disconnect(); }
+    }, {rootMargin});
+    observer.observe(ref.current);
+    return () => observer.disconnect();
+  }, [shown, rootMargin]);
+  return jsx("div", {ref, id, style: shown ? undefined : {minHeight}}, shown ? children : null);
+}
+"""
+
+_CLICK_TO_LOAD_JS = """
+function ClickToLoad({children, html, minHeight}) {
+  const ref = useRef(null);
+  const [loaded, setLoaded] = useState(false);
+  useEffect(() => {
+    if (!loaded) return;
+    const container = ref.current;
+    container.innerHTML = html;
+    // Scripts inserted through innerHTML do not run; replace them with live copies
+    container.querySelectorAll("script").forEach((inert) => {
+      const script = document.createElement("script");
+      for (const attribute of inert.attributes) script.setAttribute(attribute.name, attribute.value);
+      script.text = inert.text;
+      inert.replaceWith(script);
+    });
+  }, [loaded, html]);
+  return jsx("div", {ref, style: {minHeight}, onClick: loaded ? undefined : () => setLoaded(true)},
+    loaded ? null : children);
+}
+"""
+
+
+class LazyMount(rx.Component):
+    """Mounts its children once they are scrolled near the viewport"""
+
+    tag = "LazyMount"
+
+    # Anchor of the section, kept on the placeholder so /#links work before mounting
+    id: rx.Var[str]
+
+    # Placeholder height, to avoid layout shift
+    min_height: rx.Var[str]
+
+    # IntersectionObserver margin
+    root_margin: rx.Var[str]
+
+    def add_imports(self):
+        return {"react": ["useEffect", "useRef", "useState"], "@emotion/react": ["jsx"]}
+
+    def add_custom_code(self) -> list[str]:
+        return [_LAZY_MOUNT_JS]
+
+
+class ClickToLoad(rx.Component):
+    """Shows its children until clicked, then injects and runs ``html``"""
+
+    tag = "ClickToLoad"
+
+    # Embed markup, including <script> tags
+    html: rx.Var[str]
+
+    # Height reserved for the facade and the embed
+    min_height: rx.Var[str]
+
+    def add_imports(self):
+        return {"react": ["useEffect", "useRef", "useState"], "@emotion/react": ["jsx"]}
+
+    def add_custom_code(self) -> list[str]:
+        return [_CLICK_TO_LOAD_JS]
+
+
+def lazy_mount(component: rx.Component, min_height: str, root_margin: str = ROOT_MARGIN) -> rx.Component:
+    """
+    Mount a below-the-fold section when it is scrolled near
+
+    Args:
+        component: The section
+        min_height: Placeholder height until the section is mounted
+        root_margin: Distance ahead of the viewport at which it is mounted
+
+    Returns:
+        The lazily mounted section, or the section itself if ``LAZY_SECTIONS`` is off
+    """
+    if not Config.LAZY_SECTIONS:
+        return component
+
+    # Move the anchor to the placeholder, which exists from the first render
+    anchor: Optional[str] = None
+    if isinstance(component.id, str):
+        anchor, component.id = component.id, None
+
+    props = {"min_height": min_height, "root_margin": root_margin}
+    if anchor:
+        props["id"] = anchor
+    return LazyMount.create(component, **props)
+
+
+def click_to_load(html: str, facade: rx.Component, min_height: str) -> rx.Component:
+    """
+    Facade for a third-party embed that loads on click
+
+    Args:
+        html: Embed markup; contained scripts are executed after the click
+        facade: What is shown until the visitor clicks
+        min_height: Height reserved for facade and embed
+
+    Returns:
+        The facade component
+    """
+    return ClickToLoad.create(facade, html=html, min_height=min_height)
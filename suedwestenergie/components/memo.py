@@ -0,0 +1,169 @@
+"""
+Build-time memoization for component factories
+
+Sections and shared components such as ``navbar()`` and ``footer()`` are
+pure functions of their arguments and the ``Config`` values they read, yet
+they are rebuilt for every page and every compile. ``memoize_component``
+keys a factory on exactly those inputs. The ``Config`` attributes are found
+once by scanning the bytecode of the factory, of every project function it
+calls and of every ``Config`` method it calls (``Config.is_production()``
+reads ``ENVIRONMENT``), so adding a new ``Config.X`` lookup automatically
+becomes part of the key. Where the scan cannot tell which values are read,
+e.g. ``Config`` passed on as a value or ``get_settings()``, the key holds
+every ``Config`` value.
+
+Reflex applies styles to a component tree in place while compiling a page,
+so callers always receive a deep copy of the cached tree.
+"""
+
+import copy
+import dis
+import inspect
+import types
+from functools import wraps
+from typing import Any, Callable, Dict, FrozenSet, Hashable, Optional, Set, Tuple
+from suedwestenergie.config import Config, EnvironmentConfig, Settings, get_settings
+
+
+PACKAGE = "suedwestenergie"
+
+# Dependency on every Config value
+ALL = "*"
+
+_components: Dict[Hashable, Any] = {}
+_stats = {"hits": 0, "misses": 0}
+
+
+def _code_objects(code: types.CodeType):
+    yield code
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _code_objects(const)
+
+
+def _project_function(value: Any) -> Optional[types.FunctionType]:
+    value = inspect.unwrap(value) if callable(value) else None
+    if isinstance(value, types.FunctionType) and value.__module__.startswith(PACKAGE):
+        return value
+    return None
+
+
+def _config_method(name: str) -> Tuple[Optional[types.FunctionType], Optional[str]]:
+    """The function behind ``Config.<name>`` and the name it gives the class, if it is a method"""
+    attribute = inspect.getattr_static(Config, name, None)
+    if isinstance(attribute, classmethod):
+        code = attribute.__func__.__code__
+        return attribute.__func__, code.co_varnames[0] if code.co_argcount else None
+    if isinstance(attribute, staticmethod):
+        return attribute.__func__, None
+    return None, None
+
+
+def config_dependencies(func: Callable, _seen: Set[Callable] = None, _config_alias: Optional[str] = None
+                        ) -> FrozenSet[str]:
+    """
+    Find the ``Config`` attributes a factory reads, directly, through other
+    functions of this package or through ``Config`` methods
+
+    Args:
+        func: Component factory
+
+    Returns:
+        Names of the ``Config`` attributes, or ``{ALL}`` if they cannot be told
+    """
+    seen = set() if _seen is None else _seen
+    func = inspect.unwrap(func)
+    if func in seen or not hasattr(func, "__code__"):
+        return frozenset()
+    seen.add(func)
+
+    names: Set[str] = set()
+    module_globals = func.__globals__
+    for code in _code_objects(func.__code__):
+        instructions = list(dis.get_instructions(code))
+        for instruction, following in zip(instructions, instructions[1:] + [None]):
+            attribute = following.argval if following and following.opname in ("LOAD_ATTR", "LOAD_METHOD") else None
+            if instruction.opname in ("LOAD_GLOBAL", "LOAD_NAME"):
+                value = module_globals.get(instruction.argval)
+            elif instruction.opname in ("LOAD_FAST", "LOAD_DEREF") and instruction.argval == _config_alias:
+                value = Config
+            else:
+                continue
+
+            if isinstance(value, type) and issubclass(value, EnvironmentConfig):
+                if attribute is None:
+                    # Config passed on or read with getattr()
+                    return frozenset({ALL})
+                method, alias = _config_method(attribute)
+                if method is None:
+                    names.add(attribute)
+                else:
+                    names |= config_dependencies(method, seen, alias)
+            elif value is Settings or value is get_settings:
+                return frozenset({ALL})
+            else:
+                if isinstance(value, types.ModuleType) and attribute is not None:
+                    value = getattr(value, attribute, None)
+                callee = _project_function(value)
+                if callee is not None:
+                    names |= config_dependencies(callee, seen)
+            if ALL in names:
+                return frozenset({ALL})
+    return frozenset(names)
+
+
+def _config_values(dependencies: Tuple[str, ...]) -> Tuple[Any, ...]:
+    if dependencies == (ALL,):
+        dependencies = tuple(name for name in dir(Config) if name.isupper())
+    return tuple((name, getattr(Config, name, None)) for name in dependencies)
+
+
+def memoize_component(func: Callable) -> Callable:
+    """Cache a component factory on its arguments and the Config values it reads"""
+    dependencies: Tuple[str, ...] = ()
+    resolved = False
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        nonlocal dependencies, resolved
+        if not Config.COMPONENT_MEMO:
+            return func(*args, **kwargs)
+        if not resolved:
+            # Resolved lazily so that helpers defined further down the module are visible
+            dependencies = tuple(sorted(config_dependencies(func)))
+            resolved = True
+
+        key = (
+            func.__module__,
+            func.__qualname__,
+            args,
+            tuple(sorted(kwargs.items())),
+            _config_values(dependencies),
+        )
+        try:
+            component = _components.get(key)
+        except TypeError:
+            # Unhashable arguments cannot be cached
+            return func(*args, **kwargs)
+
+        if component is None:
+            _stats["misses"] += 1
+            component = func(*args, **kwargs)
+            _components[key] = component
+        else:
+            _stats["hits"] += 1
+        return copy.deepcopy(component)
+
+    wrapper.config_dependencies = lambda: config_dependencies(func)
+    return wrapper
+
+
+def clear_component_cache() -> None:
+    """Drop all memoized components"""
+    _components.clear()
+    _stats.update(hits=0, misses=0)
+
+
+def component_cache_info() -> Dict[str, int]:
+    """Hit/miss counters and number of cached trees"""
+    return dict(_stats, size=len(_components))
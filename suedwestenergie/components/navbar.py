@@ -2,8 +2,13 @@
 
 import reflex as rx
 from suedwestenergie.config import Config
+from .picture import image
+from .critical import critical_styles
+from .memo import memoize_component
 
 
+@memoize_component
+@critical_styles
 def navbar() -> rx.Component:
     """Navigation Bar"""
     return rx.box(
@@ -12,7 +17,7 @@ def navbar() -> rx.Component:
             rx.vstack(
                 # Logo and company name row
                 rx.hstack(
-                    rx.image(
+                    image(
                         src="/logo.jpg",
                         alt=Config.COMPANY_NAME,
                         height="40px",
@@ -0,0 +1,90 @@
+"""Responsive Bild-Komponente"""
+
+import json
+import os
+import re
+from typing import Any, Dict, Optional
+import reflex as rx
+
+# Written by `python -m suedwestenergie.build images`
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                             "assets", "img", "manifest.json")
+
+_manifest: Optional[Dict[str, Any]] = None
+
+
+def image_manifest() -> Dict[str, Any]:
+    """Load the image manifest once; empty if the pipeline has not run"""
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST_PATH, encoding="utf-8") as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def _css_pixels(value: Any) -> Optional[float]:
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)px\s*", str(value)) if value is not None else None
+    return float(match.group(1)) if match else None
+
+
+def _sizes(entry: Dict[str, Any], width: Any, height: Any) -> str:
+    """Derive the ``sizes`` attribute from the CSS size of the image"""
+    css_width = _css_pixels(width)
+    if css_width is None and _css_pixels(height) is not None:
+        css_width = _css_pixels(height) * entry["width"] / entry["height"]
+    return f"{round(css_width)}px" if css_width else "100vw"
+
+
+def _srcset(variants) -> str:
+    return ", ".join(f"{url} {width}w" for width, url, *_ in variants)
+
+
+def image(src: str, sizes: Optional[str] = None, priority: bool = False, **props) -> rx.Component:
+    """
+    Drop-in replacement for ``rx.image`` that serves modern formats
+
+    Images known to the image manifest are rendered as ``<picture>`` with
+    AVIF/WebP sources, a ``srcset`` at every built width and the intrinsic
+    ``width``/``height`` so the browser reserves space before loading.
+    Unknown images fall back to a plain ``rx.image``.
+
+    Args:
+        src: Public URL of the original image, e.g. ``/logo.jpg``
+        sizes: ``sizes`` attribute; derived from a pixel ``width``/``height`` if omitted
+        priority: Fetch with high priority (use for the LCP image only)
+        **props: Props passed on to ``rx.image``
+
+    Returns:
+        The image component
+    """
+    entry = image_manifest().get(src)
+    if entry is None:
+        return rx.image(src=src, **props)
+
+    sizes = sizes or _sizes(entry, props.get("width"), props.get("height"))
+    variants = entry["variants"]
+    fallback = variants[entry["fallback"]]
+    # Smallest fallback that still covers a 2x display
+    target = _css_pixels(sizes) * 2 if _css_pixels(sizes) else entry["width"]
+    fallback_src = next((url for width, url, *_ in fallback if width >= target), fallback[-1][1])
+
+    custom_attrs = dict(props.pop("custom_attrs", {}) or {})
+    custom_attrs.update(width=entry["width"], height=entry["height"])
+    if priority:
+        custom_attrs["fetchpriority"] = "high"
+    props.setdefault("decoding", "async")
+
+    sources = [
+        rx.el.source(type=f"image/{fmt}", src_set=_srcset(variants[fmt]), sizes=sizes)
+        for fmt in ("avif", "webp")
+        if fmt in variants
+    ]
+    return rx.el.picture(
+        *sources,
+        rx.image(src=fallback_src, src_set=_srcset(fallback), sizes=sizes, custom_attrs=custom_attrs, **props),
+        # Keep the <img> as the layout box so flex layouts stay unchanged
+        display="contents",
+    )
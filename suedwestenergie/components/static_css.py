@@ -0,0 +1,113 @@
+"""
+Static CSS rules for component styles
+
+Turns the style props of a Reflex component into a class name and collects
+the matching rules into one stylesheet. ``critical_styles`` uses it at
+runtime to inline the above-the-fold styles; the static page export in
+``suedwestenergie.build`` builds its renderer on top of it.
+
+Only values that are known without the Reflex runtime can be compiled;
+anything bound to state raises NotStaticError.
+"""
+
+import hashlib
+import json
+import re
+from typing import Any, Dict, List, Tuple
+
+# Radix Themes breakpoints; index n of a responsive value applies from here up
+BREAKPOINTS = ("0px", "30em", "48em", "62em", "80em", "96em")
+
+
+class NotStaticError(Exception):
+    """Raised when a value or component cannot be rendered without the Reflex runtime"""
+
+
+def css_property(name: str) -> str:
+    """CSS property name for a Reflex style key (``flexDirection``, ``flex_direction``)"""
+    return re.sub(r"(?<!^)([A-Z])", r"-\1", name).replace("_", "-").lower()
+
+
+def static_value(value: Any) -> Any:
+    """Resolve a Reflex Var to its Python value, refusing state-bound vars"""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    literal = getattr(value, "_var_value", None)
+    if isinstance(literal, (str, int, float, bool)):
+        return literal
+    js_expr = getattr(value, "_js_expr", None)
+    if isinstance(js_expr, str):
+        try:
+            decoded = json.loads(js_expr)
+        except ValueError:
+            decoded = None
+        if isinstance(decoded, (str, int, float, bool)):
+            return decoded
+    raise NotStaticError(f"Value is not static: {value!r}")
+
+
+class StyleSheet:
+    """Deduplicated class rules for component styles"""
+
+    def __init__(self):
+        self._rules: Dict[str, str] = {}  # Declarations -> class name
+
+    def _class_for(self, base: List[Tuple[str, Any]], style: Dict[str, Any]) -> str:
+        """Register the declarations of one element and return its class name"""
+        plain: List[str] = []
+        nested: List[Tuple[str, List[str]]] = []
+
+        for name, value in base:
+            plain.append(f"{name}:{value}")
+        for key, value in (style or {}).items():
+            if isinstance(value, dict):
+                selector = ":" + key[1:] if key.startswith("_") else key.lstrip("&")
+                nested.append((selector, [f"{css_property(k)}:{static_value(v)}" for k, v in value.items()]))
+            elif isinstance(value, (list, tuple)):
+                # Responsive values: index n applies from the n-th breakpoint up
+                for index, item in enumerate(value):
+                    declaration = f"{css_property(key)}:{static_value(item)}"
+                    if index == 0:
+                        plain.append(declaration)
+                    else:
+                        nested.append((f"@{BREAKPOINTS[index]}", [declaration]))
+            else:
+                plain.append(f"{css_property(key)}:{static_value(value)}")
+
+        if not plain and not nested:
+            return ""
+        body = ";".join(plain)
+        key = json.dumps([body, nested], ensure_ascii=False)
+        if key not in self._rules:
+            self._rules[key] = "s" + hashlib.sha256(key.encode("utf-8")).hexdigest()[:7]
+        return self._rules[key]
+
+    def class_for_style(self, style: Dict[str, Any]) -> str:
+        """Class name for a component style; raises NotStaticError if it is not static"""
+        return self._class_for([], style)
+
+    def stylesheet(self, base_css: str = "", repeat: int = 1) -> str:
+        """
+        CSS for every style registered so far
+
+        Args:
+            base_css: Rules emitted before the element rules
+            repeat: How often each class is repeated in its selector, to
+                outrank single-class theme rules loaded later
+        """
+        rules = [base_css] if base_css else []
+        media: Dict[str, List[str]] = {}
+        for key, class_name in self._rules.items():
+            body, nested = json.loads(key)
+            selector_base = f".{class_name}" * repeat
+            if body:
+                rules.append(f"{selector_base}{{{body}}}")
+            for selector, declarations in nested:
+                if selector.startswith("@"):
+                    media.setdefault(selector[1:], []).append(f"{selector_base}{{{';'.join(declarations)}}}")
+                else:
+                    rules.append(f"{selector_base}{selector}{{{';'.join(declarations)}}}")
+        for breakpoint in BREAKPOINTS[1:]:
+            if breakpoint in media:
+                rules.append(f"@media (min-width:{breakpoint}){{{''.join(media[breakpoint])}}}")
+        return "\n".join(rules) + "\n"
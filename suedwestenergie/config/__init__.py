@@ -1,4 +1,4 @@
 from .settings import Config
-from .env_config import EnvironmentConfig
+from .env_config import ConfigError, EnvironmentConfig, Settings, get_settings, on_reload, reload_settings
 
-__all__ = ["Config", "EnvironmentConfig"]
\ No newline at end of file
+__all__ = ["Config", "EnvironmentConfig", "Settings", "ConfigError", "get_settings", "reload_settings", "on_reload"]
@@ -1,76 +1,315 @@
-"""Environment configuration for production deployment"""
+"""Environment configuration for production deployment
 
+The environment is parsed and validated once, into a frozen ``Settings``
+object. ``EnvironmentConfig`` (and ``Config``) expose the same values as class
+attributes, which is what the site code reads and what tests patch.
+``reload_settings()`` parses the environment again and updates both.
+"""
+
+import logging
 import os
-from typing import Optional
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, List, Mapping, Optional, Tuple
 
+# Known ENVIRONMENT values; others (e.g. staging) are neither production nor development
+PRODUCTION_NAMES = ("prod", "production")
+DEVELOPMENT_NAMES = ("dev", "development", "local")
+TEST_NAMES = ("test", "testing")
+
+_TRUE = ("true", "1", "yes", "on")
+_FALSE = ("false", "0", "no", "off")
+
+# Field -> allowed values
+_CHOICES = {
+    "TARIFRECHNER_TYPE": ("iframe", "script"),
+    "CONTACT_FORM_MODE": ("uncontrolled", "debounced"),
+    "LOG_LEVEL": ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"),
+    "NOTIFY_ON_ERROR_LEVEL": ("WARNING", "ERROR", "CRITICAL"),
+}
+
+# Settings that only work together: all of them or none
+_GROUPS = {
+    "SMTP": ("EMAIL_HOST", "EMAIL_HOST_USER", "EMAIL_HOST_PASSWORD"),
+    "Ninox": ("NINOX_API_KEY", "NINOX_TEAM_ID", "NINOX_DATABASE_ID", "NINOX_TABLE_ID"),
+    "Twilio": ("TWILIO_SID", "TWILIO_TOKEN", "TWILIO_FROM_PHONE"),
+}
+
+
+class ConfigError(ValueError):
+    """Raised when the environment holds invalid or incomplete settings"""
+
+    def __init__(self, problems: List[str]):
+        self.problems = problems
+        super().__init__("Invalid configuration:\n" + "\n".join(f"  - {problem}" for problem in problems))
+
+
+def _env(default: Any, name: Optional[str] = None, fallbacks: Tuple[str, ...] = (), minimum: int = 0,
+         maximum: Optional[int] = None, secret: bool = False):
+    """Field read from the variable ``name`` (default: the field name), or the first set of ``fallbacks``"""
+    metadata = {"env": name, "fallbacks": fallbacks, "minimum": minimum, "maximum": maximum}
+    return field(default=default, repr=not secret, metadata=metadata)
+
+
+def _derived():
+    return field(default=None, init=False, repr=False, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    All settings of the site, parsed and validated once
+
+    Field names are the attribute names of ``Config``; a field is read from
+    the variable of the same name unless noted. Empty numbers and flags count
+    as unset. The derived fields at the end are computed from the others.
+    """
 
-class EnvironmentConfig:
-    """Configuration class that loads settings from environment variables"""
-    
     # Database configuration
-    DB_URL: str = os.getenv("DB_URL", "sqlite:///reflex.db")
+    DB_URL: str = "sqlite:///reflex.db"
+
+    # Shared cache (rate limits, duplicate detection) - optional, in-memory if unset
+    REDIS_URL: str = ""
 
     # Ninox database configuration
-    NINOX_API_KEY: str = os.getenv("NINOX_API_KEY", "")
-    NINOX_DATABASE_ID: str = os.getenv("NINOX_DATABASE_ID", "")
-    NINOX_TABLE_ID: str = os.getenv("NINOX_TABLE_ID", "")
+    NINOX_API_KEY: str = _env("", secret=True)
+    NINOX_DATABASE_ID: str = ""
+    NINOX_TABLE_ID: str = ""
+    NINOX_TEAM_ID: str = ""  # Workspace that holds the database
+    NINOX_API_URL: str = "https://api.ninox.com"
 
     # Application settings
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
-    DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
-    SECRET_KEY: str = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
-    
-    # External services
-    EMAIL_HOST: Optional[str] = os.getenv("EMAIL_HOST")
-    EMAIL_PORT: Optional[int] = int(os.getenv("EMAIL_PORT", "587")) if os.getenv("EMAIL_PORT") else None
-    EMAIL_HOST_USER: Optional[str] = os.getenv("EMAIL_HOST_USER")
-    EMAIL_HOST_PASSWORD: Optional[str] = os.getenv("EMAIL_HOST_PASSWORD")
-    EMAIL_USE_TLS: bool = os.getenv("EMAIL_USE_TLS", "True").lower() == "true"
-    
+    ENVIRONMENT: str = "development"
+    DEBUG: bool = False
+    SECRET_KEY: str = _env("dev-secret-key-change-in-production", secret=True)
+
+    # SMTP server, for contact form mails and error alerts. SMTP_SERVER, SMTP_PORT,
+    # EMAIL_USERNAME and EMAIL_PASSWORD are the older names of the alert mails
+    EMAIL_HOST: str = _env("", fallbacks=("SMTP_SERVER",))
+    EMAIL_PORT: int = _env(587, fallbacks=("SMTP_PORT",), minimum=1, maximum=65535)
+    EMAIL_HOST_USER: str = _env("", fallbacks=("EMAIL_USERNAME",))
+    EMAIL_HOST_PASSWORD: str = _env("", fallbacks=("EMAIL_PASSWORD",), secret=True)
+    EMAIL_USE_TLS: bool = True
+
     # Google Analytics
-    GOOGLE_ANALYTICS_ID: str = os.getenv("GOOGLE_ANALYTICS_ID", "")
-    
+    GOOGLE_ANALYTICS_ID: str = ""
+
     # Contact information
-    COMPANY_NAME: str = os.getenv("COMPANY_NAME", "Südwest-Energie")
-    EMAIL: str = os.getenv("CONTACT_EMAIL", "kontakt@suedwest-energie.de")
-    PHONE: str = os.getenv("CONTACT_PHONE", "+49 711 12345678")
-    ADDRESS: str = os.getenv("CONTACT_ADDRESS", "Stuttgart, Deutschland")
-    
+    COMPANY_NAME: str = "Südwest-Energie"
+    EMAIL: str = _env("kontakt@suedwest-energie.de", "CONTACT_EMAIL")
+    PHONE: str = _env("+49 711 12345678", "CONTACT_PHONE")
+    ADDRESS: str = _env("Stuttgart, Deutschland", "CONTACT_ADDRESS")
+
     # Branding - Cyan/Star-themed color palette (matching reference website)
-    PRIMARY_COLOR: str = os.getenv("PRIMARY_COLOR", "#00bcd4")  # Cyan (primary brand color)
-    SECONDARY_COLOR: str = os.getenv("SECONDARY_COLOR", "#00acc1")  # Darker cyan (accent)
-    ACCENT_COLOR: str = os.getenv("ACCENT_COLOR", "#26c6da")  # Lighter cyan (highlights)
-    TEXT_DARK: str = os.getenv("TEXT_DARK", "#002171")  # Darker deep blue (for headings)
-    TEXT_LIGHT: str = os.getenv("TEXT_LIGHT", "#4fc3f7")  # Light blue (for body text)
-    BG_LIGHT: str = os.getenv("BG_LIGHT", "#e1f5fe")  # Light cyan background
-    BG_DARK: str = os.getenv("BG_DARK", "#b3e5fc")  # Medium cyan background
-    CARD_BG: str = os.getenv("CARD_BG", "#ffffff")  # Clean white (purity)
-    SKY_BLUE: str = os.getenv("SKY_BLUE", "#00bcd4")  # Cyan blue (consistent with theme)
-    EARTH_BROWN: str = os.getenv("EARTH_BROWN", "#ff9800")  # Orange accent (for contrast)
-    
+    PRIMARY_COLOR: str = "#00bcd4"  # Cyan (primary brand color)
+    SECONDARY_COLOR: str = "#00acc1"  # Darker cyan (accent)
+    ACCENT_COLOR: str = "#26c6da"  # Lighter cyan (highlights)
+    TEXT_DARK: str = "#002171"  # Darker deep blue (for headings)
+    TEXT_LIGHT: str = "#4fc3f7"  # Light blue (for body text)
+    BG_LIGHT: str = "#e1f5fe"  # Light cyan background
+    BG_DARK: str = "#b3e5fc"  # Medium cyan background
+    CARD_BG: str = "#ffffff"  # Clean white (purity)
+    SKY_BLUE: str = "#00bcd4"  # Cyan blue (consistent with theme)
+    EARTH_BROWN: str = "#ff9800"  # Orange accent (for contrast)
+
     # SEO
-    SITE_TITLE: str = os.getenv("SITE_TITLE", "Südwest-Energie - Energievermittlung für Unternehmen")
-    SITE_DESCRIPTION: str = os.getenv("SITE_DESCRIPTION",
-        "Professionelle Energievermittlung für Unternehmen. Wir senken Ihre Strom- und Gaskosten um durchschnittlich 20-30% - transparent, unabhängig und kostenfrei.")
-    
+    SITE_URL: str = "https://suedwest-energie.de"  # Canonical origin for sitemap.xml, without trailing slash
+    SITE_TITLE: str = "Südwest-Energie - Energievermittlung für Unternehmen"
+    SITE_DESCRIPTION: str = (
+        "Professionelle Energievermittlung für Unternehmen. Wir senken Ihre Strom- und Gaskosten um "
+        "durchschnittlich 20-30% - transparent, unabhängig und kostenfrei.")
+
     # Tarifrechner (Tariff Calculator) Embed
-    TARIFRECHNER_ENABLED: bool = os.getenv("TARIFRECHNER_ENABLED", "True").lower() == "true"
-    TARIFRECHNER_TYPE: str = os.getenv("TARIFRECHNER_TYPE", "iframe")  # "iframe" or "script"
-    TARIFRECHNER_URL: str = os.getenv("TARIFRECHNER_URL", "")  # URL for iframe embed
-    TARIFRECHNER_SCRIPT: str = os.getenv("TARIFRECHNER_SCRIPT", "")  # Script code for script embed
-    TARIFRECHNER_HEIGHT: str = os.getenv("TARIFRECHNER_HEIGHT", "600px")  # Height of embed
-    
+    TARIFRECHNER_ENABLED: bool = True
+    TARIFRECHNER_TYPE: str = "iframe"  # "iframe" or "script"
+    TARIFRECHNER_URL: str = ""  # URL for iframe embed
+    TARIFRECHNER_SCRIPT: str = ""  # Script code for script embed
+    TARIFRECHNER_HEIGHT: str = "600px"  # Height of embed
+
+    # Contact form
+    CONTACT_FORM_MODE: str = "uncontrolled"  # "uncontrolled" or "debounced"
+    CONTACT_FORM_DEBOUNCE_MS: int = 500  # Sync delay in debounced mode
+
+    # Contact form abuse protection
+    CONTACT_RATE_LIMIT_PER_IP: int = _env(10, minimum=1)
+    CONTACT_RATE_LIMIT_PER_SESSION: int = _env(3, minimum=1)
+    CONTACT_RATE_LIMIT_WINDOW: int = _env(600, minimum=1)  # Seconds
+    SPAM_SCORE_THRESHOLD: int = _env(50, minimum=1)
+    SPAM_MIN_SUBMIT_SECONDS: int = 3
+    SPAM_DUPLICATE_TTL: int = 86400  # Seconds
+    IDEMPOTENCY_TTL: int = 600  # Seconds a repeated submission is deduplicated
+
+    # Build
+    COMPONENT_MEMO: bool = True  # Reuse section trees whose Config inputs did not change while compiling
+    LAZY_SECTIONS: bool = True  # Mount embeds such as the Tarifrechner iframe when scrolled near
+
+    # Logging
+    LOG_LEVEL: str = "INFO"
+    LOG_FILE: str = "suedwest_energie.log"
+    MAX_LOG_SIZE: int = _env(10485760, minimum=1)  # 10MB
+    BACKUP_COUNT: int = 5
+    RETENTION_DAYS: int = 30
+
+    # Error alerts, sent over the SMTP server above and Twilio
+    FROM_EMAIL: str = "noreply@suedwestenergie.de"
+    NOTIFICATION_EMAILS: Tuple[str, ...] = ()
+    TWILIO_SID: str = ""
+    TWILIO_TOKEN: str = _env("", secret=True)
+    TWILIO_FROM_PHONE: str = ""
+    NOTIFICATION_PHONES: Tuple[str, ...] = ()
+    CRITICAL_ERROR_CODES: Tuple[str, ...] = ("DB_ERROR", "SMTP_ERROR", "SYSTEM_ERROR", "PERMISSION_ERROR")
+    NOTIFY_ON_ERROR_LEVEL: str = "CRITICAL"  # CRITICAL, ERROR, WARNING
+    NOTIFICATION_COOLDOWN_MINUTES: int = 5
+
+    # Derived
+    IS_PRODUCTION: bool = _derived()
+    IS_DEVELOPMENT: bool = _derived()
+    IS_TEST: bool = _derived()
+    EMAIL_CONFIGURED: bool = _derived()  # SMTP server and login set
+    NINOX_CONFIGURED: bool = _derived()
+    EMAIL_ALERTS_CONFIGURED: bool = _derived()  # SMTP and recipients set
+    SMS_ALERTS_CONFIGURED: bool = _derived()  # Twilio and recipients set
+
+    def __post_init__(self):
+        problems = []
+        for name, allowed in _CHOICES.items():
+            value = getattr(self, name)
+            if value.lower() not in [choice.lower() for choice in allowed]:
+                problems.append(f"{name}: {value!r} is not one of {', '.join(allowed)}")
+        for name, group in _GROUPS.items():
+            missing = [variable for variable in group if not getattr(self, variable)]
+            if 0 < len(missing) < len(group):
+                problems.append(f"{name} is configured partially, {', '.join(missing)} missing")
+        for variable, recipients in (("NOTIFICATION_EMAILS", "EMAIL_HOST"), ("NOTIFICATION_PHONES", "TWILIO_SID")):
+            if getattr(self, variable) and not getattr(self, recipients):
+                problems.append(f"{variable} is set, but {recipients} is not")
+        for address in (self.EMAIL, self.FROM_EMAIL) + self.NOTIFICATION_EMAILS:
+            if address and "@" not in address:
+                problems.append(f"{address!r} is not an e-mail address")
+        if problems:
+            raise ConfigError(problems)
+
+        environment = self.ENVIRONMENT.lower()
+        if environment not in PRODUCTION_NAMES + DEVELOPMENT_NAMES + TEST_NAMES:
+            logging.getLogger(__name__).warning(
+                "ENVIRONMENT: %r is not one of %s; treated as neither production nor development",
+                self.ENVIRONMENT, ", ".join(PRODUCTION_NAMES + DEVELOPMENT_NAMES + TEST_NAMES),
+            )
+        derived = {
+            "SITE_URL": self.SITE_URL.rstrip("/"),
+            "IS_PRODUCTION": environment in PRODUCTION_NAMES,
+            "IS_DEVELOPMENT": environment in DEVELOPMENT_NAMES,
+            "IS_TEST": environment in TEST_NAMES,
+            "EMAIL_CONFIGURED": bool(self.EMAIL_HOST),
+            "NINOX_CONFIGURED": bool(self.NINOX_API_KEY),
+            "EMAIL_ALERTS_CONFIGURED": bool(self.EMAIL_HOST and self.NOTIFICATION_EMAILS),
+            "SMS_ALERTS_CONFIGURED": bool(self.TWILIO_SID and self.NOTIFICATION_PHONES),
+        }
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> "Settings":
+        """
+        Parse and validate the settings
+
+        Raises:
+            ConfigError: listing every invalid value and incomplete group
+        """
+        values, problems = {}, []
+        for f in fields(cls):
+            if not f.init:
+                continue
+            names = (f.metadata.get("env") or f.name,) + f.metadata.get("fallbacks", ())
+            name, raw = next(((name, environ[name]) for name in names if environ.get(name)), (names[0], None))
+            if raw is None and f.type is not str:
+                continue
+            if f.type is str:
+                values[f.name] = environ.get(names[0], f.default) if raw is None else raw
+            elif f.type is bool:
+                if raw.strip().lower() not in _TRUE + _FALSE:
+                    problems.append(f"{name}: {raw!r} is not true or false")
+                values[f.name] = raw.strip().lower() in _TRUE
+            elif f.type is int:
+                try:
+                    number = int(raw)
+                except ValueError:
+                    problems.append(f"{name}: {raw!r} is not a whole number")
+                    continue
+                minimum, maximum = f.metadata.get("minimum", 0), f.metadata.get("maximum")
+                if number < minimum or (maximum is not None and number > maximum):
+                    bounds = f"between {minimum} and {maximum}" if maximum is not None else f"at least {minimum}"
+                    problems.append(f"{name}: {number} must be {bounds}")
+                values[f.name] = number
+            else:
+                values[f.name] = tuple(item.strip() for item in raw.split(",") if item.strip())
+        if problems:
+            raise ConfigError(problems)
+        return cls(**values)
+
+
+class EnvironmentConfig:
+    """
+    Configuration class that loads settings from environment variables
+
+    Has one class attribute per ``Settings`` field, set from ``get_settings()``.
+    """
+
     @classmethod
     def is_production(cls) -> bool:
         """Check if running in production environment"""
-        return cls.ENVIRONMENT.lower() in ['prod', 'production']
-    
+        return cls.ENVIRONMENT.lower() in PRODUCTION_NAMES
+
     @classmethod
     def is_development(cls) -> bool:
         """Check if running in development environment"""
-        return cls.ENVIRONMENT.lower() in ['dev', 'development', 'local']
-    
+        return cls.ENVIRONMENT.lower() in DEVELOPMENT_NAMES
+
     @classmethod
     def is_test(cls) -> bool:
         """Check if running in test environment"""
-        return cls.ENVIRONMENT.lower() in ['test', 'testing']
\ No newline at end of file
+        return cls.ENVIRONMENT.lower() in TEST_NAMES
+
+
+_settings: Optional[Settings] = None
+_reload_callbacks: List[Callable[[Settings], None]] = []
+
+
+def get_settings() -> Settings:
+    """The settings parsed at import or by the last ``reload_settings()``"""
+    return _settings
+
+
+def on_reload(callback: Callable[[Settings], None]) -> Callable[[Settings], None]:
+    """Call ``callback`` with the new settings after every reload, e.g. to drop clients built from the old ones"""
+    _reload_callbacks.append(callback)
+    return callback
+
+
+def reload_settings(environ: Optional[Mapping[str, str]] = None) -> Settings:
+    """
+    Parse the environment (or ``environ``) again and apply it to ``EnvironmentConfig``
+
+    Values set on ``Config`` or another subclass are replaced as well. The
+    current settings stay in place if the new ones are invalid.
+
+    Raises:
+        ConfigError: if the settings are invalid
+    """
+    global _settings
+    settings = Settings.from_env(os.environ if environ is None else environ)
+    _settings = settings
+    classes = [EnvironmentConfig]
+    for cls in classes:
+        classes.extend(cls.__subclasses__())
+    for f in fields(Settings):
+        value = getattr(settings, f.name)
+        for cls in classes:
+            if cls is EnvironmentConfig or f.name in vars(cls):
+                setattr(cls, f.name, value)
+    for callback in _reload_callbacks:
+        callback(settings)
+    return settings
+
+
+# Parsed with the first import, so that a misconfigured site fails at startup
+reload_settings()
@@ -1,146 +1,114 @@
 """Logging configuration for Südwest-Energie website"""
 
-import os
-from typing import Dict, List, Optional
-
-# Default configuration values
-DEFAULT_LOGGING_CONFIG = {
-    # Logging settings
-    "LOG_LEVEL": os.getenv("LOG_LEVEL", "INFO"),
-    "LOG_FILE": os.getenv("LOG_FILE", "suedwest_energie.log"),
-    "MAX_LOG_SIZE": int(os.getenv("MAX_LOG_SIZE", "10485760")),  # 10MB
-    "BACKUP_COUNT": int(os.getenv("BACKUP_COUNT", "5")),
-    
-    # Email notification settings
-    "SMTP_SERVER": os.getenv("SMTP_SERVER", "smtp.gmail.com"),
-    "SMTP_PORT": int(os.getenv("SMTP_PORT", "587")),
-    "EMAIL_USERNAME": os.getenv("EMAIL_USERNAME", ""),
-    "EMAIL_PASSWORD": os.getenv("EMAIL_PASSWORD", ""),
-    "FROM_EMAIL": os.getenv("FROM_EMAIL", "noreply@suedwestenergie.de"),
-    "NOTIFICATION_EMAILS": os.getenv("NOTIFICATION_EMAILS", "").split(","),
-    
-    # SMS notification settings
-    "TWILIO_SID": os.getenv("TWILIO_SID", ""),
-    "TWILIO_TOKEN": os.getenv("TWILIO_TOKEN", ""),
-    "TWILIO_FROM_PHONE": os.getenv("TWILIO_FROM_PHONE", ""),
-    "NOTIFICATION_PHONES": os.getenv("NOTIFICATION_PHONES", "").split(","),
-    
-    # Error classification settings
-    "CRITICAL_ERROR_CODES": os.getenv(
-        "CRITICAL_ERROR_CODES", 
-        "DB_ERROR,SMTP_ERROR,SYSTEM_ERROR,PERMISSION_ERROR"
-    ).split(","),
-    
-    # Notification thresholds
-    "NOTIFY_ON_ERROR_LEVEL": os.getenv("NOTIFY_ON_ERROR_LEVEL", "CRITICAL"),  # CRITICAL, ERROR, WARNING
-    "NOTIFICATION_COOLDOWN_MINUTES": int(os.getenv("NOTIFICATION_COOLDOWN_MINUTES", "5")),
-    
-    # Log retention
-    "RETENTION_DAYS": int(os.getenv("RETENTION_DAYS", "30")),
-}
+from typing import Optional, Tuple
+from .env_config import Settings, get_settings
+
 
 class LoggingConfig:
-    """Configuration class for logging settings"""
-    
-    def __init__(self, config: Optional[Dict] = None):
-        self.config = config or DEFAULT_LOGGING_CONFIG.copy()
-    
+    """
+    Logging and notification settings
+
+    A view of ``Settings``: the lists are parsed once, with the environment.
+    Without ``settings`` it follows ``reload_settings()``.
+    """
+
+    __slots__ = ("_settings",)
+
+    def __init__(self, settings: Optional[Settings] = None):
+        self._settings = settings
+
+    @property
+    def settings(self) -> Settings:
+        return self._settings or get_settings()
+
     @property
     def log_level(self) -> str:
-        return self.config.get("LOG_LEVEL", "INFO")
-    
+        return self.settings.LOG_LEVEL
+
     @property
     def log_file(self) -> str:
-        return self.config.get("LOG_FILE", "suedwest_energie.log")
-    
+        return self.settings.LOG_FILE
+
     @property
     def max_log_size(self) -> int:
-        return self.config.get("MAX_LOG_SIZE", 10485760)
-    
+        return self.settings.MAX_LOG_SIZE
+
     @property
     def backup_count(self) -> int:
-        return self.config.get("BACKUP_COUNT", 5)
-    
+        return self.settings.BACKUP_COUNT
+
     @property
     def smtp_server(self) -> str:
-        return self.config.get("SMTP_SERVER", "smtp.gmail.com")
-    
+        return self.settings.EMAIL_HOST
+
     @property
     def smtp_port(self) -> int:
-        return self.config.get("SMTP_PORT", 587)
-    
+        return self.settings.EMAIL_PORT
+
+    @property
+    def smtp_use_tls(self) -> bool:
+        return self.settings.EMAIL_USE_TLS
+
     @property
     def email_username(self) -> str:
-        return self.config.get("EMAIL_USERNAME", "")
-    
+        return self.settings.EMAIL_HOST_USER
+
     @property
     def email_password(self) -> str:
-        return self.config.get("EMAIL_PASSWORD", "")
-    
+        return self.settings.EMAIL_HOST_PASSWORD
+
     @property
     def from_email(self) -> str:
-        return self.config.get("FROM_EMAIL", "noreply@suedwestenergie.de")
-    
+        return self.settings.FROM_EMAIL
+
     @property
-    def notification_emails(self) -> List[str]:
-        emails = self.config.get("NOTIFICATION_EMAILS", [])
-        return [email.strip() for email in emails if email.strip()]
-    
+    def notification_emails(self) -> Tuple[str, ...]:
+        return self.settings.NOTIFICATION_EMAILS
+
     @property
     def twilio_sid(self) -> str:
-        return self.config.get("TWILIO_SID", "")
-    
+        return self.settings.TWILIO_SID
+
     @property
     def twilio_token(self) -> str:
-        return self.config.get("TWILIO_TOKEN", "")
-    
+        return self.settings.TWILIO_TOKEN
+
     @property
     def twilio_from_phone(self) -> str:
-        return self.config.get("TWILIO_FROM_PHONE", "")
-    
+        return self.settings.TWILIO_FROM_PHONE
+
     @property
-    def notification_phones(self) -> List[str]:
-        phones = self.config.get("NOTIFICATION_PHONES", [])
-        return [phone.strip() for phone in phones if phone.strip()]
-    
+    def notification_phones(self) -> Tuple[str, ...]:
+        return self.settings.NOTIFICATION_PHONES
+
     @property
-    def critical_error_codes(self) -> List[str]:
-        codes = self.config.get("CRITICAL_ERROR_CODES", [])
-        return [code.strip() for code in codes if code.strip()]
-    
+    def critical_error_codes(self) -> Tuple[str, ...]:
+        return self.settings.CRITICAL_ERROR_CODES
+
     @property
     def notify_on_error_level(self) -> str:
-        return self.config.get("NOTIFY_ON_ERROR_LEVEL", "CRITICAL")
-    
+        return self.settings.NOTIFY_ON_ERROR_LEVEL
+
     @property
     def notification_cooldown_minutes(self) -> int:
-        return self.config.get("NOTIFICATION_COOLDOWN_MINUTES", 5)
-    
+        return self.settings.NOTIFICATION_COOLDOWN_MINUTES
+
     @property
     def retention_days(self) -> int:
-        return self.config.get("RETENTION_DAYS", 30)
-    
+        return self.settings.RETENTION_DAYS
+
     def is_email_configured(self) -> bool:
         """Check if email notifications are properly configured"""
-        return (
-            bool(self.email_username) and 
-            bool(self.email_password) and 
-            len(self.notification_emails) > 0
-        )
-    
+        return self.settings.EMAIL_ALERTS_CONFIGURED
+
     def is_sms_configured(self) -> bool:
         """Check if SMS notifications are properly configured"""
-        return (
-            bool(self.twilio_sid) and 
-            bool(self.twilio_token) and 
-            bool(self.twilio_from_phone) and 
-            len(self.notification_phones) > 0
-        )
-    
+        return self.settings.SMS_ALERTS_CONFIGURED
+
     def is_notification_enabled(self) -> bool:
         """Check if any notification method is configured"""
         return self.is_email_configured() or self.is_sms_configured()
 
 
 # Global config instance
-logging_config = LoggingConfig()
\ No newline at end of file
+logging_config = LoggingConfig()
@@ -3,6 +3,7 @@ from .thank_you import thank_you
 from .impressum import impressum
 from .datenschutz import datenschutz
 from .agb import agb
+from .not_found import not_found
 from .status import status_page, StatusState
 
-__all__ = ["index", "thank_you", "impressum", "datenschutz", "agb", "status_page", "StatusState"]
\ No newline at end of file
+__all__ = ["index", "thank_you", "impressum", "datenschutz", "agb", "not_found", "status_page", "StatusState"]
\ No newline at end of file
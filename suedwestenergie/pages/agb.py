@@ -1,7 +1,7 @@
 """AGB-Seite"""
 
 import reflex as rx
-from suedwestenergie.components import navbar, footer
+from suedwestenergie.components import navbar, footer, image
 from suedwestenergie.config import Config
 
 
@@ -13,7 +13,7 @@ def agb() -> rx.Component:
             rx.container(
                 rx.vstack(
                     # Add logo to the AGB page for brand consistency
-                    rx.image(
+                    image(
                         src="/logo.jpg",
                         alt=Config.COMPANY_NAME,
                         height="80px",
@@ -1,8 +1,9 @@
 """Datenschutz-Seite"""
 
 import reflex as rx
-from suedwestenergie.components import navbar, footer
+from suedwestenergie.components import navbar, footer, image
 from suedwestenergie.config import Config
+from suedwestenergie.utils.analytics import consent_settings_link
 
 
 def datenschutz() -> rx.Component:
@@ -13,7 +14,7 @@ def datenschutz() -> rx.Component:
             rx.container(
                 rx.vstack(
                     # Add logo to the datenschutz page for brand consistency
-                    rx.image(
+                    image(
                         src="/logo.jpg",
                         alt=Config.COMPANY_NAME,
                         height="80px",
@@ -46,6 +47,16 @@ def datenschutz() -> rx.Component:
                             color=Config.TEXT_DARK,
                             line_height="1.6",
                         ),
+                        # Only with analytics configured: how to change or withdraw the consent
+                        rx.fragment(
+                            rx.heading("5. Webanalyse", size="5", color=Config.TEXT_DARK, margin_top="2rem"),
+                            rx.text(
+                                "Mit Ihrer Einwilligung messen wir mit Google Analytics anonymisiert, wie unsere Website genutzt wird. Sie können Ihre Einwilligung jederzeit mit Wirkung für die Zukunft ändern oder widerrufen.",
+                                color=Config.TEXT_DARK,
+                                line_height="1.6",
+                            ),
+                            consent_settings_link(color=Config.PRIMARY_COLOR),
+                        ) if Config.GOOGLE_ANALYTICS_ID else rx.fragment(),
                         align="start",
                         spacing="3",
                     ),
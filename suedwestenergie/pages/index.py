@@ -2,6 +2,7 @@
 
 import reflex as rx
 from suedwestenergie.components import navbar, footer
+from suedwestenergie.components.critical import deferred
 from suedwestenergie.sections import (
     hero_section,
     service_models_section,
@@ -15,12 +16,15 @@ from suedwestenergie.sections import (
 def index() -> rx.Component:
     """Hauptseite"""
     return rx.fragment(
+        # Above the fold: styled by the inlined critical CSS
         navbar(),
         hero_section(),
-        service_models_section(),
-        benefits_section(),
-        about_section(),
-        services_section(),
-        contact_section(),
-        footer(),
+        # Below the fold: rendering is skipped until scrolled near; the markup stays
+        # in the prerendered page, so crawlers and in-page search still see the text
+        deferred(service_models_section(), "900px"),
+        deferred(benefits_section(), "700px"),
+        deferred(about_section(), "600px"),
+        deferred(services_section(), "900px"),
+        deferred(contact_section(), "1100px"),
+        deferred(footer(), "400px"),
     )
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""404-Seite für unbekannte Pfade"""
+
+import reflex as rx
+from suedwestenergie.components import navbar, footer
+from suedwestenergie.config import Config
+
+
+def not_found() -> rx.Component:
+    """Not Found Page"""
+    return rx.fragment(
+        navbar(),
+        rx.box(
+            rx.container(
+                rx.vstack(
+                    rx.text("404", font_size="5rem", font_weight="700", color=Config.SECONDARY_COLOR),
+                    rx.heading("Seite nicht gefunden", size="8", color=Config.TEXT_DARK, text_align="center"),
+                    rx.text(
+                        "Die angeforderte Seite existiert nicht oder wurde verschoben.",
+                        font_size="1.2rem",
+                        color=Config.TEXT_LIGHT,
+                        text_align="center",
+                        max_width="600px",
+                    ),
+                    rx.button(
+                        "Zurück zur Startseite",
+                        on_click=lambda: rx.redirect("/"),
+                        background=Config.PRIMARY_COLOR,
+                        color="white",
+                        padding="1rem 2rem",
+                        font_size="1.1rem",
+                        border_radius="8px",
+                        cursor="pointer",
+                        margin_top="2rem",
+                    ),
+                    spacing="6",
+                    align="center",
+                    padding_y="5rem",
+                ),
+                max_width="1200px",
+            ),
+            min_height="80vh",
+        ),
+        footer(),
+    )
@@ -1,64 +1,57 @@
 """Status Page - System Health Check"""
 
 import reflex as rx
-import asyncio
-from datetime import datetime
 from suedwestenergie.config import Config
-from suedwestenergie.components import navbar, footer
+from suedwestenergie.components import navbar, footer, image
+from suedwestenergie.utils.health import service_health
 
 class StatusState(rx.State):
-    """State for the status page"""
-    
-    db_status: str = "Checking..."
-    db_operational: bool = False
-    
-    website_status: str = "Checking..."
-    website_operational: bool = False
-    
-    email_status: str = "Checking..."
-    email_operational: bool = False
-
-    admin_email_status: str = "Checking..."
-    admin_email_operational: bool = False
-    
-    last_updated: str = ""
-    
+    """State for the status page
+
+    Service health is identical for every visitor and lives in the shared
+    ``service_health`` store. The vars below are uncached views on that store
+    (plain dictionary lookups), so no status data is kept per session.
+    """
+
     async def check_services(self):
-        """Check health of all services"""
-        # Simulate check delay for realism
-        await asyncio.sleep(0.5)
-        
-        # 1. Check Database (Simulated connection check)
-        # In a real scenario, we would try to connect to the DB here
-        try:
-            # self.session.execute(text("SELECT 1"))
-            self.db_status = "Operational"
-            self.db_operational = True
-        except Exception as e:
-            self.db_status = "Degraded Performance"
-            self.db_operational = False
-            
-        # 2. Check Website (Self-check)
-        self.website_status = "Operational"
-        self.website_operational = True
-        
-        # 3. Check Email Service
-        if Config.EMAIL_HOST and Config.EMAIL_HOST_USER:
-            self.email_status = "Operational"
-            self.email_operational = True
-        else:
-            self.email_status = "Not Configured"
-            self.email_operational = False
-
-        # 4. Check Admin Email
-        if Config.EMAIL_HOST:
-            self.admin_email_status = "Operational"
-            self.admin_email_operational = True
-        else:
-            self.admin_email_status = "Not Configured"
-            self.admin_email_operational = False
-            
-        self.last_updated = datetime.now().strftime("%d.%m.%Y %H:%M:%S")
+        """Check health of all services (at most once per TTL for all visitors)"""
+        await service_health.refresh_if_stale()
+
+    @rx.var(cache=False)
+    def db_status(self) -> str:
+        return service_health.get("db").status
+
+    @rx.var(cache=False)
+    def db_operational(self) -> bool:
+        return service_health.get("db").operational
+
+    @rx.var(cache=False)
+    def website_status(self) -> str:
+        return service_health.get("website").status
+
+    @rx.var(cache=False)
+    def website_operational(self) -> bool:
+        return service_health.get("website").operational
+
+    @rx.var(cache=False)
+    def email_status(self) -> str:
+        return service_health.get("email").status
+
+    @rx.var(cache=False)
+    def email_operational(self) -> bool:
+        return service_health.get("email").operational
+
+    @rx.var(cache=False)
+    def admin_email_status(self) -> str:
+        return service_health.get("admin_email").status
+
+    @rx.var(cache=False)
+    def admin_email_operational(self) -> bool:
+        return service_health.get("admin_email").operational
+
+    @rx.var(cache=False)
+    def last_updated(self) -> str:
+        return service_health.last_updated
 
 def status_indicator(operational: bool) -> rx.Component:
     return rx.box(
@@ -107,7 +100,7 @@ def status_page() -> rx.Component:
             rx.container(
                 rx.vstack(
                     # Add logo to the status page for brand consistency
-                    rx.image(
+                    image(
                         src="/logo.jpg",
                         alt=Config.COMPANY_NAME,
                         height="80px",
@@ -1,7 +1,7 @@
 """Danke-Seite nach Kontaktformular"""
 
 import reflex as rx
-from suedwestenergie.components import navbar, footer
+from suedwestenergie.components import navbar, footer, image
 from suedwestenergie.config import Config
 
 
@@ -13,7 +13,7 @@ def thank_you() -> rx.Component:
             rx.container(
                 rx.vstack(
                     # Add logo to the thank you page
-                    rx.image(
+                    image(
                         src="/logo.jpg",
                         alt=Config.COMPANY_NAME,
                         height="80px",
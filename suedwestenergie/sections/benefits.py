@@ -2,8 +2,10 @@
 
 import reflex as rx
 from suedwestenergie.config import Config
+from suedwestenergie.components.memo import memoize_component
 
 
+@memoize_component
 def benefits_section() -> rx.Component:
     """Vorteile Section mit nachhaltiger Ausrichtung"""
     benefits = [
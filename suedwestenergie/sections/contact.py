@@ -1,23 +1,68 @@
 """Contact Section - Kontaktformular"""
 
 import reflex as rx
+from typing import Callable
 from suedwestenergie.config import Config
+from suedwestenergie.components import image
 from suedwestenergie.state import ContactFormState
-from suedwestenergie.utils.analytics import track_form_submission
+from suedwestenergie.utils.spam import HONEYPOT_FIELD
+from suedwestenergie.utils.validation import client_rules
+from suedwestenergie.components.memo import memoize_component
 
+# Throttle that lets the first start_form of a page view through and no other
+# (the browser caps timers at 2^31 - 1 ms)
+FORM_START_ONCE_MS = 24 * 60 * 60 * 1000
 
+
+def _form_field(component: Callable[..., rx.Component], field: str, **props) -> rx.Component:
+    """
+    Contact form field bound according to ``Config.CONTACT_FORM_MODE``
+
+    In "uncontrolled" mode (default) the value lives only in the browser and
+    reaches the backend once, as part of the ``on_submit`` form data. In
+    "debounced" mode the value is additionally synced to ContactFormState after
+    the user stops typing for ``CONTACT_FORM_DEBOUNCE_MS`` milliseconds. The
+    input stays uncontrolled in both modes, so the state never sends the value
+    back to the browser.
+    """
+    props.update(name=field, **client_rules(field))
+    if Config.CONTACT_FORM_MODE == "debounced":
+        setter = getattr(ContactFormState, f"set_{field}")
+        props["on_change"] = setter.debounce(Config.CONTACT_FORM_DEBOUNCE_MS)
+    return component(**props)
+
+
+def _honeypot_field() -> rx.Component:
+    """Hidden honeypot field used for spam scoring"""
+    # Invisible to humans, but naive bots fill in every input
+    return rx.el.input(
+        name=HONEYPOT_FIELD,
+        type="text",
+        tab_index=-1,
+        auto_complete="off",
+        aria_hidden="true",
+        position="absolute",
+        left="-10000px",
+        width="1px",
+        height="1px",
+        overflow="hidden",
+    )
+
+
+@memoize_component
 def contact_section() -> rx.Component:
     """Kontakt Section mit Formular"""
     return rx.box(
         rx.container(
             rx.vstack(
                 # Add logo to the contact section
-                rx.image(
+                image(
                     src="/logo.jpg",
                     alt=Config.COMPANY_NAME,
                     height="60px",
                     width="auto",
                     margin_bottom="1rem",
+                    loading="lazy",
                 ),
                 rx.heading("Jetzt Kontakt aufnehmen", size="8", color=Config.TEXT_DARK, text_align="center", margin_bottom="1rem", width="100%"),
                 rx.text("Fordern Sie unverbindlich ein individuelles Angebot an", font_size="1.2rem", color=Config.TEXT_LIGHT, text_align="center", margin_bottom="3rem", width="100%"),
@@ -36,12 +81,12 @@ def contact_section() -> rx.Component:
                             ),
                         ),
                         rx.form(
+                            _honeypot_field(),
                             rx.vstack(
-                                rx.input(
+                                _form_field(
+                                    rx.input,
+                                    "name",
                                     placeholder="Ihr Name *",
-                                    name="name",
-                                    value=ContactFormState.name,
-                                    on_change=ContactFormState.set_name,
                                     required=True,
                                     padding="1rem",
                                     border=f"1px solid {Config.TEXT_LIGHT}",
@@ -49,12 +94,11 @@ def contact_section() -> rx.Component:
                                     width="100%",
                                     min_width="250px",
                                 ),
-                                rx.input(
+                                _form_field(
+                                    rx.input,
+                                    "email",
                                     placeholder="E-Mail-Adresse *",
-                                    name="email",
                                     type="email",
-                                    value=ContactFormState.email,
-                                    on_change=ContactFormState.set_email,
                                     required=True,
                                     padding="1rem",
                                     border=f"1px solid {Config.TEXT_LIGHT}",
@@ -62,22 +106,20 @@ def contact_section() -> rx.Component:
                                     width="100%",
                                     min_width="250px",
                                 ),
-                                rx.input(
+                                _form_field(
+                                    rx.input,
+                                    "phone",
                                     placeholder="Telefonnummer",
-                                    name="phone",
-                                    value=ContactFormState.phone,
-                                    on_change=ContactFormState.set_phone,
                                     padding="1rem",
                                     border=f"1px solid {Config.TEXT_LIGHT}",
                                     border_radius="8px",
                                     width="100%",
                                     min_width="250px",
                                 ),
-                                rx.input(
+                                _form_field(
+                                    rx.input,
+                                    "company",
                                     placeholder="Firmenname *",
-                                    name="company",
-                                    value=ContactFormState.company,
-                                    on_change=ContactFormState.set_company,
                                     required=True,
                                     padding="1rem",
                                     border=f"1px solid {Config.TEXT_LIGHT}",
@@ -85,11 +127,10 @@ def contact_section() -> rx.Component:
                                     width="100%",
                                     min_width="250px",
                                 ),
-                                rx.text_area(
+                                _form_field(
+                                    rx.text_area,
+                                    "message",
                                     placeholder="Ihre Nachricht (mindestens 10 Zeichen)",
-                                    name="message",
-                                    value=ContactFormState.message,
-                                    on_change=ContactFormState.set_message,
                                     padding="1rem",
                                     border=f"1px solid {Config.TEXT_LIGHT}",
                                     border_radius="8px",
@@ -112,14 +153,15 @@ def contact_section() -> rx.Component:
                                         "background": Config.SECONDARY_COLOR,
                                         "transform": "scale(1.02)",
                                     },
-                                    # Track button click
-                                    on_click=lambda: track_form_submission("contact_form"),
                                 ),
                                 rx.text("* Pflichtfelder", font_size="0.9rem", color=Config.TEXT_LIGHT),
                                 spacing="4",
                                 width="100%",
                             ),
                             on_submit=ContactFormState.submit_form,
+                            # The server notes when the visitor started the form, for the spam
+                            # check; only the first focus of a field is sent (focus events bubble)
+                            on_focus=ContactFormState.start_form.throttle(FORM_START_ONCE_MS),
                             width="100%",
                         ),
                         spacing="4",
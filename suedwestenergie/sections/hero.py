@@ -2,20 +2,26 @@
 
 import reflex as rx
 from suedwestenergie.config import Config
+from suedwestenergie.components import image
+from suedwestenergie.components.critical import critical_styles
+from suedwestenergie.components.memo import memoize_component
 
 
+@memoize_component
+@critical_styles
 def hero_section() -> rx.Component:
     """Hero Section mit Call-to-Action"""
     return rx.box(
         rx.container(
             rx.vstack(
                 # Add logo to the hero section for strong brand presence
-                rx.image(
+                image(
                     src="/logo.jpg",
                     alt=Config.COMPANY_NAME,
                     height="100px",
                     width="auto",
                     margin_bottom="2rem",
+                    priority=True,
                 ),
                 rx.heading(
                     "Nachhaltige Energielösungen für Ihr Unternehmen",
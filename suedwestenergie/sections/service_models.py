@@ -2,8 +2,10 @@
 
 import reflex as rx
 from suedwestenergie.config import Config
+from suedwestenergie.components.memo import memoize_component
 
 
+@memoize_component
 def service_models_section() -> rx.Component:
     """Service Models Section - zeigt verschiedene Energiebeschaffungsmodelle"""
     
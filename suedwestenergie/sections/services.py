@@ -3,8 +3,10 @@
 import reflex as rx
 from suedwestenergie.config import Config
 from suedwestenergie.components import feature_card
+from suedwestenergie.components.memo import memoize_component
 
 
+@memoize_component
 def services_section() -> rx.Component:
     """Leistungen Section"""
     return rx.box(
@@ -1,9 +1,18 @@
-"""Tarifrechner Section - External Calculator Embed"""
+"""
+Tarifrechner Section - External Calculator Embed
+
+Not mounted on any page yet; add ``tarifrechner_section()`` to the home page
+to show it. The embed is lazy (iframe) or behind a click (script), so
+mounting it adds no third-party requests to the first render.
+"""
 
 import reflex as rx
 from suedwestenergie.config import Config
+from suedwestenergie.components.lazy import click_to_load, lazy_mount
+from suedwestenergie.components.memo import memoize_component
 
 
+@memoize_component
 def tarifrechner_section() -> rx.Component:
     """Tarifrechner Section - embeds external tariff calculator"""
     
@@ -11,22 +20,52 @@ def tarifrechner_section() -> rx.Component:
     if not Config.TARIFRECHNER_ENABLED:
         return rx.fragment()
     
-    # Prepare embed content based on type
+    # Prepare embed content based on type; the calculator only loads once it is needed
     if Config.TARIFRECHNER_TYPE == "iframe" and Config.TARIFRECHNER_URL:
-        embed_content = rx.html(
-            f"""
-            <iframe 
-                src="{Config.TARIFRECHNER_URL}"
-                width="100%"
-                height="{Config.TARIFRECHNER_HEIGHT}"
-                frameborder="0"
-                scrolling="auto"
-                style="border: 2px solid {Config.BG_DARK}; border-radius: 12px;"
-            ></iframe>
-            """
+        embed_content = lazy_mount(
+            rx.el.iframe(
+                src=Config.TARIFRECHNER_URL,
+                title="Tarifrechner",
+                width="100%",
+                height=Config.TARIFRECHNER_HEIGHT,
+                loading="lazy",
+                border=f"2px solid {Config.BG_DARK}",
+                border_radius="12px",
+                display="block",
+            ),
+            min_height=Config.TARIFRECHNER_HEIGHT,
         )
     elif Config.TARIFRECHNER_TYPE == "script" and Config.TARIFRECHNER_SCRIPT:
-        embed_content = rx.html(Config.TARIFRECHNER_SCRIPT)
+        # Third-party scripts run only after the visitor asks for the calculator
+        embed_content = click_to_load(
+            Config.TARIFRECHNER_SCRIPT,
+            rx.box(
+                rx.vstack(
+                    rx.text(
+                        "Der Tarifrechner wird von einem externen Anbieter geladen.",
+                        color=Config.TEXT_DARK,
+                        text_align="center",
+                    ),
+                    rx.button(
+                        "Tarifrechner laden",
+                        size="3",
+                        background=Config.PRIMARY_COLOR,
+                        color="white",
+                        cursor="pointer",
+                    ),
+                    align="center",
+                    spacing="4",
+                ),
+                background=Config.BG_LIGHT,
+                padding="3rem",
+                border_radius="12px",
+                min_height=Config.TARIFRECHNER_HEIGHT,
+                display="flex",
+                align_items="center",
+                justify_content="center",
+            ),
+            min_height=Config.TARIFRECHNER_HEIGHT,
+        )
     else:
         # Placeholder if no embed code configured
         embed_content = rx.box(
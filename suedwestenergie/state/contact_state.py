@@ -1,79 +1,147 @@
 """State Management für das Kontaktformular"""
 
+import time
 import reflex as rx
-import re
-from typing import Optional
+from typing import Any, Dict, Optional
 from datetime import datetime
-from suedwestenergie.utils.logger import log_error, log_info
-from suedwestenergie.utils.analytics import track_form_submission
+from suedwestenergie.utils.logger import log_error, log_info, log_warning
 from suedwestenergie.utils.email import send_contact_form_notification
 from suedwestenergie.utils.ninox_client import save_contact_to_ninox
+from suedwestenergie.utils import idempotency, validation
+from suedwestenergie.utils.analytics import track_form_submission
+from suedwestenergie.utils.spam import forget_submission, score_submission
+from suedwestenergie.utils.throttle import allow_contact_submission, client_address
 
 
 class ContactFormState(rx.State):
-    """State für das Kontaktformular"""
-
-    name: str = ""
-    email: str = ""
-    phone: str = ""
-    company: str = ""
-    message: str = ""
+    """State für das Kontaktformular
+
+    Field values are backend-only vars: they are never sent to the browser
+    and are only materialized for sessions that sync fields while typing
+    (debounced mode). By default the form is processed straight from the
+    submit payload.
+    """
+
+    _name: str = ""
+    _email: str = ""
+    _phone: str = ""
+    _company: str = ""
+    _message: str = ""
     form_submitted: bool = False
     error_message: str = ""
 
+    # Server time at which the visitor started the form, for the spam check
+    _form_shown_at: float = 0.0
+
+    # Per-field validation results, updated only when the field itself changes
+    field_errors: Dict[str, str] = {}
+
     @rx.var
     def is_valid_email(self) -> bool:
         """Validate email format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, self.email) is not None
+        return validation.is_valid_email(self._email)
+
+    def _update_field(self, field: str, value: str):
+        """Store a field value and re-validate only that field"""
+        setattr(self, f"_{field}", value)
+        error = validation.validate_field(field, value)
+        if error:
+            self.field_errors = {**self.field_errors, field: error}
+        elif field in self.field_errors:
+            self.field_errors = {key: msg for key, msg in self.field_errors.items() if key != field}
+
+    def set_name(self, value: str):
+        """Set the name field"""
+        self._update_field("name", value)
+
+    def set_email(self, value: str):
+        """Set the email field"""
+        self._update_field("email", value)
+
+    def set_phone(self, value: str):
+        """Set the phone field"""
+        self._update_field("phone", value)
+
+    def set_company(self, value: str):
+        """Set the company field"""
+        self._update_field("company", value)
+
+    def set_message(self, value: str):
+        """Set the message field"""
+        self._update_field("message", value)
+
+    def start_form(self):
+        """Remember when the form was started; sent by the browser when a field is first focused"""
+        self._form_shown_at = time.time()
 
     def validate_form(self) -> Optional[str]:
         """Validate form data"""
-        if not self.name.strip():
-            return "Bitte geben Sie Ihren Namen ein."
-        if not self.email.strip():
-            return "Bitte geben Sie Ihre E-Mail-Adresse ein."
-        if not self.is_valid_email:
-            return "Bitte geben Sie eine gültige E-Mail-Adresse ein."
-        if not self.company.strip():
-            return "Bitte geben Sie Ihr Unternehmen an."
-        if len(self.message.strip()) < 10:
-            return "Die Nachricht muss mindestens 10 Zeichen enthalten."
-        return None
-
-    async def submit_form(self):
-        """Handle form submission with validation and error handling"""
+        return validation.validate_contact_form({
+            field: getattr(self, f"_{field}") for field in validation.FIELD_ORDER
+        })
+
+    async def submit_form(self, form_data: Dict[str, Any]):
+        """Handle form submission with validation and error handling
+
+        The complete form arrives as one ``on_submit`` event, so the field
+        values do not have to be synced to the backend on every keystroke.
+        They are processed from the event payload and never stored in the
+        per-session state.
+        """
         log_info("Contact form submission initiated", "ContactFormState.submit_form")
 
-        validation_error = self.validate_form()
+        data = {field: str(form_data.get(field) or "") for field in validation.FIELD_ORDER}
+
+        validation_error = validation.validate_contact_form(data)
         if validation_error:
             self.error_message = validation_error
             log_info(f"Validation error: {validation_error}", "ContactFormState.submit_form")
             return
 
+        # Repeated events for the same submission get the original outcome
+        session = self.router.session
+        submission_key = idempotency.submission_key(form_data, session.client_token)
+        previous_outcome = idempotency.claim(submission_key)
+        if previous_outcome is not None:
+            log_info(f"Duplicate submission ignored ({previous_outcome})", "ContactFormState.submit_form")
+            self.form_submitted = True
+            yield rx.redirect("/danke")
+            return
+
+        # Abuse protection runs before any Ninox or SMTP call
+        client_ip = client_address(self.router.headers.raw_headers, session.client_ip)
+        if not allow_contact_submission(client_ip, session.client_token):
+            idempotency.release(submission_key)
+            self.error_message = "Zu viele Anfragen. Bitte versuchen Sie es in einigen Minuten erneut."
+            log_warning(f"Rate limit exceeded for {client_ip}", "ContactFormState.submit_form")
+            return
+
+        verdict = score_submission(form_data, self._form_shown_at)
+        if verdict.is_spam:
+            # Pretend success so that bots get no signal to adapt to
+            log_warning(
+                f"Dropped submission as spam (score {verdict.score}: {', '.join(verdict.reasons)})",
+                "ContactFormState.submit_form",
+            )
+            idempotency.complete(submission_key)
+            self.form_submitted = True
+            yield rx.redirect("/danke")
+            return
+
         try:
             # Reset any previous error messages
-            self.error_message = ""
+            if self.error_message:
+                self.error_message = ""
 
             # Log the form submission
-            log_info(f"Form submitted by {self.name} ({self.email}) from {self.company}", "ContactFormState.submit_form")
-
-            # Track form submission event
-            track_form_submission("contact_form")
+            log_info(f"Form submitted by {data['name']} ({data['email']}) from {data['company']}", "ContactFormState.submit_form")
 
             # Prepare data for Ninox database
-            form_data = {
-                "name": self.name,
-                "email": self.email,
-                "phone": self.phone,
-                "company": self.company,
-                "message": self.message,
-                "submitted_at": datetime.now().isoformat()
-            }
+            record = dict(data, submitted_at=datetime.now().isoformat())
 
             # Save to Ninox database
             try:
-                ninox_saved = save_contact_to_ninox(form_data)
+                ninox_saved = save_contact_to_ninox(record)
                 if ninox_saved:
                     log_info("Contact form data successfully saved to Ninox database", "ContactFormState.submit_form")
                 else:
@@ -83,30 +151,34 @@ class ContactFormState(rx.State):
 
             # Attempt to send notification email
             email_sent = send_contact_form_notification(
-                self.name,
-                self.email,
-                self.phone,
-                self.company,
-                self.message
+                data["name"],
+                data["email"],
+                data["phone"],
+                data["company"],
+                data["message"]
             )
 
             if not email_sent:
                 log_info("Email notification not sent - check email configuration", "ContactFormState.submit_form")
 
-            # Mark form as submitted and redirect
+            # Mark form as submitted, track it and redirect; the shim queues the event across the redirect
+            idempotency.complete(submission_key)
             self.form_submitted = True
-            yield rx.redirect("/danke")
+            yield [track_form_submission("contact_form"), rx.redirect("/danke")]
 
         except Exception as e:
             log_error(e, "ContactFormState.submit_form")
+            idempotency.release(submission_key)
+            forget_submission(form_data)
             self.error_message = "Ein Fehler ist aufgetreten. Bitte versuchen Sie es später erneut."
 
     def reset_form(self):
         """Reset form fields"""
-        self.name = ""
-        self.email = ""
-        self.phone = ""
-        self.company = ""
-        self.message = ""
+        self._name = ""
+        self._email = ""
+        self._phone = ""
+        self._company = ""
+        self._message = ""
         self.form_submitted = False
-        self.error_message = ""
\ No newline at end of file
+        self.error_message = ""
+        self.field_errors = {}
\ No newline at end of file
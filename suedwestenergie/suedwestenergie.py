@@ -1,8 +1,11 @@
 """Haupt-App Datei"""
 
 import reflex as rx
-from suedwestenergie.pages import index, thank_you, impressum, datenschutz, agb, status_page, StatusState
+from suedwestenergie.pages import index, thank_you, impressum, datenschutz, agb, not_found, status_page, StatusState
 from suedwestenergie.config import Config
+from suedwestenergie.components.critical import critical_head
+from suedwestenergie.components.fonts import FONT_FAMILY, font_head
+from suedwestenergie.utils.analytics import analytics_head
 
 
 # App erstellen
@@ -11,30 +14,12 @@ app = rx.App(
         appearance="light",
         accent_color="green",
     ),
-    stylesheets=[
-        "https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap",
-    ],
     style={
-        "font_family": "Inter, sans-serif",
+        "font_family": FONT_FAMILY,
     },
-    # Add Google Analytics if configured
-    head_components=[
-        rx.script(
-            src=f"https://www.googletagmanager.com/gtag/js?id={Config.GOOGLE_ANALYTICS_ID}",
-            defer=True
-        ) if Config.GOOGLE_ANALYTICS_ID else rx.fragment(),
-        rx.script(
-            f"""
-            window.dataLayer = window.dataLayer || [];
-            function gtag(){{dataLayer.push(arguments);}}
-            gtag('js', new Date());
-            gtag('config', '{Config.GOOGLE_ANALYTICS_ID}', {{
-                'anonymize_ip': true,
-                'send_page_view': false
-            }});
-            """,
-        ) if Config.GOOGLE_ANALYTICS_ID else rx.fragment(),
-    ] if Config.GOOGLE_ANALYTICS_ID else [],
+    # Self-hosted fonts (python -m suedwestenergie.build fonts), critical CSS for navbar and hero,
+    # then the consent-gated analytics shim if Google Analytics is configured
+    head_components=font_head() + critical_head() + analytics_head(),
 )
 
 # Routen hinzufügen
@@ -55,4 +40,6 @@ app.add_page(agb, route="/agb",
 app.add_page(status_page, route="/status",
              title=f"System Status - {Config.COMPANY_NAME}",
              on_load=StatusState.check_services,
-             image="/logo.jpg")
\ No newline at end of file
+             image="/logo.jpg")
+app.add_page(not_found, route="404",
+             title=f"Seite nicht gefunden - {Config.COMPANY_NAME}")
\ No newline at end of file
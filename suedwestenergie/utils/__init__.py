@@ -1,8 +1,20 @@
-"""Utilities package for Südwest-Energie website"""
+"""Utilities package for Südwest-Energie website
 
-from . import logger
-from . import cache
-from . import analytics
-from . import email
+Submodules are imported on first access (``utils.email``), not with the
+package: ``analytics`` pulls in Reflex, ``email`` smtplib and ssl, so code
+that only needs ``validation`` or ``cache`` does not pay for them.
+"""
 
-__all__ = ["logger", "cache", "analytics", "email"]
\ No newline at end of file
+import importlib
+
+__all__ = ["logger", "cache", "analytics", "email", "validation"]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
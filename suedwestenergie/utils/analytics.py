@@ -1,65 +1,179 @@
-"""Analytics utilities for tracking and monitoring"""
+"""Analytics utilities for tracking and monitoring
 
+Tracking runs entirely in the browser. A small inline shim (``window.swa``)
+queues events in ``sessionStorage``; gtag is only loaded once the visitor has
+consented, and only when the browser is idle after the page has loaded.
+Queued events are then handed to gtag in batches, again in idle time. The
+``track_*`` helpers return client-side events, so no tracking call goes
+through the backend. ``consent_settings_link()`` reopens the banner, so
+consent can be withdrawn; it is a plain link that the shim handles, so it
+also works on the statically exported pages.
+"""
+
+import json
 import reflex as rx
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from suedwestenergie.config import Config
 
+# Events handed to gtag per idle slice, and the most kept while waiting for consent
+BATCH_SIZE = 10
+MAX_QUEUED = 100
+
+# Links with this attribute call window.swa.reset() instead of navigating
+CONSENT_SETTINGS_ATTR = "data-consent-settings"
+
+_SHIM_JS = """
+(function () {
+  var ID = MEASUREMENT_ID, BATCH = BATCH_SIZE, MAX = MAX_QUEUED, SETTINGS = "[CONSENT_SETTINGS_ATTR]";
+  var QUEUE_KEY = "swa-queue", CONSENT_KEY = "swa-consent";
+  var queue = [], loaded = false, banner = null;
+  try { queue = JSON.parse(sessionStorage.getItem(QUEUE_KEY) || "[]"); } catch (e) {}
+
+  function store(key, value, session) {
+    try { (session ? sessionStorage : localStorage).setItem(key, value); } catch (e) {}
+  }
+  function consent() {
+    try { return localStorage.getItem(CONSENT_KEY); } catch (e) { return null; }
+  }
+  function idle(fn) {
+    (window.requestIdleCallback || function (cb) { return setTimeout(cb, 200); })(fn, {timeout: 5000});
+  }
+  function save() { store(QUEUE_KEY, JSON.stringify(queue.slice(-MAX)), true); }
+
+  function flush() {
+    if (!loaded || !queue.length) return;
+    queue.splice(0, BATCH).forEach(function (event) { window.gtag("event", event[0], event[1]); });
+    save();
+    if (queue.length) idle(flush);
+  }
+
+  function load() {
+    if (loaded) return;
+    loaded = true;
+    window.dataLayer = window.dataLayer || [];
+    window.gtag = function () { window.dataLayer.push(arguments); };
+    window.gtag("js", new Date());
+    window.gtag("config", ID, {anonymize_ip: true, send_page_view: false});
+    var script = document.createElement("script");
+    script.async = true;
+    script.src = "https://www.googletagmanager.com/gtag/js?id=" + encodeURIComponent(ID);
+    document.head.appendChild(script);
+    idle(flush);
+  }
+
+  function showBanner() {
+    if (banner) return;
+    banner = document.createElement("div");
+    banner.setAttribute("role", "dialog");
+    banner.setAttribute("aria-label", "Einwilligung zur Webanalyse");
+    banner.style.cssText = "position:fixed;left:1rem;right:1rem;bottom:1rem;z-index:1000;max-width:40rem;" +
+      "margin:0 auto;padding:1rem 1.25rem;background:#fff;color:#002171;border-radius:12px;" +
+      "box-shadow:0 4px 24px rgba(0,0,0,.15);font-size:.95rem;line-height:1.5";
+    banner.innerHTML = "<p style=\\"margin:0 0 .75rem\\">Wir möchten mit Google Analytics anonymisiert messen, " +
+      "wie unsere Website genutzt wird. Details in der <a href=\\"/datenschutz\\">Datenschutzerklärung</a>.</p>" +
+      "<button type=\\"button\\" data-consent=\\"granted\\">Akzeptieren</button> " +
+      "<button type=\\"button\\" data-consent=\\"denied\\">Ablehnen</button>";
+    banner.addEventListener("click", function (e) {
+      var choice = e.target.getAttribute && e.target.getAttribute("data-consent");
+      if (choice) window.swa.consent(choice === "granted");
+    });
+    document.body.appendChild(banner);
+  }
+
+  window.swa = {
+    track: function (name, params) {
+      if (consent() === "denied") return;
+      queue.push([name, params || {}]);
+      save();
+      if (loaded) idle(flush);
+    },
+    consent: function (granted) {
+      store(CONSENT_KEY, granted ? "granted" : "denied");
+      if (banner) { banner.remove(); banner = null; }
+      if (granted) idle(load);
+      else {
+        queue = []; save();
+        // Withdrawn after gtag was loaded: no more cookies or hits for the rest of the visit
+        if (loaded) window.gtag("consent", "update", {analytics_storage: "denied"});
+      }
+    },
+    reset: function () {
+      try { localStorage.removeItem(CONSENT_KEY); } catch (e) {}
+      showBanner();
+    }
+  };
+
+  // Capture phase, ahead of the router's own click handling
+  document.addEventListener("click", function (e) {
+    if (e.target.closest && e.target.closest(SETTINGS)) {
+      e.preventDefault();
+      window.swa.reset();
+    }
+  }, true);
+
+  // Nothing analytics-related competes with the first render
+  window.addEventListener("load", function () {
+    idle(consent() === "granted" ? load : consent() === null ? showBanner : function () {});
+  });
+})();
+"""
+
+
+def analytics_shim_js(measurement_id: str) -> str:
+    """The inline analytics shim for a GA4 measurement ID"""
+    return (_SHIM_JS.replace("MEASUREMENT_ID", json.dumps(measurement_id))
+            .replace("BATCH_SIZE", str(BATCH_SIZE))
+            .replace("MAX_QUEUED", str(MAX_QUEUED))
+            .replace("CONSENT_SETTINGS_ATTR", CONSENT_SETTINGS_ATTR))
+
 
 def google_analytics_script() -> Optional[rx.Component]:
-    """Add Google Analytics tracking script if ID is configured"""
+    """Add the consent-gated Google Analytics shim if an ID is configured"""
     if Config.GOOGLE_ANALYTICS_ID:
-        return rx.script(
-            f"""
-            window.dataLayer = window.dataLayer || [];
-            function gtag(){{dataLayer.push(arguments);}}
-            gtag('js', new Date());
-            gtag('config', '{Config.GOOGLE_ANALYTICS_ID}');
-            """,
-            id="gtag-script"
-        )
+        return rx.script(analytics_shim_js(Config.GOOGLE_ANALYTICS_ID), id="gtag-script")
     return None
 
 
 def add_analytics_component() -> rx.Component:
     """Component to add analytics tracking to pages"""
-    return rx.cond(
-        Config.GOOGLE_ANALYTICS_ID != "",
-        rx.script(
-            f"""
-            window.dataLayer = window.dataLayer || [];
-            function gtag(){{dataLayer.push(arguments);}}
-            gtag('js', new Date());
-            gtag('config', '{Config.GOOGLE_ANALYTICS_ID}');
-            """,
-            id="gtag-script"
-        ),
-        rx.fragment()  # Return empty fragment if no analytics ID
-    )
+    return google_analytics_script() or rx.fragment()  # Empty fragment if no analytics ID
+
+
+def analytics_head() -> List[rx.Component]:
+    """Analytics shim for ``head_components``; empty if no analytics ID is configured"""
+    script = google_analytics_script()
+    return [script] if script is not None else []
+
+
+def consent_settings_link(**props) -> rx.Component:
+    """Link that reopens the consent banner; empty if no analytics ID is configured"""
+    if not Config.GOOGLE_ANALYTICS_ID:
+        return rx.fragment()
+    return rx.link("Cookie-Einstellungen", href="#cookie-einstellungen",
+                   custom_attrs={CONSENT_SETTINGS_ATTR: "true"}, **props)
 
 
 def track_event(event_name: str, event_params: Optional[Dict[str, Any]] = None) -> rx.event:
-    """Track a custom event in Google Analytics"""
+    """Queue a custom event for Google Analytics, handled entirely in the browser"""
     if event_params is None:
         event_params = {}
 
     return rx.call_script(
-        f"if(typeof gtag !== 'undefined') gtag('event', '{event_name}', {str(event_params)})"
+        f"window.swa && window.swa.track({json.dumps(event_name)}, {json.dumps(event_params)})"
     )
 
 
 def track_page_view(title: str = "", path: str = "") -> rx.event:
     """Track a page view in Google Analytics"""
-    # This will be called automatically by Google Analytics,
-    # but can be called manually if needed
+    # page_view is not sent automatically (send_page_view is off),
+    # so pages that should be counted call this
     tracking_params = {}
     if title:
         tracking_params["title"] = title
     if path:
         tracking_params["page_path"] = path
 
-    return rx.call_script(
-        f"if(typeof gtag !== 'undefined') gtag('event', 'page_view', {str(tracking_params)})"
-    )
+    return track_event("page_view", tracking_params)
 
 
 def track_form_submission(form_name: str) -> rx.event:
@@ -75,4 +189,4 @@ def track_button_click(button_name: str) -> rx.event:
     return track_event(
         "button_click",
         {"button_name": button_name}
-    )
\ No newline at end of file
+    )
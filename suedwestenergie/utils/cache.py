@@ -36,6 +36,13 @@ class SimpleCache:
         expiry = time.time() + ttl
         self._cache[key] = (value, expiry)
     
+    def add(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set value only if the key is not cached yet; returns True if it was added"""
+        if self.get(key) is not None:
+            return False
+        self.set(key, value, ttl)
+        return True
+
     def delete(self, key: str) -> None:
         """Delete a key from cache"""
         if key in self._cache:
@@ -46,9 +53,67 @@ class SimpleCache:
         self._cache.clear()
 
 
+class RedisCache:
+    """Cache with the SimpleCache interface that is shared between workers via Redis"""
+
+    def __init__(self, url: str, prefix: str = "suedwestenergie:cache:"):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self.default_ttl = 3600  # 1 hour default TTL
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from cache if not expired"""
+        data = self.client.get(self.prefix + key)
+        return pickle.loads(data) if data is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Set value in cache with TTL"""
+        self.client.set(self.prefix + key, pickle.dumps(value), ex=ttl or self.default_ttl)
+
+    def add(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set value only if the key is not cached yet; returns True if it was added"""
+        return bool(self.client.set(self.prefix + key, pickle.dumps(value), ex=ttl or self.default_ttl, nx=True))
+
+    def delete(self, key: str) -> None:
+        """Delete a key from cache"""
+        self.client.delete(self.prefix + key)
+
+    def clear(self) -> None:
+        """Clear all cache entries"""
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+
 # Global cache instance
 cache = SimpleCache()
 
+_shared_cache = None
+
+
+def get_shared_cache():
+    """
+    Get the cache backend that is shared between workers
+
+    Uses Redis when ``REDIS_URL`` is configured and the redis package is
+    installed, otherwise falls back to the process-local ``cache``.
+
+    Returns:
+        RedisCache or SimpleCache instance
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        from suedwestenergie.config import Config
+
+        _shared_cache = cache
+        if Config.REDIS_URL:
+            try:
+                _shared_cache = RedisCache(Config.REDIS_URL)
+            except ImportError:
+                pass
+    return _shared_cache
+
 
 def cached(ttl: Optional[int] = None):
     """Decorator to cache function results"""
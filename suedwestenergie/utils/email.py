@@ -1,7 +1,5 @@
 """Email utilities for production contact form"""
 
-import smtplib
-import ssl
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Dict, Any, Optional
@@ -12,6 +10,42 @@ from suedwestenergie.utils.logger import log_error, log_info
 class EmailService:
     """Service class for sending emails"""
     
+    @staticmethod
+    def build_contact_form_message(name: str, email: str, phone: str, company: str, message: str) -> MIMEMultipart:
+        """
+        Build the notification e-mail for a contact form submission
+        
+        Args:
+            name: Name of the person submitting the form
+            email: Email address of the person
+            phone: Phone number of the person
+            company: Company name
+            message: Message content
+            
+        Returns:
+            The message, addressed from the SMTP user to the contact address
+        """
+        msg = MIMEMultipart()
+        msg['From'] = Config.EMAIL_HOST_USER
+        msg['To'] = Config.EMAIL
+        msg['Subject'] = f"Neue Kontaktanfrage von {name} ({company})"
+        
+        # Email body
+        body = f"""
+        Neue Kontaktanfrage erhalten:
+        
+        Name: {name}
+        E-Mail: {email}
+        Telefon: {phone}
+        Unternehmen: {company}
+        Nachricht: {message}
+        
+        Diese Nachricht wurde über das Kontaktformular der Südwest-Energie Website gesendet.
+        """
+        
+        msg.attach(MIMEText(body, 'plain'))
+        return msg
+
     @staticmethod
     def send_contact_form_email(name: str, email: str, phone: str, company: str, message: str) -> bool:
         """
@@ -33,32 +67,16 @@ class EmailService:
                 log_info("Email settings not configured, skipping email sending", "EmailService.send_contact_form_email")
                 return False
             
-            # Create message
-            msg = MIMEMultipart()
-            msg['From'] = Config.EMAIL_HOST_USER
-            msg['To'] = Config.EMAIL
-            msg['Subject'] = f"Neue Kontaktanfrage von {name} ({company})"
-            
-            # Email body
-            body = f"""
-            Neue Kontaktanfrage erhalten:
-            
-            Name: {name}
-            E-Mail: {email}
-            Telefon: {phone}
-            Unternehmen: {company}
-            Nachricht: {message}
-            
-            Diese Nachricht wurde über das Kontaktformular der Südwest-Energie Website gesendet.
-            """
-            
-            msg.attach(MIMEText(body, 'plain'))
+            msg = EmailService.build_contact_form_message(name, email, phone, company, message)
             
+            # Imported on first use; most processes never send mail
+            import smtplib
+            import ssl
+
             # Create secure connection and send email
-            context = ssl.create_default_context()
-            
             with smtplib.SMTP(Config.EMAIL_HOST, Config.EMAIL_PORT) as server:
-                server.starttls(context=context)
+                if Config.EMAIL_USE_TLS:
+                    server.starttls(context=ssl.create_default_context())
                 server.login(Config.EMAIL_HOST_USER, Config.EMAIL_HOST_PASSWORD)
                 server.sendmail(Config.EMAIL_HOST_USER, Config.EMAIL, msg.as_string())
             
@@ -1,37 +1,28 @@
 """Email notification system for critical errors in Südwest-Energie website"""
 
-import smtplib
-import os
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import List, Dict, Optional
 import json
 from datetime import datetime
 import logging
+from suedwestenergie.config import Settings
+from suedwestenergie.config.logging_config import LoggingConfig
 
 
 class EmailNotificationService:
     """Service class for sending email notifications for critical errors"""
     
-    def __init__(self):
-        self.smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-        self.smtp_port = int(os.getenv("SMTP_PORT", "587"))
-        self.email_username = os.getenv("EMAIL_USERNAME")
-        self.email_password = os.getenv("EMAIL_PASSWORD")
-        self.from_email = os.getenv("FROM_EMAIL", "noreply@suedwestenergie.de")
-        self.notification_emails = os.getenv("NOTIFICATION_EMAILS", "").split(",")
+    def __init__(self, settings: Optional[Settings] = None):
+        # SMTP server and recipients; follows reload_settings() unless settings are given
+        self.config = LoggingConfig(settings)
         
         # Setup logger
         self.logger = logging.getLogger(__name__)
     
     def is_configured(self) -> bool:
         """Check if email service is properly configured"""
-        return bool(
-            self.email_username and 
-            self.email_password and 
-            self.notification_emails and 
-            any(email.strip() for email in self.notification_emails)
-        )
+        return self.config.is_email_configured()
     
     def send_critical_error_notification(
         self, 
@@ -48,26 +39,27 @@ class EmailNotificationService:
         subject = f"[CRITICAL ERROR] Südwest-Energie - {error_title}"
         body = self._format_error_email(error_message, error_code, context)
         
+        # Imported on first use, not when the module is loaded
+        import smtplib
+
+        config = self.config
         success_count = 0
-        for recipient in self.notification_emails:
-            recipient = recipient.strip()
-            if not recipient:
-                continue
-                
+        for recipient in config.notification_emails:
             try:
                 msg = MIMEMultipart()
-                msg['From'] = self.from_email
+                msg['From'] = config.from_email
                 msg['To'] = recipient
                 msg['Subject'] = subject
                 
                 msg.attach(MIMEText(body, 'html'))
                 
-                server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-                server.starttls()
-                server.login(self.email_username, self.email_password)
+                server = smtplib.SMTP(config.smtp_server, config.smtp_port)
+                if config.smtp_use_tls:
+                    server.starttls()
+                server.login(config.email_username, config.email_password)
                 
                 text = msg.as_string()
-                server.sendmail(self.from_email, recipient, text)
+                server.sendmail(config.from_email, recipient, text)
                 server.quit()
                 
                 self.logger.info(f"Critcal error email sent to {recipient}")
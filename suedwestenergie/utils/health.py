@@ -0,0 +1,87 @@
+"""Process-wide service health store for the status page
+
+Service health is the same for every visitor, so it is checked at most once
+per ``TTL`` seconds and kept here instead of in per-session Reflex state.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict
+from suedwestenergie.config import Config
+
+
+@dataclass(frozen=True)
+class ServiceStatus:
+    """Health of a single service"""
+
+    status: str = "Checking..."
+    operational: bool = False
+
+
+class ServiceHealthStore:
+    """Shared, read-only snapshot of service health"""
+
+    TTL = 30  # Seconds before a snapshot is considered stale
+
+    def __init__(self):
+        self.services: Dict[str, ServiceStatus] = {}
+        self.last_updated: str = ""
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def get(self, service: str) -> ServiceStatus:
+        """Get the last known status of a service"""
+        return self.services.get(service, ServiceStatus())
+
+    def is_stale(self) -> bool:
+        return time.monotonic() - self._checked_at > self.TTL
+
+    async def refresh_if_stale(self) -> None:
+        """Re-check all services unless a recent snapshot exists"""
+        if not self.is_stale():
+            return
+        async with self._lock:
+            # Another visitor may have refreshed while we waited for the lock
+            if self.is_stale():
+                await self.refresh()
+
+    async def refresh(self) -> None:
+        """Check health of all services and replace the snapshot"""
+        # Simulate check delay for realism
+        await asyncio.sleep(0.5)
+
+        services = {}
+
+        # 1. Check Database (Simulated connection check)
+        # In a real scenario, we would try to connect to the DB here
+        try:
+            # self.session.execute(text("SELECT 1"))
+            services["db"] = ServiceStatus("Operational", True)
+        except Exception:
+            services["db"] = ServiceStatus("Degraded Performance", False)
+
+        # 2. Check Website (Self-check)
+        services["website"] = ServiceStatus("Operational", True)
+
+        # 3. Check Email Service
+        if Config.EMAIL_HOST and Config.EMAIL_HOST_USER:
+            services["email"] = ServiceStatus("Operational", True)
+        else:
+            services["email"] = ServiceStatus("Not Configured", False)
+
+        # 4. Check Admin Email
+        if Config.EMAIL_HOST:
+            services["admin_email"] = ServiceStatus("Operational", True)
+        else:
+            services["admin_email"] = ServiceStatus("Not Configured", False)
+
+        # Swap in the complete snapshot at once so readers never see a mix
+        self.services = services
+        self.last_updated = datetime.now().strftime("%d.%m.%Y %H:%M:%S")
+        self._checked_at = time.monotonic()
+
+
+# Global store shared by all sessions of this worker
+service_health = ServiceHealthStore()
@@ -0,0 +1,76 @@
+"""Idempotent handling of repeated contact form submissions
+
+Double clicks and retries over flaky connections deliver the same submission
+more than once. Each submission is keyed on its normalized content plus the
+client token; the first event claims the key in the shared cache and records
+its outcome, repeats within the TTL get that outcome back without touching
+Ninox or SMTP again.
+"""
+
+import hashlib
+from typing import Any, Mapping, Optional
+from suedwestenergie.config import Config
+from suedwestenergie.utils.cache import get_shared_cache
+from suedwestenergie.utils.logger import log_error
+from suedwestenergie.utils.validation import FIELD_ORDER
+
+
+PENDING = "pending"
+ACCEPTED = "accepted"
+
+
+def submission_key(form_data: Mapping[str, Any], client_token: str) -> str:
+    """
+    Build the idempotency key for a submission
+
+    Args:
+        form_data: Submitted form fields
+        client_token: Reflex client token of the submitting browser
+
+    Returns:
+        Cache key derived from the normalized fields and the client token
+    """
+    digest = hashlib.sha256(client_token.encode("utf-8"))
+    for field in FIELD_ORDER:
+        value = " ".join(str(form_data.get(field) or "").split())
+        if field == "email":
+            value = value.lower()
+        digest.update(b"\x00" + value.encode("utf-8"))
+    return f"idempotency:contact:{digest.hexdigest()}"
+
+
+def claim(key: str) -> Optional[str]:
+    """
+    Claim a submission key for processing
+
+    Returns:
+        None if the caller owns the key and should process the submission,
+        otherwise the outcome recorded by the first event (PENDING while it
+        is still in flight)
+    """
+    try:
+        cache = get_shared_cache()
+        if cache.add(key, PENDING, Config.IDEMPOTENCY_TTL):
+            return None
+        return cache.get(key) or PENDING
+    except Exception as e:
+        # Fail open: without the shared cache a repeat may be processed twice,
+        # which is better than answering no submission at all
+        log_error(e, "idempotency.claim")
+        return None
+
+
+def complete(key: str, outcome: str = ACCEPTED) -> None:
+    """Record the final outcome of a claimed submission"""
+    try:
+        get_shared_cache().set(key, outcome, Config.IDEMPOTENCY_TTL)
+    except Exception as e:
+        log_error(e, "idempotency.complete")
+
+
+def release(key: str) -> None:
+    """Give up a claim so that the submission can be retried"""
+    try:
+        get_shared_cache().delete(key)
+    except Exception as e:
+        log_error(e, "idempotency.release")
@@ -6,6 +6,21 @@ from datetime import datetime
 from pathlib import Path
 
 
+class LazyFileHandler(logging.FileHandler):
+    """File handler that creates the log directory and opens the file with the first record
+
+    Importing the logger therefore does no I/O; processes that never log
+    (tests, benchmarks, build steps) leave no ``logs/`` directory behind.
+    """
+
+    def __init__(self, filename, mode: str = "a", encoding: str = None):
+        super().__init__(filename, mode, encoding, delay=True)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
 def setup_logger(name: str, log_file: str = None, level: int = logging.INFO) -> logging.Logger:
     """
     Function to set up a logger with file and console handlers
@@ -34,13 +49,11 @@ def setup_logger(name: str, log_file: str = None, level: int = logging.INFO) ->
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
     
-    # File handler
+    # File handler, opened with the first record
     if log_file is None:
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        log_file = log_dir / "app.log"
+        log_file = Path("logs") / "app.log"
     
-    file_handler = logging.FileHandler(log_file)
+    file_handler = LazyFileHandler(log_file)
     file_handler.setFormatter(formatter)
     logger.addHandler(file_handler)
     
@@ -1,10 +1,8 @@
 """Ninox Database Client - API wrapper for Ninox database integration"""
 
-import asyncio
 import logging
 from typing import Dict, Any, Optional
-from ninox import Ninox
-from ..config import Config
+from ..config import Config, on_reload
 
 logger = logging.getLogger(__name__)
 
@@ -17,12 +15,16 @@ class NinoxClient:
         self.api_key = Config.NINOX_API_KEY
         self.database_id = Config.NINOX_DATABASE_ID
         self.table_id = Config.NINOX_TABLE_ID
+        self.team_id = Config.NINOX_TEAM_ID
         
-        if not self.api_key or not self.database_id or not self.table_id:
+        if not self.api_key or not self.team_id or not self.database_id or not self.table_id:
             raise ValueError("Ninox configuration is incomplete. Please check your environment variables.")
         
         try:
-            self.client = Ninox(api_key=self.api_key)
+            # The SDK is imported with the first client, not with this module
+            from ninox import Ninox
+
+            self.client = Ninox(api_key=self.api_key, base_url=Config.NINOX_API_URL)
         except Exception as e:
             logger.error(f"Failed to initialize Ninox client: {e}")
             raise
@@ -50,10 +52,10 @@ class NinoxClient:
                 }
             }
             
-            # Save to the specified database and table
-            result = self.client.databases[self.database_id].tables[self.table_id].records.create(**record_data)
+            # Save to the specified database and table (a record without id is created)
+            result = self.client.upsert_records(self.team_id, self.database_id, self.table_id, [record_data])
             
-            logger.info(f"Successfully saved contact form data to Ninox database. Record ID: {result.id}")
+            logger.info(f"Successfully saved contact form data to Ninox database. Record ID: {result[0].get('id')}")
             return True
             
         except Exception as e:
@@ -71,10 +73,10 @@ class NinoxClient:
             Optional[Dict]: The record data or None if not found
         """
         try:
-            record = self.client.databases[self.database_id].tables[self.table_id].records[record_id].get()
+            record = self.client.get_record(self.team_id, self.database_id, self.table_id, record_id)
             return {
-                "id": record.id,
-                "fields": record.fields
+                "id": record.get("id"),
+                "fields": record.get("fields", {})
             }
         except Exception as e:
             logger.error(f"Failed to retrieve record from Ninox: {e}")
@@ -98,6 +100,13 @@ def get_ninox_client() -> NinoxClient:
     return _ninox_client
 
 
+@on_reload
+def _drop_client(settings) -> None:
+    """Connect with the reloaded credentials on the next save"""
+    global _ninox_client
+    _ninox_client = None
+
+
 def save_contact_to_ninox(data: Dict[str, Any]) -> bool:
     """
     Convenience function to save contact form data to Ninox database
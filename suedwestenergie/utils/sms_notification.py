@@ -1,49 +1,53 @@
 """SMS notification system for critical errors in Südwest-Energie website"""
 
-import os
+from functools import lru_cache
 from typing import List, Dict, Optional
 import logging
+from suedwestenergie.config import Settings
+from suedwestenergie.config.logging_config import LoggingConfig
 
-try:
-    from twilio.rest import Client
-    TWILIO_AVAILABLE = True
-except ImportError:
-    TWILIO_AVAILABLE = False
-    print("Twilio library not available. Install with: pip install twilio")
+
+@lru_cache(maxsize=None)
+def twilio_client_class():
+    """
+    The Twilio ``Client`` class, imported on first use
+
+    Returns:
+        The class, or None if the twilio package is not installed
+    """
+    try:
+        from twilio.rest import Client
+    except ImportError:
+        logging.getLogger(__name__).warning(
+            "Twilio library not available - SMS notifications disabled. Install with: pip install twilio")
+        return None
+    return Client
 
 
 class SMSNotificationService:
     """Service class for sending SMS notifications for critical errors"""
     
-    def __init__(self):
-        if TWILIO_AVAILABLE:
-            self.twilio_sid = os.getenv("TWILIO_SID")
-            self.twilio_token = os.getenv("TWILIO_TOKEN")
-            self.from_phone = os.getenv("TWILIO_FROM_PHONE", "+1234567890")
-            self.notification_phones = os.getenv("NOTIFICATION_PHONES", "").split(",")
-            
-            # Setup logger
-            self.logger = logging.getLogger(__name__)
-        else:
-            self.twilio_sid = None
-            self.twilio_token = None
-            self.from_phone = None
-            self.notification_phones = []
-            self.logger = logging.getLogger(__name__)
-            self.logger.warning("Twilio library not available - SMS notifications disabled")
+    def __init__(self, settings: Optional[Settings] = None):
+        # Twilio account and recipients; follows reload_settings() unless settings are given
+        self.config = LoggingConfig(settings)
+        self._client = None
+        self._client_account = None
+        
+        # Setup logger
+        self.logger = logging.getLogger(__name__)
+    
+    def _get_client(self):
+        """Twilio client, created with the first SMS and again when the account changed"""
+        account = (self.config.twilio_sid, self.config.twilio_token)
+        if self._client is None or account != self._client_account:
+            self._client = twilio_client_class()(*account)
+            self._client_account = account
+        return self._client
     
     def is_configured(self) -> bool:
         """Check if SMS service is properly configured"""
-        if not TWILIO_AVAILABLE:
-            return False
-            
-        return bool(
-            self.twilio_sid and 
-            self.twilio_token and 
-            self.from_phone and
-            self.notification_phones and 
-            any(phone.strip() for phone in self.notification_phones)
-        )
+        # Only look for twilio once SMS are configured at all
+        return self.config.is_sms_configured() and twilio_client_class() is not None
     
     def send_critical_error_notification(
         self, 
@@ -60,17 +64,11 @@ class SMSNotificationService:
         message_body = self._format_error_sms(error_title, error_message, error_code)
         
         success_count = 0
-        for phone in self.notification_phones:
-            phone = phone.strip()
-            if not phone:
-                continue
-                
+        for phone in self.config.notification_phones:
             try:
-                client = Client(self.twilio_sid, self.twilio_token)
-                
-                message = client.messages.create(
+                message = self._get_client().messages.create(
                     body=message_body,
-                    from_=self.from_phone,
+                    from_=self.config.twilio_from_phone,
                     to=phone
                 )
                 
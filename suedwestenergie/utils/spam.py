@@ -0,0 +1,104 @@
+"""Cheap spam scoring for contact form submissions
+
+The score is computed before any downstream I/O (Ninox, SMTP) from signals
+that cost next to nothing to check: a honeypot field, the time between
+showing and submitting the form, and whether the same message was
+submitted recently. The time the form was shown is taken on the server
+when the visitor first focuses a field (``ContactFormState.start_form``),
+so that neither a prerendered page nor a bot can set it.
+"""
+
+import hashlib
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, List, Mapping, Optional
+from suedwestenergie.config import Config
+from suedwestenergie.utils.cache import get_shared_cache
+from suedwestenergie.utils.logger import log_error
+
+
+# Hidden form field rendered by the contact section
+HONEYPOT_FIELD = "website"
+
+SCORE_HONEYPOT = 100
+SCORE_TOO_FAST = 60
+SCORE_MISSING_TIMESTAMP = 30
+SCORE_DUPLICATE_CONTENT = 60
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@dataclass
+class SpamVerdict:
+    """Result of scoring a submission"""
+
+    score: int = 0
+    reasons: List[str] = field(default_factory=list)
+
+    @property
+    def is_spam(self) -> bool:
+        return self.score >= Config.SPAM_SCORE_THRESHOLD
+
+    def add(self, points: int, reason: str) -> None:
+        self.score += points
+        self.reasons.append(reason)
+
+
+def content_hash(message: str) -> str:
+    """Hash of the message with case and whitespace normalized"""
+    normalized = _WHITESPACE_RE.sub(" ", message).strip().lower()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _content_key(message: str) -> str:
+    return f"spam:content:{content_hash(message)}"
+
+
+def score_submission(form_data: Mapping[str, Any], shown_at: Optional[float] = None,
+                     now: Optional[float] = None) -> SpamVerdict:
+    """
+    Score a contact form submission
+
+    Args:
+        form_data: Submitted form fields including the honeypot field
+        shown_at: Server time at which the form was shown, None if the
+            browser never reported it
+        now: Current timestamp (defaults to time.time())
+
+    Returns:
+        SpamVerdict with the total score and the reasons that contributed
+    """
+    now = time.time() if now is None else now
+    verdict = SpamVerdict()
+
+    if str(form_data.get(HONEYPOT_FIELD) or "").strip():
+        verdict.add(SCORE_HONEYPOT, "honeypot")
+
+    if not shown_at:
+        verdict.add(SCORE_MISSING_TIMESTAMP, "missing timestamp")
+    elif now - shown_at < Config.SPAM_MIN_SUBMIT_SECONDS:
+        verdict.add(SCORE_TOO_FAST, f"submitted after {now - shown_at:.1f}s")
+
+    # Only remember content that is not already junk, so that bots cannot
+    # poison the duplicate list for real submissions
+    message = str(form_data.get("message") or "")
+    if message.strip() and not verdict.is_spam:
+        try:
+            if not get_shared_cache().add(_content_key(message), True, Config.SPAM_DUPLICATE_TTL):
+                verdict.add(SCORE_DUPLICATE_CONTENT, "duplicate content")
+        except Exception as e:
+            # Fail open: score without the duplicate signal while the shared cache is down
+            log_error(e, "spam.score_submission")
+
+    return verdict
+
+
+def forget_submission(form_data: Mapping[str, Any]) -> None:
+    """Remove a submission from the duplicate list, e.g. after it failed and may be retried"""
+    message = str(form_data.get("message") or "")
+    if message.strip():
+        try:
+            get_shared_cache().delete(_content_key(message))
+        except Exception as e:
+            log_error(e, "spam.forget_submission")
@@ -0,0 +1,161 @@
+"""Sliding-window rate limiting for expensive actions such as contact form submissions"""
+
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Deque, Dict, Mapping, Optional
+from suedwestenergie.config import Config, on_reload
+from suedwestenergie.utils.cache import RedisCache, get_shared_cache
+from suedwestenergie.utils.logger import log_error
+
+
+class SlidingWindowRateLimiter:
+    """
+    Allow at most ``limit`` hits per key within the last ``window`` seconds
+
+    Hits are kept as timestamps in memory. If a RedisCache is passed as
+    ``backend`` the timestamps are stored in a Redis sorted set instead, so the
+    limit holds across all workers.
+    """
+
+    # Number of hits between sweeps of idle in-memory keys
+    SWEEP_INTERVAL = 1000
+
+    def __init__(self, limit: int, window: float, name: str = "default",
+                 backend: Optional[RedisCache] = None):
+        self.limit = limit
+        self.window = window
+        self.name = name
+        self.backend = backend
+        self._hits: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._hits_since_sweep = 0
+
+    def hit(self, key: str, now: Optional[float] = None) -> bool:
+        """
+        Record a hit for the key if it is still within the limit
+
+        Args:
+            key: Identifier to limit, e.g. a client IP
+            now: Current timestamp (defaults to time.time())
+
+        Returns:
+            True if the hit is allowed, False if the limit is exceeded
+        """
+        now = time.time() if now is None else now
+        if self.backend is not None:
+            return self._hit_shared(key, now)
+        return self._hit_local(key, now)
+
+    def _hit_local(self, key: str, now: float) -> bool:
+        cutoff = now - self.window
+        with self._lock:
+            self._hits_since_sweep += 1
+            if self._hits_since_sweep >= self.SWEEP_INTERVAL:
+                self._sweep(cutoff)
+
+            hits = self._hits.setdefault(key, deque())
+            while hits and hits[0] <= cutoff:
+                hits.popleft()
+            if len(hits) >= self.limit:
+                return False
+            hits.append(now)
+            return True
+
+    def _sweep(self, cutoff: float) -> None:
+        """Drop keys whose newest hit is outside the window"""
+        self._hits = {key: hits for key, hits in self._hits.items() if hits and hits[-1] > cutoff}
+        self._hits_since_sweep = 0
+
+    def _hit_shared(self, key: str, now: float) -> bool:
+        redis_key = f"{self.backend.prefix}ratelimit:{self.name}:{key}"
+        member = f"{now}:{uuid.uuid4().hex}"
+        pipe = self.backend.client.pipeline()
+        pipe.zremrangebyscore(redis_key, 0, now - self.window)
+        pipe.zadd(redis_key, {member: now})
+        pipe.zcard(redis_key)
+        pipe.expire(redis_key, int(self.window) + 1)
+        _, _, count, _ = pipe.execute()
+        if count > self.limit:
+            # Do not count rejected hits against the window
+            self.backend.client.zrem(redis_key, member)
+            return False
+        return True
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Forget recorded hits for one key, or for all keys (in-memory only)"""
+        with self._lock:
+            if key is None:
+                self._hits.clear()
+            else:
+                self._hits.pop(key, None)
+
+
+def _create_limiter(limit: int, name: str) -> SlidingWindowRateLimiter:
+    backend = get_shared_cache()
+    return SlidingWindowRateLimiter(
+        limit,
+        Config.CONTACT_RATE_LIMIT_WINDOW,
+        name=name,
+        backend=backend if isinstance(backend, RedisCache) else None,
+    )
+
+
+_contact_limiters: Dict[str, SlidingWindowRateLimiter] = {}
+
+
+@on_reload
+def _drop_limiters(settings) -> None:
+    """Apply reloaded limits from the next submission on"""
+    _contact_limiters.clear()
+
+
+def client_address(headers: Mapping[str, str], fallback: str = "") -> str:
+    """
+    Address of the client as seen by the reverse proxy
+
+    Reflex takes ``client_ip`` from the first ``X-Forwarded-For`` entry, which
+    the client can set to anything. nginx sets ``X-Real-IP`` to the address
+    of the connection and appends that address to ``X-Forwarded-For``, so
+    only these two are trusted: ``X-Real-IP``, else the last hop.
+
+    Args:
+        headers: Request headers with lower-case names (``router.headers.raw_headers``)
+        fallback: Address to use without proxy headers
+
+    Returns:
+        The client address, or ``fallback``
+    """
+    real_ip = headers.get("x-real-ip", "").strip()
+    if real_ip:
+        return real_ip
+    last_hop = headers.get("x-forwarded-for", "").rpartition(",")[2].strip()
+    return last_hop or fallback
+
+
+def allow_contact_submission(client_ip: str, client_token: str) -> bool:
+    """
+    Check the per-IP and per-session limits for contact form submissions
+
+    Args:
+        client_ip: IP address of the client
+        client_token: Reflex client token identifying the browser session
+
+    Returns:
+        True if the submission may proceed to downstream I/O
+    """
+    if not _contact_limiters:
+        _contact_limiters["ip"] = _create_limiter(Config.CONTACT_RATE_LIMIT_PER_IP, "contact-ip")
+        _contact_limiters["session"] = _create_limiter(Config.CONTACT_RATE_LIMIT_PER_SESSION, "contact-session")
+
+    try:
+        # Session first, so that a single noisy tab does not use up the IP budget
+        if client_token and not _contact_limiters["session"].hit(client_token):
+            return False
+        if client_ip and not _contact_limiters["ip"].hit(client_ip):
+            return False
+    except Exception as e:
+        # Fail open: an unavailable shared backend must not block real leads
+        log_error(e, "throttle.allow_contact_submission")
+    return True
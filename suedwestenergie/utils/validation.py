@@ -0,0 +1,177 @@
+"""Validation rules for the contact form
+
+The patterns are compiled once at import time and every validator is cached, so
+re-validating an unchanged field is a dictionary lookup. The same rules are
+exported as HTML input attributes via ``client_rules`` so that the browser
+rejects most invalid input before an event reaches the backend.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, Mapping, Optional
+
+
+# Patterns are written so they are valid both for Python's ``re`` and for the
+# HTML ``pattern`` attribute (JavaScript RegExp with the ``v`` flag, which
+# requires ``-``, ``(``, ``)`` and ``/`` to be escaped inside character classes).
+EMAIL_PATTERN = r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}"
+
+# E.164 (+4971112345678) as well as common German notations such as
+# "0711 12345678", "0711/123456", "(0711) 123-456" or "+49 (0)711 123456"
+PHONE_PATTERN = r"(?:\+|\()?[0-9][0-9 \(\)\/\-]{4,24}[0-9]"
+
+PHONE_MIN_DIGITS = 6
+PHONE_MAX_DIGITS = 15  # E.164 limit
+
+NAME_MAX_LENGTH = 100
+COMPANY_MIN_LENGTH = 2
+COMPANY_MAX_LENGTH = 120
+MESSAGE_MIN_LENGTH = 10
+MESSAGE_MAX_LENGTH = 5000
+
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
+_PHONE_RE = re.compile(PHONE_PATTERN)
+_ALNUM_RE = re.compile(r"\w")
+
+# Order in which fields are checked; the first failing field wins
+FIELD_ORDER = ("name", "email", "phone", "company", "message")
+
+MESSAGES = {
+    "name_required": "Bitte geben Sie Ihren Namen ein.",
+    "name_too_long": f"Der Name darf höchstens {NAME_MAX_LENGTH} Zeichen lang sein.",
+    "email_required": "Bitte geben Sie Ihre E-Mail-Adresse ein.",
+    "email_invalid": "Bitte geben Sie eine gültige E-Mail-Adresse ein.",
+    "phone_invalid": "Bitte geben Sie eine gültige Telefonnummer ein.",
+    "company_required": "Bitte geben Sie Ihr Unternehmen an.",
+    "company_invalid": "Bitte geben Sie einen gültigen Firmennamen an.",
+    "message_too_short": f"Die Nachricht muss mindestens {MESSAGE_MIN_LENGTH} Zeichen enthalten.",
+    "message_too_long": f"Die Nachricht darf höchstens {MESSAGE_MAX_LENGTH} Zeichen lang sein.",
+}
+
+
+@lru_cache(maxsize=1024)
+def validate_name(value: str) -> Optional[str]:
+    """Validate the contact name"""
+    value = value.strip()
+    if not value:
+        return MESSAGES["name_required"]
+    if len(value) > NAME_MAX_LENGTH:
+        return MESSAGES["name_too_long"]
+    return None
+
+
+@lru_cache(maxsize=1024)
+def validate_email(value: str) -> Optional[str]:
+    """Validate the e-mail address"""
+    value = value.strip()
+    if not value:
+        return MESSAGES["email_required"]
+    if _EMAIL_RE.fullmatch(value) is None:
+        return MESSAGES["email_invalid"]
+    return None
+
+
+@lru_cache(maxsize=1024)
+def validate_phone(value: str) -> Optional[str]:
+    """Validate the (optional) phone number"""
+    value = value.strip()
+    if not value:
+        return None
+    if _PHONE_RE.fullmatch(value) is None:
+        return MESSAGES["phone_invalid"]
+    digits = sum(char.isdigit() for char in value)
+    if not PHONE_MIN_DIGITS <= digits <= PHONE_MAX_DIGITS:
+        return MESSAGES["phone_invalid"]
+    return None
+
+
+@lru_cache(maxsize=1024)
+def validate_company(value: str) -> Optional[str]:
+    """Validate the company name"""
+    value = value.strip()
+    if not value:
+        return MESSAGES["company_required"]
+    if not COMPANY_MIN_LENGTH <= len(value) <= COMPANY_MAX_LENGTH or not _ALNUM_RE.search(value):
+        return MESSAGES["company_invalid"]
+    return None
+
+
+@lru_cache(maxsize=256)
+def validate_message(value: str) -> Optional[str]:
+    """Validate the message text"""
+    value = value.strip()
+    if len(value) < MESSAGE_MIN_LENGTH:
+        return MESSAGES["message_too_short"]
+    if len(value) > MESSAGE_MAX_LENGTH:
+        return MESSAGES["message_too_long"]
+    return None
+
+
+VALIDATORS: Dict[str, Callable[[str], Optional[str]]] = {
+    "name": validate_name,
+    "email": validate_email,
+    "phone": validate_phone,
+    "company": validate_company,
+    "message": validate_message,
+}
+
+
+def is_valid_email(value: str) -> bool:
+    """Check whether the given string is a valid e-mail address"""
+    return validate_email(value) is None
+
+
+def validate_field(field: str, value: str) -> Optional[str]:
+    """
+    Validate a single form field
+
+    Args:
+        field: Field name, one of ``FIELD_ORDER``
+        value: Current field value
+
+    Returns:
+        German error message, or None if the value is valid
+    """
+    return VALIDATORS[field](value or "")
+
+
+def validate_contact_form(data: Mapping[str, str]) -> Optional[str]:
+    """
+    Validate a complete contact form submission
+
+    Args:
+        data: Mapping of field name to value; missing fields count as empty
+
+    Returns:
+        The error message of the first invalid field, or None if all are valid
+    """
+    for field in FIELD_ORDER:
+        error = validate_field(field, data.get(field) or "")
+        if error:
+            return error
+    return None
+
+
+def client_rules(field: str) -> Dict[str, Any]:
+    """
+    HTML validation attributes for a form field
+
+    The returned props can be passed straight to ``rx.input``/``rx.text_area``
+    so the browser enforces the same rules as ``validate_field``.
+    """
+    rules: Dict[str, Dict[str, Any]] = {
+        "name": {"max_length": NAME_MAX_LENGTH},
+        "email": {"pattern": EMAIL_PATTERN, "title": MESSAGES["email_invalid"]},
+        "phone": {"pattern": PHONE_PATTERN, "title": MESSAGES["phone_invalid"]},
+        "company": {
+            "min_length": COMPANY_MIN_LENGTH,
+            "max_length": COMPANY_MAX_LENGTH,
+            "title": MESSAGES["company_invalid"],
+        },
+        "message": {
+            "min_length": MESSAGE_MIN_LENGTH,
+            "max_length": MESSAGE_MAX_LENGTH,
+            "title": MESSAGES["message_too_short"],
+        },
+    }
+    return dict(rules[field])
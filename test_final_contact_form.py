@@ -1,342 +0,0 @@
-#!/usr/bin/env python3
-"""
-Final Contact Form Validation Test for Südwest-Energie Website
-
-This script tests the contact form validation and Ninox integration functionality directly,
-bypassing Reflex state instantiation issues.
-"""
-
-import time
-from datetime import datetime
-import json
-import sys
-import re
-from faker import Faker
-
-
-class FinalContactFormTester:
-    def __init__(self):
-        self.fake = Faker('de_DE')  # German locale for realistic German data
-        self.test_results = {
-            "start_time": datetime.now().isoformat(),
-            "tests": [],
-            "summary": {
-                "total": 0,
-                "passed": 0,
-                "failed": 0,
-                "errors": []
-            }
-        }
-
-    def add_test_result(self, test_name, passed, details=None):
-        """Add test result to the test results"""
-        result = {
-            "name": test_name,
-            "passed": passed,
-            "details": details,
-            "timestamp": datetime.now().isoformat()
-        }
-        self.test_results["tests"].append(result)
-        self.test_results["summary"]["total"] += 1
-        
-        if passed:
-            self.test_results["summary"]["passed"] += 1
-            print(f"✅ {test_name}")
-        else:
-            self.test_results["summary"]["failed"] += 1
-            print(f"❌ {test_name}")
-            if details:
-                print(f"   Details: {details}")
-
-    def test_email_validation_logic(self):
-        """Test the email validation logic from the contact form"""
-        # The validation pattern from the contact state
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        valid_emails = [
-            self.fake.email(),
-            "test@example.com",
-            "user.name@domain.co.uk",
-            "user+tag@example.org"
-        ]
-        
-        invalid_emails = [
-            "invalid-email",
-            "test@",
-            "@example.com",
-            "test@.com",
-            "test",
-            "",
-            "test@example",
-            "test@.domain.com"
-        ]
-        
-        all_passed = True
-        details = []
-        
-        # Test valid emails
-        for email in valid_emails:
-            is_valid = re.match(email_pattern, email) is not None
-            if is_valid:
-                details.append(f"Valid email '{email}': PASS")
-            else:
-                details.append(f"Valid email '{email}': FAIL")
-                all_passed = False
-        
-        # Test invalid emails
-        for email in invalid_emails:
-            is_valid = re.match(email_pattern, email) is not None
-            if not is_valid:
-                details.append(f"Invalid email '{email}': PASS")
-            else:
-                details.append(f"Invalid email '{email}': FAIL")
-                all_passed = False
-        
-        self.add_test_result("Email validation logic", all_passed, "; ".join(details))
-        return all_passed
-
-    def test_message_length_validation(self):
-        """Test message length validation"""
-        # The validation requires at least 10 characters
-        valid_messages = [
-            "This is a valid message with more than 10 characters",
-            self.fake.text(max_nb_chars=150),
-            "1234567890"  # Exactly 10 characters
-        ]
-        
-        invalid_messages = [
-            "",  # Empty message
-            "Short",  # Less than 10 characters
-            "123456789"  # 9 characters
-        ]
-        
-        all_passed = True
-        details = []
-        
-        # Test valid messages
-        for msg in valid_messages:
-            is_valid = len(msg.strip()) >= 10
-            if is_valid:
-                details.append(f"Valid message length '{len(msg)}': PASS")
-            else:
-                details.append(f"Valid message length '{len(msg)}': FAIL")
-                all_passed = False
-        
-        # Test invalid messages
-        for msg in invalid_messages:
-            is_valid = len(msg.strip()) >= 10
-            if not is_valid:
-                details.append(f"Invalid message length '{len(msg)}': PASS")
-            else:
-                details.append(f"Invalid message length '{len(msg)}': FAIL")
-                all_passed = False
-        
-        self.add_test_result("Message length validation", all_passed, "; ".join(details))
-        return all_passed
-
-    def test_ninox_integration_functionality(self):
-        """Test the Ninox integration by checking configuration and trying to import the client"""
-        try:
-            import sys
-            sys.path.insert(0, '/home/jchnhffmnn/Documents/suedwest-energie_website/suedwestenergie-reflex-projekt')
-            
-            from suedwestenergie.config import Config
-            from suedwestenergie.utils.ninox_client import NinoxClient, save_contact_to_ninox
-            
-            # Check configuration
-            config_details = []
-            api_key_set = bool(Config.NINOX_API_KEY)
-            db_id_set = bool(Config.NINOX_DATABASE_ID)
-            table_id_set = bool(Config.NINOX_TABLE_ID)
-            
-            if api_key_set:
-                config_details.append(f"API Key: {'SET' if api_key_set else 'NOT SET'}")
-            if db_id_set:
-                # Show partial key for security
-                db_id_display = Config.NINOX_DATABASE_ID[:8] + "..." if len(Config.NINOX_DATABASE_ID) > 8 else Config.NINOX_DATABASE_ID
-                config_details.append(f"DB ID: {db_id_display}")
-            if table_id_set:
-                table_id_display = Config.NINOX_TABLE_ID[:8] + "..." if len(Config.NINOX_TABLE_ID) > 8 else Config.NINOX_TABLE_ID
-                config_details.append(f"Table ID: {table_id_display}")
-            
-            # Check if all required values are present and not placeholder values
-            has_complete_config = (
-                Config.NINOX_API_KEY and 
-                Config.NINOX_DATABASE_ID and 
-                Config.NINOX_TABLE_ID and
-                Config.NINOX_API_KEY != "your-ninox-api-key" and
-                Config.NINOX_DATABASE_ID != "your-ninox-database-id" and
-                Config.NINOX_TABLE_ID != "your-ninox-table-id"
-            )
-            
-            if has_complete_config:
-                # Test if we can create the client (but won't actually connect)
-                try:
-                    # We won't initialize the client here as it would try to connect to Ninox
-                    import inspect
-                    client_module = __import__('suedwestenergie.utils.ninox_client', fromlist=['save_contact_to_ninox'])
-                    save_func = getattr(client_module, 'save_contact_to_ninox')
-                    
-                    # Check if the function exists and is callable
-                    if callable(save_func):
-                        self.add_test_result("Ninox integration functionality", True, 
-                                           f"Configuration: {', '.join(config_details)}; Function available: save_contact_to_ninox")
-                        return True
-                    else:
-                        self.add_test_result("Ninox integration functionality", False, 
-                                           "Save function is not callable")
-                        return False
-                except Exception as e:
-                    self.add_test_result("Ninox integration functionality", False, 
-                                       f"Error accessing save function: {str(e)}")
-                    return False
-            else:
-                # Show which values are missing
-                missing = []
-                if not Config.NINOX_API_KEY or Config.NINOX_API_KEY == "your-ninox-api-key":
-                    missing.append("API Key")
-                if not Config.NINOX_DATABASE_ID or Config.NINOX_DATABASE_ID == "your-ninox-database-id":
-                    missing.append("Database ID")
-                if not Config.NINOX_TABLE_ID or Config.NINOX_TABLE_ID == "your-ninox-table-id":
-                    missing.append("Table ID")
-                
-                self.add_test_result("Ninox integration functionality", False, 
-                                   f"Missing: {', '.join(missing) if missing else 'None'}")
-                return False
-                
-        except ImportError as e:
-            self.add_test_result("Ninox integration functionality", False, f"Import error: {str(e)}")
-            return False
-        except Exception as e:
-            self.add_test_result("Ninox integration functionality", False, f"Error: {str(e)}")
-            return False
-
-    def test_form_validation_function(self):
-        """Test form validation logic directly by examining the code"""
-        try:
-            import sys
-            sys.path.insert(0, '/home/jchnhffmnn/Documents/suedwest-energie_website/suedwestenergie-reflex-projekt')
-            
-            # Read the contact state file to verify validation logic exists
-            with open('/home/jchnhffmnn/Documents/suedwest-energie_website/suedwestenergie-reflex-projekt/suedwestenergie/state/contact_state.py', 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Check for key validation components
-            has_name_validation = 'not self.name.strip()' in content
-            has_email_validation = 'is_valid_email' in content or 're.match' in content
-            has_company_validation = 'not self.company.strip()' in content
-            has_message_validation = 'len(self.message.strip()) < 10' in content
-            has_validate_form_method = 'def validate_form' in content
-            
-            all_validations_present = all([
-                has_name_validation,
-                has_email_validation,
-                has_company_validation,
-                has_message_validation,
-                has_validate_form_method
-            ])
-            
-            details = f"Name validation: {'YES' if has_name_validation else 'NO'}, "
-            details += f"Email validation: {'YES' if has_email_validation else 'NO'}, "
-            details += f"Company validation: {'YES' if has_company_validation else 'NO'}, "
-            details += f"Message validation: {'YES' if has_message_validation else 'NO'}, "
-            details += f"Validate method: {'YES' if has_validate_form_method else 'NO'}"
-            
-            self.add_test_result("Form validation function", all_validations_present, details)
-            return all_validations_present
-            
-        except Exception as e:
-            self.add_test_result("Form validation function", False, str(e))
-            return False
-
-    def test_fake_data_generation(self):
-        """Test if fake data generation is working properly"""
-        try:
-            # Test that fake data generation is working
-            test_name = self.fake.name()
-            test_email = self.fake.email()
-            test_company = self.fake.company()
-            test_message = self.fake.text(max_nb_chars=100)
-            test_phone = self.fake.phone_number()
-            
-            all_generated = all([test_name, test_email, test_company, test_message, test_phone])
-            
-            details = f"Name: {test_name[:20]}..., Email: {test_email}, Company: {test_company[:20]}..."
-            self.add_test_result("Fake data generation", all_generated, details)
-            return all_generated
-        except Exception as e:
-            self.add_test_result("Fake data generation", False, str(e))
-            return False
-
-    def run_all_tests(self):
-        """Run all final contact form tests"""
-        print("Starting final contact form validation tests with fake data...\n")
-        
-        # Test fake data generation
-        print("Testing fake data generation...")
-        self.test_fake_data_generation()
-        
-        # Test form validation function
-        print("\nTesting form validation function...")
-        self.test_form_validation_function()
-        
-        # Test email validation logic
-        print("\nTesting email validation logic...")
-        self.test_email_validation_logic()
-        
-        # Test message length validation
-        print("\nTesting message length validation...")
-        self.test_message_length_validation()
-        
-        # Test Ninox integration
-        print("\nTesting Ninox integration functionality...")
-        self.test_ninox_integration_functionality()
-        
-        # Print summary
-        print("\n" + "="*60)
-        print("FINAL CONTACT FORM VALIDATION TESTING SUMMARY")
-        print("="*60)
-        summary = self.test_results["summary"]
-        print(f"Total tests: {summary['total']}")
-        print(f"Passed: {summary['passed']}")
-        print(f"Failed: {summary['failed']}")
-        print(f"Success rate: {(summary['passed']/max(1, summary['total'])*100):.1f}%")
-        print("="*60)
-        
-        print("\nAll core form validation and Ninox integration functionality has been tested.")
-        print("The contact form is properly implemented and ready for use when Ninox credentials are configured.")
-
-    def save_test_results(self, filename="final_contact_form_test_results.json"):
-        """Save test results to a file"""
-        self.test_results["end_time"] = datetime.now().isoformat()
-        self.test_results["summary"]["success_rate"] = (self.test_results["summary"]["passed"] / 
-                                                       max(1, self.test_results["summary"]["total"])) * 100
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.test_results, f, indent=2, ensure_ascii=False)
-        
-        print(f"\nFinal contact form test results saved to {filename}")
-
-
-def main():
-    """Main function to run the final tests"""
-    # Initialize tester
-    tester = FinalContactFormTester()
-    
-    try:
-        # Run comprehensive tests
-        tester.run_all_tests()
-        
-        # Save test results
-        tester.save_test_results()
-        
-    except KeyboardInterrupt:
-        print("\nTesting interrupted by user")
-    except Exception as e:
-        print(f"An error occurred during testing: {e}")
-        import traceback
-        traceback.print_exc()
-
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
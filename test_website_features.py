@@ -10,24 +10,200 @@ This script tests all major features of the Südwest-Energie website including:
 - Page load times and responsiveness
 - Footer and header elements
 - Social media links
+- Frontend performance (--perf): Navigation Timing, LCP, CLS, TBT, JS heap and
+  the resource waterfall, as the median of repeated loads compared with a baseline
 """
 
+import argparse
+import statistics
 import time
 import requests
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
+try:
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import Select
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.keys import Keys
+    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+    from webdriver_manager.chrome import ChromeDriverManager
+    from selenium.webdriver.chrome.service import Service
+except ImportError:  # the performance statistics below are usable without a browser
+    webdriver = None
 import sys
 import os
 from datetime import datetime
 import json
+from urllib.parse import urljoin
+
+# Pages measured by the performance audit
+PERF_PAGES = [
+    ("/", "Homepage"),
+    ("/impressum", "Impressum"),
+    ("/datenschutz", "Datenschutz"),
+    ("/agb", "AGB"),
+    ("/danke", "Thank You"),
+]
+
+# Metrics compared with the baseline, with the smallest increase that counts as
+# a regression. Smaller changes are within the run-to-run noise of a page load.
+PERF_METRICS = {
+    "ttfb_ms": 50,
+    "fcp_ms": 100,
+    "lcp_ms": 100,
+    "dom_content_loaded_ms": 100,
+    "load_ms": 100,
+    "cls": 0.02,
+    "tbt_ms": 50,
+    "js_heap_bytes": 1024 * 1024,
+    "transfer_bytes": 10 * 1024,
+    "requests": 2,
+}
+
+# Main-thread work beyond this is blocking (as in Lighthouse)
+LONG_TASK_MS = 50
+
+# Time after the load event for late layout shifts, long tasks and the final LCP
+SETTLE_SECONDS = 1.0
+
+# Registered before any page script runs, so that entries of the whole load are observed
+PERF_OBSERVER_SCRIPT = """
+window.__perf = {lcp: null, shifts: [], longTasks: []};
+const observe = (type, callback) => {
+  try {
+    new PerformanceObserver(list => list.getEntries().forEach(callback)).observe({type, buffered: true});
+  } catch (e) {}
+};
+observe('largest-contentful-paint', e => { window.__perf.lcp = e.startTime; });
+observe('layout-shift', e => { if (!e.hadRecentInput) window.__perf.shifts.push([e.startTime, e.value]); });
+observe('longtask', e => { window.__perf.longTasks.push([e.startTime, e.duration]); });
+"""
+
+PERF_COLLECT_SCRIPT = """
+const paint = {};
+performance.getEntriesByType('paint').forEach(e => { paint[e.name] = e.startTime; });
+const navigation = performance.getEntriesByType('navigation')[0];
+return {
+  navigation: navigation ? navigation.toJSON() : null,
+  paint: paint,
+  observed: window.__perf || null,
+  heap: performance.memory ? performance.memory.usedJSHeapSize : null,
+  now: performance.now(),
+  resources: performance.getEntriesByType('resource').map(e => ({
+    name: e.name, type: e.initiatorType, start: e.startTime, duration: e.duration,
+    transfer: e.transferSize, size: e.encodedBodySize,
+  })),
+};
+"""
+
+
+def cumulative_layout_shift(shifts):
+    """
+    CLS as defined by Web Vitals: the largest session window of layout shifts
+
+    A window ends after a gap of 1s without shifts or when it spans 5s.
+    """
+    largest = current = 0.0
+    window_start = previous = None
+    for start, value in sorted(shifts):
+        if previous is None or start - previous > 1000 or start - window_start > 5000:
+            window_start, current = start, 0.0
+        current += value
+        previous = start
+        largest = max(largest, current)
+    return round(largest, 4)
+
+
+def total_blocking_time(long_tasks, fcp_ms):
+    """Sum of the main-thread time beyond 50ms of every task after the first contentful paint"""
+    blocking = 0.0
+    for start, duration in long_tasks:
+        end = start + duration
+        if end > fcp_ms:
+            blocking += max(0.0, end - max(start, fcp_ms) - LONG_TASK_MS)
+    return round(blocking, 1)
+
+
+def page_metrics(raw):
+    """Metrics of one page load from the data returned by PERF_COLLECT_SCRIPT"""
+    navigation = raw.get("navigation") or {}
+    observed = raw.get("observed") or {}
+    fcp = raw.get("paint", {}).get("first-contentful-paint")
+    resources = raw.get("resources") or []
+    waterfall = [
+        {
+            "name": resource["name"],
+            "type": resource["type"],
+            "start_ms": round(resource["start"], 1),
+            "duration_ms": round(resource["duration"], 1),
+            "transfer_bytes": resource["transfer"],
+        }
+        for resource in sorted(resources, key=lambda resource: resource["start"])
+    ]
+    metrics = {
+        "ttfb_ms": navigation.get("responseStart"),
+        "fcp_ms": fcp,
+        "lcp_ms": observed.get("lcp"),
+        "dom_content_loaded_ms": navigation.get("domContentLoadedEventEnd"),
+        "load_ms": navigation.get("loadEventEnd"),
+        "cls": cumulative_layout_shift(observed.get("shifts", [])),
+        "tbt_ms": total_blocking_time(observed.get("longTasks", []), fcp or 0.0),
+        "js_heap_bytes": raw.get("heap"),
+        "transfer_bytes": navigation.get("transferSize", 0) + sum(resource["transfer"] or 0 for resource in resources),
+        "requests": 1 + len(resources),
+    }
+    return {
+        "metrics": {name: round(value, 1) if name.endswith("_ms") and value is not None else value
+                    for name, value in metrics.items()},
+        "waterfall": waterfall,
+    }
+
+
+def median_metrics(samples):
+    """
+    Median of every metric over repeated loads of one page
+
+    Returns:
+        The medians and the waterfall of the load whose load time was the median
+    """
+    medians = {}
+    for name in PERF_METRICS:
+        values = [sample["metrics"][name] for sample in samples if sample["metrics"].get(name) is not None]
+        medians[name] = round(statistics.median(values), 4) if values else None
+    by_load = sorted(samples, key=lambda sample: sample["metrics"].get("load_ms") or 0)
+    return {"metrics": medians, "waterfall": by_load[len(by_load) // 2]["waterfall"] if samples else []}
+
+
+def compare_to_baseline(current, baseline, tolerance=0.2):
+    """
+    Metrics that got worse than the baseline
+
+    A metric regresses when it grew by more than ``tolerance`` (relative) and
+    by more than its noise floor in PERF_METRICS (absolute).
+
+    Returns:
+        One description per regression, e.g. "lcp_ms: 1200 -> 1650 (+37.5%)"
+    """
+    regressions = []
+    for name, floor in PERF_METRICS.items():
+        before, after = baseline.get(name), current.get(name)
+        if before is None or after is None:
+            continue
+        increase = after - before
+        if increase > floor and increase > before * tolerance:
+            change = f"+{increase / before * 100:.1f}%" if before else f"+{increase:g}"
+            regressions.append(f"{name}: {before:g} -> {after:g} ({change})")
+    return regressions
+
+
+def load_baseline(filename):
+    """Page medians of the baseline file, or None if there is none yet"""
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
 
 
 class WebsiteFeatureTester:
@@ -46,6 +222,12 @@ class WebsiteFeatureTester:
             }
         }
         
+        self._perf_observers = False
+
+        if webdriver is None:
+            print("Selenium is not installed: pip install selenium webdriver-manager")
+            sys.exit(1)
+
         # Setup Chrome options
         chrome_options = Options()
         if headless:
@@ -54,6 +236,7 @@ class WebsiteFeatureTester:
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument("--enable-precise-memory-info")  # unrounded JS heap sizes
 
         try:
             # Setup ChromeDriver using webdriver-manager
@@ -65,7 +248,7 @@ class WebsiteFeatureTester:
             print(f"Failed to initialize browser: {e}")
             sys.exit(1)
 
-    def add_test_result(self, test_name, passed, details=None):
+    def add_test_result(self, test_name, passed, details=None, metrics=None):
         """Add test result to the test results"""
         result = {
             "name": test_name,
@@ -73,6 +256,8 @@ class WebsiteFeatureTester:
             "details": details,
             "timestamp": datetime.now().isoformat()
         }
+        if metrics is not None:
+            result["metrics"] = metrics
         self.test_results["tests"].append(result)
         self.test_results["summary"]["total"] += 1
         
@@ -367,6 +552,79 @@ class WebsiteFeatureTester:
         print(f"Success rate: {(summary['passed']/max(1, summary['total'])*100):.1f}%")
         print("="*60)
 
+    def measure_page_load(self, url):
+        """Load a page with an empty cache and return its performance metrics"""
+        if not self._perf_observers:
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": PERF_OBSERVER_SCRIPT})
+            self._perf_observers = True
+        self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        self.driver.get(url)
+        self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+        time.sleep(SETTLE_SECONDS)
+        return page_metrics(self.driver.execute_script(PERF_COLLECT_SCRIPT))
+
+    def audit_page_performance(self, path, page_name, runs=5, baseline=None, tolerance=0.2):
+        """
+        Measure a page ``runs`` times and compare the medians with the baseline
+
+        Returns:
+            The medians and the waterfall, see ``median_metrics``
+        """
+        test_name = f"{page_name} performance"
+        try:
+            samples = [self.measure_page_load(urljoin(self.base_url, path)) for _ in range(runs)]
+        except Exception as e:
+            self.add_test_result(test_name, False, str(e))
+            return None
+
+        result = median_metrics(samples)
+        medians = result["metrics"]
+        regressions = compare_to_baseline(medians, baseline, tolerance) if baseline else []
+        summary = ", ".join(f"{name}={medians[name]:g}" for name in ("lcp_ms", "cls", "tbt_ms") if medians[name] is not None)
+        if regressions:
+            details = "Regressions: " + "; ".join(regressions)
+        elif baseline:
+            details = f"Median of {runs} runs within {tolerance:.0%} of the baseline ({summary})"
+        else:
+            details = f"Median of {runs} runs, no baseline yet ({summary})"
+        self.add_test_result(test_name, not regressions, details, metrics={
+            "runs": runs,
+            "median": medians,
+            "samples": [sample["metrics"] for sample in samples],
+            "baseline": baseline,
+            "regressions": regressions,
+            "waterfall": result["waterfall"],
+        })
+        return result
+
+    def run_performance_audits(self, pages=PERF_PAGES, runs=5, baseline_file="perf_baseline.json",
+                               update_baseline=False, tolerance=0.2):
+        """
+        Audit the frontend performance of all pages
+
+        The medians become the baseline when there is none yet or with
+        ``update_baseline``; otherwise a page fails when a metric regressed.
+        """
+        print(f"Starting performance audits ({runs} runs per page)...\n")
+        stored = load_baseline(baseline_file)
+        baseline_pages = {} if stored is None or update_baseline else stored.get("pages", {})
+
+        medians = {}
+        for path, page_name in pages:
+            result = self.audit_page_performance(path, page_name, runs, baseline_pages.get(page_name), tolerance)
+            if result is not None:
+                medians[page_name] = result["metrics"]
+
+        if stored is None or update_baseline:
+            with open(baseline_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "created": datetime.now().isoformat(),
+                    "base_url": self.base_url,
+                    "runs": runs,
+                    "pages": medians,
+                }, f, indent=2, ensure_ascii=False)
+            print(f"\nBaseline saved to {baseline_file}")
+
     def save_test_results(self, filename="test_results.json"):
         """Save test results to a file"""
         self.test_results["end_time"] = datetime.now().isoformat()
@@ -385,29 +643,52 @@ class WebsiteFeatureTester:
             print("\nBrowser closed")
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Browser tests for the Südwest-Energie website")
+    parser.add_argument("--base-url", default="http://localhost:3000", help="Website URL")
+    parser.add_argument("--headless", action="store_true", help="Run Chrome without a window")
+    parser.add_argument("--perf", action="store_true", help="Run the performance audits instead of the feature tests")
+    parser.add_argument("--runs", type=int, default=5, help="Loads per page; the median is reported")
+    parser.add_argument("--baseline", default="perf_baseline.json", help="Baseline file of the performance audits")
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Relative increase over the baseline that counts as a regression")
+    parser.add_argument("--output", default=None,
+                        help="Results file (default: test_results.json, or perf_results.json with --perf)")
+    return parser.parse_args()
+
+
 def main():
     """Main function to run the tests"""
+    args = parse_args()
+    base_url = args.base_url
+
     # Check if server is running
     try:
-        response = requests.get("http://localhost:3000")
+        response = requests.get(base_url)
         if response.status_code != 200:
-            print("Error: Website is not accessible at http://localhost:3000")
+            print(f"Error: Website is not accessible at {base_url}")
             print("Make sure the Reflex server is running with 'reflex run'")
             return
     except requests.ConnectionError:
-        print("Error: Cannot connect to website at http://localhost:3000")
+        print(f"Error: Cannot connect to website at {base_url}")
         print("Make sure the Reflex server is running with 'reflex run'")
         return
     
-    # Initialize tester
-    tester = WebsiteFeatureTester(base_url="http://localhost:3000", headless=False)
+    # Initialize tester; performance is always measured headless, like in CI
+    tester = WebsiteFeatureTester(base_url=base_url, headless=args.headless or args.perf)
     
     try:
+        if args.perf:
+            tester.run_performance_audits(PERF_PAGES, args.runs, args.baseline, args.update_baseline, args.tolerance)
+            tester.save_test_results(args.output or "perf_results.json")
+            return
+
         # Run comprehensive tests
         tester.run_comprehensive_tests()
         
         # Save test results
-        tester.save_test_results()
+        tester.save_test_results(args.output or "test_results.json")
         
     except KeyboardInterrupt:
         print("\nTesting interrupted by user")
@@ -9,15 +9,57 @@ It can test:
 - Contact form submission via the backend API
 - Static asset accessibility
 - Response times
+- Behavior under concurrent load (--load), with open or closed arrival models
 """
 
+import argparse
+import bisect
+import math
+import random
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
 import sys
 from urllib.parse import urljoin
 
+# Upper bounds (ms) of the latency histogram buckets in load test results
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def _percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def latency_summary(latencies_ms, errors, elapsed):
+    """Percentiles, histogram, throughput and error rate of one route's samples"""
+    ordered = sorted(latencies_ms)
+    total = len(ordered)
+    # Requests per bucket, keyed by the bucket's upper bound
+    histogram = {f"<={bound}ms": 0 for bound in LATENCY_BUCKETS_MS}
+    histogram[f">{LATENCY_BUCKETS_MS[-1]}ms"] = 0
+    keys = list(histogram)
+    for value in ordered:
+        histogram[keys[bisect.bisect_left(LATENCY_BUCKETS_MS, value)]] += 1
+    return {
+        "requests": total,
+        "errors": errors,
+        "error_rate": round(errors / total, 4) if total else 0.0,
+        "throughput_rps": round(total / elapsed, 2) if elapsed > 0 else 0.0,
+        "p50_ms": round(_percentile(ordered, 50), 2),
+        "p95_ms": round(_percentile(ordered, 95), 2),
+        "p99_ms": round(_percentile(ordered, 99), 2),
+        "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+        "mean_ms": round(sum(ordered) / total, 2) if total else 0.0,
+        "histogram": histogram,
+    }
+
 
 class HTTPFeatureTester:
     def __init__(self, base_url="http://localhost:3000"):
@@ -37,7 +79,7 @@ class HTTPFeatureTester:
             }
         }
 
-    def add_test_result(self, test_name, passed, details=None):
+    def add_test_result(self, test_name, passed, details=None, metrics=None):
         """Add test result to the test results"""
         result = {
             "name": test_name,
@@ -45,6 +87,8 @@ class HTTPFeatureTester:
             "details": details,
             "timestamp": datetime.now().isoformat()
         }
+        if metrics is not None:
+            result["metrics"] = metrics
         self.test_results["tests"].append(result)
         self.test_results["summary"]["total"] += 1
         
@@ -190,6 +234,123 @@ class HTTPFeatureTester:
             self.add_test_result("sitemap.xml", False, str(e))
             return False
 
+    def _timed_get(self, session, path):
+        """One GET; returns (latency in ms, error or None)"""
+        start = time.perf_counter()
+        try:
+            response = session.get(urljoin(self.base_url, path), timeout=30)
+            error = None if response.status_code < 400 else f"HTTP {response.status_code}"
+        except requests.RequestException as e:
+            error = type(e).__name__
+        return (time.perf_counter() - start) * 1000, error
+
+    def run_load_test(self, pages, concurrency=10, total_requests=500, duration=None,
+                      arrival="closed", rate=50.0, max_error_rate=0.01, max_p95=1.0):
+        """
+        Generate concurrent load and record per-route latency statistics
+
+        Args:
+            pages: (path, name) pairs, requested round-robin
+            concurrency: Worker threads (closed model: concurrent users)
+            total_requests: Stop after this many requests
+            duration: Stop after this many seconds instead, if given
+            arrival: "closed" - every worker sends its next request as soon as the last one
+                     returned; "open" - requests arrive at ``rate`` per second (Poisson),
+                     independent of how fast the server answers
+            rate: Arrival rate of the open model in requests per second
+            max_error_rate: A route passes with at most this share of failed requests
+            max_p95: ... and a p95 latency of at most this many seconds
+        """
+        samples = {path: [] for path, _ in pages}
+        errors = {path: 0 for path, _ in pages}
+        error_kinds = {}
+        lock = threading.Lock()
+        local = threading.local()
+        deadline = time.perf_counter() + duration if duration else None
+        limit = None if duration else total_requests
+
+        def session():
+            if not hasattr(local, "session"):
+                local.session = requests.Session()
+                local.session.headers.update(self.session.headers)
+            return local.session
+
+        def record(path, latency, error):
+            with lock:
+                samples[path].append(latency)
+                if error:
+                    errors[path] += 1
+                    error_kinds[error] = error_kinds.get(error, 0) + 1
+
+        print(f"Load test: {arrival} model, concurrency {concurrency}, "
+              + (f"{duration}s" if duration else f"{total_requests} requests")
+              + (f", {rate} req/s" if arrival == "open" else ""))
+        started = time.perf_counter()
+
+        if arrival == "closed":
+            counter = iter(range(limit if limit is not None else sys.maxsize))
+
+            def worker():
+                while deadline is None or time.perf_counter() < deadline:
+                    with lock:
+                        index = next(counter, None)
+                    if index is None:
+                        return
+                    path = pages[index % len(pages)][0]
+                    record(path, *self._timed_get(session(), path))
+
+            threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        elif arrival == "open":
+            def send(path, scheduled):
+                latency, error = self._timed_get(session(), path)
+                # Include the time spent queued behind busy workers (no coordinated omission)
+                queued = (time.perf_counter() - scheduled) * 1000 - latency
+                record(path, latency + max(0.0, queued), error)
+
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                scheduled = started
+                index = 0
+                while (limit is None or index < limit) and (deadline is None or scheduled < deadline):
+                    pause = scheduled - time.perf_counter()
+                    if pause > 0:
+                        time.sleep(pause)
+                    pool.submit(send, pages[index % len(pages)][0], scheduled)
+                    index += 1
+                    scheduled += random.expovariate(rate)
+        else:
+            raise ValueError(f"Unknown arrival model: {arrival}")
+
+        elapsed = time.perf_counter() - started
+        for path, name in pages:
+            metrics = latency_summary(samples[path], errors[path], elapsed)
+            passed = metrics["requests"] > 0 and metrics["error_rate"] <= max_error_rate \
+                and metrics["p95_ms"] <= max_p95 * 1000
+            self.add_test_result(
+                f"{name} load",
+                passed,
+                f"p50 {metrics['p50_ms']}ms, p95 {metrics['p95_ms']}ms, p99 {metrics['p99_ms']}ms, "
+                f"max {metrics['max_ms']}ms, {metrics['throughput_rps']} req/s, "
+                f"errors {metrics['errors']}/{metrics['requests']} (max p95: {max_p95}s)",
+                metrics,
+            )
+        all_latencies = [value for values in samples.values() for value in values]
+        overall = latency_summary(all_latencies, sum(errors.values()), elapsed)
+        overall["error_kinds"] = error_kinds
+        self.test_results["load"] = {
+            "arrival": arrival,
+            "concurrency": concurrency,
+            "rate": rate if arrival == "open" else None,
+            "duration_s": round(elapsed, 2),
+            "overall": overall,
+        }
+        print(f"\nOverall: {overall['requests']} requests in {elapsed:.1f}s, {overall['throughput_rps']} req/s, "
+              f"p95 {overall['p95_ms']}ms, errors {overall['errors']}")
+        return overall
+
     def run_comprehensive_tests(self):
         """Run all HTTP-based website feature tests"""
         print("Starting HTTP-based website feature tests...\n")
@@ -244,6 +405,17 @@ class HTTPFeatureTester:
         print(f"\nHTTP test results saved to {filename}")
 
 
+# Routes requested by the load test
+LOAD_TEST_PAGES = [
+    ("/", "Homepage"),
+    ("/impressum", "Impressum"),
+    ("/datenschutz", "Datenschutz"),
+    ("/agb", "AGB"),
+    ("/danke", "Thank You"),
+    ("/logo.jpg", "Logo"),
+]
+
+
 def run_ninox_integration_tests():
     """Specific tests for Ninox integration functionality"""
     print("\nTesting Ninox Integration...")
@@ -277,28 +449,59 @@ def run_ninox_integration_tests():
         print("   Set NINOX_API_KEY, NINOX_DATABASE_ID, and NINOX_TABLE_ID in your environment")
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="HTTP tests for the Südwest-Energie website")
+    parser.add_argument("--base-url", default="http://localhost:3000", help="Website URL")
+    parser.add_argument("--load", action="store_true", help="Run the concurrent load test instead of the feature tests")
+    parser.add_argument("--concurrency", type=int, default=10, help="Worker threads / concurrent users")
+    parser.add_argument("--requests", type=int, default=500, help="Total requests (ignored with --duration)")
+    parser.add_argument("--duration", type=float, default=None, help="Run for this many seconds")
+    parser.add_argument("--arrival", choices=["closed", "open"], default="closed", help="Arrival model")
+    parser.add_argument("--rate", type=float, default=50.0, help="Requests per second in the open model")
+    parser.add_argument("--max-p95", type=float, default=1.0, help="Max p95 latency per route in seconds")
+    parser.add_argument("--output", default=None,
+                        help="Results file (default: http_test_results.json, or http_load_results.json with --load)")
+    return parser.parse_args()
+
+
 def main():
     """Main function to run the tests"""
+    args = parse_args()
+    base_url = args.base_url
+
     # Check if server is running
     try:
-        response = requests.get("http://localhost:3000", timeout=10)
+        response = requests.get(base_url, timeout=10)
         if response.status_code != 200:
-            print("Error: Website is not accessible at http://localhost:3000")
+            print(f"Error: Website is not accessible at {base_url}")
             print("Make sure the Reflex server is running with 'reflex run'")
             return
     except requests.ConnectionError:
-        print("Error: Cannot connect to website at http://localhost:3000")
+        print(f"Error: Cannot connect to website at {base_url}")
         print("Make sure the Reflex server is running with 'reflex run'")
         return
     except requests.Timeout:
-        print("Error: Connection to website at http://localhost:3000 timed out")
+        print(f"Error: Connection to website at {base_url} timed out")
         print("Make sure the Reflex server is running with 'reflex run'")
         return
     
     # Initialize tester
-    tester = HTTPFeatureTester(base_url="http://localhost:3000")
+    tester = HTTPFeatureTester(base_url=base_url)
     
     try:
+        if args.load:
+            tester.run_load_test(
+                LOAD_TEST_PAGES,
+                concurrency=args.concurrency,
+                total_requests=args.requests,
+                duration=args.duration,
+                arrival=args.arrival,
+                rate=args.rate,
+                max_p95=args.max_p95,
+            )
+            tester.save_test_results(args.output or "http_load_results.json")
+            return
+
         # Run comprehensive tests
         tester.run_comprehensive_tests()
         
@@ -306,7 +509,7 @@ def main():
         run_ninox_integration_tests()
         
         # Save test results
-        tester.save_test_results()
+        tester.save_test_results(args.output or "http_test_results.json")
         
     except KeyboardInterrupt:
         print("\nTesting interrupted by user")
@@ -0,0 +1,315 @@
+"""Shared fixtures and the merged result report of the test suite
+
+The suite runs in one process or spread over pytest-xdist workers
+(``pytest -n auto``). Everything that must exist only once per run, the local
+backend and its Ninox/SMTP stand-ins as well as the JSON report, lives in the
+controller process; the workers receive the backend URL through
+``pytest_configure_node``.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+import pytest
+import requests
+from benchmarks.stand_ins import StandIns
+from suedwestenergie.utils import email, logger, ninox_client
+
+pytest_plugins = ("pytester",)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) suedwestenergie-test-suite"
+
+_TARGETS = pytest.StashKey[Dict[str, Optional[str]]]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("suedwestenergie", "Südwest-Energie site tests")
+    group.addoption("--site-url", default=os.getenv("SITE_URL"),
+                    help="Running website for the page and browser tests, e.g. http://localhost:3000")
+    group.addoption("--backend-url", default=os.getenv("BACKEND_URL"),
+                    help="Running state backend for the event tests, e.g. http://localhost:8000")
+    group.addoption("--start-backend", action="store_true",
+                    help="Start a local backend against Ninox and SMTP stand-ins for the event tests")
+    group.addoption("--backend-timeout", type=float, default=120.0,
+                    help="Seconds to wait for the local backend to answer (default: 120)")
+    group.addoption("--results-json", metavar="FILE",
+                    help="Write the results of all tests, merged over the workers, to FILE")
+
+
+def start_stand_ins() -> Tuple[StandIns, Any]:
+    """
+    Start Ninox and SMTP stand-ins on free ports in a background event loop
+
+    Returns:
+        The started stand-ins and a function that stops them
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    stand_ins = StandIns(smtp_port=0, ninox_port=0)
+    asyncio.run_coroutine_threadsafe(stand_ins.start(), loop).result(10)
+
+    def stop():
+        asyncio.run_coroutine_threadsafe(stand_ins.stop(), loop).result(10)
+        loop.call_soon_threadsafe(loop.stop)
+
+    return stand_ins, stop
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class LocalBackend:
+    """``reflex run --env prod --backend-only`` pointed at local Ninox and SMTP stand-ins"""
+
+    def __init__(self, timeout: float = 120.0):
+        self.timeout = timeout
+        self.process: Optional[subprocess.Popen] = None
+        self._log = None
+        self._stop_stand_ins = None
+
+    def start(self) -> Dict[str, str]:
+        """
+        Start the stand-ins and the backend and wait until it answers
+
+        Returns:
+            ``backend_url`` and ``stats_url`` (the Ninox stand-in, see ``StandIns``)
+
+        Raises:
+            RuntimeError: If reflex is missing or the backend does not come up
+        """
+        reflex = shutil.which("reflex")
+        if reflex is None:
+            raise RuntimeError("reflex is not installed")
+
+        stand_ins, self._stop_stand_ins = start_stand_ins()
+        port = _free_port()
+        self._log = tempfile.TemporaryFile()
+        self.process = subprocess.Popen(
+            [reflex, "run", "--env", "prod", "--backend-only", "--backend-port", str(port)],
+            cwd=ROOT,
+            env=dict(os.environ, **stand_ins.backend_env()),
+            stdout=self._log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,  # the workers of the backend are stopped with it
+        )
+        url = f"http://127.0.0.1:{port}"
+        deadline = time.monotonic() + self.timeout
+        while True:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"backend exited with {self.process.returncode}: {self._tail()}")
+            try:
+                if requests.get(f"{url}/ping", timeout=2).ok:
+                    break
+            except requests.RequestException:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"backend did not answer within {self.timeout:.0f}s: {self._tail()}")
+            time.sleep(0.5)
+        return {"backend_url": url, "stats_url": stand_ins.backend_env()["NINOX_API_URL"]}
+
+    def stop(self) -> None:
+        if self.process is not None and self.process.poll() is None:
+            os.killpg(self.process.pid, signal.SIGTERM)
+            try:
+                self.process.wait(10)
+            except subprocess.TimeoutExpired:
+                os.killpg(self.process.pid, signal.SIGKILL)
+                self.process.wait()
+        if self._stop_stand_ins is not None:
+            self._stop_stand_ins()
+        if self._log is not None:
+            self._log.close()
+
+    def _tail(self, lines: int = 5) -> str:
+        self._log.seek(0)
+        return " | ".join(self._log.read().decode("utf-8", "replace").strip().splitlines()[-lines:])
+
+
+class ResultReport:
+    """
+    Collects the outcome of every test into one JSON file
+
+    Registered in the controller only: with pytest-xdist the controller
+    receives the reports of all workers, so the file covers the whole run.
+    The format follows the ``*_test_results.json`` files of the test scripts.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.start_time = datetime.now()
+        self.tests: Dict[str, Dict[str, Any]] = {}
+
+    def pytest_runtest_logreport(self, report):
+        node = getattr(report, "node", None)  # the sending worker, set by pytest-xdist
+        test = self.tests.setdefault(report.nodeid, {
+            "name": report.nodeid,
+            "passed": True,
+            "outcome": "passed",
+            "details": None,
+            "duration": 0.0,
+            "worker": node.gateway.id if node is not None else None,
+            "timestamp": datetime.now().isoformat(),
+        })
+        test["duration"] = round(test["duration"] + report.duration, 4)
+        if report.user_properties:
+            test.setdefault("metrics", {}).update(dict(report.user_properties))
+        if report.failed:
+            test["passed"] = False
+            test["outcome"] = "failed" if report.when == "call" else "error"
+            crash = getattr(report.longrepr, "reprcrash", None)
+            test["details"] = crash.message if crash is not None else report.longreprtext
+        elif report.skipped and test["outcome"] == "passed":
+            test["passed"] = None
+            test["outcome"] = "skipped"
+            reason = report.longrepr[2] if isinstance(report.longrepr, tuple) else str(report.longrepr)
+            test["details"] = reason.removeprefix("Skipped: ")
+
+    def pytest_sessionfinish(self, session):
+        tests = list(self.tests.values())
+        outcomes = [test["outcome"] for test in tests]
+        executed = len(tests) - outcomes.count("skipped")
+        passed = outcomes.count("passed")
+        results = {
+            "start_time": self.start_time.isoformat(),
+            "end_time": datetime.now().isoformat(),
+            "duration_seconds": round((datetime.now() - self.start_time).total_seconds(), 2),
+            "tests": tests,
+            "summary": {
+                "total": executed,
+                "passed": passed,
+                "failed": outcomes.count("failed") + outcomes.count("error"),
+                "skipped": outcomes.count("skipped"),
+                "errors": [test["name"] for test in tests if test["outcome"] == "error"],
+                "success_rate": passed / max(1, executed) * 100,
+            },
+        }
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+def pytest_configure(config):
+    if hasattr(config, "workerinput"):
+        config.stash[_TARGETS] = config.workerinput["suedwestenergie_targets"]
+        return
+
+    targets = {
+        "site_url": config.getoption("site_url"),
+        "backend_url": config.getoption("backend_url"),
+        "stats_url": None,
+        "backend_error": None,
+    }
+    if config.getoption("start_backend") and not targets["backend_url"]:
+        backend = LocalBackend(config.getoption("backend_timeout"))
+        config.add_cleanup(backend.stop)
+        try:
+            targets.update(backend.start())
+        except RuntimeError as e:
+            targets["backend_error"] = f"local backend unavailable: {e}"
+    config.stash[_TARGETS] = targets
+
+    if config.getoption("results_json"):
+        config.pluginmanager.register(ResultReport(config.getoption("results_json")), "suedwestenergie-results")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    # Called in the controller for every pytest-xdist worker
+    node.workerinput["suedwestenergie_targets"] = node.config.stash[_TARGETS]
+
+
+@pytest.fixture(scope="session")
+def site_url(pytestconfig) -> str:
+    """Origin of the running website"""
+    url = pytestconfig.stash[_TARGETS]["site_url"]
+    if not url:
+        pytest.skip("needs a running website (--site-url or SITE_URL)")
+    return url.rstrip("/")
+
+
+@pytest.fixture(scope="session")
+def http() -> requests.Session:
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def backend_url(pytestconfig) -> str:
+    """Origin of the state backend, either given or started by ``--start-backend``"""
+    targets = pytestconfig.stash[_TARGETS]
+    if not targets["backend_url"]:
+        pytest.skip(targets["backend_error"] or "needs a state backend (--backend-url or --start-backend)")
+    return targets["backend_url"].rstrip("/")
+
+
+@pytest.fixture
+def backend_stats(pytestconfig):
+    """
+    Counters of the stand-ins behind the local backend
+
+    Returns a function that fetches ``{"emails": ..., "ninox_records": ...}``,
+    or None when the backend was not started by the suite.
+    """
+    stats_url = pytestconfig.stash[_TARGETS]["stats_url"]
+    if not stats_url:
+        return None
+    return lambda: requests.get(f"{stats_url}/stats", timeout=5).json()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def app_log(tmp_path_factory) -> str:
+    """Write the app log to a temporary directory instead of logs/app.log in the tree"""
+    path = str(tmp_path_factory.mktemp("logs") / "app.log")
+    handlers = [h for h in logger.app_logger.handlers if isinstance(h, logging.FileHandler)]
+    original = [h.baseFilename for h in handlers]
+    for handler in handlers:
+        handler.close()  # opened again, at the new path, with the next record
+        handler.baseFilename = path
+    yield path
+    for handler, filename in zip(handlers, original):
+        handler.close()
+        handler.baseFilename = filename
+
+
+@pytest.fixture(scope="session")
+def stand_ins() -> StandIns:
+    """Ninox and SMTP stand-ins in the test process"""
+    stand_ins, stop = start_stand_ins()
+    yield stand_ins
+    stop()
+
+
+@pytest.fixture
+def service_config(stand_ins, monkeypatch) -> StandIns:
+    """Point the Ninox client and the e-mail service of the app at the stand-ins"""
+    env = stand_ins.backend_env()
+    settings = {
+        "EMAIL_HOST": env["EMAIL_HOST"], "EMAIL_PORT": int(env["EMAIL_PORT"]), "EMAIL_USE_TLS": False,
+        "EMAIL_HOST_USER": env["EMAIL_HOST_USER"], "EMAIL_HOST_PASSWORD": env["EMAIL_HOST_PASSWORD"],
+        "NINOX_API_URL": env["NINOX_API_URL"], "NINOX_API_KEY": env["NINOX_API_KEY"],
+        "NINOX_TEAM_ID": env["NINOX_TEAM_ID"], "NINOX_DATABASE_ID": env["NINOX_DATABASE_ID"],
+        "NINOX_TABLE_ID": env["NINOX_TABLE_ID"],
+    }
+    for module in (email, ninox_client):
+        for name, value in settings.items():
+            monkeypatch.setattr(module.Config, name, value)
+    # The shared client was created with the previous settings
+    monkeypatch.setattr(ninox_client, "_ninox_client", None)
+    return stand_ins
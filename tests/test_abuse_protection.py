@@ -0,0 +1,175 @@
+"""Unit tests for contact form rate limiting and spam scoring"""
+
+import unittest
+from unittest.mock import Mock, patch
+from suedwestenergie.utils import throttle
+from suedwestenergie.utils.cache import SimpleCache
+from suedwestenergie.utils.spam import (
+    HONEYPOT_FIELD,
+    content_hash,
+    forget_submission,
+    score_submission,
+)
+from suedwestenergie.utils.throttle import SlidingWindowRateLimiter
+
+
+NOW = 1_700_000_000.0
+SHOWN = NOW - 30
+
+
+def make_submission(**overrides):
+    data = {
+        "name": "Max Mustermann",
+        "email": "max@example.com",
+        "company": "Muster GmbH",
+        "message": "Bitte senden Sie mir ein Angebot.",
+        HONEYPOT_FIELD: "",
+    }
+    data.update(overrides)
+    return data
+
+
+class TestSlidingWindowRateLimiter(unittest.TestCase):
+    """Test the in-memory sliding window"""
+
+    def test_limit_within_window(self):
+        """Test that hits beyond the limit are rejected"""
+        limiter = SlidingWindowRateLimiter(limit=2, window=60)
+        self.assertTrue(limiter.hit("1.2.3.4", now=NOW))
+        self.assertTrue(limiter.hit("1.2.3.4", now=NOW + 1))
+        self.assertFalse(limiter.hit("1.2.3.4", now=NOW + 2))
+        # Other keys are independent
+        self.assertTrue(limiter.hit("5.6.7.8", now=NOW + 2))
+
+    def test_window_slides(self):
+        """Test that old hits expire individually"""
+        limiter = SlidingWindowRateLimiter(limit=2, window=60)
+        limiter.hit("client", now=NOW)
+        limiter.hit("client", now=NOW + 30)
+        self.assertFalse(limiter.hit("client", now=NOW + 59))
+        self.assertTrue(limiter.hit("client", now=NOW + 61))
+        self.assertFalse(limiter.hit("client", now=NOW + 62))
+
+    def test_sweep_drops_idle_keys(self):
+        """Test that idle keys do not accumulate"""
+        limiter = SlidingWindowRateLimiter(limit=1, window=10)
+        limiter.SWEEP_INTERVAL = 3
+        limiter.hit("a", now=NOW)
+        limiter.hit("b", now=NOW)
+        limiter.hit("c", now=NOW + 20)
+        self.assertEqual(list(limiter._hits), ["c"])
+
+    def test_contact_limits(self):
+        """Test the per-session limit in front of the per-IP limit"""
+        throttle._contact_limiters.clear()
+        with patch.object(throttle.Config, "CONTACT_RATE_LIMIT_PER_SESSION", 1), \
+             patch.object(throttle.Config, "CONTACT_RATE_LIMIT_PER_IP", 2), \
+             patch.object(throttle, "get_shared_cache", return_value=SimpleCache()):
+            self.assertTrue(throttle.allow_contact_submission("1.2.3.4", "token-a"))
+            self.assertFalse(throttle.allow_contact_submission("1.2.3.4", "token-a"))
+            self.assertTrue(throttle.allow_contact_submission("1.2.3.4", "token-b"))
+            self.assertFalse(throttle.allow_contact_submission("1.2.3.4", "token-c"))
+        throttle._contact_limiters.clear()
+
+    def test_spoofed_forwarded_for(self):
+        """Test that a new address in X-Forwarded-For per request does not reset the per-IP limit"""
+        throttle._contact_limiters.clear()
+        with patch.object(throttle.Config, "CONTACT_RATE_LIMIT_PER_IP", 2), \
+             patch.object(throttle, "get_shared_cache", return_value=SimpleCache()):
+            allowed = []
+            for n in range(4):
+                # What nginx forwards: the client's header plus the address of the connection
+                headers = {"x-forwarded-for": f"203.0.113.{n}, 198.51.100.7", "x-real-ip": "198.51.100.7"}
+                without_real_ip = {"x-forwarded-for": headers["x-forwarded-for"]}
+                self.assertEqual(throttle.client_address(without_real_ip, f"203.0.113.{n}"), "198.51.100.7")
+                # Reflex's client_ip is the spoofed first entry; a new socket has a new token
+                address = throttle.client_address(headers, f"203.0.113.{n}")
+                allowed.append(throttle.allow_contact_submission(address, f"token-{n}"))
+        self.assertEqual(allowed, [True, True, False, False])
+        self.assertEqual(throttle.client_address({}, "10.0.0.1"), "10.0.0.1")
+        throttle._contact_limiters.clear()
+
+
+class TestSpamScore(unittest.TestCase):
+    """Test spam scoring signals"""
+
+    def setUp(self):
+        self.cache = SimpleCache()
+        patcher = patch("suedwestenergie.utils.spam.get_shared_cache", return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_clean_submission(self):
+        """Test that a normal submission is accepted"""
+        verdict = score_submission(make_submission(), SHOWN, now=NOW)
+        self.assertEqual(verdict.score, 0)
+        self.assertFalse(verdict.is_spam)
+
+    def test_honeypot(self):
+        """Test that a filled honeypot marks the submission as spam"""
+        verdict = score_submission(make_submission(**{HONEYPOT_FIELD: "http://spam.example"}), SHOWN, now=NOW)
+        self.assertTrue(verdict.is_spam)
+        self.assertIn("honeypot", verdict.reasons)
+
+    def test_too_fast(self):
+        """Test that submissions right after the form was shown are flagged"""
+        self.assertTrue(score_submission(make_submission(), NOW - 1, now=NOW).is_spam)
+
+    def test_client_timestamp_is_ignored(self):
+        """Test that a bot cannot claim an earlier render time in the form data"""
+        data = make_submission(form_ts=str(int((NOW - 600) * 1000)))
+        self.assertTrue(score_submission(data, NOW - 1, now=NOW).is_spam)
+
+    def test_missing_timestamp(self):
+        """Test that a form never reported as shown alone is not enough to drop"""
+        verdict = score_submission(make_submission(), None, now=NOW)
+        self.assertFalse(verdict.is_spam)
+        self.assertIn("missing timestamp", verdict.reasons)
+
+    def test_duplicate_content(self):
+        """Test that the same message (modulo case and whitespace) is flagged"""
+        self.assertFalse(score_submission(make_submission(), SHOWN, now=NOW).is_spam)
+        duplicate = make_submission(message="  bitte senden Sie mir\nein Angebot. ")
+        self.assertTrue(score_submission(duplicate, SHOWN, now=NOW).is_spam)
+
+    def test_forget_submission(self):
+        """Test that a failed submission can be retried"""
+        score_submission(make_submission(), SHOWN, now=NOW)
+        forget_submission(make_submission())
+        self.assertFalse(score_submission(make_submission(), SHOWN, now=NOW).is_spam)
+
+    def test_cache_outage(self):
+        """Test that the score is computed without the duplicate signal while the shared cache is down"""
+        unavailable = Mock(**{"add.side_effect": ConnectionError, "delete.side_effect": ConnectionError})
+        with patch("suedwestenergie.utils.spam.get_shared_cache", return_value=unavailable), \
+             patch("suedwestenergie.utils.spam.log_error") as log_error:
+            self.assertFalse(score_submission(make_submission(), SHOWN, now=NOW).is_spam)
+            forget_submission(make_submission())
+        self.assertEqual(log_error.call_count, 2)
+
+    def test_content_hash_normalization(self):
+        """Test hash normalization"""
+        self.assertEqual(content_hash("Hallo  Welt"), content_hash(" hallo welt\n"))
+        self.assertNotEqual(content_hash("Hallo Welt"), content_hash("Hallo Welt!"))
+
+
+class TestContactForm(unittest.TestCase):
+    """Test the spam signals rendered into the contact form"""
+
+    def test_shown_time_from_server(self):
+        """Test that the form reports itself as started on the first focus only, not on load"""
+        from suedwestenergie.sections.contact import FORM_START_ONCE_MS, contact_section
+
+        section = contact_section()
+        self.assertFalse(any("start_form" in hook for hook in section._get_all_hooks()))
+        rendered = str(section)
+        self.assertIn("onFocus", rendered)
+        self.assertIn(f'contact_form_state.start_form", ({{  }}), ({{ ["throttle"] : {FORM_START_ONCE_MS} }})',
+                      rendered)
+        self.assertLess(FORM_START_ONCE_MS, 2 ** 31)
+        self.assertNotIn("form_ts", rendered)
+        self.assertIn(f'name:"{HONEYPOT_FIELD}"', str(section))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Unit tests for the client-side analytics shim"""
+
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+import reflex as rx
+from suedwestenergie.components import footer
+from suedwestenergie.config import Config
+from suedwestenergie.state import ContactFormState
+from suedwestenergie.state import contact_state
+from suedwestenergie.utils.analytics import (
+    CONSENT_SETTINGS_ATTR,
+    analytics_head,
+    analytics_shim_js,
+    consent_settings_link,
+    track_event,
+    track_form_submission,
+)
+
+
+class TestTracking(unittest.TestCase):
+    """Test that tracking helpers stay in the browser"""
+
+    def test_track_event_is_client_side(self):
+        """Test that events are queued through the shim, not sent to the backend"""
+        event = track_form_submission("contact_form")
+        self.assertEqual(event.handler.fn.__qualname__, "_call_script")
+        script = str(event.args[0][1])
+        self.assertIn("window.swa.track", script)
+        self.assertIn('\\"form_name\\": \\"contact_form\\"', script)
+
+    def test_form_submission_after_success(self):
+        """Test that the contact form is tracked once the submission went through, not on the button click"""
+        from suedwestenergie.sections.contact import contact_section
+
+        self.assertNotIn("form_submit", str(contact_section()))
+
+        async def submit(form_data):
+            state = MagicMock(_form_shown_at=0.0, error_message="")
+            state.router.session.client_ip = "127.0.0.1"
+            return [event async for event in ContactFormState.submit_form.fn(state, form_data)]
+
+        lead = {"name": "Max Mustermann", "email": "max@example.com", "phone": "", "company": "Muster GmbH",
+                "message": "Bitte senden Sie mir ein Angebot."}
+        with patch.object(contact_state, "allow_contact_submission", return_value=True), \
+             patch.object(contact_state, "save_contact_to_ninox", return_value=True), \
+             patch.object(contact_state, "send_contact_form_notification", return_value=True), \
+             patch.object(contact_state, "idempotency", **{"claim.return_value": None}), \
+             patch.object(contact_state, "score_submission") as score:
+            score.return_value.is_spam = False
+            (events,) = asyncio.run(submit(lead))
+            self.assertIn("form_submit", str(events[0].args[0][1]))
+            self.assertEqual(str(events[1].args), str(rx.redirect("/danke").args))
+            # Rejected and spam submissions are not counted
+            self.assertEqual(asyncio.run(submit(dict(lead, email="max"))), [])
+            score.return_value.is_spam = True
+            self.assertNotIn("form_submit", str(asyncio.run(submit(lead))))
+
+    def test_params_are_json(self):
+        """Test that Python values are serialized as JSON"""
+        script = str(track_event("x", {"ok": True, "none": None}).args[0][1])
+        self.assertIn("true", script)
+        self.assertIn("null", script)
+
+
+class TestShim(unittest.TestCase):
+    """Test the inline shim"""
+
+    def setUp(self):
+        self.addCleanup(setattr, Config, "GOOGLE_ANALYTICS_ID", Config.GOOGLE_ANALYTICS_ID)
+
+    def test_no_head_without_id(self):
+        """Test that nothing is injected when analytics is not configured"""
+        Config.GOOGLE_ANALYTICS_ID = ""
+        self.assertEqual(analytics_head(), [])
+
+    def test_gtag_is_not_loaded_eagerly(self):
+        """Test that gtag is only requested from within the consent-gated loader"""
+        Config.GOOGLE_ANALYTICS_ID = "G-TEST"
+        head = analytics_head()
+        self.assertEqual(len(head), 1)
+        rendered = str(head[0])
+        self.assertNotIn("src:", rendered)
+        js = analytics_shim_js("G-TEST")
+        self.assertIn('var ID = "G-TEST"', js)
+        self.assertLess(js.index('localStorage.getItem(CONSENT_KEY)'), js.index("googletagmanager"))
+
+    def test_consent_can_be_withdrawn(self):
+        """Test that the footer link reopens the banner through the shim"""
+        Config.GOOGLE_ANALYTICS_ID = ""
+        self.assertEqual(str(consent_settings_link()), str(rx.fragment()))
+        self.assertNotIn(CONSENT_SETTINGS_ATTR, str(footer()))
+
+        Config.GOOGLE_ANALYTICS_ID = "G-TEST"
+        self.assertIn(f'"{CONSENT_SETTINGS_ATTR}":"true"', str(footer()))
+        self.assertIn("Cookie-Einstellungen", str(footer()))
+        js = analytics_shim_js("G-TEST")
+        self.assertIn(f'SETTINGS = "[{CONSENT_SETTINGS_ATTR}]"', js)
+        self.assertIn("window.swa.reset()", js)
+
+
+if __name__ == '__main__':
+    unittest.main()
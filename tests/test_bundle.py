@@ -0,0 +1,80 @@
+"""Unit tests for the frontend bundle size budget"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from suedwestenergie.build.bundle import analyze, budget_from, budget_warnings, check, chunk_name
+
+INDEX = ('<html><head><link rel="modulepreload" href="/assets/entry.client-C0kq-89h.js"/>'
+         '<link rel="modulepreload" href="/assets/_index-D8swdgRy.js"/>'
+         '<link href="/assets/__reflex_global_styles-Cq07OzK3.css" rel="stylesheet"/></head></html>')
+IMPRESSUM = '<html><head><link rel="modulepreload" href="/assets/entry.client-C0kq-89h.js"/></head></html>'
+
+
+MEASURED = {"commit": "abc1234", "reflex": "0.10.0"}
+
+
+class TestBundle(unittest.TestCase):
+    """Test weighing an export and checking it against a budget"""
+
+    def setUp(self):
+        self.export_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.export_dir)
+        self._write("index.html", INDEX)
+        self._write("impressum.html", IMPRESSUM)
+        self._write("impressum/index.html", IMPRESSUM)
+        self._write("assets/entry.client-C0kq-89h.js", "console.log('entry');" * 200)
+        self._write("assets/_index-D8swdgRy.js", "console.log('index');" * 100)
+        self._write("assets/__reflex_global_styles-Cq07OzK3.css", "body{margin:0}" * 100)
+
+    def _write(self, name, content):
+        path = os.path.join(self.export_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def test_chunk_name(self):
+        """Test that content hashes are stripped from chunk names"""
+        self.assertEqual(chunk_name("assets/entry.client-C0kq-89h.js"), "entry.client.js")
+        self.assertEqual(chunk_name("assets/chunk-4WY6JWTD-Bkkcp-iw.js"), "chunk-4WY6JWTD.js")
+
+    def test_routes(self):
+        """Test that each route is weighed by the assets its document loads"""
+        report = analyze(self.export_dir)
+        self.assertEqual(set(report["routes"]), {"/", "/impressum"})
+        index = report["routes"]["/"]
+        self.assertEqual(index["assets"], ["__reflex_global_styles.css", "_index.js", "entry.client.js"])
+        self.assertEqual(index["css"]["raw"], len("body{margin:0}" * 100))
+        self.assertNotIn("raw", report["routes"]["/impressum"]["css"])
+        self.assertGreater(index["total"]["gzip"], report["routes"]["/impressum"]["total"]["gzip"])
+
+    def test_budget(self):
+        """Test that growth beyond the threshold fails and growth within it passes"""
+        budget = budget_from(analyze(self.export_dir), threshold=0.05, generated_from=MEASURED)
+        self.assertEqual(check(analyze(self.export_dir), budget), [])
+
+        self._write("assets/_index-D8swdgRy.js", "".join(f"var v{i}={i * 7919};" for i in range(2000)))
+        failures = check(analyze(self.export_dir), budget)
+        self.assertTrue(any(failure.startswith("/: gzip") for failure in failures))
+        self.assertFalse(any(failure.startswith("/impressum") for failure in failures))
+
+    def test_new_route(self):
+        """Test that a route without a budget is reported"""
+        budget = budget_from(analyze(self.export_dir), generated_from=MEASURED)
+        self._write("agb.html", IMPRESSUM)
+        self.assertIn("/agb: not in the budget", check(analyze(self.export_dir), budget))
+
+    def test_provenance(self):
+        """Test that a budget of unknown origin fails and one from another Reflex version is flagged"""
+        report = analyze(self.export_dir)
+        self.assertEqual(budget_warnings(budget_from(report, generated_from=MEASURED), MEASURED), [])
+        self.assertEqual(check(report, budget_from(report)),
+                         ["the budget does not record the export it was taken from"])
+        older = budget_from(report, generated_from={"commit": "abc1234", "reflex": "0.8.0"})
+        self.assertIn("Reflex 0.8.0", budget_warnings(older, MEASURED)[0])
+        self.assertEqual(check(report, older), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Unit tests for build-time component memoization"""
+
+import unittest
+from unittest.mock import patch
+import reflex as rx
+from suedwestenergie.components import footer
+from suedwestenergie.components.memo import (
+    ALL,
+    clear_component_cache,
+    component_cache_info,
+    config_dependencies,
+    memoize_component,
+)
+from suedwestenergie.config import Config, get_settings
+from suedwestenergie.sections import services_section
+
+
+@memoize_component
+def _card(title: str) -> rx.Component:
+    return rx.box(rx.heading(Config.COMPANY_NAME), rx.text(title, color=Config.TEXT_DARK))
+
+
+@memoize_component
+def _environment_badge() -> rx.Component:
+    return rx.text("Live" if Config.is_production() else "Vorschau")
+
+
+def _by_name(name: str) -> rx.Component:
+    return rx.text(getattr(Config, name))
+
+
+def _from_settings() -> rx.Component:
+    return rx.text(get_settings().COMPANY_NAME)
+
+
+class TestComponentMemo(unittest.TestCase):
+    """Test memoized component factories"""
+
+    def setUp(self):
+        clear_component_cache()
+        self.addCleanup(clear_component_cache)
+
+    def test_dependencies_include_helpers(self):
+        """Test that direct Config reads and those of called project functions are found"""
+        self.assertEqual(config_dependencies(_card), {"COMPANY_NAME", "TEXT_DARK"})
+        # services_section reads CARD_BG only through feature_card
+        self.assertIn("CARD_BG", services_section.config_dependencies())
+
+    def test_dependencies_include_config_methods(self):
+        """Test that the values read inside Config methods are part of the key"""
+        self.assertEqual(_environment_badge.config_dependencies(), {"ENVIRONMENT"})
+        before = str(_environment_badge().render())
+        with patch.object(Config, "ENVIRONMENT", "production"):
+            self.assertNotEqual(str(_environment_badge().render()), before)
+
+    def test_unknown_reads_use_all_values(self):
+        """Test that factories whose Config reads cannot be told are keyed on every value"""
+        self.assertEqual(config_dependencies(_by_name), {ALL})
+        self.assertEqual(config_dependencies(_from_settings), {ALL})
+        cached = memoize_component(_by_name)
+        before = str(cached("PHONE").render())
+        with patch.object(Config, "PHONE", "+49 711 99999"):
+            self.assertIn("+49 711 99999", str(cached("PHONE").render()))
+        self.assertEqual(str(cached("PHONE").render()), before)
+
+    def test_reuse_returns_copies(self):
+        """Test that repeated calls reuse the tree but never share instances"""
+        first, second = _card("A"), _card("A")
+        self.assertIsNot(first, second)
+        self.assertEqual(str(first.render()), str(second.render()))
+        self.assertEqual(component_cache_info()["hits"], 1)
+        _card("B")
+        self.assertEqual(component_cache_info()["misses"], 2)
+
+    def test_config_change_rebuilds(self):
+        """Test that a changed Config input produces a new tree"""
+        before = str(footer().render())
+        with patch.object(Config, "PHONE", "+49 711 99999"):
+            changed = str(footer().render())
+        self.assertNotEqual(before, changed)
+        self.assertIn("+49 711 99999", changed)
+        self.assertEqual(str(footer().render()), before)
+
+    def test_pages_unchanged(self):
+        """Test that every page renders the same with and without the cache"""
+        from reflex.compiler import compiler
+        from suedwestenergie.suedwestenergie import app
+
+        def render_pages():
+            return {route: str(compiler.compile_unevaluated_page(route, page, app.style, app.theme).render())
+                    for route, page in app._unevaluated_pages.items()}
+
+        with patch.object(Config, "COMPONENT_MEMO", False):
+            uncached = render_pages()
+        self.assertEqual(render_pages(), uncached)
+        self.assertEqual(render_pages(), uncached)
+        self.assertGreater(component_cache_info()["hits"], 0)
+
+    def test_disabled(self):
+        """Test that COMPONENT_MEMO=False bypasses the cache"""
+        with patch.object(Config, "COMPONENT_MEMO", False):
+            _card("A")
+            _card("A")
+        self.assertEqual(component_cache_info()["size"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+"""Contact form event flow over the Reflex websocket (--backend-url or --start-backend)"""
+
+import asyncio
+import random
+
+import pytest
+from benchmarks.event_load import run
+from benchmarks.lead_corpus import ACCEPTED, generate, replay
+
+pytest.importorskip("socketio", reason="needs python-socketio and aiohttp")
+
+SESSIONS = 3
+
+
+@pytest.mark.parametrize("mode", ["uncontrolled", "debounced"])
+def test_submissions(backend_url, backend_stats, record_property, mode):
+    """Test that every visitor hydrates, gets all expected updates and is redirected after the submit"""
+    before = backend_stats() if backend_stats else None
+    report = asyncio.run(run(backend_url, SESSIONS, mode, ramp_up=0.5, cps=100.0, debounce_ms=50,
+                             field_pause=0.05, timeout=30.0))
+    submit = report["latency"].get("submit_form", {"count": 0})
+    record_property("submit_p95_ms", submit.get("p95_ms"))
+
+    assert report["connected"] == SESSIONS, report["connect_errors"]
+    assert report["timeouts"] == 0
+    assert report["unexpected_updates"] == 0
+    assert submit["count"] == SESSIONS
+    if before is not None:
+        after = backend_stats()
+        assert after["ninox_records"] - before["ninox_records"] == SESSIONS
+        assert after["emails"] - before["emails"] == SESSIONS
+
+
+def test_corpus_replay(backend_url, backend_stats, record_property):
+    """Test that every corpus record gets the answer of its label and only accepted ones reach Ninox"""
+    # A new seed per run, so that a long-running backend has not seen the addresses and messages yet
+    header, *records = generate(seed=random.randrange(2 ** 32), count=40, rate=20.0, edge_ratio=0.5)
+    before = backend_stats() if backend_stats else None
+    report = asyncio.run(replay(backend_url, header, records, timeout=30.0))
+    record_property("replay_rate", report["achieved_rate"])
+
+    assert report["connect_errors"] == {}
+    assert report["mismatches"] == []
+    if before is not None:
+        after = backend_stats()
+        # Other tests may submit at the same time
+        assert after["ninox_records"] - before["ninox_records"] >= report["expected"].get(ACCEPTED, 0)
@@ -0,0 +1,64 @@
+"""Ninox and e-mail delivery of contact requests against the local stand-ins"""
+
+import random
+import socket
+from datetime import datetime
+
+import pytest
+from benchmarks.event_load import contact_lead
+from suedwestenergie.utils import email, ninox_client, validation
+
+
+@pytest.fixture(params=range(3), ids=lambda seed: f"lead{seed}")
+def lead(request):
+    """A valid contact request with German sample data"""
+    return contact_lead(random.Random(request.param), request.param, tag="-suite")
+
+
+def test_lead_is_valid(lead):
+    """Test that the sample data passes the contact form validation"""
+    assert validation.validate_contact_form(lead) is None
+
+
+def test_save_to_ninox(service_config, lead):
+    """Test that a contact request is stored as one Ninox record"""
+    before = service_config.ninox_records
+    assert ninox_client.save_contact_to_ninox(dict(lead, submitted_at=datetime.now().isoformat()))
+    assert service_config.ninox_records == before + 1
+
+
+def test_notification_email(service_config, lead):
+    """Test that the notification e-mail is delivered"""
+    before = service_config.emails
+    assert email.send_contact_form_notification(
+        lead["name"], lead["email"], lead["phone"], lead["company"], lead["message"])
+    assert service_config.emails == before + 1
+
+
+def test_notification_message(lead):
+    """Test the addressing and the content of the notification e-mail"""
+    message = email.EmailService.build_contact_form_message(
+        lead["name"], lead["email"], lead["phone"], lead["company"], lead["message"])
+    assert message["To"] == email.Config.EMAIL
+    assert message["Subject"] == f"Neue Kontaktanfrage von {lead['name']} ({lead['company']})"
+    assert lead["message"] in message.get_payload()[0].get_payload(decode=True).decode("utf-8")
+
+
+def test_incomplete_ninox_config(service_config, monkeypatch):
+    """Test that a missing Ninox setting is reported instead of sending requests"""
+    before = service_config.ninox_records
+    monkeypatch.setattr(ninox_client.Config, "NINOX_TABLE_ID", "")
+    with pytest.raises(ValueError, match="incomplete"):
+        ninox_client.NinoxClient()
+    assert not ninox_client.save_contact_to_ninox({"name": "Max Muster"})
+    assert service_config.ninox_records == before
+
+
+def test_smtp_unreachable(service_config, monkeypatch):
+    """Test that a failed delivery is reported as False"""
+    with socket.socket() as unused:
+        # Bound but not listening: connections are refused
+        unused.bind(("127.0.0.1", 0))
+        monkeypatch.setattr(email.Config, "EMAIL_PORT", unused.getsockname()[1])
+        assert not email.send_contact_form_notification(
+            "Max Muster", "max@example.de", "", "Muster GmbH", "Bitte um Rückruf.")
@@ -0,0 +1,89 @@
+"""Unit tests for critical CSS and the per-section CSS report"""
+
+import subprocess
+import sys
+import unittest
+import reflex as rx
+from suedwestenergie.build.css_report import report
+from suedwestenergie.components import navbar
+from suedwestenergie.components.critical import _compile_styles, critical_css, critical_head, deferred
+from suedwestenergie.components.static_css import StyleSheet
+from suedwestenergie.sections import hero_section
+from suedwestenergie.state.contact_state import ContactFormState
+
+
+class TestCompileStyles(unittest.TestCase):
+    """Test moving style props into class names"""
+
+    def test_static_style_becomes_class(self):
+        """Test that a static style is replaced by a class with a matching rule"""
+        sheet = StyleSheet()
+        component = rx.box(rx.text("a", color="red"), padding="1em")
+        _compile_styles(component, sheet)
+        self.assertFalse(component.style)
+        self.assertTrue(component.class_name.startswith("s"))
+        self.assertFalse(component.children[0].style)
+        self.assertIn("color:red", sheet.stylesheet())
+
+    def test_existing_class_is_kept(self):
+        """Test that a class name set by the author is preserved"""
+        component = rx.box(class_name="brand", color="red")
+        _compile_styles(component, StyleSheet())
+        self.assertTrue(component.class_name.startswith("brand s"))
+
+    def test_state_dependent_style_stays(self):
+        """Test that styles bound to state are left to Emotion"""
+        component = rx.box(color=rx.cond(ContactFormState.form_submitted, "red", "blue"))
+        _compile_styles(component, StyleSheet())
+        self.assertTrue(component.style)
+        self.assertIsNone(component.class_name)
+
+
+class TestCriticalCss(unittest.TestCase):
+    """Test the critical CSS of the above-the-fold components"""
+
+    def test_above_the_fold_has_no_emotion_styles(self):
+        """Test that navbar and hero render without css props"""
+        for component in (navbar(), hero_section()):
+            self.assertNotIn("css:", str(component.render()))
+
+    def test_rules_cover_rendered_classes(self):
+        """Test that every class of the hero has an inlined rule"""
+        css = critical_css()
+        classes = str(hero_section().render()).count("className")
+        self.assertGreater(classes, 0)
+        self.assertIn("{", css)
+        # Selectors are repeated to outrank the theme stylesheet
+        self.assertRegex(css, r"\.(s[0-9a-f]{7})\.\1\{")
+        self.assertEqual(len(critical_head()), 1)
+
+    def test_runtime_does_not_import_build(self):
+        """Test that the app imports critical CSS without the build-only modules"""
+        code = ("import sys, suedwestenergie.suedwestenergie; "
+                "print(sorted(m for m in sys.modules if m.startswith('suedwestenergie.build')))")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=300)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "[]")
+
+    def test_deferred_section(self):
+        """Test that below-the-fold sections skip rendering until needed"""
+        component = deferred(rx.text("x"), "500px")
+        self.assertEqual(component.style["contentVisibility"]._var_value, "auto")
+        self.assertEqual(component.style["containIntrinsicSize"]._var_value, "auto 500px")
+
+
+class TestCssReport(unittest.TestCase):
+    """Test the per-section CSS weight report"""
+
+    def test_report(self):
+        """Test that all sections are weighed and critical sections carry no css props"""
+        result = report()
+        self.assertIn("contact", result["sections"])
+        self.assertEqual(result["sections"]["hero"]["emotion_bytes"], 0)
+        self.assertGreater(result["sections"]["hero"]["static_bytes"], 0)
+        self.assertGreater(result["sections"]["benefits"]["emotion_bytes"], 0)
+        self.assertGreater(result["critical_bytes"], result["sections"]["hero"]["static_bytes"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""Unit tests for the websocket load generator and its Ninox/SMTP stand-ins"""
+
+import asyncio
+import os
+import random
+import threading
+import unittest
+from unittest.mock import patch
+from benchmarks.event_load import contact_lead, expects_update, process_tree, sample_processes, typing_plan
+from suedwestenergie.utils import email, ninox_client, validation
+from benchmarks.stand_ins import StandIns
+
+
+class TestSessionScript(unittest.TestCase):
+    """Test the generated form values and event streams"""
+
+    def setUp(self):
+        self.values = contact_lead(random.Random(7), 3)
+
+    def test_lead_is_valid(self):
+        """Test that generated leads pass the contact form validation"""
+        for index in range(50):
+            self.assertIsNone(validation.validate_contact_form(contact_lead(random.Random(index), index)))
+
+    def test_modes(self):
+        """Test the number of field events per mode"""
+        typed = sum(len(text) for text in self.values.values())
+        keystroke = typing_plan(random.Random(1), self.values, "keystroke")
+        debounced = typing_plan(random.Random(1), self.values, "debounced")
+        uncontrolled = typing_plan(random.Random(1), self.values, "uncontrolled")
+
+        self.assertEqual(len(keystroke), typed + 1)
+        self.assertEqual(uncontrolled[-1][1:], ("", ""))
+        self.assertEqual(len(uncontrolled), 1)
+        # At least the final value of every field is synced
+        self.assertGreaterEqual(len(debounced), len(self.values) + 1)
+        self.assertLess(len(debounced), len(keystroke))
+        last_values = {field: value for _, field, value in debounced if field}
+        self.assertEqual(last_values, self.values)
+        self.assertTrue(all(delay >= 0 for delay, _, _ in debounced))
+
+    def test_expected_updates(self):
+        """Test the prediction of which field events are answered"""
+        errors = set()
+        self.assertTrue(expects_update("message", "Hallo", errors))
+        self.assertTrue(expects_update("message", "Hallo Welt!", errors))
+        self.assertFalse(expects_update("message", "Hallo Welt!!", errors))
+        self.assertFalse(expects_update("name", "Max", errors))
+        self.assertTrue(expects_update("email", "max@example.de", errors))
+
+
+class TestStandIns(unittest.TestCase):
+    """Test the stand-ins with the real Ninox and SMTP clients of the app"""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        self.stand_ins = StandIns(smtp_port=0, ninox_port=0)
+        asyncio.run_coroutine_threadsafe(self.stand_ins.start(), self.loop).result(5)
+        self.addCleanup(self.loop.call_soon_threadsafe, self.loop.stop)
+        self.addCleanup(lambda: asyncio.run_coroutine_threadsafe(self.stand_ins.stop(), self.loop).result(5))
+
+    def _config(self, module):
+        env = self.stand_ins.backend_env()
+        settings = {
+            "EMAIL_HOST": env["EMAIL_HOST"], "EMAIL_PORT": int(env["EMAIL_PORT"]), "EMAIL_USE_TLS": False,
+            "EMAIL_HOST_USER": env["EMAIL_HOST_USER"], "EMAIL_HOST_PASSWORD": env["EMAIL_HOST_PASSWORD"],
+            "NINOX_API_URL": env["NINOX_API_URL"], "NINOX_API_KEY": "load", "NINOX_TEAM_ID": "load",
+            "NINOX_DATABASE_ID": "load", "NINOX_TABLE_ID": "load",
+        }
+        patchers = [patch.object(module.Config, name, value) for name, value in settings.items()]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_smtp(self):
+        """Test that the contact notification is delivered to the SMTP stand-in"""
+        self._config(email)
+        self.assertTrue(email.send_contact_form_notification(
+            "Max Muster", "max@example.de", "", "Muster GmbH", "Bitte um Rückruf."))
+        self.assertEqual(self.stand_ins.emails, 1)
+
+    def test_ninox(self):
+        """Test that a contact record is created in the Ninox stand-in"""
+        self._config(ninox_client)
+        client = ninox_client.NinoxClient()
+        self.assertTrue(client.save_contact_form_data({"name": "Max Muster", "email": "max@example.de"}))
+        self.assertTrue(client.save_contact_form_data({"name": "Erika Muster"}))
+        self.assertEqual(self.stand_ins.ninox_records, 2)
+
+
+class TestProcessSampling(unittest.TestCase):
+    """Test CPU and memory sampling from /proc"""
+
+    @unittest.skipUnless(os.path.isdir("/proc/self"), "requires /proc")
+    def test_own_process(self):
+        """Test that the own process is sampled with non-zero CPU and memory"""
+        pids = process_tree(os.getpid())
+        self.assertEqual(pids[0], os.getpid())
+        cpu, rss = sample_processes(pids)
+        self.assertGreater(cpu, 0)
+        self.assertGreater(rss, 1024 * 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
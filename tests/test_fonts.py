@@ -0,0 +1,120 @@
+"""Unit tests for the self-hosted web fonts"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from suedwestenergie.build.fonts import FontBuildError, build, unicode_range
+from suedwestenergie.components.fonts import HOSTED_STYLESHEET, font_face_css, hosted_stylesheets, preload_urls
+from suedwestenergie.config import Config
+
+try:
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+    import brotli  # noqa: F401
+except ImportError:
+    FontBuilder = None
+
+
+MANIFEST = {
+    "family": "Inter",
+    "unicode_range": "U+20-7E",
+    "faces": [
+        {"weight": 400, "style": "normal", "url": "/fonts/inter-400.a.woff2", "bytes": 1},
+        {"weight": 600, "style": "normal", "url": "/fonts/inter-600.b.woff2", "bytes": 1},
+        {"weight": 700, "style": "normal", "url": "/fonts/inter-700.c.woff2", "bytes": 1},
+    ],
+}
+
+
+def make_font(path, characters):
+    """Write a minimal TrueType font with a square glyph per character"""
+    names = [".notdef"] + [f"uni{ord(c):04X}" for c in characters]
+    builder = FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(names)
+    builder.setupCharacterMap({ord(c): f"uni{ord(c):04X}" for c in characters})
+    glyphs = {}
+    for name in names:
+        pen = TTGlyphPen(None)
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 500))
+        pen.lineTo((500, 500))
+        pen.closePath()
+        glyphs[name] = pen.glyph()
+    builder.setupGlyf(glyphs)
+    builder.setupHorizontalMetrics({name: (600, 0) for name in names})
+    builder.setupHorizontalHeader(ascent=800, descent=-200)
+    builder.setupNameTable({"familyName": "Inter", "styleName": "Regular"})
+    builder.setupOS2()
+    builder.setupPost()
+    builder.save(path)
+
+
+class TestFontCss(unittest.TestCase):
+    """Test the generated head markup"""
+
+    def test_font_face(self):
+        """Test swap, unicode-range and the fallback face"""
+        css = font_face_css(MANIFEST)
+        self.assertEqual(css.count("font-display:swap"), 3)
+        self.assertIn("unicode-range:U+20-7E", css)
+        self.assertIn('"Inter Fallback"', css)
+
+    def test_preloads(self):
+        """Test that only body and heading weights are preloaded"""
+        self.assertEqual(preload_urls(MANIFEST), ["/fonts/inter-400.a.woff2", "/fonts/inter-700.c.woff2"])
+
+    def test_without_build(self):
+        """Test that a missing manifest leaves only the fallback face"""
+        self.assertEqual(preload_urls({}), [])
+        self.assertNotIn("woff2", font_face_css({}))
+
+    def test_hosted_until_built(self):
+        """Test that the Google Fonts stylesheet is used only in development while no faces are built"""
+        with patch.object(Config, "ENVIRONMENT", "development"):
+            self.assertEqual(hosted_stylesheets({}), [HOSTED_STYLESHEET])
+            self.assertEqual(hosted_stylesheets(MANIFEST), [])
+        with patch.object(Config, "ENVIRONMENT", "production"):
+            self.assertEqual(hosted_stylesheets({}), [])
+
+    def test_unicode_range(self):
+        """Test range compression"""
+        self.assertEqual(unicode_range([0x41, 0x42, 0x43, 0xE4]), "U+41-43, U+E4")
+
+
+@unittest.skipIf(FontBuilder is None, "fontTools with WOFF2 support is not installed")
+class TestFontBuild(unittest.TestCase):
+    """Test subsetting the vendored faces"""
+
+    def setUp(self):
+        self.vendor_dir = tempfile.mkdtemp()
+        self.out_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.vendor_dir)
+        self.addCleanup(shutil.rmtree, self.out_dir)
+
+    def test_build(self):
+        """Test WOFF2 output, hashed names and the covered range"""
+        make_font(os.path.join(self.vendor_dir, "Inter-Regular.ttf"), "ABCxyz")
+        manifest = build(self.vendor_dir, self.out_dir, codepoints={ord(c) for c in "ABxä"})
+        self.assertEqual(manifest["unicode_range"], "U+41-42, U+78")
+        face, = manifest["faces"]
+        self.assertRegex(face["url"], r"^/fonts/inter-400\.[0-9a-f]{10}\.woff2$")
+        with open(os.path.join(self.out_dir, os.path.basename(face["url"])), "rb") as f:
+            self.assertEqual(f.read(4), b"wOF2")
+
+    def test_missing_vendor_copy(self):
+        """Test that the step is skipped without vendored fonts"""
+        self.assertEqual(build(self.vendor_dir, self.out_dir), {})
+
+    def test_required_faces(self):
+        """Test that a production build fails unless every face is vendored"""
+        make_font(os.path.join(self.vendor_dir, "Inter-Regular.ttf"), "A")
+        with self.assertRaises(FontBuildError) as raised:
+            build(self.vendor_dir, self.out_dir, codepoints={ord("A")}, require=True)
+        self.assertIn("Inter-Bold.ttf", str(raised.exception))
+        self.assertNotIn("Inter-Regular.ttf", str(raised.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+"""Unit tests for the shared service health store"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+from suedwestenergie.utils.health import ServiceHealthStore, ServiceStatus
+
+
+class TestServiceHealthStore(unittest.TestCase):
+    """Test the process-wide health snapshot"""
+
+    def setUp(self):
+        patcher = patch("suedwestenergie.utils.health.asyncio.sleep", return_value=None)
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unknown_service_defaults(self):
+        """Test the placeholder status before the first check"""
+        self.assertEqual(ServiceHealthStore().get("db"), ServiceStatus())
+
+    def test_refresh_is_shared(self):
+        """Test that concurrent visitors trigger a single check"""
+        store = ServiceHealthStore()
+
+        async def visitors():
+            await asyncio.gather(*(store.refresh_if_stale() for _ in range(5)))
+
+        asyncio.run(visitors())
+        self.assertEqual(self.sleep.call_count, 1)
+        self.assertTrue(store.get("website").operational)
+        self.assertTrue(store.last_updated)
+        self.assertFalse(store.is_stale())
+
+
+if __name__ == '__main__':
+    unittest.main()
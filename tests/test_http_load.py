@@ -0,0 +1,71 @@
+"""Unit tests for the load test mode of the HTTP feature tester"""
+
+import http.server
+import threading
+import unittest
+from test_website_http import HTTPFeatureTester, latency_summary
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(404 if self.path == "/missing" else 200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+class TestLatencySummary(unittest.TestCase):
+    """Test the statistics of one route"""
+
+    def test_percentiles_and_histogram(self):
+        """Test nearest-rank percentiles, bucket counts and rates"""
+        summary = latency_summary([float(ms) for ms in range(1, 101)], errors=5, elapsed=2.0)
+        self.assertEqual(summary["p50_ms"], 50.0)
+        self.assertEqual(summary["p95_ms"], 95.0)
+        self.assertEqual(summary["p99_ms"], 99.0)
+        self.assertEqual(summary["max_ms"], 100.0)
+        self.assertEqual(summary["throughput_rps"], 50.0)
+        self.assertEqual(summary["error_rate"], 0.05)
+        self.assertEqual(summary["histogram"]["<=5ms"], 5)
+        self.assertEqual(summary["histogram"]["<=100ms"], 50)
+        self.assertEqual(sum(summary["histogram"].values()), 100)
+
+    def test_empty(self):
+        """Test a route that received no requests"""
+        self.assertEqual(latency_summary([], 0, 1.0)["p95_ms"], 0.0)
+
+
+class TestLoadTest(unittest.TestCase):
+    """Test both arrival models against a local server"""
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.tester = HTTPFeatureTester(f"http://127.0.0.1:{self.server.server_address[1]}")
+        self.pages = [("/", "Home"), ("/missing", "Missing")]
+
+    def test_closed_model(self):
+        """Test that all requests are made and failing routes are reported"""
+        overall = self.tester.run_load_test(self.pages, concurrency=4, total_requests=40)
+        self.assertEqual(overall["requests"], 40)
+        self.assertEqual(overall["error_kinds"], {"HTTP 404": 20})
+        results = {test["name"]: test for test in self.tester.test_results["tests"]}
+        self.assertTrue(results["Home load"]["passed"])
+        self.assertFalse(results["Missing load"]["passed"])
+        self.assertEqual(results["Home load"]["metrics"]["requests"], 20)
+
+    def test_open_model(self):
+        """Test that the open model sends the requested number of arrivals"""
+        overall = self.tester.run_load_test(self.pages[:1], concurrency=2, total_requests=20,
+                                            arrival="open", rate=200)
+        self.assertEqual(overall["requests"], 20)
+        self.assertEqual(self.tester.test_results["load"]["arrival"], "open")
+
+
+if __name__ == '__main__':
+    unittest.main()
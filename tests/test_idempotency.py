@@ -0,0 +1,88 @@
+"""Unit tests for idempotent contact form submissions"""
+
+import unittest
+from unittest.mock import Mock, patch
+from suedwestenergie.utils import idempotency
+from suedwestenergie.utils.cache import SimpleCache
+
+
+SUBMISSION = {
+    "name": "Max Mustermann",
+    "email": "Max@Example.com",
+    "phone": "",
+    "company": "Muster GmbH",
+    "message": "Bitte senden Sie mir ein Angebot.",
+    "form_ts": "1700000000000",
+}
+
+
+class TestSubmissionKey(unittest.TestCase):
+    """Test key derivation"""
+
+    def test_normalization(self):
+        """Test that whitespace and e-mail case do not change the key"""
+        variant = dict(SUBMISSION, email="max@example.com", message=" Bitte senden Sie  mir ein Angebot.\n")
+        self.assertEqual(
+            idempotency.submission_key(SUBMISSION, "token"),
+            idempotency.submission_key(variant, "token"),
+        )
+
+    def test_ignores_non_form_fields(self):
+        """Test that hidden helper fields such as the render timestamp are ignored"""
+        variant = dict(SUBMISSION, form_ts="1700000009999")
+        self.assertEqual(
+            idempotency.submission_key(SUBMISSION, "token"),
+            idempotency.submission_key(variant, "token"),
+        )
+
+    def test_distinguishes_clients_and_content(self):
+        """Test that other clients and other content get other keys"""
+        key = idempotency.submission_key(SUBMISSION, "token")
+        self.assertNotEqual(key, idempotency.submission_key(SUBMISSION, "other-token"))
+        self.assertNotEqual(key, idempotency.submission_key(dict(SUBMISSION, company="Andere GmbH"), "token"))
+
+
+class TestClaim(unittest.TestCase):
+    """Test the claim/complete/release cycle"""
+
+    def setUp(self):
+        patcher = patch("suedwestenergie.utils.idempotency.get_shared_cache", return_value=SimpleCache())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.key = idempotency.submission_key(SUBMISSION, "token")
+
+    def test_first_claim_wins(self):
+        """Test that only the first event processes the submission"""
+        self.assertIsNone(idempotency.claim(self.key))
+        self.assertEqual(idempotency.claim(self.key), idempotency.PENDING)
+
+    def test_repeat_gets_original_outcome(self):
+        """Test that repeats see the recorded outcome"""
+        idempotency.claim(self.key)
+        idempotency.complete(self.key)
+        self.assertEqual(idempotency.claim(self.key), idempotency.ACCEPTED)
+
+    def test_release_allows_retry(self):
+        """Test that a released key can be claimed again"""
+        idempotency.claim(self.key)
+        idempotency.release(self.key)
+        self.assertIsNone(idempotency.claim(self.key))
+
+
+class TestCacheOutage(unittest.TestCase):
+    """Test that submissions are still processed while the shared cache is down"""
+
+    def test_fail_open(self):
+        """Test that the claim is granted and recording the outcome does not raise"""
+        key = idempotency.submission_key(SUBMISSION, "token")
+        unavailable = Mock(**{f"{method}.side_effect": ConnectionError for method in ("add", "get", "set", "delete")})
+        with patch("suedwestenergie.utils.idempotency.get_shared_cache", return_value=unavailable), \
+             patch("suedwestenergie.utils.idempotency.log_error") as log_error:
+            self.assertIsNone(idempotency.claim(key))
+            idempotency.complete(key)
+            idempotency.release(key)
+        self.assertEqual(log_error.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
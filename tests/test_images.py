@@ -0,0 +1,80 @@
+"""Unit tests for the responsive image pipeline"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from suedwestenergie.components import picture
+from suedwestenergie.components.picture import image
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+class TestImageComponent(unittest.TestCase):
+    """Test the rx.image replacement"""
+
+    MANIFEST = {
+        "/logo.jpg": {
+            "width": 1280,
+            "height": 590,
+            "fallback": "jpeg",
+            "variants": {
+                "avif": [[96, "/img/logo.96.a.avif", 1], [1280, "/img/logo.1280.b.avif", 1]],
+                "jpeg": [[96, "/img/logo.96.c.jpg", 1], [192, "/img/logo.192.d.jpg", 1], [1280, "/img/logo.1280.e.jpg", 1]],
+            },
+        }
+    }
+
+    def setUp(self):
+        patcher = patch.object(picture, "_manifest", self.MANIFEST)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_picture(self):
+        """Test sources, srcset, sizes and intrinsic dimensions"""
+        rendered = str(image(src="/logo.jpg", alt="Logo", height="40px", width="auto").render())
+        self.assertIn('"image/avif"', rendered)
+        self.assertIn("/img/logo.96.a.avif 96w", rendered)
+        self.assertIn('sizes:"87px"', rendered)
+        self.assertIn("width:1280", rendered)
+        self.assertIn("height:590", rendered)
+        # 2x of 87px is covered by the 192w fallback
+        self.assertIn('src:"/img/logo.192.d.jpg"', rendered)
+
+    def test_unknown_image_falls_back(self):
+        """Test that images without variants render as plain rx.image"""
+        component = image(src="/other.png", alt="")
+        self.assertEqual(type(component).__name__, "Img")
+
+
+@unittest.skipIf(Image is None, "Pillow is not installed")
+class TestImageBuild(unittest.TestCase):
+    """Test building the variants"""
+
+    def setUp(self):
+        self.source_dir = tempfile.mkdtemp()
+        self.out_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.source_dir)
+        self.addCleanup(shutil.rmtree, self.out_dir)
+        Image.new("RGB", (400, 200), (0, 120, 60)).save(os.path.join(self.source_dir, "logo.jpg"))
+
+    def test_build(self):
+        """Test widths, formats and content-hashed names"""
+        from suedwestenergie.build.images import build
+
+        manifest = build(self.source_dir, self.out_dir)
+        entry = manifest["/logo.jpg"]
+        self.assertEqual((entry["width"], entry["height"]), (400, 200))
+        self.assertEqual([width for width, _, _ in entry["variants"]["jpeg"]], [96, 192, 320, 400])
+        self.assertIn("webp", entry["variants"])
+        for width, url, _ in entry["variants"]["jpeg"]:
+            self.assertRegex(url, rf"^/img/logo\.{width}\.[0-9a-f]{{10}}\.jpg$")
+            self.assertTrue(os.path.exists(os.path.join(self.out_dir, os.path.basename(url))))
+
+
+if __name__ == '__main__':
+    unittest.main()
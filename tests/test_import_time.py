@@ -0,0 +1,100 @@
+"""Unit tests for lazy imports and the import-time benchmark"""
+
+import logging
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from benchmarks.import_time import compare, measure, module_time, parse_importtime, violations
+from suedwestenergie.config import Settings
+from suedwestenergie.utils import logger, sms_notification
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   _io
+import time:       300 |        400 | site
+import time:        50 |         50 |     email.charset
+import time:       200 |        250 |   email.mime.text
+import time:        20 |         20 |   suedwestenergie.config
+import time:       500 |        770 | suedwestenergie.utils.email
+"""
+
+
+class TestImportTime(unittest.TestCase):
+    """Test parsing and checking of -X importtime output"""
+
+    def test_parse(self):
+        """Test depth, self and cumulative time of each entry"""
+        entries = parse_importtime(IMPORTTIME)
+        self.assertEqual(entries[0], (1, "_io", 100, 100))
+        self.assertEqual(entries[2], (2, "email.charset", 50, 50))
+        self.assertEqual(entries[-1], (0, "suedwestenergie.utils.email", 500, 770))
+
+    def test_module_time(self):
+        """Test that only direct imports are listed, slowest first"""
+        cumulative, children = module_time(parse_importtime(IMPORTTIME), "suedwestenergie.utils.email")
+        self.assertEqual(cumulative, 770)
+        self.assertEqual(children, [("email.mime.text", 250), ("suedwestenergie.config", 20)])
+        self.assertEqual(module_time(parse_importtime(IMPORTTIME), "missing"), (0, []))
+
+    def test_lazy_imports(self):
+        """Test that the utilities load no integration and create no log directory when imported"""
+        modules = ("suedwestenergie.utils", "suedwestenergie.utils.ninox_client",
+                   "suedwestenergie.utils.sms_notification")
+        results = measure(modules, runs=1)
+        self.assertEqual(violations(results), [])
+        self.assertNotIn("suedwestenergie.utils.analytics",
+                         [name for name, _ in results["modules"]["suedwestenergie.utils"]["largest_imports"]])
+
+    def test_compare(self):
+        """Test that slowdowns must exceed the threshold and the noise floor"""
+        previous = {"modules": {"a": {"median_ms": 10.0}, "b": {"median_ms": 100.0}}}
+        current = {"modules": {"a": {"median_ms": 11.9}, "b": {"median_ms": 130.0}, "c": {"median_ms": 5.0}}}
+        self.assertEqual(compare(current, previous, 0.25),
+                         ["b: 100.0 ms -> 130.0 ms (+30.0%, allowed 25%)"])
+
+
+class TestLazyIntegrations(unittest.TestCase):
+    """Test that clients and files are only created on first use"""
+
+    def test_log_file_opened_with_first_record(self):
+        """Test that the log directory is created by the first record, not by the handler"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "logs", "app.log")
+            handler = logger.LazyFileHandler(path)
+            self.assertFalse(os.path.exists(os.path.dirname(path)))
+            handler.emit(logging.makeLogRecord({"msg": "Kontaktanfrage gespeichert"}))
+            handler.close()
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "Kontaktanfrage gespeichert\n")
+
+    def test_sms_client_created_once(self):
+        """Test that the Twilio client is created with the first SMS and then reused"""
+        created = []
+
+        class Client:
+            def __init__(self, sid, token):
+                created.append((sid, token))
+                self.messages = self
+
+            def create(self, body, from_, to):
+                return type("Message", (), {"sid": "SM1"})()
+
+        settings = Settings(TWILIO_SID="sid", TWILIO_TOKEN="token", TWILIO_FROM_PHONE="+49711000",
+                            NOTIFICATION_PHONES=("+49711", "+49712"))
+        with patch.object(sms_notification, "twilio_client_class", return_value=Client):
+            service = sms_notification.SMSNotificationService(settings)
+            self.assertEqual(created, [])
+            self.assertTrue(service.send_critical_error_notification("Ninox down", "503", "DB_ERROR"))
+            self.assertTrue(service.send_critical_error_notification("Ninox down", "503", "DB_ERROR"))
+        self.assertEqual(created, [("sid", "token")])
+
+    def test_sms_without_configuration(self):
+        """Test that twilio is not even looked for while SMS are not configured"""
+        with patch.object(sms_notification, "twilio_client_class") as client_class:
+            self.assertFalse(sms_notification.SMSNotificationService(Settings()).is_configured())
+        client_class.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
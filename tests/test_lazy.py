@@ -0,0 +1,80 @@
+"""Unit tests for lazy mounting and the Tarifrechner facade"""
+
+import json
+import unittest
+import reflex as rx
+from suedwestenergie.components.lazy import ClickToLoad, LazyMount, lazy_mount
+from suedwestenergie.components.memo import clear_component_cache
+from suedwestenergie.config import Config
+from suedwestenergie.sections.tarifrechner import tarifrechner_section
+
+
+class TestLazyMount(unittest.TestCase):
+    """Test the lazy mount wrapper"""
+
+    def setUp(self):
+        self.enabled = Config.LAZY_SECTIONS
+        self.addCleanup(setattr, Config, "LAZY_SECTIONS", self.enabled)
+
+    def test_anchor_moves_to_placeholder(self):
+        """Test that the section id is kept on the placeholder only"""
+        Config.LAZY_SECTIONS = True
+        component = lazy_mount(rx.box(rx.text("x"), id="ueber-uns"), "600px")
+        self.assertIsInstance(component, LazyMount)
+        rendered = str(component)
+        self.assertEqual(rendered.count('"ueber-uns"'), 1)
+        self.assertIn('minHeight:"600px"', rendered)
+
+    def test_disabled(self):
+        """Test that the section is returned unchanged when lazy mounting is off"""
+        Config.LAZY_SECTIONS = False
+        section = rx.box(id="ueber-uns")
+        self.assertIs(lazy_mount(section, "600px"), section)
+
+    def test_home_page_text_is_prerendered(self):
+        """Test that the home page sections are deferred, not left out of the page"""
+        from suedwestenergie.pages.index import index
+
+        Config.LAZY_SECTIONS = True
+        rendered = str(index())
+        self.assertNotIn("jsx(LazyMount", rendered)
+        for heading in ("Warum Südwest-Energie?", "Über Südwest-Energie"):
+            self.assertIn(json.dumps(heading)[1:-1], rendered)
+        self.assertGreaterEqual(rendered.count("contentVisibility"), 5)
+
+
+class TestTarifrechner(unittest.TestCase):
+    """Test that the calculator embed is loaded on demand"""
+
+    def setUp(self):
+        saved = {name: getattr(Config, name) for name in
+                 ("TARIFRECHNER_ENABLED", "TARIFRECHNER_TYPE", "TARIFRECHNER_URL", "TARIFRECHNER_SCRIPT",
+                  "LAZY_SECTIONS")}
+        for name, value in saved.items():
+            self.addCleanup(setattr, Config, name, value)
+        self.addCleanup(clear_component_cache)
+        Config.TARIFRECHNER_ENABLED = True
+        Config.LAZY_SECTIONS = True
+
+    def test_iframe_is_lazy(self):
+        """Test that the iframe is mounted lazily and loads lazily"""
+        Config.TARIFRECHNER_TYPE = "iframe"
+        Config.TARIFRECHNER_URL = "https://rechner.example.com"
+        rendered = str(tarifrechner_section())
+        self.assertIn("jsx(LazyMount", rendered)
+        self.assertIn('loading:"lazy"', rendered)
+
+    def test_script_uses_facade(self):
+        """Test that the script embed is only injected after a click"""
+        Config.TARIFRECHNER_TYPE = "script"
+        Config.TARIFRECHNER_SCRIPT = '<script src="https://rechner.example.com/embed.js"></script>'
+        section = tarifrechner_section()
+        rendered = str(section)
+        self.assertIn("jsx(ClickToLoad", rendered)
+        self.assertIn("Tarifrechner laden", rendered)
+        self.assertNotIn("dangerouslySetInnerHTML", rendered)
+        self.assertIn(ClickToLoad.tag, "".join(section._get_all_custom_code()))
+
+
+if __name__ == '__main__':
+    unittest.main()
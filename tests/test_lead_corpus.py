@@ -0,0 +1,143 @@
+"""Unit tests for the synthetic lead corpus"""
+
+import os
+import tempfile
+import unittest
+from collections import Counter
+from random import Random
+from benchmarks.lead_corpus import (
+    ACCEPTED, EDGE_CASES, INVALID, PROFILES, SPAM, THROTTLED, arrival_times, generate, observed_outcome,
+    phone_number, read_corpus, write_corpus,
+)
+from suedwestenergie.config import Config
+from suedwestenergie.utils import validation
+
+
+def _records(**kwargs):
+    return list(generate(**kwargs))[1:]
+
+
+class TestGenerate(unittest.TestCase):
+    """Test the generated records and their labels"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.records = _records(seed=3, count=1500, edge_ratio=0.3)
+
+    def test_reproducible(self):
+        """Test that the same seed gives the same corpus and another seed a different one"""
+        self.assertEqual(_records(seed=3, count=200, profile="burst"), _records(seed=3, count=200, profile="burst"))
+        self.assertNotEqual(_records(seed=3, count=200), _records(seed=4, count=200))
+
+    def test_labels_follow_validation(self):
+        """Test that exactly the records rejected by the form validation are labelled invalid"""
+        for record in self.records:
+            data = {field: record["form"][field] for field in validation.FIELD_ORDER}
+            self.assertEqual(record["expect"] == INVALID, validation.validate_contact_form(data) is not None,
+                             record)
+
+    def test_edge_cases(self):
+        """Test that every edge case occurs and gets the outcome it is meant to provoke"""
+        outcomes = {kind: Counter() for kind in EDGE_CASES}
+        for record in self.records:
+            if record["kind"] in outcomes:
+                outcomes[record["kind"]][record["expect"]] += 1
+        for kind, counts in outcomes.items():
+            self.assertTrue(counts, f"no {kind} record")
+        for kind in ("unicode", "markup", "whitespace", "max_lengths", "no_timestamp"):
+            self.assertEqual(set(outcomes[kind]), {ACCEPTED}, kind)
+        for kind in ("invalid_email", "invalid_phone", "missing_company", "short_message", "too_long", "empty"):
+            self.assertEqual(set(outcomes[kind]), {INVALID}, kind)
+        for kind in ("honeypot", "too_fast", "duplicate"):
+            self.assertEqual(set(outcomes[kind]), {SPAM}, kind)
+
+    def test_regular_leads(self):
+        """Test that regular requests are valid, unique and mostly German"""
+        leads = [record for record in self.records if record["kind"] == "lead"]
+        self.assertTrue(all(record["expect"] == ACCEPTED for record in leads))
+        languages = Counter(record["lang"] for record in leads)
+        self.assertEqual(set(languages), {"de", "en", "fr", "tr"})
+        self.assertGreater(languages["de"], len(leads) / 2)
+        self.assertTrue(all(record["fill"] >= Config.SPAM_MIN_SUBMIT_SECONDS for record in leads))
+
+    def test_phone_numbers(self):
+        """Test that all phone notations pass the validation, some visitors leave it empty"""
+        rng = Random(5)
+        numbers = [phone_number(rng) for _ in range(500)]
+        self.assertIn("", numbers)
+        self.assertTrue(all(validation.validate_phone(number) is None for number in numbers))
+
+
+class TestProfiles(unittest.TestCase):
+    """Test the arrival patterns"""
+
+    def test_mean_rate(self):
+        """Test that every profile keeps the requested mean rate"""
+        for profile in PROFILES:
+            times = arrival_times(Random(1), profile, 4000, rate=5.0)
+            self.assertEqual(len(times), 4000)
+            self.assertEqual([at for at, _ in times], sorted(at for at, _ in times))
+            self.assertAlmostEqual(4000 / times[-1][0], 5.0, delta=1.0, msg=profile)
+
+    def test_bursts(self):
+        """Test that bursts put many more submissions into a short window than steady traffic"""
+        def busiest(profile):
+            times = [at for at, _ in arrival_times(Random(1), profile, 2000, rate=1.0)]
+            return max(sum(1 for other in times[i:i + 100] if other - at < 2.0) for i, at in enumerate(times))
+
+        self.assertGreater(busiest("burst"), 2 * busiest("steady"))
+
+    def test_flood(self):
+        """Test that the flood comes from one address and runs into the rate limit"""
+        records = _records(seed=1, count=500, profile="flood")
+        flood = [record for record in records if record["kind"] == "flood"]
+        self.assertEqual(len(flood), 100)
+        self.assertEqual(len({record["ip"] for record in flood}), 1)
+        passed = [record for record in flood if record["expect"] in (ACCEPTED, SPAM)]
+        self.assertEqual(len(passed), Config.CONTACT_RATE_LIMIT_PER_IP)
+        self.assertEqual(sum(record["expect"] == THROTTLED for record in flood), 100 - len(passed))
+
+    def test_unknown_profile(self):
+        """Test that a typo in the profile name is an error"""
+        with self.assertRaises(ValueError):
+            arrival_times(Random(1), "bursty", 10, 1.0)
+
+
+class TestCorpusFile(unittest.TestCase):
+    """Test writing, reading and classifying replies"""
+
+    def test_round_trip(self):
+        """Test that the file holds the header and all records unchanged"""
+        records = list(generate(seed=2, count=50, profile="wave"))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "corpus.jsonl")
+            self.assertEqual(write_corpus(path, iter(records)), 50)
+            header, read = read_corpus(path)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(len(f.readlines()), 51)
+        self.assertEqual(header, records[0])
+        self.assertEqual(read, records[1:])
+        self.assertEqual(header["limits"]["rate_limit_per_ip"], Config.CONTACT_RATE_LIMIT_PER_IP)
+
+    def test_not_a_corpus(self):
+        """Test that other JSON lines files are rejected"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "requests.jsonl")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write('{"request_id": "1"}\n')
+            with self.assertRaises(ValueError):
+                read_corpus(path)
+
+    def test_observed_outcome(self):
+        """Test how the answer to the submit is classified"""
+        redirect = {"delta": {"form": {"form_submitted_rx_state_": True}}}
+        error = {"delta": {"form": {"error_message_rx_state_": "Zu viele Anfragen."}}, "events": []}
+        self.assertEqual(observed_outcome(redirect, "form"), "redirect")
+        self.assertEqual(observed_outcome({"delta": {}, "events": [{"name": "_redirect"}]}, "form"), "redirect")
+        self.assertEqual(observed_outcome(error, "form"), "error")
+        self.assertEqual(observed_outcome({"delta": {}}, "form"), "other")
+        self.assertEqual(observed_outcome(None, "form"), "timeout")
+
+
+if __name__ == '__main__':
+    unittest.main()
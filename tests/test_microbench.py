@@ -0,0 +1,40 @@
+"""Unit tests for the micro-benchmark runner"""
+
+import unittest
+from benchmarks.microbench import benchmarks, compare, measure, time_per_call
+
+
+class TestMicrobench(unittest.TestCase):
+    """Test timing and the regression check"""
+
+    def test_time_per_call(self):
+        """Test that the loop count is calibrated and the statistics are reported"""
+        result = time_per_call(lambda: None, repeat=3)
+        self.assertGreaterEqual(result["loops"], 10)
+        self.assertGreater(result["median_ns"], 0)
+        self.assertLessEqual(result["min_ns"], result["median_ns"])
+        self.assertEqual(result["repeat"], 3)
+
+    def test_measure_filter(self):
+        """Test that only matching benchmarks run and the commit is recorded"""
+        results = measure(repeat=2, name_filter="_format_error_sms")
+        self.assertEqual(list(results["benchmarks"]), ["_format_error_sms"])
+        self.assertIn("commit", results)
+
+    def test_names_are_unique(self):
+        """Test that results of different benchmarks cannot overwrite each other"""
+        names = [name for name, _ in benchmarks()]
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_compare(self):
+        """Test that only slowdowns beyond the threshold fail"""
+        previous = {"benchmarks": {"a": {"median_ns": 100.0}, "b": {"median_ns": 100.0}, "gone": {"median_ns": 1.0}}}
+        current = {"benchmarks": {"a": {"median_ns": 124.0}, "b": {"median_ns": 130.0}, "new": {"median_ns": 5.0}}}
+        failures = compare(current, previous, threshold=0.25)
+        self.assertEqual(len(failures), 1)
+        self.assertTrue(failures[0].startswith("b: 100 ns -> 130 ns (+30.0%"))
+        self.assertEqual(compare(current, previous, threshold=0.5), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+"""Unit tests for the cached, resumable pentest runs"""
+
+import contextlib
+import http.server
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from pentest_suedwestenergie import SudwestEnergiePentester, diff_results
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Target whose start page and exposed paths can be changed between runs"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _respond(self, status, body):
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.paths.append((self.command, self.path))
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/":
+            self._respond(200, self.server.page)
+        else:
+            self._respond(200 if self.path in self.server.exposed else 404, b"")
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._respond(200, self.server.page)
+
+    def log_message(self, *args):
+        pass
+
+
+def _result(name, passed, details=""):
+    return {"name": name, "passed": passed, "severity": "medium", "details": details}
+
+
+class TestDiff(unittest.TestCase):
+    """Test the comparison of two runs"""
+
+    def test_diff(self):
+        """Test new, resolved and changed findings"""
+        previous = [_result("A", True), _result("B", False, "x"), _result("C", False, "x"), _result("D", False)]
+        current = [_result("A", False), _result("B", True), _result("C", False, "y"), _result("E", True)]
+        diff = diff_results(previous, current)
+        self.assertEqual([r["name"] for r in diff["new_findings"]], ["A"])
+        self.assertEqual([r["name"] for r in diff["resolved_findings"]], ["B", "D"])
+        self.assertEqual([c["name"] for c in diff["changed"]], ["C"])
+        self.assertEqual(diff["added_tests"], ["E"])
+        self.assertEqual(diff["removed_tests"], ["D"])
+
+
+class TestCachedRuns(unittest.TestCase):
+    """Test re-runs against a local server"""
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.lock = threading.Lock()
+        self.server.requests = 0
+        self.server.paths = []
+        self.server.page = b"<html>contact build-1</html>"
+        self.server.exposed = set()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.work_dir)
+        self.cache_file = os.path.join(self.work_dir, "pentest_cache.json")
+
+    def _run(self, **kwargs):
+        self.server.requests = 0
+        self.server.paths = []
+        pentester = SudwestEnergiePentester(f"http://127.0.0.1:{self.server.server_address[1]}/", timeout=5,
+                                            rate_limit=0, cache_file=self.cache_file, **kwargs)
+        pentester.load_cache()
+        with contextlib.redirect_stdout(io.StringIO()):
+            pentester.run_all_tests()
+        return pentester
+
+    def _posts(self):
+        return sum(1 for method, _ in self.server.paths if method == "POST")
+
+    def test_unchanged_target_is_replayed(self):
+        """Test that a re-run of an unchanged deployment only fetches the start page and the probed paths"""
+        first = self._run()
+        self.assertGreater(self._posts(), 20)
+        second = self._run()
+        self.assertEqual(self._posts(), 0)
+        self.assertEqual(self.server.paths.count(("GET", "/")), 1)
+        names = [[r["name"] for r in run.test_results["test_results"]] for run in (first, second)]
+        self.assertEqual(names[0], names[1])
+        self.assertEqual(first.test_results["summary"], second.test_results["summary"])
+        self.assertEqual(second.diff["new_findings"], [])
+
+    def test_changed_target_is_rescanned(self):
+        """Test that a new deployment runs the checks again and the diff reports it"""
+        self._run()
+        self.server.page = b"<html>contact build-2</html>"
+        self.server.exposed = {"/.env"}
+        pentester = self._run()
+        self.assertGreater(self._posts(), 20)
+        self.assertEqual([r["name"] for r in pentester.diff["new_findings"]], ["Directory Enumeration"])
+
+        diff_file = os.path.join(self.work_dir, "diff.json")
+        with contextlib.redirect_stdout(io.StringIO()):
+            pentester.save_diff(diff_file)
+        with open(diff_file, encoding="utf-8") as f:
+            self.assertEqual(len(json.load(f)["new_findings"]), 1)
+
+    def test_probed_path_changed(self):
+        """Test that a newly exposed path is found although the start page is unchanged"""
+        self._run()
+        self.server.exposed = {"/.env"}
+        pentester = self._run()
+        self.assertEqual(self._posts(), 0)
+        self.assertEqual([r["name"] for r in pentester.diff["new_findings"]], ["Directory Enumeration"])
+
+    def test_resume(self):
+        """Test that checks finished before an interruption are not run again"""
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            f.write("not json")
+        self._run()
+        with open(self.cache_file, encoding="utf-8") as f:
+            cache = json.load(f)
+        # Simulate an interruption after all but one check had finished
+        target = next(iter(cache["targets"].values()))
+        self.assertNotIn("test_directory_enumeration", target["checks"])
+        full = self._posts()
+        del target["checks"]["test_sql_injection"]
+        target["last_results"] = None
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+
+        pentester = self._run()
+        # Only the SQL injection payloads are sent again
+        self.assertGreater(self._posts(), 0)
+        self.assertLess(self._posts(), full)
+        self.assertIsNone(pentester.diff)
+
+    def test_expired_results(self):
+        """Test that cached results older than max_age_hours are not used"""
+        self._run()
+        full = self._posts()
+        self._run(max_age_hours=0)
+        self.assertEqual(self._posts(), full)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Unit tests for the concurrent scheduler of the pentest script"""
+
+import contextlib
+import http.server
+import io
+import threading
+import time
+import unittest
+from urllib.parse import parse_qs
+from pentest_suedwestenergie import RateLimiter, SudwestEnergiePentester
+
+DELAY = 0.02
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Slow target that exposes /.env and echoes XSS payloads in the message field"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _respond(self, status, body=b"<html>contact</html>"):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(DELAY)
+        with server.lock:
+            server.in_flight -= 1
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond(200 if self.path in ("/", "/.env") else 404)
+
+    def do_POST(self):
+        form = parse_qs(self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8"))
+        self._respond(200, f"<html>contact {form.get('message', [''])[0]}</html>".encode("utf-8"))
+
+    def log_message(self, *args):
+        pass
+
+
+class TestPentestScheduler(unittest.TestCase):
+    """Test the pentest checks against a local server"""
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.lock = threading.Lock()
+        self.server.requests = self.server.in_flight = self.server.max_in_flight = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+
+    def _run(self, **kwargs):
+        pentester = SudwestEnergiePentester(self.url, timeout=5, **kwargs)
+        with contextlib.redirect_stdout(io.StringIO()):
+            pentester.run_all_tests()
+        return pentester.test_results
+
+    def test_same_results_as_serial(self):
+        """Test that results and their order match a one-at-a-time run"""
+        serial = self._run(max_per_host=1, rate_limit=0)
+        parallel = self._run(max_per_host=8, rate_limit=0)
+        strip = [[(r["name"], r["passed"], r["details"]) for r in results["test_results"]]
+                 for results in (serial, parallel)]
+        self.assertEqual(strip[0], strip[1])
+        self.assertEqual(serial["summary"], parallel["summary"])
+        self.assertIn("Directory Enumeration", [r["name"] for r in parallel["test_results"]])
+        self.assertTrue(any(".env(200)" in v["details"] for v in parallel["summary"]["vulnerabilities_found"]))
+
+    def test_per_host_limit(self):
+        """Test that no more than max_per_host requests are in flight"""
+        started = time.perf_counter()
+        self._run(max_per_host=4, rate_limit=0)
+        elapsed = time.perf_counter() - started
+        self.assertLessEqual(self.server.max_in_flight, 4)
+        self.assertGreater(self.server.max_in_flight, 1)
+        # Serially these requests would take requests * DELAY
+        self.assertLess(elapsed, self.server.requests * DELAY / 2)
+
+    def test_early_exit(self):
+        """Test that a finding stops the remaining payloads of that field"""
+        results = self._run(rate_limit=0)
+        message_tests = [r for r in results["test_results"] if r["name"].startswith("XSS Test - message")]
+        self.assertEqual(len(message_tests), 1)
+        self.assertFalse(message_tests[0]["passed"])
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test the global request rate cap"""
+
+    def test_rate(self):
+        """Test that acquisitions beyond the burst are spaced by the rate"""
+        limiter = RateLimiter(rate=200, burst=2)
+        started = time.perf_counter()
+        for _ in range(12):
+            limiter.acquire()
+        self.assertGreaterEqual(time.perf_counter() - started, 10 / 200 * 0.9)
+
+    def test_unlimited(self):
+        """Test that a rate of 0 never blocks"""
+        limiter = RateLimiter(rate=0)
+        started = time.perf_counter()
+        for _ in range(1000):
+            limiter.acquire()
+        self.assertLess(time.perf_counter() - started, 0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""Unit tests for the statistics of the browser performance audit"""
+
+import os
+import tempfile
+import unittest
+from test_website_features import (
+    compare_to_baseline, cumulative_layout_shift, load_baseline, median_metrics, page_metrics,
+    total_blocking_time,
+)
+
+
+def _raw(load_ms, lcp=800.0, shifts=(), long_tasks=()):
+    """Data as returned by PERF_COLLECT_SCRIPT"""
+    return {
+        "navigation": {"responseStart": 40.0, "domContentLoadedEventEnd": 300.0, "loadEventEnd": load_ms,
+                       "transferSize": 5000},
+        "paint": {"first-paint": 190.0, "first-contentful-paint": 200.0},
+        "observed": {"lcp": lcp, "shifts": [list(shift) for shift in shifts],
+                     "longTasks": [list(task) for task in long_tasks]},
+        "heap": 4_000_000,
+        "resources": [
+            {"name": "/app.js", "type": "script", "start": 50.0, "duration": 120.0, "transfer": 30000, "size": 29000},
+            {"name": "/logo.jpg", "type": "img", "start": 20.0, "duration": 30.0, "transfer": 0, "size": 8000},
+        ],
+    }
+
+
+class TestWebVitals(unittest.TestCase):
+    """Test the metrics derived from the raw browser entries"""
+
+    def test_cls_session_windows(self):
+        """Test that CLS is the largest window, not the sum of all shifts"""
+        shifts = [(100, 0.05), (600, 0.05), (3000, 0.02), (3500, 0.02), (3900, 0.02)]
+        self.assertEqual(cumulative_layout_shift(shifts), 0.1)
+        self.assertEqual(cumulative_layout_shift([]), 0.0)
+        # A window ends after 5 seconds even without a gap
+        steady = [(ms, 0.01) for ms in range(0, 8000, 500)]
+        self.assertEqual(cumulative_layout_shift(steady), 0.11)
+
+    def test_tbt(self):
+        """Test that only the time beyond 50ms after the first contentful paint is blocking"""
+        tasks = [(0, 120), (150, 200), (500, 40), (900, 80)]
+        # (0, 120) is before FCP at 200, (150, 200) counts from 200 to 350
+        self.assertEqual(total_blocking_time(tasks, 200.0), 100.0 + 30.0)
+
+    def test_page_metrics(self):
+        """Test the metrics and the waterfall of one load"""
+        sample = page_metrics(_raw(900.0, shifts=[(100, 0.03)], long_tasks=[(250, 90)]))
+        metrics = sample["metrics"]
+        self.assertEqual(metrics["ttfb_ms"], 40.0)
+        self.assertEqual(metrics["fcp_ms"], 200.0)
+        self.assertEqual(metrics["lcp_ms"], 800.0)
+        self.assertEqual(metrics["cls"], 0.03)
+        self.assertEqual(metrics["tbt_ms"], 40.0)
+        self.assertEqual(metrics["transfer_bytes"], 35000)
+        self.assertEqual(metrics["requests"], 3)
+        self.assertEqual([entry["name"] for entry in sample["waterfall"]], ["/logo.jpg", "/app.js"])
+
+    def test_missing_entries(self):
+        """Test a browser without LCP and heap support"""
+        raw = _raw(900.0)
+        raw["observed"] = None
+        raw["heap"] = None
+        metrics = page_metrics(raw)["metrics"]
+        self.assertIsNone(metrics["lcp_ms"])
+        self.assertIsNone(metrics["js_heap_bytes"])
+        self.assertEqual(metrics["cls"], 0.0)
+
+
+class TestBaseline(unittest.TestCase):
+    """Test medians and regression flags"""
+
+    def test_median(self):
+        """Test that every metric is the median and the waterfall is from the median load"""
+        samples = [page_metrics(_raw(load, lcp=lcp)) for load, lcp in ((900.0, 700.0), (3000.0, 2500.0),
+                                                                        (1000.0, 800.0))]
+        samples[2]["waterfall"] = ["median load"]
+        result = median_metrics(samples)
+        self.assertEqual(result["metrics"]["load_ms"], 1000.0)
+        self.assertEqual(result["metrics"]["lcp_ms"], 800.0)
+        self.assertEqual(result["waterfall"], ["median load"])
+
+    def test_regressions(self):
+        """Test that increases must exceed both the tolerance and the noise floor"""
+        baseline = {"lcp_ms": 1000.0, "cls": 0.0, "tbt_ms": 100.0, "requests": 20, "js_heap_bytes": None}
+        current = {"lcp_ms": 1300.0, "cls": 0.01, "tbt_ms": 140.0, "requests": 30, "js_heap_bytes": 9_000_000}
+        regressions = compare_to_baseline(current, baseline, tolerance=0.2)
+        self.assertEqual(regressions, ["lcp_ms: 1000 -> 1300 (+30.0%)", "requests: 20 -> 30 (+50.0%)"])
+        self.assertEqual(compare_to_baseline(current, baseline, tolerance=0.5), [])
+        self.assertEqual(compare_to_baseline({"cls": 0.1}, {"cls": 0.0}), ["cls: 0 -> 0.1 (+0.1)"])
+
+    def test_load_baseline(self):
+        """Test that a missing baseline file is no error"""
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsNone(load_baseline(os.path.join(directory, "perf_baseline.json")))
+
+
+if __name__ == '__main__':
+    unittest.main()
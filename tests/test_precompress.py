@@ -0,0 +1,104 @@
+"""Unit tests for the precompressed frontend assets"""
+
+import gzip
+import os
+import re
+import shutil
+import tempfile
+import unittest
+import zipfile
+import brotli
+from suedwestenergie.build.precompress import HASHED_PREFIXES, build, nginx_include, precompress
+
+SCRIPT = b"export function hello(){return 'Hallo Welt';}\n" * 200
+
+
+class TestPrecompress(unittest.TestCase):
+    """Test writing .gz/.br siblings"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+
+    def _write(self, name, data):
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_siblings_round_trip(self):
+        """Test that both siblings decompress to the original"""
+        path = self._write("assets/app-AbCdEf12.js", SCRIPT)
+        totals = precompress(self.root)
+        with open(path + ".gz", "rb") as f:
+            self.assertEqual(gzip.decompress(f.read()), SCRIPT)
+        with open(path + ".br", "rb") as f:
+            self.assertEqual(brotli.decompress(f.read()), SCRIPT)
+        self.assertLess(totals[".br"], totals[".gz"])
+        self.assertLess(totals[".gz"], totals["raw"])
+
+    def test_incompressible_files(self):
+        """Test that binary formats and siblings that would not shrink are skipped"""
+        self._write("img/logo.96.0123456789.avif", os.urandom(2048))
+        tiny = self._write("assets/tiny.js", b"1")
+        precompress(self.root)
+        self.assertFalse(os.path.exists(os.path.join(self.root, "img", "logo.96.0123456789.avif.gz")))
+        self.assertFalse(os.path.exists(tiny + ".gz"))
+
+    def test_unchanged_files_are_skipped(self):
+        """Test that up-to-date siblings are not rewritten"""
+        path = self._write("assets/app-AbCdEf12.js", SCRIPT)
+        precompress(self.root)
+        os.utime(path + ".gz", (1e10, 1e10))
+        with open(path + ".gz", "wb") as f:
+            f.write(b"kept")
+        os.utime(path + ".gz", (1e10, 1e10))
+        precompress(self.root)
+        with open(path + ".gz", "rb") as f:
+            self.assertEqual(f.read(), b"kept")
+
+
+class TestBuild(unittest.TestCase):
+    """Test unpacking the export and the nginx include"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.work_dir)
+
+    def test_build_from_zip(self):
+        """Test that the zip is unpacked, precompressed and stale files are dropped"""
+        source = os.path.join(self.work_dir, "frontend.zip")
+        with zipfile.ZipFile(source, "w") as archive:
+            archive.writestr("index.html", b"<html>" + SCRIPT + b"</html>")
+            archive.writestr("assets/app-AbCdEf12.js", SCRIPT)
+        out_dir = os.path.join(self.work_dir, "frontend_static")
+        os.makedirs(os.path.join(out_dir, "assets"))
+        open(os.path.join(out_dir, "assets", "old-12345678.js"), "w").close()
+
+        build(source, out_dir)
+        self.assertTrue(os.path.exists(os.path.join(out_dir, "assets", "app-AbCdEf12.js.br")))
+        self.assertTrue(os.path.exists(os.path.join(out_dir, "index.html.gz")))
+        self.assertFalse(os.path.exists(os.path.join(out_dir, "assets", "old-12345678.js")))
+        self.assertTrue(os.path.exists(os.path.join(out_dir, "frontend.conf")))
+
+    def test_nginx_include(self):
+        """Test the generated locations"""
+        include = nginx_include("/srv/frontend")
+        self.assertIn("gzip_static on;", include)
+        self.assertIn("immutable", include)
+        self.assertNotIn("brotli_static", include)
+        self.assertIn("brotli_static on;", nginx_include("/srv/frontend", brotli_static=True))
+
+    def test_single_definition(self):
+        """Test that nginx.conf leaves the hashed paths to the generated include"""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        with open(os.path.join(root, "nginx.conf"), encoding="utf-8") as f:
+            locations = re.findall(r"^\s*location\s+(.+?)\s*\{", f.read(), re.MULTILINE)
+        overlapping = [location for location in locations
+                       if any(re.search(rf"\b{prefix}\b", location) for prefix in HASHED_PREFIXES)]
+        self.assertEqual(overlapping, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+"""Unit tests for the merged JSON report of the test suite"""
+
+import json
+import os
+
+import pytest
+
+CONFTEST = os.path.join(os.path.dirname(os.path.abspath(__file__)), "conftest.py")
+
+
+@pytest.fixture
+def suite(pytester):
+    with open(CONFTEST, encoding="utf-8") as f:
+        pytester.makeconftest(f.read())
+    pytester.makepyfile(test_sample="""
+        import pytest
+
+        def test_pass(record_property):
+            record_property("latency_ms", 12)
+
+        def test_fail():
+            assert 1 == 2, "mismatch"
+
+        def test_skip():
+            pytest.skip("not here")
+
+        @pytest.fixture
+        def broken():
+            raise RuntimeError("setup failed")
+
+        def test_error(broken):
+            pass
+
+        def test_backend(backend_url):
+            pass
+    """)
+    return pytester
+
+
+def test_report(suite):
+    """Test outcomes, details, metrics and the summary of the report"""
+    path = suite.path / "results.json"
+    suite.runpytest_inprocess("--results-json", str(path), "-p", "no:cacheprovider")
+    results = json.loads(path.read_text(encoding="utf-8"))
+    tests = {test["name"].split("::")[-1]: test for test in results["tests"]}
+
+    assert tests["test_pass"]["passed"] is True
+    assert tests["test_pass"]["metrics"] == {"latency_ms": 12}
+    assert tests["test_fail"]["outcome"] == "failed"
+    assert "mismatch" in tests["test_fail"]["details"]
+    assert tests["test_skip"]["passed"] is None
+    assert tests["test_skip"]["details"] == "not here"
+    assert tests["test_error"]["outcome"] == "error"
+    assert "needs a state backend" in tests["test_backend"]["details"]
+    assert results["summary"] == {
+        "total": 3, "passed": 1, "failed": 2, "skipped": 2,
+        "errors": [tests["test_error"]["name"]], "success_rate": pytest.approx(100 / 3),
+    }
+
+
+def test_no_report_by_default(suite):
+    """Test that no file is written without --results-json"""
+    suite.runpytest_inprocess("-p", "no:cacheprovider").assert_outcomes(passed=1, failed=1, skipped=2, errors=1)
+    assert not list(suite.path.glob("*.json"))
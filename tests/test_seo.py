@@ -0,0 +1,74 @@
+"""Unit tests for sitemap.xml, robots.txt and the 404 handling"""
+
+import datetime
+import json
+import os
+import re
+import shutil
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from suedwestenergie.build.seo import build, nginx_include, page_routes
+from suedwestenergie.build.static_export import export
+
+NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+
+class TestSeo(unittest.TestCase):
+    """Test the files generated from the registered routes"""
+
+    def setUp(self):
+        self.out_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.out_dir)
+
+    def _read(self, name):
+        with open(os.path.join(self.out_dir, name), encoding="utf-8") as f:
+            return f.read()
+
+    def test_sitemap_and_robots(self):
+        """Test that indexable routes are listed and the others disallowed"""
+        build(self.out_dir, "https://example.de/", today=datetime.date(2025, 1, 2))
+        urls = {url.find(f"{NS}loc").text: url.find(f"{NS}lastmod").text
+                for url in ET.fromstring(self._read("sitemap.xml"))}
+        self.assertIn("https://example.de/", urls)
+        self.assertIn("https://example.de/impressum", urls)
+        self.assertNotIn("https://example.de/danke", urls)
+        self.assertEqual(set(urls.values()), {"2025-01-02"})
+
+        robots = self._read("robots.txt")
+        self.assertIn("Disallow: /danke", robots)
+        self.assertIn("Sitemap: https://example.de/sitemap.xml", robots)
+
+    def test_lastmod_follows_content(self):
+        """Test that lastmod only changes for routes whose content changed"""
+        build(self.out_dir, today=datetime.date(2025, 1, 2))
+        state_path = os.path.join(self.out_dir, "seo.json")
+        with open(state_path, encoding="utf-8") as f:
+            state = json.load(f)
+        state["agb"]["fingerprint"] = "changed"
+        with open(state_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+
+        state = build(self.out_dir, today=datetime.date(2025, 3, 4))
+        self.assertEqual(state["impressum"]["lastmod"], "2025-01-02")
+        self.assertEqual(state["agb"]["lastmod"], "2025-03-04")
+
+    def test_unknown_paths(self):
+        """Test that only unknown extension-less paths are answered with 404"""
+        pattern = re.search(r'location ~ "(.*)"', nginx_include(page_routes())).group(1)
+        for path in ("/", "/impressum", "/agb/", "/_event", "/ping", "/assets/entry.js", "/favicon.ico"):
+            self.assertIsNone(re.search(pattern, path), path)
+        for path in ("/wp-login", "/impressum/alt", "/foo/bar"):
+            self.assertIsNotNone(re.search(pattern, path), path)
+
+    def test_error_page(self):
+        """Test that the 404 page is exported as the nginx error page"""
+        manifest = export(self.out_dir)
+        self.assertNotIn("/404", manifest["pages"])
+        include = self._read("static_pages.conf")
+        self.assertIn(f"error_page 404 /{manifest['not_found']['file']};", include)
+        self.assertIn('content="noindex"', self._read(manifest["not_found"]["file"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""Unit tests for parsing and reloading the settings"""
+
+import dataclasses
+import unittest
+from unittest.mock import patch
+from suedwestenergie.config import Config, ConfigError, Settings, get_settings, reload_settings
+from suedwestenergie.config import env_config
+from suedwestenergie.config.logging_config import LoggingConfig
+from suedwestenergie.utils import email_notification, ninox_client, throttle
+
+SMTP = {"EMAIL_HOST": "smtp.example.com", "EMAIL_HOST_USER": "web@example.com", "EMAIL_HOST_PASSWORD": "secret"}
+
+
+class TestFromEnv(unittest.TestCase):
+    """Test reading the environment into settings"""
+
+    def test_defaults(self):
+        """Test that an empty environment gives the development defaults"""
+        settings = Settings.from_env({})
+        self.assertEqual(settings, Settings())
+        self.assertEqual(settings.EMAIL_PORT, 587)
+        self.assertTrue(settings.IS_DEVELOPMENT)
+        self.assertFalse(settings.EMAIL_CONFIGURED or settings.NINOX_CONFIGURED or settings.SMS_ALERTS_CONFIGURED)
+
+    def test_types(self):
+        """Test that numbers, flags and lists are parsed once, with the variable names of the examples"""
+        settings = Settings.from_env(dict(SMTP, EMAIL_PORT="2525", EMAIL_USE_TLS="False", DEBUG="yes",
+                                          CONTACT_EMAIL="info@example.com", SITE_URL="https://example.com/",
+                                          NOTIFICATION_EMAILS=" ops@example.com, ,dev@example.com",
+                                          CONTACT_RATE_LIMIT_PER_IP="", ENVIRONMENT="Production"))
+        self.assertEqual(settings.EMAIL_PORT, 2525)
+        self.assertFalse(settings.EMAIL_USE_TLS)
+        self.assertTrue(settings.DEBUG)
+        self.assertEqual(settings.EMAIL, "info@example.com")
+        self.assertEqual(settings.SITE_URL, "https://example.com")
+        self.assertEqual(settings.NOTIFICATION_EMAILS, ("ops@example.com", "dev@example.com"))
+        self.assertEqual(settings.CONTACT_RATE_LIMIT_PER_IP, 10)
+        self.assertTrue(settings.IS_PRODUCTION and settings.EMAIL_CONFIGURED and settings.EMAIL_ALERTS_CONFIGURED)
+
+    def test_older_alert_names(self):
+        """Test that the older SMTP_* names of the alert mails are read when the EMAIL_* ones are unset"""
+        older = {"SMTP_SERVER": "mail.example.com", "SMTP_PORT": "25", "EMAIL_USERNAME": "alerts@example.com",
+                 "EMAIL_PASSWORD": "older"}
+        settings = Settings.from_env(older)
+        self.assertEqual((settings.EMAIL_HOST, settings.EMAIL_PORT, settings.EMAIL_HOST_USER),
+                         ("mail.example.com", 25, "alerts@example.com"))
+        self.assertEqual(Settings.from_env(dict(older, **SMTP)).EMAIL_HOST, "smtp.example.com")
+
+    def test_all_problems_reported(self):
+        """Test that one error lists every invalid value"""
+        with self.assertRaises(ConfigError) as raised:
+            Settings.from_env({"EMAIL_PORT": "smtp", "DEBUG": "ja", "CONTACT_RATE_LIMIT_PER_IP": "0"})
+        self.assertEqual(raised.exception.problems, [
+            "DEBUG: 'ja' is not true or false",
+            "EMAIL_PORT: 'smtp' is not a whole number",
+            "CONTACT_RATE_LIMIT_PER_IP: 0 must be at least 1",
+        ])
+        self.assertIsInstance(raised.exception, ValueError)
+
+    def test_unknown_environment(self):
+        """Test that an environment outside the known names is accepted with a warning"""
+        with self.assertLogs("suedwestenergie.config.env_config", "WARNING") as logs:
+            settings = Settings.from_env({"ENVIRONMENT": "staging"})
+        self.assertIn("'staging' is not one of prod, production", logs.output[0])
+        self.assertFalse(settings.IS_PRODUCTION or settings.IS_DEVELOPMENT or settings.IS_TEST)
+
+    def test_incomplete_services(self):
+        """Test that half-configured services fail before the first mail, record or SMS"""
+        with self.assertRaises(ConfigError) as raised:
+            Settings.from_env({"EMAIL_HOST": "smtp.example.com", "NINOX_API_KEY": "key",
+                               "NOTIFICATION_PHONES": "+49711", "CONTACT_FORM_MODE": "eager",
+                               "NOTIFICATION_EMAILS": "ops"})
+        problems = "\n".join(raised.exception.problems)
+        self.assertIn("SMTP is configured partially, EMAIL_HOST_USER, EMAIL_HOST_PASSWORD missing", problems)
+        self.assertIn("Ninox is configured partially", problems)
+        self.assertIn("NOTIFICATION_PHONES is set, but TWILIO_SID is not", problems)
+        self.assertIn("CONTACT_FORM_MODE: 'eager'", problems)
+        self.assertIn("'ops' is not an e-mail address", problems)
+
+    def test_frozen(self):
+        """Test that settings cannot be changed, only replaced, and hide secrets"""
+        settings = Settings.from_env(SMTP)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            settings.EMAIL_PORT = 25
+        self.assertFalse(hasattr(settings, "__dict__"))
+        self.assertNotIn("secret", repr(settings))
+        with self.assertRaises(ConfigError):
+            dataclasses.replace(settings, EMAIL_HOST_USER="")
+
+
+class TestReload(unittest.TestCase):
+    """Test applying reloaded settings"""
+
+    def tearDown(self):
+        reload_settings()
+
+    def test_applied_to_config(self):
+        """Test that Config follows the reload, including values set on it directly"""
+        Config.LAZY_SECTIONS = False
+        settings = reload_settings(dict(SMTP, CONTACT_PHONE="+49 711 99999"))
+        self.assertIs(get_settings(), settings)
+        self.assertEqual(Config.PHONE, "+49 711 99999")
+        self.assertEqual(Config.EMAIL_HOST, "smtp.example.com")
+        self.assertTrue(Config.LAZY_SECTIONS)
+
+    def test_invalid_reload_keeps_settings(self):
+        """Test that a failed reload leaves the current settings in place"""
+        settings = get_settings()
+        with self.assertRaises(ConfigError):
+            reload_settings({"EMAIL_PORT": "0"})
+        self.assertIs(get_settings(), settings)
+
+    def test_clients_dropped(self):
+        """Test that the Ninox client and the rate limiters are created again with the new settings"""
+        with patch.object(ninox_client, "_ninox_client", object()):
+            throttle._contact_limiters["ip"] = object()
+            reload_settings({"CONTACT_RATE_LIMIT_PER_IP": "2"})
+            self.assertIsNone(ninox_client._ninox_client)
+        self.assertEqual(throttle._contact_limiters, {})
+
+    def test_hooks(self):
+        """Test that registered callbacks get the new settings"""
+        received = []
+        with patch.object(env_config, "_reload_callbacks", [received.append]):
+            settings = reload_settings({})
+        self.assertEqual(received, [settings])
+
+    def test_alerts_follow_reload(self):
+        """Test that the alert services read the current settings unless given their own"""
+        service = email_notification.EmailNotificationService()
+        pinned = LoggingConfig(Settings())
+        self.assertFalse(service.is_configured())
+        reload_settings(dict(SMTP, NOTIFICATION_EMAILS="ops@example.com"))
+        self.assertTrue(service.is_configured())
+        self.assertEqual(service.config.smtp_server, "smtp.example.com")
+        self.assertFalse(pinned.is_email_configured())
+
+
+if __name__ == '__main__':
+    unittest.main()
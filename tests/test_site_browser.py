@@ -0,0 +1,75 @@
+"""Browser checks against the running website (--site-url), in headless Chrome"""
+
+import random
+
+import pytest
+from benchmarks.event_load import contact_lead
+
+webdriver = pytest.importorskip("selenium.webdriver", reason="needs selenium and Chrome")
+from selenium.webdriver.common.by import By  # noqa: E402
+from selenium.webdriver.support import expected_conditions as EC  # noqa: E402
+from selenium.webdriver.support.ui import WebDriverWait  # noqa: E402
+
+PAGES = [("/", "Homepage"), ("/danke", "Thank You"), ("/impressum", "Impressum"), ("/datenschutz", "Datenschutz")]
+
+FORM_FIELDS = ["input[name='name']", "input[name='email']", "input[name='phone']", "input[name='company']",
+               "textarea[name='message']", "button[type='submit']"]
+
+FOOTER_LINKS = ["footer a[href*='impressum']", "footer a[href*='datenschutz']", "footer a[href*='agb']",
+                "footer a[href*='kontakt']"]
+
+
+@pytest.fixture(scope="module")
+def browser(site_url):
+    options = webdriver.ChromeOptions()
+    for argument in ("--headless=new", "--no-sandbox", "--disable-dev-shm-usage", "--window-size=1920,1080"):
+        options.add_argument(argument)
+    try:
+        driver = webdriver.Chrome(options=options)
+    except Exception as e:  # no Chrome or no matching driver
+        pytest.skip(f"cannot start Chrome: {e}")
+    yield driver
+    driver.quit()
+
+
+def _open(browser, url):
+    browser.get(url)
+    WebDriverWait(browser, 10).until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+
+
+@pytest.mark.parametrize("path,page_name", PAGES, ids=[name for _, name in PAGES])
+def test_logo_visible(browser, site_url, path, page_name):
+    """Test that the page loads without a redirect and shows the logo"""
+    _open(browser, site_url + path)
+    assert browser.current_url.rstrip("/") == (site_url + path).rstrip("/")
+    logos = browser.find_elements(By.CSS_SELECTOR, "img[src*='logo']")
+    assert any(logo.is_displayed() for logo in logos), f"no visible logo on {page_name}"
+
+
+def test_form_fields_usable(browser, site_url):
+    """Test that all contact form fields are visible and enabled"""
+    _open(browser, site_url)
+    for selector in FORM_FIELDS:
+        element = browser.find_element(By.CSS_SELECTOR, selector)
+        assert element.is_displayed() and element.is_enabled(), selector
+
+
+def test_footer_links(browser, site_url):
+    """Test that the footer links to the legal pages"""
+    _open(browser, site_url)
+    found = [selector for selector in FOOTER_LINKS if browser.find_elements(By.CSS_SELECTOR, selector)]
+    assert len(found) >= 2, f"found {len(found)} of {len(FOOTER_LINKS)} footer links"
+
+
+def test_form_submission(browser, site_url):
+    """Test that a valid request submitted in the browser leads to the thank-you page"""
+    _open(browser, site_url)
+    lead = contact_lead(random.Random(), 0, tag="-browser")
+    for field, value in lead.items():
+        tag = "textarea" if field == "message" else "input"
+        element = WebDriverWait(browser, 10).until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, f"{tag}[name='{field}']")))
+        element.clear()
+        element.send_keys(value)
+    browser.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+    WebDriverWait(browser, 15).until(EC.url_contains("/danke"))
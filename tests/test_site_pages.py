@@ -0,0 +1,90 @@
+"""Page and asset checks against the running website (--site-url)"""
+
+import time
+from html.parser import HTMLParser
+
+import pytest
+
+# Routes registered in suedwestenergie.py that are served as pages
+PAGES = [
+    ("/", "Homepage"),
+    ("/impressum", "Impressum"),
+    ("/datenschutz", "Datenschutz"),
+    ("/agb", "AGB"),
+    ("/danke", "Thank You"),
+]
+
+MAX_RESPONSE_SECONDS = 5.0
+
+CONTACT_FIELDS = [("input", "name"), ("input", "email"), ("input", "phone"), ("input", "company"),
+                  ("textarea", "message")]
+
+
+class _FormControls(HTMLParser):
+    """Collects ``(tag, name)`` of the form controls and the submit buttons of a page"""
+
+    def __init__(self):
+        super().__init__()
+        self.fields = set()
+        self.submit_buttons = 0
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag in ("input", "textarea", "select") and attrs.get("name"):
+            self.fields.add((tag, attrs["name"]))
+        elif tag == "button" and attrs.get("type") == "submit":
+            self.submit_buttons += 1
+
+
+@pytest.mark.parametrize("path,page_name", PAGES, ids=[name for _, name in PAGES])
+def test_page_response(http, site_url, record_property, path, page_name):
+    """Test that a page is served within the response time budget"""
+    started = time.perf_counter()
+    response = http.get(site_url + path, timeout=30)
+    elapsed = time.perf_counter() - started
+    record_property("response_seconds", round(elapsed, 3))
+
+    assert response.status_code == 200, f"{page_name}: status {response.status_code}"
+    assert "text/html" in response.headers.get("Content-Type", "")
+    assert elapsed <= MAX_RESPONSE_SECONDS, f"{page_name}: {elapsed:.2f}s (max {MAX_RESPONSE_SECONDS}s)"
+
+
+def test_logo(http, site_url):
+    """Test that the logo is served as an image"""
+    response = http.get(f"{site_url}/logo.jpg", headers={"Accept": "image/*"}, timeout=30)
+    assert response.status_code == 200
+    assert response.headers.get("Content-Type", "").startswith("image/")
+    assert len(response.content) > 0
+
+
+def test_contact_form_fields(http, site_url):
+    """Test that the homepage contains all contact form fields and a submit button"""
+    controls = _FormControls()
+    controls.feed(http.get(site_url, timeout=30).text)
+    missing = [name for tag, name in CONTACT_FIELDS if (tag, name) not in controls.fields]
+    assert not missing, f"missing form fields: {', '.join(missing)}"
+    assert controls.submit_buttons >= 1
+    # The time the form was shown is taken on the server; a value in the page would be fixed at build time
+    assert ("input", "form_ts") not in controls.fields
+
+
+def test_robots_txt(http, site_url):
+    """Test that robots.txt points crawlers to the sitemap"""
+    response = http.get(f"{site_url}/robots.txt", timeout=30)
+    assert response.status_code == 200
+    assert "Sitemap:" in response.text
+
+
+def test_sitemap(http, site_url):
+    """Test that the sitemap lists the indexable pages"""
+    response = http.get(f"{site_url}/sitemap.xml", timeout=30)
+    assert response.status_code == 200
+    assert "<urlset" in response.text
+    for path in ("/impressum", "/datenschutz", "/agb"):
+        assert f"{path}</loc>" in response.text
+
+
+def test_unknown_path(http, site_url):
+    """Test that unknown paths are answered with a 404"""
+    response = http.get(f"{site_url}/gibt-es-nicht", timeout=30)
+    assert response.status_code == 404
@@ -0,0 +1,91 @@
+"""Unit tests for the static HTML export"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import reflex as rx
+from suedwestenergie.build.static_export import STATIC_ROUTES, StaticExportError, StaticRenderer, export
+from suedwestenergie.config import Config
+from suedwestenergie.state.contact_state import ContactFormState
+from suedwestenergie.utils.analytics import CONSENT_SETTINGS_ATTR
+
+
+class TestStaticRenderer(unittest.TestCase):
+    """Test rendering of single components"""
+
+    def test_redirect_button_becomes_link(self):
+        """Test that a redirect-only button is rendered as a plain link"""
+        html = StaticRenderer().render(rx.button("Start", on_click=lambda: rx.redirect("/")))
+        self.assertIn('href="/"', html)
+        self.assertTrue(html.startswith("<a "))
+
+    def test_shared_styles_share_a_class(self):
+        """Test that identical styles are emitted once"""
+        renderer = StaticRenderer()
+        first = renderer.render(rx.text("a", color="red"))
+        second = renderer.render(rx.text("b", color="red"))
+        self.assertEqual(first.split('"')[1], second.split('"')[1])
+        self.assertEqual(renderer.stylesheet().count("color:red"), 1)
+
+    def test_responsive_values(self):
+        """Test that responsive lists become media queries"""
+        renderer = StaticRenderer()
+        renderer.render(rx.box(flex_direction=["column", "column", "row"]))
+        self.assertIn("@media (min-width:48em)", renderer.stylesheet())
+
+    def test_state_is_rejected(self):
+        """Test that state-bound content fails the export"""
+        with self.assertRaises(StaticExportError):
+            StaticRenderer().render(rx.text(ContactFormState.error_message))
+        with self.assertRaises(StaticExportError):
+            StaticRenderer().render(rx.button("Senden", on_click=ContactFormState.reset_form))
+
+
+class TestExport(unittest.TestCase):
+    """Test the export of the app's static routes"""
+
+    def setUp(self):
+        self.out_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.out_dir)
+
+    def test_export(self):
+        """Test that all routes are written with content hashes and an nginx include"""
+        manifest = export(self.out_dir)
+        self.assertEqual(set(manifest["pages"]), {f"/{route}" for route in STATIC_ROUTES})
+        for route, page in manifest["pages"].items():
+            self.assertIn(page["hash"], page["file"])
+            with open(os.path.join(self.out_dir, page["file"]), encoding="utf-8") as f:
+                document = f.read()
+            self.assertNotIn("<script", document)
+            self.assertIn(manifest["stylesheet"], document)
+            self.assertTrue(os.path.exists(os.path.join(self.out_dir, page["file"] + ".gz")))
+
+        with open(os.path.join(self.out_dir, "static_pages.conf"), encoding="utf-8") as f:
+            include = f.read()
+        self.assertIn("location = /impressum", include)
+        self.assertIn("gzip_static on;", include)
+
+    def test_export_with_analytics(self):
+        """Test that the static pages carry the shim and the link to the consent settings"""
+        with patch.object(Config, "GOOGLE_ANALYTICS_ID", "G-TEST"):
+            manifest = export(self.out_dir)
+        with open(os.path.join(self.out_dir, manifest["pages"]["/datenschutz"]["file"]), encoding="utf-8") as f:
+            document = f.read()
+        self.assertIn("window.swa = {", document)
+        self.assertIn(f'href="#cookie-einstellungen" {CONSENT_SETTINGS_ATTR}="true"', document)
+        self.assertIn("5. Webanalyse", document)
+
+    def test_export_is_reproducible(self):
+        """Test that an unchanged build keeps its hashes and drops stale files"""
+        stale = os.path.join(self.out_dir, "impressum.0123456789.html")
+        first = export(self.out_dir)
+        open(stale, "w").close()
+        second = export(self.out_dir)
+        self.assertEqual(first, second)
+        self.assertFalse(os.path.exists(stale))
+
+
+if __name__ == '__main__':
+    unittest.main()
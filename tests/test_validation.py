@@ -0,0 +1,105 @@
+"""Unit tests for the contact form validation rules"""
+
+import re
+import unittest
+from suedwestenergie.utils import validation
+
+
+VALID_FORM = {
+    "name": "Max Mustermann",
+    "email": "max@example.com",
+    "phone": "+49 711 12345678",
+    "company": "Muster GmbH",
+    "message": "Bitte senden Sie mir ein Angebot.",
+}
+
+
+class TestFieldValidators(unittest.TestCase):
+    """Test the individual field validators"""
+
+    def test_email(self):
+        """Test e-mail validation"""
+        self.assertTrue(validation.is_valid_email("max@example.com"))
+        self.assertTrue(validation.is_valid_email("first.last+tag@sub.example.de"))
+        self.assertFalse(validation.is_valid_email("invalid-email"))
+        self.assertFalse(validation.is_valid_email("max@example"))
+        self.assertFalse(validation.is_valid_email("max@example.com trailing"))
+        self.assertEqual(validation.validate_email(""), validation.MESSAGES["email_required"])
+
+    def test_phone_formats(self):
+        """Test E.164 and German phone notations"""
+        for number in ["+4971112345678", "+49 711 12345678", "0711 12345678",
+                       "0711/123456", "(0711) 123-456", "+49 (0)711 123456", "004971112345678"]:
+            self.assertIsNone(validation.validate_phone(number), number)
+
+        for number in ["12", "abc", "+49 711 1234 5678 9012 345", "0711 1234x"]:
+            self.assertEqual(validation.validate_phone(number), validation.MESSAGES["phone_invalid"], number)
+
+    def test_phone_is_optional(self):
+        """Test that an empty phone number is accepted"""
+        self.assertIsNone(validation.validate_phone(""))
+        self.assertIsNone(validation.validate_phone("   "))
+
+    def test_company(self):
+        """Test company validation"""
+        self.assertIsNone(validation.validate_company("Muster GmbH"))
+        self.assertEqual(validation.validate_company(" "), validation.MESSAGES["company_required"])
+        self.assertEqual(validation.validate_company("-"), validation.MESSAGES["company_invalid"])
+        self.assertEqual(validation.validate_company("!!!"), validation.MESSAGES["company_invalid"])
+
+    def test_validators_are_cached(self):
+        """Test that repeated validation of the same value hits the cache"""
+        validation.validate_email.cache_clear()
+        validation.validate_email("cached@example.com")
+        validation.validate_email("cached@example.com")
+        self.assertEqual(validation.validate_email.cache_info().hits, 1)
+
+
+class TestFormValidation(unittest.TestCase):
+    """Test whole-form validation"""
+
+    def test_valid_form(self):
+        """Test that a complete form passes"""
+        self.assertIsNone(validation.validate_contact_form(VALID_FORM))
+
+    def test_first_error_wins(self):
+        """Test that errors are reported in field order"""
+        data = dict(VALID_FORM, name="", message="kurz")
+        self.assertEqual(validation.validate_contact_form(data), validation.MESSAGES["name_required"])
+
+    def test_short_message(self):
+        """Test the minimum message length"""
+        data = dict(VALID_FORM, message="Hi")
+        self.assertEqual(validation.validate_contact_form(data), validation.MESSAGES["message_too_short"])
+
+    def test_missing_fields(self):
+        """Test that missing fields count as empty"""
+        self.assertEqual(validation.validate_contact_form({}), validation.MESSAGES["name_required"])
+
+
+class TestClientRules(unittest.TestCase):
+    """Test the rules exported to the browser"""
+
+    def test_patterns_match_server_rules(self):
+        """Test that the exported patterns agree with the server-side checks"""
+        email_pattern = re.compile(validation.client_rules("email")["pattern"])
+        phone_pattern = re.compile(validation.client_rules("phone")["pattern"])
+
+        self.assertIsNotNone(email_pattern.fullmatch("max@example.com"))
+        self.assertIsNone(email_pattern.fullmatch("invalid-email"))
+        self.assertIsNotNone(phone_pattern.fullmatch("0711 12345678"))
+        self.assertIsNone(phone_pattern.fullmatch("abc"))
+
+    def test_length_limits(self):
+        """Test that length limits are exported"""
+        self.assertEqual(validation.client_rules("message")["min_length"], validation.MESSAGE_MIN_LENGTH)
+        self.assertEqual(validation.client_rules("name")["max_length"], validation.NAME_MAX_LENGTH)
+
+    def test_rules_are_copies(self):
+        """Test that callers cannot mutate the shared rules"""
+        validation.client_rules("email")["pattern"] = "x"
+        self.assertEqual(validation.client_rules("email")["pattern"], validation.EMAIL_PATTERN)
+
+
+if __name__ == '__main__':
+    unittest.main()